@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from app.api.v1.endpoints.glossary_processor import router as glossary_processor_router
+from app.api.v1.endpoints.jobs import router as jobs_router
 from app.api.v1.endpoints.lokalise import router as lokalise_router
 from app.api.v1.endpoints.translation import router as translation_router
 
@@ -18,3 +19,6 @@ api_router.include_router(
 api_router.include_router(
     glossary_processor_router, prefix="/glossary", tags=["glossary-processor"]
 )
+
+# Include background job status endpoints
+api_router.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
@@ -1,82 +1,237 @@
-# Save uploaded file temporarily
-import os
-import tempfile
+import asyncio
+from collections.abc import Callable, Coroutine
+from pathlib import Path
+from typing import Any
 
-from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from fastapi import APIRouter, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
 
+from app.core.config import get_settings
 from app.schemas.glossary_processor import (
     FoundTerm,
     GlossaryLoadResponse,
+    GlossaryScanReport,
+    GlossaryScanRequest,
     GlossaryStats,
+    GlossarySyncReport,
+    GlossaryUploadReport,
     TermLookupRequest,
     TermLookupResponse,
     TextProcessingRequest,
     TextProcessingResponse,
 )
+from app.schemas.jobs import BACKGROUND_JOB_RESPONSES
 from app.services.glossary_processor import glossary_processor
+from app.services.glossary_reader import stage_glossary_file
+from app.services.glossary_scan import glossary_scan_service
+from app.services.job_runner import Job, job_runner
+
+# Multipart framing allowed on top of GLOSSARY_MAX_FILE_BYTES when checking
+# the request size (the file itself is checked exactly while it is copied)
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class GlossaryUploadRoute(APIRoute):
+    """
+    Route rejecting uploads by their Content-Length before the body is read.
+
+    FastAPI parses (and spools) the whole multipart body before dependencies
+    and the endpoint run, so the size has to be checked here to stop an
+    oversized upload early.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def limited_handler(request: Request) -> Response:
+            max_bytes = get_settings().GLOSSARY_MAX_FILE_BYTES
+            length = request.headers.get("content-length", "")
+            if length.isdigit() and int(length) > max_bytes + MULTIPART_OVERHEAD_BYTES:
+                return JSONResponse(
+                    status_code=413,
+                    content={
+                        "detail": f"Glossary file is larger than the {max_bytes} byte limit"
+                    },
+                )
+            return await handler(request)
+
+        return limited_handler
+
 
 router = APIRouter()
+# File upload endpoints, included into ``router`` below
+upload_router = APIRouter(route_class=GlossaryUploadRoute)
 
 # Module-level variables for FastAPI parameter defaults
 REQUIRED_FILE = File(...)
 REQUIRED_PROJECT_ID = Query(..., description="Lokalise project ID")
 SOURCE_LANGUAGE = Query("en", description="Source language for terms")
+BACKGROUND = Query(
+    True, description="Run as a background job and return its status (202)"
+)
+
+
+async def save_glossary_file(file: UploadFile) -> Path:
+    """
+    Stream an uploaded glossary file to a temporary file for the reader.
+
+    The copy runs in a worker thread, so large uploads neither block the
+    event loop nor get loaded into memory; the caller removes the file once
+    it has been processed. Requests declaring an oversized body are already
+    rejected by ``GlossaryUploadRoute``; this catches the rest.
+
+    Raises:
+        HTTPException: 400 for unsupported file types, 413 for files over
+            ``GLOSSARY_MAX_FILE_BYTES``
+    """
+    return await asyncio.to_thread(
+        stage_glossary_file,
+        file.file,
+        file.filename,
+        get_settings().GLOSSARY_MAX_FILE_BYTES,
+        file.size,
+    )
 
 
-@router.post("/load", response_model=GlossaryLoadResponse)
+@upload_router.post(
+    "/load", response_model=GlossaryLoadResponse, responses=BACKGROUND_JOB_RESPONSES
+)
 async def load_glossary_file(
     file: UploadFile = REQUIRED_FILE,
     project_id: str = REQUIRED_PROJECT_ID,
     source_language: str = SOURCE_LANGUAGE,
+    background: bool = BACKGROUND,
 ):
     """
-    Load glossary from an uploaded XLSX file and upload to Lokalise.
+    Load glossary from an uploaded XLSX or CSV file and upload to Lokalise.
+
+    The file is saved before the response is sent; by default the import
+    then runs as a background job that keeps going if the client
+    disconnects. Follow it with ``/jobs/{job_id}`` or
+    ``/jobs/{job_id}/events``: progress counts the terms done and reports
+    ``rows_parsed``, ``batches_uploaded``, ``created``, ``skipped`` and
+    ``failed`` counters, and the result is the load response.
 
     Args:
-        file: XLSX file containing glossary data
+        file: XLSX or CSV file containing glossary data
         project_id: Lokalise project ID
         source_language: Source language for terms (default: "en")
+        background: Run as a background job
 
     Returns:
-        Load response with success status and statistics
+        Load response with success status, statistics and the per-term
+        upload report; uploading the same file again resumes a partial upload
     """
-    # Validate file type
-    if not file.filename or not file.filename.endswith((".xlsx", ".xls")):
-        raise HTTPException(
-            status_code=400, detail="Invalid file type. Please upload an XLSX file."
-        )
-
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+    temp_file_path = await save_glossary_file(file)
+    filename = file.filename
 
+    async def run(job: Job | None = None) -> dict[str, Any]:
         try:
             # Load glossary from the temporary file and upload to Lokalise
-            await glossary_processor.load_glossary_from_xlsx(
-                temp_file_path, project_id, source_language
+            report = await glossary_processor.load_glossary_file(
+                temp_file_path,
+                project_id,
+                source_language,
+                on_progress=job.report_progress if job else None,
             )
 
             # Get statistics
             stats = await glossary_processor.get_stats(project_id)
 
+            if report["failed"]:
+                message = (
+                    f"Uploaded terms from {filename} to Lokalise project "
+                    f"{project_id}, but {report['failed']} terms failed; upload "
+                    f"the same file again to retry them"
+                )
+            else:
+                message = f"Successfully loaded and uploaded terms from {filename} to Lokalise project {project_id}"
+
             return GlossaryLoadResponse(
-                success=True,
-                message=f"Successfully loaded and uploaded terms from {file.filename} to Lokalise project {project_id}",
+                success=not report["failed"],
+                message=message,
                 stats=GlossaryStats(**stats),
-            )
+                report=GlossaryUploadReport(**report),
+            ).model_dump()
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to process glossary file: {e!s}"
+            ) from e
         finally:
             # Clean up temporary file
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+            temp_file_path.unlink(missing_ok=True)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to process glossary file: {e!s}"
-        ) from e
+    if not background:
+        return await run()
+
+    job = job_runner.submit("glossary.load", run)
+    return JSONResponse(status_code=202, content=job.model_dump(mode="json"))
+
+
+@upload_router.post(
+    "/sync", response_model=GlossarySyncReport, responses=BACKGROUND_JOB_RESPONSES
+)
+async def sync_glossary_file(
+    file: UploadFile = REQUIRED_FILE,
+    project_id: str = REQUIRED_PROJECT_ID,
+    dry_run: bool = Query(
+        False, description="Only return the diff; nothing is changed in Lokalise"
+    ),
+    delete_missing: bool = Query(
+        False,
+        description="Delete project terms that are not in the file "
+        "(preview the deletions with dry_run first)",
+    ),
+    background: bool = BACKGROUND,
+):
+    """
+    Make the project glossary match an uploaded XLSX or CSV file.
+
+    Unlike ``/load``, which only adds new terms, terms whose description,
+    flags or translations differ from the file are updated and, only with
+    ``delete_missing``, terms missing from the file are deleted, so a
+    partial file never removes terms by accident.
+    Only the differences are sent to Lokalise. Runs as a background job by
+    default (follow it with ``/jobs/{job_id}`` or ``/jobs/{job_id}/events``).
+
+    Args:
+        file: XLSX or CSV file containing glossary data
+        project_id: Lokalise project ID
+        dry_run: Only compute the diff
+        delete_missing: Delete project terms that are not in the file
+        background: Run as a background job
+
+    Returns:
+        Sync report with counts per action and every change
+    """
+    temp_file_path = await save_glossary_file(file)
+
+    async def run(job: Job | None = None) -> dict[str, Any]:
+        try:
+            return await glossary_processor.sync_glossary_file(
+                temp_file_path,
+                project_id,
+                dry_run=dry_run,
+                delete_missing=delete_missing,
+                on_progress=job.report_progress if job else None,
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to sync glossary file: {e!s}"
+            ) from e
+        finally:
+            temp_file_path.unlink(missing_ok=True)
+
+    if not background:
+        return await run()
+
+    job = job_runner.submit("glossary.sync", run)
+    return JSONResponse(status_code=202, content=job.model_dump(mode="json"))
 
 
 @router.post("/find-terms", response_model=list[FoundTerm])
@@ -276,3 +431,49 @@ async def get_glossary_stats(
         raise HTTPException(
             status_code=500, detail=f"Failed to get glossary stats: {e!s}"
         ) from e
+
+
+@router.post(
+    "/compliance-scan",
+    response_model=GlossaryScanReport,
+    responses=BACKGROUND_JOB_RESPONSES,
+)
+async def scan_glossary_compliance(
+    request: GlossaryScanRequest,
+    project_id: str = REQUIRED_PROJECT_ID,
+    background: bool = BACKGROUND,
+):
+    """
+    Check every key of a project against the glossary in all target languages.
+
+    Keys and translations are read from the local key mirror (synced first if
+    needed). Source translations are searched for glossary terms, and each
+    target translation must contain the glossary translation of translatable
+    terms and keep forbidden and non-translatable terms. Runs as a background
+    job by default (poll ``/jobs/{job_id}``).
+
+    Args:
+        request: Source language and target languages to check
+        project_id: Lokalise project ID
+        background: Run as a background job
+
+    Returns:
+        Per-language violation report
+    """
+
+    async def run(job: Job | None = None) -> dict[str, Any]:
+        return await glossary_scan_service.scan_project(
+            project_id,
+            request.source_lang,
+            request.target_langs,
+            on_progress=job.report_progress if job else None,
+        )
+
+    if not background:
+        return await run()
+
+    job = job_runner.submit("glossary.compliance_scan", run)
+    return JSONResponse(status_code=202, content=job.model_dump(mode="json"))
+
+
+router.include_router(upload_router)
@@ -0,0 +1,50 @@
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Path
+from fastapi.responses import StreamingResponse
+
+from app.schemas.jobs import JobStatus
+from app.services.job_runner import job_runner
+
+router = APIRouter()
+
+
+@router.get("/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str = Path(..., description="A unique job identifier")):
+    """
+    Get the status of a background job.
+
+    Long-running operations (e.g. bulk key imports) started with
+    ``background=true`` return a job; poll this endpoint until its status is
+    ``completed`` or ``failed``.
+    """
+    return job_runner.get(job_id)
+
+
+@router.get(
+    "/{job_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_job_events(
+    job_id: str = Path(..., description="A unique job identifier"),
+):
+    """
+    Follow a background job as server-sent events.
+
+    Each event carries the job status (as returned by ``/jobs/{job_id}``)
+    and is sent when the status or progress changes; the stream ends once
+    the job has completed or failed. Disconnecting does not stop the job.
+    """
+    # Unknown jobs fail with 404 before the stream starts
+    job_runner.get(job_id)
+
+    async def events() -> AsyncIterator[str]:
+        async for status in job_runner.watch(job_id):
+            yield f"data: {status.model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
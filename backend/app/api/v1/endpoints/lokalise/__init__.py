@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from .client import router as client_router
 from .payment_cards import router as payment_cards_router
 from .projects import router as projects_router
 from .system import router as system_router
@@ -7,6 +8,7 @@ from .teams import router as teams_router
 
 router = APIRouter()
 
+router.include_router(client_router)
 router.include_router(payment_cards_router)
 router.include_router(projects_router)
 router.include_router(system_router)
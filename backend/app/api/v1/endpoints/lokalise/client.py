@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+
+from app.schemas.lokalise.client import LokaliseClientStats
+from app.services.lokalise.rate_limiter import lokalise_rate_limiter
+from app.services.lokalise.retry import lokalise_retry_stats
+
+router = APIRouter(prefix="/client", tags=["lokalise-client"])
+
+
+@router.get("/stats", response_model=LokaliseClientStats)
+async def get_client_stats():
+    """
+    Get rate limiting and retry counters of the Lokalise API client.
+
+    Counters are kept in memory since server start.
+    """
+    return LokaliseClientStats(
+        queue_depth=lokalise_rate_limiter.queue_depth,
+        **lokalise_retry_stats.snapshot(),
+    )
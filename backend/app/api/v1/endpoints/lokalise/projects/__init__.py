@@ -3,6 +3,7 @@ from typing import Annotated
 from fastapi import APIRouter, HTTPException, Path, Query
 from fastapi.responses import Response
 
+from app.core.serialization import ModelResponse
 from app.schemas.lokalise.projects import (
     ProjectCreateRequest,
     ProjectDeleteResponse,
@@ -19,6 +20,7 @@ from .files import router as files_router
 from .glossary import router as glossary_router
 from .keys import router as keys_router
 from .languages import router as languages_router
+from .mirror import router as mirror_router
 from .processes import router as processes_router
 from .screenshots import router as screenshots_router
 from .segments import router as segments_router
@@ -36,6 +38,7 @@ router.include_router(files_router, prefix="/{project_id}")
 router.include_router(glossary_router, prefix="/{project_id}")
 router.include_router(keys_router, prefix="/{project_id}")
 router.include_router(languages_router, prefix="/{project_id}")
+router.include_router(mirror_router, prefix="/{project_id}")
 router.include_router(processes_router, prefix="/{project_id}")
 router.include_router(screenshots_router, prefix="/{project_id}")
 router.include_router(segments_router, prefix="/{project_id}")
@@ -88,7 +91,7 @@ async def list_projects(
     Requires read_projects OAuth access scope.
     """
 
-    return await lokalise_projects_service.list_projects(
+    projects_response = await lokalise_projects_service.list_projects(
         filter_team_id=filter_team_id,
         filter_names=filter_names,
         include_statistics=include_statistics,
@@ -96,6 +99,7 @@ async def list_projects(
         limit=limit,
         page=page,
     )
+    return ModelResponse(projects_response)
 
 
 @router.post("/", response_model=ProjectResponse, status_code=201)
@@ -129,7 +133,8 @@ async def get_project(
         ProjectResponse: Complete project object with settings, statistics, and languages
     """
 
-    return await lokalise_projects_service.get_project(project_id)
+    project_response = await lokalise_projects_service.get_project(project_id)
+    return ModelResponse(project_response)
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
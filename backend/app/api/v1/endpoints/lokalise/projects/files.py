@@ -1,17 +1,48 @@
-from fastapi import APIRouter, HTTPException, Path, Query, Response
+from typing import Any
 
+from fastapi import (
+    APIRouter,
+    File,
+    Form,
+    HTTPException,
+    Path,
+    Query,
+    Response,
+    UploadFile,
+)
+from fastapi.responses import FileResponse, JSONResponse
+from pydantic import ValidationError
+
+from app.schemas.file_export import FileExportResult
+from app.schemas.file_upload import FileImportResponse
+from app.schemas.jobs import BACKGROUND_JOB_RESPONSES
 from app.schemas.lokalise.files import (
     FileDeleteResponse,
     FileDownloadRequest,
     FileDownloadResponse,
     FileSyncDownloadResponse,
+    FileUploadOptions,
     FileUploadRequest,
     FileUploadResponse,
     ProjectFilesResponse,
 )
+from app.services.file_export import file_export_service
+from app.services.file_upload import file_upload_service
+from app.services.job_runner import Job, job_runner
+from app.services.lokalise.files import lokalise_files_service
 
 router = APIRouter(tags=["lokalise-files"])
 
+# Module-level variables for FastAPI parameter defaults
+IMPORT_FILES = File(..., description="Localization files to import")
+IMPORT_LANG_ISOS = Form(
+    ...,
+    description="Language code of each file (same order), or one code for all files",
+)
+IMPORT_OPTIONS = Form(
+    None, description="JSON object with upload options (see FileUploadRequest)"
+)
+
 
 @router.get("/files", response_model=ProjectFilesResponse)
 async def list_project_files(
@@ -52,9 +83,63 @@ async def upload_file(
     used, but in the future it will be returned if the same file is already in the
     upload queue.
 
+    For large files use ``POST /files/import``, which takes the raw file as
+    multipart upload and never holds its base64 encoding in memory.
+
     Requires write_files OAuth access scope.
     """
-    raise HTTPException(status_code=501, detail="Not implemented")
+    return await lokalise_files_service.upload_file(project_id, request)
+
+
+@router.post(
+    "/files/import",
+    response_model=FileImportResponse,
+    status_code=200,
+    responses=BACKGROUND_JOB_RESPONSES,
+)
+async def import_files(
+    project_id: str = Path(..., description="A unique project identifier"),
+    files: list[UploadFile] = IMPORT_FILES,
+    lang_iso: list[str] = IMPORT_LANG_ISOS,
+    options: str | None = IMPORT_OPTIONS,
+    background: bool = Query(
+        True, description="Run as a background job and return its status (202)"
+    ),
+):
+    """Import localization files sent as multipart upload.
+
+    Not part of the Lokalise API. Files are streamed to disk, base64-encoded
+    chunk by chunk while being sent to Lokalise, uploaded concurrently within
+    the rate limit, and their import processes are tracked until they finish.
+    Runs as a background job by default (poll ``/jobs/{job_id}``).
+
+    Requires write_files OAuth access scope.
+    """
+    try:
+        upload_options = (
+            FileUploadOptions.model_validate_json(options) if options else None
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422, detail=f"Invalid upload options: {e}"
+        ) from e
+
+    work_dir, uploads = await file_upload_service.stage_uploads(files, lang_iso)
+
+    async def run(job: Job | None = None) -> dict[str, Any]:
+        return await file_upload_service.import_files(
+            project_id,
+            work_dir,
+            uploads,
+            upload_options,
+            on_progress=job.report_progress if job else None,
+        )
+
+    if not background:
+        return await run()
+
+    job = job_runner.submit("files.import", run, total=len(uploads))
+    return JSONResponse(status_code=202, content=job.model_dump(mode="json"))
 
 
 @router.post(
@@ -73,9 +158,61 @@ async def download_files_async(
     processes API endpoint. Once complete, the download URL can be accessed using
     the Retrieve process API endpoint.
 
+    To wait for the export, download and unpack the bundle in one go use
+    ``POST /files/export`` instead.
+
     Requires read_files OAuth access scope.
     """
-    raise HTTPException(status_code=501, detail="Not implemented")
+    return await lokalise_files_service.start_async_download(project_id, request)
+
+
+@router.post(
+    "/files/export",
+    response_model=FileExportResult,
+    status_code=200,
+    responses=BACKGROUND_JOB_RESPONSES,
+)
+async def export_files(
+    project_id: str = Path(..., description="A unique project identifier"),
+    request: FileDownloadRequest = ...,
+    background: bool = Query(
+        True, description="Run as a background job and return its status (202)"
+    ),
+):
+    """Export project files and unpack the bundle on the server.
+
+    Not part of the Lokalise API. Starts an async export with the given
+    download options, polls its queued process with backoff, streams the
+    bundle to disk and extracts it file by file. Runs as a background job by
+    default (poll ``/jobs/{job_id}``); the bundle can then be fetched from
+    ``GET /files/export/{process_id}/bundle``.
+
+    Requires read_files OAuth access scope.
+    """
+
+    async def run(job: Job | None = None) -> dict[str, Any]:
+        return await file_export_service.export_project(
+            project_id, request, on_progress=job.report_progress if job else None
+        )
+
+    if not background:
+        return await run()
+
+    job = job_runner.submit("files.export", run)
+    return JSONResponse(status_code=202, content=job.model_dump(mode="json"))
+
+
+@router.get("/files/export/{process_id}/bundle", response_class=FileResponse)
+async def get_export_bundle(
+    project_id: str = Path(..., description="A unique project identifier"),
+    process_id: str = Path(..., description="Export process identifier"),
+):
+    """Download the zip bundle of a finished ``/files/export`` run."""
+    return FileResponse(
+        file_export_service.get_bundle_path(project_id, process_id),
+        media_type="application/zip",
+        filename=f"{project_id}-{process_id}.zip",
+    )
 
 
 @router.post(
@@ -98,7 +235,7 @@ async def download_files(
 
     Requires read_files OAuth access scope.
     """
-    raise HTTPException(status_code=501, detail="Not implemented")
+    return await lokalise_files_service.download(project_id, request)
 
 
 @router.delete("/files/{file_id}", response_model=FileDeleteResponse, status_code=200)
@@ -1,25 +1,58 @@
-from typing import Literal
+from typing import Any, Literal
 
-from fastapi import APIRouter, HTTPException, Path, Query, Response
+from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi.responses import JSONResponse
 
+from app.core.serialization import ModelResponse
+from app.schemas.jobs import BACKGROUND_JOB_RESPONSES
 from app.schemas.lokalise.keys import (
     KeyDeleteResponse,
+    KeysBulkResponse,
     KeysCreateRequest,
     KeysDeleteRequest,
     KeysDeleteResponse,
     KeySingleUpdateRequest,
     KeysUpdateRequest,
-    KeyUpdateResponse,
     ProjectKeyResponse,
     ProjectKeysResponse,
 )
+from app.services.job_runner import Job, job_runner
+from app.services.key_mirror import key_mirror_service
+from app.services.lokalise.keys import lokalise_keys_service
 
 router = APIRouter(tags=["lokalise-keys"])
 
 
+async def _write_keys(
+    project_id: str,
+    method: Literal["POST", "PUT"],
+    keys: list[dict[str, Any]],
+    use_automations: bool | None,
+    background: bool,
+) -> dict[str, Any] | JSONResponse:
+    """Run a bulk key write inline or as a background job."""
+
+    async def run(job: Job | None = None) -> dict[str, Any]:
+        result = await lokalise_keys_service.write_keys(
+            project_id,
+            method,
+            keys,
+            use_automations=use_automations,
+            on_progress=job.report_progress if job else None,
+        )
+        await key_mirror_service.apply_written_keys(project_id, result["keys"])
+        return result
+
+    if not background:
+        return await run()
+
+    kind = "keys.create" if method == "POST" else "keys.update"
+    job = job_runner.submit(kind, run, total=len(keys))
+    return JSONResponse(status_code=202, content=job.model_dump(mode="json"))
+
+
 @router.get("/keys", response_model=ProjectKeysResponse)
 async def list_project_keys(
-    response: Response,
     project_id: str = Path(..., description="A unique project identifier"),
     disable_references: int | None = Query(
         0, ge=0, le=1, description="Whether to disable key references"
@@ -82,12 +115,33 @@ async def list_project_keys(
     fetch results periodically, store them locally, and serve static content.
     Consider using the File Download endpoint with cloud storage integration.
 
+    Requests are served from the local key mirror (see
+    ``app.services.key_mirror``), which is bulk-loaded on first access and
+    refreshed incrementally in the background afterwards.
+
     Requires read_keys OAuth access scope.
     """
-    # Set X-Total-Count header based on results (placeholder)
-    response.headers["X-Total-Count"] = "0"
-
-    raise HTTPException(status_code=501, detail="Not implemented")
+    keys_response, headers = await key_mirror_service.list_keys(
+        project_id,
+        include_comments=bool(include_comments),
+        include_screenshots=bool(include_screenshots),
+        include_translations=bool(include_translations),
+        filter_translation_lang_ids=filter_translation_lang_ids,
+        filter_tags=filter_tags,
+        filter_filenames=filter_filenames,
+        filter_keys=filter_keys,
+        filter_key_ids=filter_key_ids,
+        filter_platforms=filter_platforms,
+        filter_untranslated=bool(filter_untranslated),
+        filter_qa_issues=filter_qa_issues,
+        filter_archived=filter_archived or "include",
+        pagination=pagination or "offset",
+        limit=limit or 100,
+        page=page or 1,
+        cursor=cursor,
+        disable_references=disable_references,
+    )
+    return ModelResponse(keys_response, headers=headers)
 
 
 @router.get("/keys/{key_id}", response_model=ProjectKeyResponse)
@@ -147,10 +201,18 @@ async def delete_key(
     raise HTTPException(status_code=501, detail="Not implemented")
 
 
-@router.post("/keys", response_model=ProjectKeysResponse, status_code=200)
+@router.post(
+    "/keys",
+    response_model=KeysBulkResponse,
+    status_code=200,
+    responses=BACKGROUND_JOB_RESPONSES,
+)
 async def create_keys(
     project_id: str = Path(..., description="A unique project identifier"),
     request: KeysCreateRequest = ...,
+    background: bool = Query(
+        False, description="Run as a background job and return its status (202)"
+    ),
 ):
     """Create one or more keys in the project.
 
@@ -160,15 +222,34 @@ async def create_keys(
     Creates one or more keys in the project. Requires Manage keys admin right.
     We recommend sending payload in chunks of up to 500 keys per request.
 
+    Any number of keys is accepted: they are split into chunks of 500 that are
+    sent concurrently within the Lokalise rate limit. Chunks that fail are
+    retried on their own, and keys that still fail are listed in ``errors``.
+    Large imports can pass ``background=true`` and poll ``/jobs/{job_id}``.
+
     Requires write_keys OAuth access scope.
     """
-    raise HTTPException(status_code=501, detail="Not implemented")
-
-
-@router.put("/keys", response_model=KeyUpdateResponse, status_code=200)
+    return await _write_keys(
+        project_id,
+        "POST",
+        [key.model_dump(exclude_none=True) for key in request.keys],
+        request.use_automations,
+        background,
+    )
+
+
+@router.put(
+    "/keys",
+    response_model=KeysBulkResponse,
+    status_code=200,
+    responses=BACKGROUND_JOB_RESPONSES,
+)
 async def update_keys(
     project_id: str = Path(..., description="A unique project identifier"),
     request: KeysUpdateRequest = ...,
+    background: bool = Query(
+        False, description="Run as a background job and return its status (202)"
+    ),
 ):
     """Update one or more keys in the project (multi-update).
 
@@ -178,9 +259,18 @@ async def update_keys(
     Updates one or more keys in the project. Requires Manage keys admin right.
     Supports merge options for tags and custom translation statuses.
 
+    Chunking, retries, error reporting and ``background`` behave as for key
+    creation.
+
     Requires write_keys OAuth access scope.
     """
-    raise HTTPException(status_code=501, detail="Not implemented")
+    return await _write_keys(
+        project_id,
+        "PUT",
+        [key.model_dump(exclude_none=True) for key in request.keys],
+        request.use_automations,
+        background,
+    )
 
 
 @router.delete("/keys", response_model=KeysDeleteResponse, status_code=200)
@@ -0,0 +1,70 @@
+"""Local key mirror endpoints (not part of the Lokalise API)."""
+
+from fastapi import APIRouter, Path, Query
+
+from app.schemas.key_mirror import (
+    KeyMirrorStatus,
+    KeyMirrorSyncResponse,
+    KeySearchResponse,
+)
+from app.services.key_mirror import key_mirror_service
+
+router = APIRouter(tags=["lokalise-mirror"])
+
+
+@router.get("/mirror", response_model=KeyMirrorStatus)
+async def get_mirror_status(
+    project_id: str = Path(..., description="A unique project identifier"),
+):
+    """Return the sync state of the local key/translation mirror."""
+    return await key_mirror_service.get_status(project_id)
+
+
+@router.post("/mirror/sync", response_model=KeyMirrorSyncResponse)
+async def sync_mirror(
+    project_id: str = Path(..., description="A unique project identifier"),
+    full: bool = Query(
+        False, description="Reload every key instead of syncing only changes"
+    ),
+):
+    """
+    Synchronise the local key/translation mirror with Lokalise.
+
+    The first sync of a project is always a full bulk load. Subsequent syncs
+    list lightweight key headers and re-fetch only keys whose modification
+    timestamps changed.
+    """
+    return await key_mirror_service.sync_project(project_id, full=full)
+
+
+@router.get("/mirror/search", response_model=KeySearchResponse)
+async def search_mirror(
+    project_id: str = Path(..., description="A unique project identifier"),
+    q: str = Query(..., min_length=1, description="Search text; all words must match"),
+    fields: str | None = Query(
+        None,
+        description="Comma-separated fields to search: name, description, translation "
+        "(default: all)",
+    ),
+    filter_lang_iso: str | None = Query(
+        None, description="Comma-separated language codes to match translations in"
+    ),
+    prefix: bool = Query(True, description="Match words as prefixes"),
+    limit: int = Query(20, ge=1, le=100, description="Number of items per page"),
+    page: int = Query(1, ge=1, description="Page number"),
+):
+    """
+    Full-text search over key names, descriptions and translations.
+
+    Results are ranked by BM25 relevance from the local mirror; matches in key
+    names rank above matches in descriptions and translations.
+    """
+    return await key_mirror_service.search_keys(
+        project_id,
+        q,
+        fields=fields,
+        filter_lang_iso=filter_lang_iso,
+        prefix=prefix,
+        limit=limit,
+        page=page,
+    )
@@ -2,12 +2,13 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi import APIRouter, Path, Query
 
 from app.schemas.lokalise.queued_processes import (
     ProjectProcessesResponse,
     ProjectProcessResponse,
 )
+from app.services.lokalise.processes import lokalise_processes_service
 
 router = APIRouter(tags=["lokalise-processes"])
 
@@ -49,7 +50,9 @@ async def list_processes(
     Returns:
         ProjectProcessesResponse: Project processes with project_id and processes list
     """
-    raise HTTPException(status_code=501, detail="Not implemented")
+    return await lokalise_processes_service.list_processes(
+        project_id, limit=limit, page=page
+    )
 
 
 @router.get("/processes/{process_id}", response_model=ProjectProcessResponse)
@@ -78,4 +81,4 @@ async def retrieve_process(
     Returns:
         ProjectProcessResponse: Project process with project_id and single process object
     """
-    raise HTTPException(status_code=501, detail="Not implemented")
+    return await lokalise_processes_service.get_process(project_id, process_id)
@@ -1,17 +1,18 @@
-from fastapi import APIRouter, HTTPException, Path, Query, Response
+from fastapi import APIRouter, HTTPException, Path, Query
 
+from app.core.serialization import ModelResponse
 from app.schemas.lokalise.translations import (
     TranslationResponse,
     TranslationsResponse,
     TranslationUpdateRequest,
 )
+from app.services.key_mirror import key_mirror_service
 
 router = APIRouter(tags=["lokalise-project-translations"])
 
 
 @router.get("/translations", response_model=TranslationsResponse)
 async def list_project_translations(
-    response: Response,
     project_id: str = Path(..., description="A unique project identifier"),
     disable_references: int | None = Query(
         None,
@@ -68,13 +69,26 @@ async def list_project_translations(
     Mirrors Lokalise API endpoint:
     GET https://api.lokalise.com/api2/projects/{project_id}/translations
 
+    Served from the local key mirror; requests filtering by QA issues are
+    passed through to Lokalise.
+
     Requires read_translations OAuth access scope.
     """
-    # Set X-Total-Count header based on results (placeholder)
-    response.headers["X-Total-Count"] = "0"
-
-    # TODO: implement service call when services are ready
-    raise HTTPException(status_code=501, detail="Not implemented")
+    translations_response, headers = await key_mirror_service.list_translations(
+        project_id,
+        filter_lang_id=filter_lang_id,
+        filter_is_reviewed=bool(filter_is_reviewed),
+        filter_unverified=bool(filter_unverified),
+        filter_untranslated=bool(filter_untranslated),
+        filter_qa_issues=filter_qa_issues,
+        filter_active_task_id=filter_active_task_id,
+        pagination=pagination or "offset",
+        limit=limit or 100,
+        page=page or 1,
+        cursor=cursor,
+        disable_references=disable_references,
+    )
+    return ModelResponse(translations_response, headers=headers)
 
 
 @router.get("/translations/{translation_id}", response_model=TranslationResponse)
@@ -0,0 +1,85 @@
+from collections.abc import Iterator
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import MetricFamily, metrics_registry
+from app.services.evaluation_cache import evaluation_cache
+from app.services.lokalise.rate_limiter import lokalise_rate_limiter
+from app.services.lokalise.retry import lokalise_retry_stats
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _retry_family(
+    name: str, documentation: str, counts: dict[str, int]
+) -> MetricFamily:
+    family = MetricFamily(name, documentation, "counter", ("method", "reason"))
+    for key, count in counts.items():
+        method, _, reason = key.partition(" ")
+        family.add(count, method, reason)
+    return family
+
+
+def collect_service_metrics() -> Iterator[MetricFamily]:
+    """Counters kept by the services themselves, read at scrape time."""
+    cache = evaluation_cache.stats()
+    yield MetricFamily(
+        "evaluation_cache_hits_total",
+        "Translation evaluations served from the cache.",
+        "counter",
+        samples=[((), cache["hits"])],
+    )
+    yield MetricFamily(
+        "evaluation_cache_misses_total",
+        "Translation evaluations not found in the cache.",
+        "counter",
+        samples=[((), cache["misses"])],
+    )
+    yield MetricFamily(
+        "evaluation_cache_memory_entries",
+        "Evaluations held in the in-memory cache tier.",
+        "gauge",
+        samples=[((), cache["memory_entries"])],
+    )
+    yield MetricFamily(
+        "lokalise_rate_limiter_queue_depth",
+        "Lokalise requests waiting for a rate limiter slot.",
+        "gauge",
+        samples=[((), lokalise_rate_limiter.queue_depth)],
+    )
+
+    retries = lokalise_retry_stats.snapshot()
+    yield _retry_family(
+        "lokalise_retries_total", "Retried Lokalise requests.", retries["retries"]
+    )
+    yield _retry_family(
+        "lokalise_retries_exhausted_total",
+        "Lokalise requests that still failed after all retries.",
+        retries["exhausted"],
+    )
+    yield MetricFamily(
+        "lokalise_ambiguous_writes_total",
+        "Lokalise writes that failed in a way that may have applied them.",
+        "counter",
+        samples=[((), retries["ambiguous_writes"])],
+    )
+
+
+metrics_registry.register_collector(collect_service_metrics)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """
+    Get process metrics in the Prometheus text format.
+
+    Includes per-stage latency histograms of the translation and evaluation
+    pipelines, Lokalise request latencies by endpoint, evaluation cache hits
+    and misses, the Lokalise rate limiter queue and retry counters.
+    """
+    return PlainTextResponse(
+        metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE
+    )
@@ -0,0 +1,50 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Path
+from fastapi.responses import FileResponse
+
+from app.core.profiling import request_profiler
+from app.schemas.profiles import ProfileInfo
+
+
+def require_profiling_token(
+    x_profile_token: str | None = Header(None, description="PROFILING_TOKEN"),
+) -> None:
+    """Reject requests without the profiling token."""
+    if not request_profiler.authorized(x_profile_token):
+        raise HTTPException(status_code=403, detail="Profiling not authorized")
+
+
+router = APIRouter(dependencies=[Depends(require_profiling_token)])
+
+
+@router.get("", response_model=list[ProfileInfo])
+async def list_profiles():
+    """
+    List stored request profiles, newest first.
+
+    Profile a request by sending it with ``X-Profile: sample`` (or
+    ``cprofile``) and ``X-Profile-Token``; its profile id is returned in
+    ``X-Profile-Id``.
+    """
+    return [asdict(profile) for profile in request_profiler.profiles()]
+
+
+@router.get("/{profile_id}", response_class=FileResponse)
+async def download_profile(
+    profile_id: str = Path(..., description="Profile identifier (X-Profile-Id)"),
+):
+    """
+    Download a request profile.
+
+    Sampled profiles are collapsed stacks (``.folded``) for flamegraph.pl or
+    speedscope; ``cprofile`` profiles are pstats files (``.prof``) for
+    snakeviz or flameprof.
+    """
+    profile = request_profiler.get(profile_id)
+    if profile is None or not profile.file.exists():
+        raise HTTPException(status_code=404, detail=f"Profile {profile_id} not found")
+    media_type = (
+        "text/plain" if profile.mode == "sample" else "application/octet-stream"
+    )
+    return FileResponse(profile.file, media_type=media_type, filename=profile.file.name)
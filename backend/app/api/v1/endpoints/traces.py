@@ -0,0 +1,74 @@
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query
+
+from app.core.config import get_settings
+from app.core.tracing import Span, tracer
+from app.schemas.traces import SpanRecord, TraceDetail, TraceSummary
+
+
+def require_tracing_token(
+    x_trace_token: str | None = Header(None, description="TRACING_TOKEN"),
+) -> None:
+    """Reject requests without the tracing token (never served without one)."""
+    token = get_settings().TRACING_TOKEN
+    if (
+        not token
+        or not x_trace_token
+        or not secrets.compare_digest(x_trace_token.encode(), token.encode())
+    ):
+        raise HTTPException(status_code=403, detail="Trace viewer not authorized")
+
+
+router = APIRouter(dependencies=[Depends(require_tracing_token)])
+
+
+def _summary(trace_id: str, spans: list[Span]) -> dict:
+    root = next((span for span in spans if span.parent_id is None), spans[0])
+    return {
+        "trace_id": trace_id,
+        "name": root.name,
+        "start_time_ns": spans[0].start_ns,
+        "duration_ms": root.duration_ms or 0.0,
+        "span_count": len(spans),
+        "error": any(span.status == "error" for span in spans),
+    }
+
+
+@router.get("", response_model=list[TraceSummary])
+async def list_traces(
+    limit: int = Query(50, ge=1, le=1000, description="Maximum traces to return"),
+):
+    """
+    List the most recent recorded traces, newest first.
+
+    Only sampled traces (``TRACING_SAMPLE_RATE``) are recorded, and only the
+    latest ``TRACING_BUFFER_TRACES`` are kept.
+    """
+    return [_summary(spans[0].trace_id, spans) for spans in tracer.buffer.recent(limit)]
+
+
+@router.get("/{trace_id}", response_model=TraceDetail)
+async def get_trace(
+    trace_id: str = Path(..., description="Trace identifier (e.g. from X-Trace-Id)"),
+):
+    """Get the spans of a recorded trace."""
+    spans = tracer.buffer.get(trace_id)
+    if spans is None:
+        raise HTTPException(status_code=404, detail=f"Trace {trace_id} not found")
+    return {
+        **_summary(trace_id, spans),
+        "spans": [
+            SpanRecord(
+                span_id=span.span_id,
+                parent_id=span.parent_id,
+                name=span.name,
+                start_time_ns=span.start_ns,
+                duration_ms=span.duration_ms or 0.0,
+                status=span.status,
+                error=span.error,
+                attributes=span.attributes,
+            )
+            for span in spans
+        ],
+    }
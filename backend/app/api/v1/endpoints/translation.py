@@ -1,7 +1,9 @@
-import logging
+from collections.abc import AsyncIterator
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
+from app.core.logging import get_logger
 from app.schemas.glossary_translation import (
     GlossaryBatchTranslationRequest,
     GlossaryBatchTranslationResponse,
@@ -16,6 +18,9 @@ from app.schemas.translation import (
     TranslationResponse,
 )
 from app.schemas.translation_evaluation import (
+    BatchEvaluationCorpusResult,
+    BatchEvaluationRequest,
+    BatchEvaluationSegmentResult,
     TranslationEvaluationRequest,
     TranslationEvaluationResponse,
 )
@@ -25,7 +30,7 @@ from app.services.translation_evaluation_service import translation_evaluation_s
 
 router = APIRouter()
 
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 @router.post("/translate", response_model=TranslationResponse)
@@ -108,14 +113,6 @@ async def translate_with_glossary(request: GlossaryTranslationRequest):
         Glossary translation response with verification results
     """
     try:
-        logger.info("=== STARTING GLOSSARY TRANSLATION ===")
-        logger.info(
-            f"Request: source_text='{request.source_text}', source_lang='{request.source_lang}', target_lang='{request.target_lang}', project_id='{request.project_id}'"
-        )
-        logger.info(
-            f"Settings: preserve_forbidden_terms={request.preserve_forbidden_terms}, translate_allowed_terms={request.translate_allowed_terms}"
-        )
-
         result = await glossary_aware_translation_service.translate_with_glossary(
             source_text=request.source_text,
             source_lang=request.source_lang,
@@ -125,10 +122,6 @@ async def translate_with_glossary(request: GlossaryTranslationRequest):
             translate_allowed_terms=request.translate_allowed_terms,
         )
 
-        logger.info(f"Translation service returned: {list(result.keys())}")
-        logger.info(f"Translated text length: {len(result['translated_text'])}")
-        logger.info(f"Found {len(result['glossary_terms_found'])} glossary terms")
-
         response = GlossaryTranslationResponse(
             translated_text=result["translated_text"],
             source_text=result["source_text"],
@@ -139,14 +132,10 @@ async def translate_with_glossary(request: GlossaryTranslationRequest):
             verification_results=VerificationResults(**result["verification_results"]),
         )
 
-        logger.info("=== GLOSSARY TRANSLATION COMPLETED SUCCESSFULLY ===")
         return response
 
     except Exception as e:
-        logger.error("=== GLOSSARY TRANSLATION FAILED ===")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error(f"Error message: {e!s}")
-        logger.error("Full error details:", exc_info=True)
+        logger.exception("Glossary translation failed")
         raise HTTPException(
             status_code=500,
             detail=f"Failed to translate with glossary: {e!s}",
@@ -229,13 +218,6 @@ async def evaluate_translation(request: TranslationEvaluationRequest):
         Translation evaluation response with metric scores and assessment
     """
     try:
-        logger.info("=== STARTING TRANSLATION EVALUATION ===")
-        logger.info(
-            f"Request: source='{request.source_text}' ({request.source_lang}), "
-            f"translation='{request.translated_text}' ({request.target_lang}), "
-            f"reference='{request.reference_text}', project_id='{request.project_id}'"
-        )
-
         result = await translation_evaluation_service.evaluate_translation(
             source_text=request.source_text,
             source_lang=request.source_lang,
@@ -243,19 +225,75 @@ async def evaluate_translation(request: TranslationEvaluationRequest):
             target_lang=request.target_lang,
             reference_text=request.reference_text,
             project_id=request.project_id,
+            force_llm=request.force_llm,
         )
 
         response = TranslationEvaluationResponse(**result)
 
-        logger.info("=== TRANSLATION EVALUATION COMPLETED SUCCESSFULLY ===")
         return response
 
     except Exception as e:
-        logger.error("=== TRANSLATION EVALUATION FAILED ===")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error(f"Error message: {e!s}")
-        logger.error("Full error details:", exc_info=True)
+        logger.exception("Translation evaluation failed")
         raise HTTPException(
             status_code=500,
             detail=f"Failed to evaluate translation: {e!s}",
         ) from e
+
+
+@router.post(
+    "/evaluate/batch",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": (
+                "Newline-delimited JSON: one BatchEvaluationSegmentResult per "
+                "segment in request order, then one BatchEvaluationCorpusResult"
+            ),
+            "content": {"application/x-ndjson": {}},
+        }
+    },
+)
+async def evaluate_translation_batch(request: BatchEvaluationRequest):
+    """
+    Evaluate many translations against references at corpus level.
+
+    Sentence-level BLEU, chrF, TER and edit distance are computed for each
+    segment in worker processes and streamed back as NDJSON while the rest
+    of the batch is still being scored. The last line holds corpus-level
+    BLEU, chrF and TER over all segments. With ``include_llm_feedback``, each
+    segment also gets LLM feedback, requested for many segments at a time.
+
+    Args:
+        request: Batch evaluation request
+
+    Returns:
+        Streaming NDJSON response with per-segment and corpus results
+    """
+    logger.info(
+        "Batch evaluation of %s segments (%s -> %s)",
+        len(request.segments),
+        request.source_lang,
+        request.target_lang,
+    )
+    segments = request.segments
+
+    async def lines() -> AsyncIterator[bytes]:
+        results = translation_evaluation_service.evaluate_batch(
+            hypotheses=[segment.translated_text for segment in segments],
+            references=[segment.reference_text for segment in segments],
+            sources=[segment.source_text for segment in segments]
+            if request.include_llm_feedback
+            else None,
+            source_lang=request.source_lang,
+            target_lang=request.target_lang,
+        )
+        async for result in results:
+            if result["type"] == "segment":
+                line = BatchEvaluationSegmentResult(
+                    **result, id=segments[result["index"]].id
+                )
+            else:
+                line = BatchEvaluationCorpusResult(**result)
+            yield line.model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
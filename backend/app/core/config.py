@@ -1,4 +1,6 @@
 from functools import lru_cache
+from pathlib import Path
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 
@@ -25,9 +27,110 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: str | None = None
     LOKALISE_API_TOKEN: str | None = None
 
+    # Lokalise API traffic limits (Lokalise allows 6 requests/second per token)
+    LOKALISE_MAX_REQUESTS_PER_SECOND: float = 6.0
+    LOKALISE_MAX_CONCURRENT_REQUESTS: int = 4
+
+    # Retries of transient Lokalise failures (see app.services.lokalise.retry)
+    LOKALISE_RETRY_MAX_ATTEMPTS: int = 5
+    LOKALISE_RETRY_BASE_DELAY_SECONDS: float = 0.5
+    LOKALISE_RETRY_MAX_DELAY_SECONDS: float = 20.0
+    LOKALISE_RETRY_MAX_RETRY_AFTER_SECONDS: float = 120.0
+
+    # Local storage (key mirror databases, job state, ...)
+    DATA_DIR: str = str(Path(__file__).parent.parent.parent / "data")
+
+    # Exported bundles and their extracted files are deleted after this age
+    EXPORT_RETENTION_SECONDS: float = 86400.0
+
+    # Key mirror settings
+    KEY_MIRROR_SYNC_INTERVAL_SECONDS: int = 300
+
+    # Cached project languages used to resolve ISO codes to language IDs
+    LANGUAGE_REGISTRY_TTL_SECONDS: float = 3600.0
+    # Minimum age of cached languages before an unknown code reloads them
+    LANGUAGE_REGISTRY_RELOAD_INTERVAL_SECONDS: float = 30.0
+
+    # Translation evaluation settings (None workers = one per CPU)
+    EVALUATION_EXECUTOR: Literal["thread", "process"] = "process"
+    EVALUATION_WORKERS: int | None = None
+    EVALUATION_METRIC_TIMEOUT_SECONDS: float = 10.0
+    # Longer texts only get the linear-time metrics (BLEU, chrF)
+    EVALUATION_FULL_METRICS_MAX_CHARS: int = 5000
+    # Stages of a single evaluation run concurrently within the deadline
+    EVALUATION_GLOSSARY_TIMEOUT_SECONDS: float = 20.0
+    EVALUATION_LLM_TIMEOUT_SECONDS: float = 30.0
+    EVALUATION_DEADLINE_SECONDS: float = 35.0
+    # Tiered evaluation: the LLM judge only runs when chrF falls between these
+    # bounds (or cannot be computed) and glossary compliance is not poor
+    EVALUATION_CHRF_FAIL_BELOW: float = 40.0
+    EVALUATION_CHRF_PASS_ABOVE: float = 75.0
+    EVALUATION_GLOSSARY_FAIL_BELOW: float = 60.0
+    # Evaluation result cache (memory LRU entries, persisted entry lifetime)
+    EVALUATION_CACHE_MAX_ENTRIES: int = 1000
+    EVALUATION_CACHE_TTL_SECONDS: float = 86400.0
+
+    # Glossary file uploads: largest accepted file, concurrent create requests,
+    # and terms per request (adapted between the bounds to keep requests near
+    # the target duration)
+    GLOSSARY_MAX_FILE_BYTES: int = 50 * 1024 * 1024
+    GLOSSARY_UPLOAD_CONCURRENCY: int = 3
+    GLOSSARY_UPLOAD_BATCH_SIZE: int = 50
+    GLOSSARY_UPLOAD_MIN_BATCH_SIZE: int = 5
+    GLOSSARY_UPLOAD_MAX_BATCH_SIZE: int = 200
+    GLOSSARY_UPLOAD_TARGET_BATCH_SECONDS: float = 5.0
+
+    # Project-wide glossary compliance scans (keys per worker task, sample
+    # violations listed per language)
+    GLOSSARY_SCAN_CHUNK_SIZE: int = 2000
+    GLOSSARY_SCAN_SAMPLE_LIMIT: int = 20
+
+    # Batched LLM judge settings (token counts estimated from text length)
+    LLM_JUDGE_INPUT_TOKEN_BUDGET: int = 24000
+    LLM_JUDGE_MAX_OUTPUT_TOKENS: int = 8192
+    LLM_JUDGE_OUTPUT_TOKENS_PER_ITEM: int = 350
+    LLM_JUDGE_MAX_CONCURRENT_REQUESTS: int = 4
+
     # Environment
     ENVIRONMENT: str = "development"
+
+    # Prometheus metrics (/metrics); series per metric are capped, and project
+    # labels can be dropped when there are many projects
+    METRICS_ENABLED: bool = True
+    METRICS_MAX_SERIES: int = 2000
+    METRICS_PROJECT_LABELS: bool = True
+
+    # Request tracing: share of traces recorded, recent traces kept for
+    # /debug/traces, and an optional OTLP/JSON export file in logs/. The trace
+    # viewer needs TRACING_TOKEN in X-Trace-Token (never without a token)
+    TRACING_ENABLED: bool = True
+    TRACING_SAMPLE_RATE: float = 1.0
+    TRACING_BUFFER_TRACES: int = 200
+    TRACING_EXPORT_FILE: str | None = None
+    TRACING_TOKEN: str | None = None
+
+    # On-demand profiling of requests sent with X-Profile and X-Profile-Token
+    # (never without a token); profiles are kept in logs/<PROFILING_DIR>
+    PROFILING_ENABLED: bool = False
+    PROFILING_TOKEN: str | None = None
+    PROFILING_DIR: str = "profiles"
+    PROFILING_KEEP: int = 20
+    PROFILING_SAMPLE_INTERVAL_MS: float = 5.0
+    # Event loop stalls at least this long are counted as blocks
+    PROFILING_LOOP_BLOCK_THRESHOLD_MS: float = 50.0
+
+    # Logging (records are written by a background thread)
     LOG_LEVEL: str = "INFO"
+    # Levels of single modules, e.g. {"app.services.glossary_processor": "DEBUG"}
+    LOG_LEVELS: dict[str, str] = {}
+    LOG_FILE: str | None = "app.log"
+    LOG_CONSOLE_FORMAT: Literal["text", "json"] = "text"
+    # Source/target texts in log records are cut to this length (or hidden)
+    LOG_TEXT_MAX_CHARS: int = 80
+    LOG_REDACT_TEXT: bool = False
+    # Debug records kept per call site and interval; the rest are dropped
+    LOG_DEBUG_SAMPLE_LIMIT: int = 20
+    LOG_DEBUG_SAMPLE_INTERVAL_SECONDS: float = 10.0
 
     class Config:
         case_sensitive = True
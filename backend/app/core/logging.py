@@ -1,57 +1,278 @@
+"""
+Application logging.
+
+Loggers only put records on an in-memory queue; a background listener thread
+formats them and writes the log file and the console, so no I/O happens on
+the event loop. Messages with ``%`` arguments (``logger.debug("Found %s",
+term)``) are only rendered for records that pass the level and sampling
+filters, so filtered-out calls cost next to nothing. Rendering happens when a
+record is queued, so arguments changed by the caller afterwards are logged as
+they were.
+
+Modules log through ``get_logger(__name__)``, so levels can be set per module
+(``LOG_LEVELS``). The log file holds one JSON object per record; ``extra``
+fields are kept as JSON fields, and records logged within a trace carry its
+``trace_id``. Debug records are sampled per call site, and
+source/target texts are logged through ``excerpt``, which truncates or
+redacts them.
+"""
+
+import atexit
+import copy
+import json
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import cast
+from typing import Any, Literal
+
+from app.core.config import Settings, get_settings
+from app.core.tracing import current_trace_id
 
 # Create logs directory if it doesn't exist
 logs_dir = Path(__file__).parent.parent.parent / "logs"
 logs_dir.mkdir(exist_ok=True)
 
+# Attributes of every LogRecord; anything else came in through ``extra``
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime"}
+
+# Text logging policy, set by setup_logging
+_text_max_chars = 80
+_redact_text = False
+
+_listener: QueueListener | None = None
+
+
+class _Excerpt:
+    """Text rendered truncated or redacted, only when the record is written."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str | None):
+        self.text = text
+
+    def __str__(self) -> str:
+        text = self.text or ""
+        if _redact_text:
+            return f"<{len(text)} chars>"
+        if len(text) <= _text_max_chars:
+            return text
+        return f"{text[:_text_max_chars]}… (+{len(text) - _text_max_chars} chars)"
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+
+def excerpt(text: str | None) -> _Excerpt:
+    """Wrap a source/target text for logging under the text policy."""
+    return _Excerpt(text)
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(
+            (key, value)
+            for key, value in record.__dict__.items()
+            if key not in _RECORD_ATTRIBUTES
+        )
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Rate-limits records at or below a level, per call site.
+
+    At most ``limit`` records of each call site pass per interval. The first
+    record let through after some were dropped carries their number in a
+    ``sampled_out`` field.
+    """
+
+    def __init__(self, limit: int, interval_seconds: float, level: int = logging.DEBUG):
+        super().__init__()
+        self.limit = limit
+        self.interval_seconds = interval_seconds
+        self.level = level
+        # (path, line) -> [window start, records passed, records dropped]
+        self._windows: dict[tuple[str, int], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.level:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.setdefault(
+                (record.pathname, record.lineno), [now, 0, 0]
+            )
+            if now - window[0] >= self.interval_seconds:
+                window[0], window[1] = now, 0
+            if window[1] >= self.limit:
+                window[2] += 1
+                return False
+            window[1] += 1
+            dropped, window[2] = window[2], 0
+        if dropped:
+            record.sampled_out = int(dropped)
+        return True
+
+
+def _add_trace_id(record: logging.LogRecord) -> bool:
+    """Tag a record with the current trace (runs in the caller, before queueing)."""
+    trace_id = current_trace_id()
+    if trace_id is not None:
+        record.trace_id = trace_id
+    return True
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Queues records with their message rendered, leaving output formatting to
+    the listener thread.
+
+    Unlike ``QueueHandler.prepare`` the traceback is kept apart from the
+    message (in ``exc_text``), so the JSON formatter still logs it as its own
+    field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
 
 def setup_logging(
     log_level: str = "INFO",
     log_file: str | None = "app.log",
     max_bytes: int = 10 * 1024 * 1024,  # 10MB
     backup_count: int = 5,
+    *,
+    module_levels: dict[str, str] | None = None,
+    console_format: Literal["text", "json"] = "text",
+    text_max_chars: int = 80,
+    redact_text: bool = False,
+    debug_sample_limit: int = 20,
+    debug_sample_interval: float = 10.0,
 ) -> logging.Logger:
     """
     Set up logging configuration for the application.
 
+    Calling it again replaces the previous configuration.
+
     Args:
         log_level: The logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        log_file: Name of the log file
+        log_file: Name of the log file (JSON lines)
         max_bytes: Maximum size of each log file before rotation
         backup_count: Number of backup log files to keep
+        module_levels: Levels of single loggers by name
+        console_format: "text" for human-readable console output or "json"
+        text_max_chars: Length source/target texts are cut to
+        redact_text: Hide source/target texts entirely
+        debug_sample_limit: Debug records kept per call site and interval
+        debug_sample_interval: Sampling interval in seconds
 
     Returns:
         logging.Logger: Configured logger instance
     """
+    global _listener, _text_max_chars, _redact_text  # noqa: PLW0603
+
+    _text_max_chars = text_max_chars
+    _redact_text = redact_text
+
     # Create logger
     logger = logging.getLogger("app")
-    logger.setLevel(cast(int, getattr(logging, log_level.upper())))
-
-    # Create formatters
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    console_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    logger.setLevel(log_level.upper())
+    for name, level in (module_levels or {}).items():
+        logging.getLogger(name).setLevel(level.upper())
 
-    # File handler
+    # Writers, run by the listener thread
+    handlers: list[logging.Handler] = []
     if log_file:
         file_handler = RotatingFileHandler(
-            logs_dir / log_file, maxBytes=max_bytes, backupCount=backup_count
+            logs_dir / log_file,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
         )
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
 
-    # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(
+        JsonFormatter()
+        if console_format == "json"
+        else logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    handlers.append(console_handler)
+
+    shutdown_logging()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(debug_sample_limit, debug_sample_interval))
+    queue_handler.addFilter(_add_trace_id)
+    logger.addHandler(queue_handler)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     return logger
 
 
+def shutdown_logging() -> None:
+    """Write out queued records and stop the listener thread."""
+    global _listener  # noqa: PLW0603
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger of a module (``get_logger(__name__)``), under the app logger."""
+    return logging.getLogger(name)
+
+
+def configure_logging(settings: Settings | None = None) -> logging.Logger:
+    """Set up logging from the application settings."""
+    settings = settings or get_settings()
+    return setup_logging(
+        settings.LOG_LEVEL,
+        settings.LOG_FILE,
+        module_levels=settings.LOG_LEVELS,
+        console_format=settings.LOG_CONSOLE_FORMAT,
+        text_max_chars=settings.LOG_TEXT_MAX_CHARS,
+        redact_text=settings.LOG_REDACT_TEXT,
+        debug_sample_limit=settings.LOG_DEBUG_SAMPLE_LIMIT,
+        debug_sample_interval=settings.LOG_DEBUG_SAMPLE_INTERVAL_SECONDS,
+    )
+
+
 # Create default logger instance
-logger = setup_logging()
+logger = configure_logging()
+atexit.register(shutdown_logging)
@@ -0,0 +1,309 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+Counters and histograms are kept in memory per label set and rendered on
+scrape by the ``/metrics`` endpoint; values that other services already
+count (cache hits, limiter queue, retries) are read at scrape time through
+collectors instead of being counted twice.
+
+Label values are free text, so every metric caps its number of series at
+``METRICS_MAX_SERIES``: once reached, new label sets are counted under
+``other``. Project labels can be switched off entirely with
+``METRICS_PROJECT_LABELS`` for deployments with many projects.
+"""
+
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from app.core.config import get_settings
+from app.core.tracing import tracer
+
+# Latency buckets in seconds, from in-memory stages to slow LLM calls
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+OVERFLOW_LABEL = "other"
+
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+@dataclass
+class MetricFamily:
+    """A metric and its samples, as produced by a collector."""
+
+    name: str
+    documentation: str
+    kind: str  # "counter" or "gauge"
+    labelnames: Labels = ()
+    samples: list[tuple[Labels, float]] = field(default_factory=list)
+
+    def add(self, value: float, *labelvalues: str) -> None:
+        self.samples.append((labelvalues, value))
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for labelvalues, value in self.samples:
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+
+class _Metric(ABC):
+    """Base of metrics whose series are keyed by label values."""
+
+    kind = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        max_series: int,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.max_series = max_series
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str | None], series: dict) -> Labels:
+        """Label values of a sample (``other`` once the series cap is hit)."""
+        key = tuple(str(labels.get(name) or "") for name in self.labelnames)
+        if key not in series and len(series) >= self.max_series:
+            key = (OVERFLOW_LABEL,) * len(self.labelnames)
+        return key
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self._render_samples()
+
+    @abstractmethod
+    def _render_samples(self) -> Iterator[str]:
+        """Sample lines of every series of the metric."""
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str | None) -> None:
+        with self._lock:
+            key = self._key(labels, self._values)
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str | None) -> float:
+        key = tuple(str(labels.get(name) or "") for name in self.labelnames)
+        return self._values.get(key, 0)
+
+    def _render_samples(self) -> Iterator[str]:
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Distribution of observed values (e.g. durations) per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (last is +Inf), sum]
+        self._series: dict[Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str | None) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            key = self._key(labels, self._series)
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    @contextmanager
+    def time(self, **labels: str | None) -> Iterator[None]:
+        """Observe the duration of the block in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str | None) -> int:
+        key = tuple(str(labels.get(name) or "") for name in self.labelnames)
+        series = self._series.get(key)
+        return sum(series[0]) if series else 0
+
+    def _render_samples(self) -> Iterator[str]:
+        with self._lock:
+            snapshot = [
+                (key, list(counts), total[0])
+                for key, (counts, total) in self._series.items()
+            ]
+        names = (*self.labelnames, "le")
+        for key, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts, strict=True):
+                cumulative += count
+                labels = _format_labels(names, (*key, _format_value(bound)))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+class MetricsRegistry:
+    """Metrics of the process, rendered together on scrape."""
+
+    def __init__(self, max_series: int):
+        self.max_series = max_series
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Collector] = []
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._add(Counter(name, documentation, labelnames, self.max_series))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._add(
+            Histogram(name, documentation, labelnames, self.max_series, buckets=buckets)
+        )
+
+    def register_collector(self, collector: Collector) -> None:
+        """Add a callable producing metrics read at scrape time."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text format."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for family in collector():
+                lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+    def _add[MetricT: _Metric](self, metric: MetricT) -> MetricT:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+
+_settings = get_settings()
+metrics_registry = MetricsRegistry(max_series=_settings.METRICS_MAX_SERIES)
+
+stage_duration_seconds = metrics_registry.histogram(
+    "pipeline_stage_duration_seconds",
+    "Duration of translation and evaluation pipeline stages.",
+    ("stage", "project", "lang_pair"),
+)
+stage_failures_total = metrics_registry.counter(
+    "pipeline_stage_failures_total",
+    "Pipeline stages that raised an error.",
+    ("stage", "project", "lang_pair"),
+)
+lokalise_request_duration_seconds = metrics_registry.histogram(
+    "lokalise_request_duration_seconds",
+    "Duration of Lokalise API requests (each attempt), including rate limiting.",
+    ("method", "endpoint", "status"),
+)
+
+
+def stage_labels(
+    project_id: str | None = None,
+    source_lang: str | None = None,
+    target_lang: str | None = None,
+) -> dict[str, str]:
+    """Project and language pair labels of a pipeline stage."""
+    return {
+        "project": (project_id or "") if _settings.METRICS_PROJECT_LABELS else "",
+        "lang_pair": f"{source_lang or ''}-{target_lang}" if target_lang else "",
+    }
+
+
+@contextmanager
+def track_stage(stage: str, **labels: str) -> Iterator[None]:
+    """
+    Record the duration of a pipeline stage, and its failure.
+
+    The stage also runs in a span of the current trace.
+
+    Args:
+        stage: Stage name (e.g. "term_matching")
+        labels: Project and language pair labels (see ``stage_labels``)
+    """
+    started = time.perf_counter()
+    try:
+        with tracer.span(stage, **labels):
+            yield
+    except Exception:
+        stage_failures_total.inc(stage=stage, **labels)
+        raise
+    finally:
+        stage_duration_seconds.observe(
+            time.perf_counter() - started, stage=stage, **labels
+        )
+
+
+async def timed[T](awaitable: Awaitable[T], stage: str, **labels: str) -> T:
+    """Await a pipeline stage, recording it like ``track_stage``."""
+    with track_stage(stage, **labels):
+        return await awaitable
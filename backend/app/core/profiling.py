@@ -0,0 +1,350 @@
+"""
+On-demand profiling of single requests.
+
+With ``PROFILING_ENABLED``, a request sent with an ``X-Profile`` header and the
+``PROFILING_TOKEN`` in ``X-Profile-Token`` is run under a profiler:
+
+- ``sample`` (default) samples the event loop thread's stack every
+  ``PROFILING_SAMPLE_INTERVAL_MS`` from a helper thread and stores collapsed
+  stacks (``<id>.folded``), the input of flamegraph.pl, speedscope and
+  similar tools. Overhead is low and does not depend on the code profiled.
+- ``cprofile`` runs the deterministic ``cProfile`` profiler and stores its
+  stats (``<id>.prof``, for pstats, snakeviz or flameprof).
+
+Both see everything running on the event loop while the request is handled,
+including other requests, so profile on a quiet worker. Work offloaded to
+threads or processes is not profiled. The event loop's lag is measured during
+the request as well: a watcher task reports how late it was woken up, which is
+how long the loop was blocked by synchronous code.
+
+The response carries the profile id in ``X-Profile-Id``; profiles are kept in
+``logs/<PROFILING_DIR>`` (the latest ``PROFILING_KEEP``) and served by the
+``/debug/profiles`` endpoints. One request is profiled at a time.
+"""
+
+import asyncio
+import cProfile
+import secrets
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from types import FrameType
+from typing import Literal
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.tracing import current_trace_id
+
+logger = get_logger(__name__)
+
+# Parent of the profile directory (shared with the application log)
+logs_dir = Path(__file__).parent.parent.parent / "logs"
+
+PROFILE_HEADER = "X-Profile"
+TOKEN_HEADER = "X-Profile-Token"
+ProfileMode = Literal["sample", "cprofile"]
+PROFILE_MODES: tuple[ProfileMode, ...] = ("sample", "cprofile")
+PROFILE_SUFFIXES: dict[ProfileMode, str] = {"sample": ".folded", "cprofile": ".prof"}
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame: FrameType | None) -> str:
+    """Stack of a frame in the collapsed format, outermost call first."""
+    names = []
+    while frame is not None:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """Counts the stacks of one thread, sampled from a helper thread."""
+
+    def __init__(self, thread_id: int, interval_seconds: float):
+        self.thread_id = thread_id
+        self.interval_seconds = interval_seconds
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._sample, name="stack-sampler", daemon=True
+        )
+
+    @property
+    def samples(self) -> int:
+        return self.stacks.total()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        """Stacks and their sample counts, one ``stack count`` line each."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse_stack(frame)] += 1
+
+
+class LoopLagMonitor:
+    """
+    Measures how long the event loop is blocked.
+
+    A task sleeps for ``interval_seconds`` at a time; the time it is woken up
+    late is time the loop spent running something that did not yield.
+    """
+
+    def __init__(self, interval_seconds: float, block_threshold_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.block_threshold_seconds = block_threshold_seconds
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self.blocks = 0
+        self._task: asyncio.Task[None] | None = None
+        self._sleep_started = 0.0
+
+    async def start(self) -> None:
+        self._sleep_started = asyncio.get_running_loop().time()
+        self._task = asyncio.create_task(self._watch())
+        # Let the watcher start sleeping before the loop can be blocked
+        await asyncio.sleep(0)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+            # A stall at the very end has not woken the watcher yet
+            self._record(asyncio.get_running_loop().time())
+
+    async def _watch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            self._record(loop.time())
+            self._sleep_started = loop.time()
+
+    def _record(self, now: float) -> None:
+        lag = max(0.0, now - self._sleep_started - self.interval_seconds)
+        self.total_lag += lag
+        self.max_lag = max(self.max_lag, lag)
+        if lag >= self.block_threshold_seconds:
+            self.blocks += 1
+
+
+@dataclass
+class Profile:
+    """A stored request profile."""
+
+    profile_id: str
+    mode: ProfileMode
+    method: str
+    path: str
+    status_code: int | None
+    trace_id: str | None
+    started_at: datetime
+    duration_ms: float
+    samples: int | None
+    loop_lag_total_ms: float
+    loop_lag_max_ms: float
+    loop_blocks: int
+    file: Path
+
+
+class RequestProfiler:
+    """Profiles single requests and keeps the latest profiles."""
+
+    def __init__(
+        self,
+        directory: Path,
+        token: str | None,
+        sample_interval_seconds: float = 0.005,
+        block_threshold_seconds: float = 0.05,
+        keep: int = 20,
+    ):
+        self.directory = directory
+        self.token = token
+        self.sample_interval_seconds = sample_interval_seconds
+        self.block_threshold_seconds = block_threshold_seconds
+        self.keep = keep
+        self._profiles: deque[Profile] = deque()
+        self._lock = asyncio.Lock()
+
+    def authorized(self, token: str | None) -> bool:
+        """Whether a request may be profiled (never without a configured token)."""
+        if not self.token or not token:
+            return False
+        return secrets.compare_digest(token.encode(), self.token.encode())
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    def profiles(self) -> list[Profile]:
+        """Stored profiles, newest first."""
+        return list(reversed(self._profiles))
+
+    def get(self, profile_id: str) -> Profile | None:
+        return next((p for p in self._profiles if p.profile_id == profile_id), None)
+
+    async def profile(
+        self,
+        app: ASGIApp,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        mode: ProfileMode,
+    ) -> Profile:
+        """Handle a request under a profiler and store the profile."""
+        async with self._lock:
+            profile_id = uuid.uuid4().hex
+            status_code: int | None = None
+
+            async def send_with_id(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    MutableHeaders(scope=message).append("X-Profile-Id", profile_id)
+                await send(message)
+
+            monitor = LoopLagMonitor(
+                self.sample_interval_seconds, self.block_threshold_seconds
+            )
+            sampler: StackSampler | None = None
+            profiler: cProfile.Profile | None = None
+            if mode == "sample":
+                sampler = StackSampler(
+                    threading.get_ident(), self.sample_interval_seconds
+                )
+                sampler.start()
+            else:
+                profiler = cProfile.Profile()
+                profiler.enable()
+            await monitor.start()
+            started_at = datetime.now(UTC)
+            started = time.perf_counter()
+            try:
+                await app(scope, receive, send_with_id)
+            finally:
+                duration = time.perf_counter() - started
+                await monitor.stop()
+                if profiler is not None:
+                    profiler.disable()
+                if sampler is not None:
+                    sampler.stop()
+
+                profile = Profile(
+                    profile_id=profile_id,
+                    mode=mode,
+                    method=scope["method"],
+                    path=scope["path"],
+                    status_code=status_code,
+                    trace_id=current_trace_id(),
+                    started_at=started_at,
+                    duration_ms=round(duration * 1000, 3),
+                    samples=sampler.samples if sampler else None,
+                    loop_lag_total_ms=round(monitor.total_lag * 1000, 3),
+                    loop_lag_max_ms=round(monitor.max_lag * 1000, 3),
+                    loop_blocks=monitor.blocks,
+                    file=self.directory / f"{profile_id}{PROFILE_SUFFIXES[mode]}",
+                )
+                await asyncio.to_thread(self._write, profile, sampler, profiler)
+                self._store(profile)
+                logger.info(
+                    "Profiled %s %s in %.1f ms (event loop blocked %.1f ms): %s",
+                    profile.method,
+                    profile.path,
+                    profile.duration_ms,
+                    profile.loop_lag_total_ms,
+                    profile.file,
+                )
+            return profile
+
+    def _write(
+        self,
+        profile: Profile,
+        sampler: StackSampler | None,
+        profiler: cProfile.Profile | None,
+    ) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if sampler is not None:
+            profile.file.write_text(sampler.collapsed(), encoding="utf-8")
+        if profiler is not None:
+            profiler.dump_stats(profile.file)
+
+    def _store(self, profile: Profile) -> None:
+        self._profiles.append(profile)
+        while len(self._profiles) > self.keep:
+            self._profiles.popleft().file.unlink(missing_ok=True)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests that ask for it with an ``X-Profile`` header.
+
+    Requests without the header pass through untouched. A missing or wrong
+    ``X-Profile-Token`` is rejected with 403, an unknown mode with 400 and a
+    request arriving while another one is profiled with 409.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler | None = None):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        mode = headers.get(PROFILE_HEADER)
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+
+        profiler = self.profiler or request_profiler
+        mode = mode.strip().lower() or "sample"
+        if not profiler.authorized(headers.get(TOKEN_HEADER)):
+            response = JSONResponse({"detail": "Profiling not authorized"}, 403)
+        elif mode not in PROFILE_MODES:
+            response = JSONResponse(
+                {
+                    "detail": f"Unknown profile mode {mode!r}, use one of {PROFILE_MODES}"
+                },
+                400,
+            )
+        elif profiler.busy:
+            response = JSONResponse(
+                {"detail": "Another request is being profiled"}, 409
+            )
+        else:
+            await profiler.profile(self.app, scope, receive, send, mode)
+            return
+        await response(scope, receive, send)
+
+
+_settings = get_settings()
+request_profiler = RequestProfiler(
+    directory=logs_dir / _settings.PROFILING_DIR,
+    token=_settings.PROFILING_TOKEN,
+    sample_interval_seconds=_settings.PROFILING_SAMPLE_INTERVAL_MS / 1000,
+    block_threshold_seconds=_settings.PROFILING_LOOP_BLOCK_THRESHOLD_MS / 1000,
+    keep=_settings.PROFILING_KEEP,
+)
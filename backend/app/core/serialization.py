@@ -0,0 +1,59 @@
+"""
+Fast JSON helpers for large API payloads.
+
+Lokalise responses can carry thousands of projects, keys or translations.
+Decoding and validation run in pydantic-core in one pass over the raw bytes,
+and endpoints return already validated models through ``ModelResponse`` so
+FastAPI does not dump, re-validate and re-encode them a second time.
+"""
+
+import gc
+from functools import cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+# Payloads from this size on are validated with the cyclic GC paused
+GC_PAUSE_THRESHOLD = 1024 * 1024
+
+
+@cache
+def get_type_adapter(tp: Any) -> TypeAdapter[Any]:
+    """Return a cached ``TypeAdapter`` for ``tp`` (building one compiles a schema)."""
+    return TypeAdapter(tp)
+
+
+def validate_json[T](tp: type[T], data: bytes) -> T:
+    """
+    Parse and validate raw JSON as ``tp`` in a single pydantic-core pass.
+
+    Validating a large payload allocates hundreds of thousands of objects,
+    which makes the cyclic garbage collector rescan them over and over; for
+    payloads above ``GC_PAUSE_THRESHOLD`` it is paused for the duration of
+    the (synchronous) call, roughly halving validation time.
+    """
+    adapter = get_type_adapter(tp)
+    if len(data) < GC_PAUSE_THRESHOLD or not gc.isenabled():
+        return adapter.validate_json(data)
+
+    gc.disable()
+    try:
+        return adapter.validate_json(data)
+    finally:
+        gc.enable()
+
+
+class ModelResponse(Response):
+    """
+    JSON response serializing a validated pydantic model straight to bytes.
+
+    Return it from endpoints whose result is already a validated instance of
+    the route's ``response_model``; the model still documents the response in
+    OpenAPI, but FastAPI skips its own validation and encoding.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return get_type_adapter(type(content)).dump_json(content)
@@ -0,0 +1,394 @@
+"""
+Lightweight request tracing.
+
+Every HTTP request gets a trace, continuing the caller's W3C ``traceparent``
+header when there is one, and code paths open nested spans with
+``tracer.span``. The current span is kept in a context variable, so spans
+follow a request through awaits, ``asyncio.to_thread`` and the background
+jobs and tasks it starts.
+
+Whether a trace is recorded is decided once at its root
+(``TRACING_SAMPLE_RATE``); unrecorded traces still carry ids for log
+correlation. Finished spans of recorded traces are kept in a ring buffer of
+recent traces, served by the ``/debug/traces`` endpoints to requests carrying
+``TRACING_TOKEN`` in ``X-Trace-Token``, and with
+``TRACING_EXPORT_FILE`` appended by a background thread to a file of
+OTLP/JSON export requests, which OpenTelemetry collectors can ingest.
+"""
+
+import atexit
+import functools
+import json
+import queue
+import random
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+
+# Directory of the export file (shared with the application log)
+logs_dir = Path(__file__).parent.parent.parent / "logs"
+
+SpanStatus = Literal["unset", "ok", "error"]
+# OTLP status codes
+_OTLP_STATUS = {"unset": 0, "ok": 1, "error": 2}
+
+_current_span: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    sampled: bool
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: SpanStatus = "unset"
+    error: str | None = None
+
+    @property
+    def duration_ms(self) -> float | None:
+        if self.end_ns is None:
+            return None
+        return round((self.end_ns - self.start_ns) / 1e6, 3)
+
+    @property
+    def traceparent(self) -> str:
+        """W3C trace context header value pointing at this span."""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(
+            (key, value) for key, value in attributes.items() if value is not None
+        )
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Span in the OTLP/JSON encoding."""
+        span: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # internal
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": {"code": _OTLP_STATUS[self.status]},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.error:
+            span["status"]["message"] = self.error
+        return span
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def parse_traceparent(header: str | None) -> tuple[str, str, bool] | None:
+    """Trace id, parent span id and sampled flag of a ``traceparent`` header."""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:  # noqa: PLR2004
+        return None
+    try:
+        if not int(parts[1], 16) or not int(parts[2], 16):
+            return None
+        sampled = bool(int(parts[3], 16) & 1)
+    except ValueError:
+        return None
+    return parts[1], parts[2], sampled
+
+
+class TraceBuffer:
+    """Spans of the most recent recorded traces."""
+
+    def __init__(self, max_traces: int):
+        self.max_traces = max_traces
+        self._traces: OrderedDict[str, list[Span]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            spans = self._traces.get(span.trace_id)
+            if spans is None:
+                if len(self._traces) >= self.max_traces:
+                    self._traces.popitem(last=False)
+                spans = self._traces[span.trace_id] = []
+            spans.append(span)
+
+    def get(self, trace_id: str) -> list[Span] | None:
+        """Finished spans of a trace, by start time."""
+        with self._lock:
+            spans = self._traces.get(trace_id)
+            return sorted(spans, key=lambda s: s.start_ns) if spans else None
+
+    def recent(self, limit: int) -> list[list[Span]]:
+        """Spans of the latest traces, newest first."""
+        with self._lock:
+            trace_ids = list(self._traces)[-limit:][::-1]
+        return [spans for trace_id in trace_ids if (spans := self.get(trace_id))]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+
+class OTLPFileExporter:
+    """
+    Appends finished spans to a file as OTLP/JSON export requests.
+
+    Spans are queued and written by a daemon thread, one line per batch of
+    spans that were waiting, so request handlers never touch the file.
+    """
+
+    def __init__(self, path: Path, service_name: str):
+        self.path = path
+        self.service_name = service_name
+        self._queue: queue.SimpleQueue[Span | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._write, name="trace-exporter", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put(span)
+
+    def shutdown(self) -> None:
+        """Write out queued spans and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _write(self) -> None:
+        # app.core.logging imports this module, so its logger is looked up here
+        from app.core.logging import get_logger  # noqa: PLC0415
+
+        logger = get_logger(__name__)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get())
+            stopping = None in batch
+            spans = [span for span in batch if span is not None]
+            if not spans:
+                continue
+            try:
+                with self.path.open("a", encoding="utf-8") as file:
+                    file.write(json.dumps(self._request(spans)) + "\n")
+            except OSError as e:
+                logger.warning("Could not export %d spans: %s", len(spans), e)
+
+    def _request(self, spans: list[Span]) -> dict[str, Any]:
+        resource = {
+            "attributes": [
+                {"key": "service.name", "value": _otlp_value(self.service_name)}
+            ]
+        }
+        return {
+            "resourceSpans": [
+                {
+                    "resource": resource,
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "app"},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+class Tracer:
+    """Creates spans and hands finished recorded ones to the buffer and exporter."""
+
+    def __init__(
+        self,
+        sample_rate: float,
+        buffer: TraceBuffer,
+        exporter: OTLPFileExporter | None = None,
+    ):
+        self.sample_rate = sample_rate
+        self.buffer = buffer
+        self.exporter = exporter
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        *,
+        remote_parent: tuple[str, str, bool] | None = None,
+        **attributes: Any,
+    ) -> Iterator[Span]:
+        """
+        Run a block in a new span, child of the current span.
+
+        Args:
+            name: Operation name
+            remote_parent: Trace id, span id and sampled flag of a caller in
+                another process (see ``parse_traceparent``); only used for
+                spans without a local parent
+            attributes: Span attributes (None values are left out)
+        """
+        parent = _current_span.get()
+        if parent is not None:
+            trace_id, parent_id, sampled = (
+                parent.trace_id,
+                parent.span_id,
+                parent.sampled,
+            )
+        elif remote_parent is not None:
+            trace_id, parent_id, sampled = remote_parent
+        else:
+            trace_id, parent_id = secrets.token_hex(16), None
+            sampled = random.random() < self.sample_rate
+
+        span = Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent_id,
+            sampled=sampled,
+        )
+        span.set_attributes(**attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            if span.status == "unset" and span.error is None:
+                span.status = "ok"
+            if span.sampled:
+                self.buffer.add(span)
+                if self.exporter is not None:
+                    self.exporter.export(span)
+
+    def traced[**P, R](
+        self, name: str
+    ) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+        """Decorator running every call of a coroutine function in a span."""
+
+        def decorate(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+            @functools.wraps(func)
+            async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                with self.span(name):
+                    return await func(*args, **kwargs)
+
+            return wrapper
+
+        return decorate
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def current_trace_id() -> str | None:
+    span = _current_span.get()
+    return span.trace_id if span else None
+
+
+def set_span_attributes(**attributes: Any) -> None:
+    """Add attributes to the current span, if any."""
+    span = _current_span.get()
+    if span is not None:
+        span.set_attributes(**attributes)
+
+
+class TracingMiddleware:
+    """
+    Runs every HTTP request in a root span.
+
+    The response carries the span's ``traceparent`` and its trace id in
+    ``X-Trace-Id``. Requests to ``exclude_paths`` (e.g. scrapes) are not
+    traced.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        tracer: "Tracer | None" = None,
+        exclude_paths: tuple[str, ...] = (),
+    ):
+        self.app = app
+        self.tracer = tracer
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if scope["type"] != "http" or path.startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+
+        remote_parent = parse_traceparent(Headers(scope=scope).get("traceparent"))
+        with (self.tracer or tracer).span(
+            f"{scope['method']} {path}",
+            remote_parent=remote_parent,
+            **{"http.method": scope["method"], "http.target": path},
+        ) as span:
+
+            async def send_with_trace(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attributes(**{"http.status_code": message["status"]})
+                    if message["status"] >= 500:  # noqa: PLR2004
+                        span.status = "error"
+                    headers = MutableHeaders(scope=message)
+                    headers.append("traceparent", span.traceparent)
+                    headers.append("X-Trace-Id", span.trace_id)
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace)
+
+
+_settings = get_settings()
+tracer = Tracer(
+    sample_rate=_settings.TRACING_SAMPLE_RATE,
+    buffer=TraceBuffer(max_traces=_settings.TRACING_BUFFER_TRACES),
+    exporter=OTLPFileExporter(
+        logs_dir / _settings.TRACING_EXPORT_FILE, _settings.PROJECT_NAME
+    )
+    if _settings.TRACING_EXPORT_FILE
+    else None,
+)
+if tracer.exporter is not None:
+    atexit.register(tracer.exporter.shutdown)
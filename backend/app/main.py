@@ -7,7 +7,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.api import api_router
+from app.api.v1.endpoints.metrics import router as metrics_router
+from app.api.v1.endpoints.profiles import router as profiles_router
+from app.api.v1.endpoints.traces import router as traces_router
 from app.core.config import get_settings, validate_api_keys
+from app.core.profiling import ProfilingMiddleware
+from app.core.tracing import TracingMiddleware
 
 # Load environment variables
 _ = load_dotenv()
@@ -38,11 +43,34 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Trace-Id"],
 )
 
+# Profile requests that ask for it (inside the request's trace)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+# Trace every request (scrapes and the trace viewer itself excluded)
+if settings.TRACING_ENABLED:
+    app.add_middleware(
+        TracingMiddleware, exclude_paths=("/metrics", "/health", "/debug/")
+    )
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+# Prometheus scrape endpoint, outside the versioned API
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
+
+# Recent traces (behind TRACING_TOKEN), outside the versioned API
+if settings.TRACING_ENABLED:
+    app.include_router(traces_router, prefix="/debug/traces", tags=["debug"])
+
+# Stored request profiles
+if settings.PROFILING_ENABLED:
+    app.include_router(profiles_router, prefix="/debug/profiles", tags=["debug"])
+
 
 @app.get("/")
 async def root():
@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field
+
+
+class ExportedFile(BaseModel):
+    """A file extracted from an export bundle."""
+
+    path: str = Field(..., description="Path relative to the export directory")
+    size: int = Field(..., description="Uncompressed size in bytes")
+
+
+class FileExportResult(BaseModel):
+    """Result of a project export run through the download pipeline."""
+
+    project_id: str = Field(..., description="A unique project identifier")
+    process_id: str = Field(..., description="Lokalise export process identifier")
+    bundle_url: str = Field(..., description="URL the bundle was downloaded from")
+    bundle_size: int = Field(..., description="Size of the zip bundle in bytes")
+    total_number_of_keys: int | None = Field(
+        None, description="Number of exported keys, as reported by Lokalise"
+    )
+    files: list[ExportedFile] = Field(..., description="Extracted files")
+    duration_seconds: float = Field(..., description="Wall-clock export duration")
@@ -0,0 +1,29 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class FileImportResult(BaseModel):
+    """Outcome of importing a single file."""
+
+    filename: str = Field(..., description="Uploaded filename")
+    lang_iso: str = Field(..., description="Language of the translations in the file")
+    process_id: str | None = Field(
+        None, description="Lokalise import process identifier, if the upload was queued"
+    )
+    status: str = Field(
+        ..., description="Final process status (finished, failed or cancelled)"
+    )
+    message: str = Field("", description="Process or error message")
+    details: dict[str, Any] | None = Field(
+        None, description="Import statistics reported by Lokalise"
+    )
+
+
+class FileImportResponse(BaseModel):
+    """Result of importing one or more files through the upload pipeline."""
+
+    project_id: str = Field(..., description="A unique project identifier")
+    files: list[FileImportResult] = Field(..., description="Per-file results")
+    failed: int = Field(..., description="Number of files that were not imported")
+    duration_seconds: float = Field(..., description="Wall-clock import duration")
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -73,9 +75,139 @@ class GlossaryStats(BaseModel):
     language_count: int = Field(description="Number of available languages")
 
 
+class GlossaryUploadTerm(BaseModel):
+    """Outcome of uploading one glossary term."""
+
+    term: str = Field(description="The glossary term")
+    status: Literal["created", "skipped", "failed"] = Field(
+        description="created: added to Lokalise; skipped: already in the "
+        "glossary; failed: not created (retried when the import is re-run)"
+    )
+    detail: str | None = Field(None, description="Reason for skips and failures")
+
+
+class GlossaryUploadReport(BaseModel):
+    """Per-term report of a glossary file upload."""
+
+    project_id: str = Field(description="Lokalise project ID")
+    upload_id: str = Field(
+        description="Identifies the upload (project and file content); "
+        "uploading the same file again resumes it"
+    )
+    created: int = Field(description="Number of terms created")
+    skipped: int = Field(description="Number of terms already in the glossary")
+    failed: int = Field(description="Number of terms that failed to upload")
+    terms: list[GlossaryUploadTerm] = Field(description="Outcome of every term")
+
+
 class GlossaryLoadResponse(BaseModel):
     """Response for glossary loading operations."""
 
     success: bool = Field(description="Whether the loading was successful")
     message: str = Field(description="Status message")
     stats: GlossaryStats | None = Field(None, description="Glossary statistics")
+    report: GlossaryUploadReport | None = Field(
+        None, description="Per-term upload report"
+    )
+
+
+class GlossarySyncChange(BaseModel):
+    """One change of a glossary sync."""
+
+    term: str = Field(description="The glossary term")
+    action: Literal["create", "update", "delete"] = Field(
+        description="create: not in the project glossary; update: differs from "
+        "the project glossary; delete: not in the file"
+    )
+    status: Literal["planned", "applied", "failed"] = Field(
+        description="planned: dry run; applied: done in Lokalise; failed: not done"
+    )
+    fields: list[str] = Field(
+        default_factory=list,
+        description="Changed fields of updated terms (language codes for translations)",
+    )
+    detail: str | None = Field(None, description="Reason for failures")
+
+
+class GlossarySyncReport(BaseModel):
+    """Diff of a glossary file against a project glossary, and its outcome."""
+
+    project_id: str = Field(description="Lokalise project ID")
+    dry_run: bool = Field(description="Whether changes were only computed")
+    languages: list[str] = Field(description="Languages compared (file columns)")
+    created: int = Field(description="Number of terms created (or to create)")
+    updated: int = Field(description="Number of terms updated (or to update)")
+    deleted: int = Field(description="Number of terms deleted (or to delete)")
+    unchanged: int = Field(description="Number of terms already up to date")
+    failed: int = Field(description="Number of changes that failed")
+    changes: list[GlossarySyncChange] = Field(description="Every change")
+
+
+class GlossaryScanRequest(BaseModel):
+    """Request for a project-wide glossary compliance scan."""
+
+    source_lang: str = Field("en", description="Language searched for glossary terms")
+    target_langs: list[str] | None = Field(
+        None,
+        description="Languages to check (default: every project language except "
+        "the source language)",
+    )
+
+
+class GlossaryScanViolation(BaseModel):
+    """One glossary term handled incorrectly in a translation."""
+
+    key_id: int = Field(description="Key whose translation violates the glossary")
+    key_name: str = Field(description="Name of the key")
+    term: str = Field(description="Glossary term found in the source text")
+    kind: Literal["not_preserved", "missing_translation", "no_translation"] = Field(
+        description="not_preserved: a forbidden or non-translatable term is "
+        "missing from the translation; missing_translation: the glossary "
+        "translation is not used; no_translation: the glossary has no "
+        "translation of the term for this language"
+    )
+    expected: str | None = Field(
+        description="Text the translation should contain (lowercased)"
+    )
+    translation: str = Field(description="The checked translation")
+
+
+class GlossaryScanTermCount(BaseModel):
+    """Number of violations of one glossary term."""
+
+    term: str = Field(description="Glossary term")
+    violations: int = Field(description="Number of violations")
+
+
+class GlossaryScanLanguageReport(BaseModel):
+    """Compliance of all translations into one language."""
+
+    language_iso: str = Field(description="Target language code")
+    keys_checked: int = Field(description="Keys with a translation in this language")
+    keys_untranslated: int = Field(description="Keys without a translation")
+    keys_with_terms: int = Field(description="Checked keys containing glossary terms")
+    keys_with_violations: int = Field(description="Keys with at least one violation")
+    terms_checked: int = Field(description="Glossary term occurrences checked")
+    violations: dict[str, int] = Field(description="Violation counts by kind")
+    compliance_score: float | None = Field(
+        description="Percentage of checked terms handled correctly"
+    )
+    top_terms: list[GlossaryScanTermCount] = Field(
+        description="Terms with the most violations"
+    )
+    samples: list[GlossaryScanViolation] = Field(
+        description="First violations found (capped)"
+    )
+
+
+class GlossaryScanReport(BaseModel):
+    """Result of a project-wide glossary compliance scan."""
+
+    project_id: str = Field(description="Lokalise project ID")
+    source_lang: str = Field(description="Language searched for glossary terms")
+    glossary_terms: int = Field(description="Number of glossary terms")
+    keys_scanned: int = Field(description="Number of non-archived keys scanned")
+    languages: list[GlossaryScanLanguageReport] = Field(
+        description="Compliance per target language"
+    )
+    duration_seconds: float = Field(description="Wall-clock scan duration")
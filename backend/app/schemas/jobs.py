@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+JobState = Literal["queued", "running", "completed", "failed"]
+
+
+class JobProgress(BaseModel):
+    """Progress counters of a background job."""
+
+    completed: int = Field(0, description="Number of processed items")
+    total: int | None = Field(None, description="Total number of items, if known")
+    counters: dict[str, int] = Field(
+        default_factory=dict,
+        description="Job-specific counters (e.g. rows parsed, batches uploaded)",
+    )
+
+
+class JobStatus(BaseModel):
+    """State of a background job."""
+
+    job_id: str = Field(..., description="A unique job identifier")
+    kind: str = Field(..., description="Type of work the job performs")
+    status: JobState = Field(..., description="Current job state")
+    progress: JobProgress = Field(
+        default_factory=JobProgress, description="Progress counters"
+    )
+    result: dict[str, Any] | None = Field(
+        None, description="Job result once the job has completed"
+    )
+    error: str | None = Field(None, description="Error message if the job failed")
+    created_at: datetime = Field(..., description="When the job was submitted")
+    started_at: datetime | None = Field(None, description="When the job started")
+    finished_at: datetime | None = Field(None, description="When the job finished")
+    trace_id: str | None = Field(
+        None, description="Trace the job runs in (see /debug/traces)"
+    )
+
+
+# OpenAPI ``responses`` entry for endpoints that can run as a background job
+BACKGROUND_JOB_RESPONSES: dict[int | str, dict[str, Any]] = {
+    202: {"model": JobStatus, "description": "Background job started"}
+}
@@ -0,0 +1,81 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+class KeyMirrorSyncResponse(BaseModel):
+    """Result of a key mirror synchronisation run."""
+
+    project_id: str = Field(..., description="A unique project identifier")
+    mode: Literal["full", "incremental"] = Field(
+        ..., description="Whether the whole project was reloaded or only changes"
+    )
+    keys_fetched: int = Field(..., description="Number of keys listed from Lokalise")
+    keys_upserted: int = Field(
+        ..., description="Number of new or modified keys written to the mirror"
+    )
+    translations_upserted: int = Field(
+        ..., description="Number of translations written to the mirror"
+    )
+    keys_deleted: int = Field(
+        ..., description="Number of keys removed because they no longer exist"
+    )
+    duration_seconds: float = Field(..., description="Wall-clock sync duration")
+
+
+class KeyMirrorStatus(BaseModel):
+    """State of the local key mirror for a project."""
+
+    project_id: str = Field(..., description="A unique project identifier")
+    synced: bool = Field(..., description="Whether the mirror has been loaded")
+    syncing: bool = Field(..., description="Whether a sync is currently running")
+    last_full_sync_at: float | None = Field(
+        None, description="Unix timestamp of the last full reload"
+    )
+    last_sync_at: float | None = Field(
+        None, description="Unix timestamp of the last (full or incremental) sync"
+    )
+    key_count: int = Field(..., description="Number of mirrored keys")
+    translation_count: int = Field(..., description="Number of mirrored translations")
+    language_count: int = Field(..., description="Number of mirrored languages")
+
+
+class KeySearchMatch(BaseModel):
+    """A highlighted field of a key that matched the search query."""
+
+    field: Literal["name", "description", "translation"] = Field(
+        ..., description="Which field matched"
+    )
+    language_iso: str | None = Field(
+        None, description="Language of the matching translation"
+    )
+    snippet: str = Field(
+        ..., description="Matching text with hits wrapped in <mark> tags"
+    )
+
+
+class KeySearchResult(BaseModel):
+    """A key ranked by full-text relevance."""
+
+    key_id: int = Field(..., description="A unique identifier of the key")
+    key_name: str | dict[str, Any] | None = Field(
+        None, description="Key identifier (per platform for per-platform names)"
+    )
+    description: str | None = Field(None, description="Description of the key")
+    is_archived: bool = Field(False, description="Whether the key is archived")
+    score: float = Field(..., description="Relevance score (higher is better)")
+    matches: list[KeySearchMatch] = Field(
+        default_factory=list, description="Highlighted matching fields"
+    )
+
+
+class KeySearchResponse(BaseModel):
+    """Page of full-text search results over a project mirror."""
+
+    project_id: str = Field(..., description="A unique project identifier")
+    query: str = Field(..., description="The search query")
+    total_count: int = Field(..., description="Number of matching keys")
+    page: int = Field(..., description="Current page number")
+    limit: int = Field(..., description="Page size")
+    took_ms: float = Field(..., description="Query time in milliseconds")
+    results: list[KeySearchResult] = Field(..., description="Ranked matching keys")
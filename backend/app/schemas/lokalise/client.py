@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+
+
+class LokaliseClientStats(BaseModel):
+    """Traffic counters of this server's Lokalise API client."""
+
+    queue_depth: int = Field(
+        ..., description="Requests currently waiting for a rate limiter slot"
+    )
+    retries_total: int = Field(..., description="Number of retried requests")
+    retries: dict[str, int] = Field(
+        default_factory=dict, description="Retries per method and failure reason"
+    )
+    exhausted: dict[str, int] = Field(
+        default_factory=dict,
+        description="Requests that kept failing after all retries, per method and reason",
+    )
+    ambiguous_writes: int = Field(
+        0, description="Writes that failed in a way that may have applied them"
+    )
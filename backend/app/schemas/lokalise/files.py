@@ -33,14 +33,9 @@ class ProjectFilesResponse(BaseModel):
     files: list[File] = Field(..., description="Project files with key counts")
 
 
-class FileUploadRequest(BaseModel):
-    """Request schema for uploading a file."""
+class FileUploadOptions(BaseModel):
+    """Import options of a file upload (everything except the file itself)."""
 
-    data: str = Field(..., description="Base64 encoded file")
-    filename: str = Field(..., description="Set the filename")
-    lang_iso: str = Field(
-        ..., description="Language code of the translations in the file"
-    )
     convert_placeholders: bool | None = Field(
         None, description="Enable to automatically convert placeholders"
     )
@@ -106,6 +101,16 @@ class FileUploadRequest(BaseModel):
     )
 
 
+class FileUploadRequest(FileUploadOptions):
+    """Request schema for uploading a file."""
+
+    data: str = Field(..., description="Base64 encoded file")
+    filename: str = Field(..., description="Set the filename")
+    lang_iso: str = Field(
+        ..., description="Language code of the translations in the file"
+    )
+
+
 class FileUploadResponse(BaseModel):
     """Response schema for file upload."""
 
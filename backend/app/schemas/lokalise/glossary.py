@@ -6,7 +6,9 @@ from pydantic import BaseModel, Field
 class GlossaryTermTranslation(BaseModel):
     """Translation within a glossary term."""
 
-    lang_id: int = Field(..., description="Language ID")
+    lang_id: int = Field(
+        0, description="Language ID (resolved from lang_iso when omitted)"
+    )
     lang_name: str = Field("", description="Language name (optional for API responses)")
     lang_iso: str = Field(
         "", description="Language ISO code (optional for API responses)"
@@ -20,7 +22,10 @@ class GlossaryTermTranslation(BaseModel):
 class GlossaryTermTranslationUpdate(BaseModel):
     """Translation object for glossary term updates."""
 
-    lang_id: int = Field(..., description="Language ID")
+    lang_id: int = Field(
+        0, description="Language ID (resolved from lang_iso when omitted)"
+    )
+    lang_iso: str = Field("", description="Language ISO code (if lang_id is omitted)")
     translation: str = Field(..., description="Translation of the term")
     description: str | None = Field(None, description="Description of the translation")
 
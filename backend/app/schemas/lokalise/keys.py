@@ -1,3 +1,5 @@
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 from .comments import Comment
@@ -99,7 +101,7 @@ class Key(BaseModel):
         ...,
         description="An object containing key names for all platforms or a string. You may need to enable 'Per-platform key names' in project settings",
     )
-    filenames: list[KeyFilename] = Field(
+    filenames: KeyFilename = Field(
         ..., description="An object containing key filename attribute for each platform"
     )
     description: str = Field(..., description="Description of the key")
@@ -395,6 +397,26 @@ class KeyUpdateResponse(BaseModel):
     key: Key = Field(..., description="Updated key object")
 
 
+class KeyBulkError(BaseModel):
+    """Error reported for a key that could not be created or updated."""
+
+    message: str = Field(..., description="Error message")
+    code: int = Field(..., description="Error code")
+    key: dict[str, Any] | None = Field(
+        None, description="Identifying attributes of the rejected key"
+    )
+
+
+class KeysBulkResponse(BaseModel):
+    """Response schema for creating or updating multiple keys."""
+
+    project_id: str = Field(..., description="A unique project identifier")
+    keys: list[Key] = Field(..., description="Keys that were written")
+    errors: list[KeyBulkError] = Field(
+        default_factory=list, description="Keys that were rejected"
+    )
+
+
 # ----- Key Delete Schemas -----
 
 
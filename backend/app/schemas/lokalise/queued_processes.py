@@ -1,3 +1,5 @@
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -27,6 +29,10 @@ class QueuedProcess(BaseModel):
     created_at_timestamp: int = Field(
         ..., description="Unix timestamp of when the process was created in the queue"
     )
+    details: dict[str, Any] | None = Field(
+        None,
+        description="Process type specific details (e.g. download_url of a finished export, or imported key counts of a file import)",
+    )
 
 
 class QueuedProcessResponse(BaseModel):
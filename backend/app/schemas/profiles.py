@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class ProfileInfo(BaseModel):
+    """A stored request profile."""
+
+    profile_id: str = Field(..., description="Profile identifier (X-Profile-Id)")
+    mode: Literal["sample", "cprofile"] = Field(..., description="Profiler used")
+    method: str = Field(..., description="HTTP method of the profiled request")
+    path: str = Field(..., description="Path of the profiled request")
+    status_code: int | None = Field(None, description="Response status code")
+    trace_id: str | None = Field(None, description="Trace of the request, if any")
+    started_at: datetime = Field(..., description="When the request started")
+    duration_ms: float = Field(..., description="Request duration in milliseconds")
+    samples: int | None = Field(None, description="Stack samples taken (sample mode)")
+    loop_lag_total_ms: float = Field(
+        ..., description="Time the event loop was blocked during the request"
+    )
+    loop_lag_max_ms: float = Field(..., description="Longest event loop stall")
+    loop_blocks: int = Field(
+        ..., description="Stalls longer than PROFILING_LOOP_BLOCK_THRESHOLD_MS"
+    )
@@ -0,0 +1,35 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+class SpanRecord(BaseModel):
+    """A finished span of a trace."""
+
+    span_id: str = Field(..., description="Span identifier (16 hex digits)")
+    parent_id: str | None = Field(None, description="Parent span, if any")
+    name: str = Field(..., description="Operation name")
+    start_time_ns: int = Field(..., description="Start time (Unix nanoseconds)")
+    duration_ms: float = Field(..., description="Duration in milliseconds")
+    status: Literal["unset", "ok", "error"] = Field(..., description="Span status")
+    error: str | None = Field(None, description="Error the span ended with")
+    attributes: dict[str, Any] = Field(
+        default_factory=dict, description="Span attributes"
+    )
+
+
+class TraceSummary(BaseModel):
+    """Overview of a recorded trace."""
+
+    trace_id: str = Field(..., description="Trace identifier (32 hex digits)")
+    name: str = Field(..., description="Name of the root span (or earliest span)")
+    start_time_ns: int = Field(..., description="Start time (Unix nanoseconds)")
+    duration_ms: float = Field(..., description="Duration of the root span")
+    span_count: int = Field(..., description="Number of finished spans")
+    error: bool = Field(..., description="Whether any span ended with an error")
+
+
+class TraceDetail(TraceSummary):
+    """A recorded trace with its spans, by start time."""
+
+    spans: list[SpanRecord] = Field(..., description="Finished spans")
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -20,6 +20,10 @@ class TranslationEvaluationRequest(BaseModel):
     project_id: str | None = Field(
         None, description="Optional Lokalise project ID for glossary checking"
     )
+    force_llm: bool = Field(
+        False,
+        description="Get LLM feedback even when metrics and glossary checks are conclusive",
+    )
 
 
 class MetricScores(BaseModel):
@@ -93,3 +97,72 @@ class TranslationEvaluationResponse(BaseModel):
         ...,
         description="Overall quality assessment (based on metrics if reference provided, otherwise descriptive)",
     )
+    verdict: Literal["pass", "fail", "uncertain"] = Field(
+        "uncertain", description="Pass/fail verdict of the evaluation"
+    )
+    decided_by: Literal["metrics", "glossary", "llm"] | None = Field(
+        None,
+        description="Evaluation tier that produced the verdict (None if uncertain)",
+    )
+    partial: bool = Field(
+        False, description="Whether some evaluation stages are missing"
+    )
+    cached: bool = Field(
+        False, description="Whether the result was served from the evaluation cache"
+    )
+    incomplete_stages: list[str] = Field(
+        default_factory=list,
+        description="Stages that failed or timed out (metric_scores, glossary_compliance, llm_feedback)",
+    )
+
+
+class BatchEvaluationSegment(BaseModel):
+    """A translation and its reference within a batch evaluation."""
+
+    id: str | None = Field(None, description="Optional caller-defined segment ID")
+    source_text: str = Field(..., description="Original source text")
+    translated_text: str = Field(..., description="The translated text to evaluate")
+    reference_text: str = Field(..., description="Reference translation")
+
+
+class BatchEvaluationRequest(BaseModel):
+    """Request model for corpus-level batch evaluation."""
+
+    source_lang: str = Field(
+        ..., max_length=10, description="Source language code (e.g., 'en', 'es_419')"
+    )
+    target_lang: str = Field(
+        ..., max_length=10, description="Target language code (e.g., 'en', 'es_419')"
+    )
+    segments: list[BatchEvaluationSegment] = Field(
+        ...,
+        min_length=1,
+        max_length=100_000,
+        description="Segments to evaluate against their references",
+    )
+    include_llm_feedback: bool = Field(
+        False,
+        description="Also get qualitative LLM feedback per segment (batched requests)",
+    )
+
+
+class BatchEvaluationSegmentResult(MetricScores):
+    """NDJSON line with the metric scores of one batch segment."""
+
+    type: Literal["segment"] = "segment"
+    index: int = Field(..., description="Position of the segment in the request")
+    id: str | None = Field(None, description="Segment ID from the request")
+    llm_feedback: LLMFeedback | None = Field(
+        None, description="Qualitative LLM feedback, if requested"
+    )
+
+
+class BatchEvaluationCorpusResult(BaseModel):
+    """Final NDJSON line with corpus-level scores of a batch evaluation."""
+
+    type: Literal["corpus"] = "corpus"
+    segments: int = Field(..., description="Number of segments evaluated")
+    bleu: float | None = Field(None, description="Corpus BLEU score (0-100)")
+    chrf: float | None = Field(None, description="Corpus chrF score (0-100)")
+    ter: float | None = Field(None, description="Corpus TER (0-100, lower is better)")
+    duration_seconds: float = Field(..., description="Time spent scoring")
@@ -0,0 +1,119 @@
+"""
+Executor for CPU-bound work such as translation metrics.
+
+Running CPU-bound functions directly in an async handler blocks the event loop
+and with it every other request on the worker. ``CPUExecutor`` runs them on a
+thread pool or a process pool instead, chosen by configuration:
+
+- ``process`` (default) runs functions in spawned worker processes, so they
+  execute in parallel with the event loop and each other. Functions and their
+  arguments must be picklable (module-level functions, plain data).
+- ``thread`` keeps everything in-process. It only frees the event loop while
+  the function releases the GIL, but avoids process start-up and pickling,
+  which suits small inputs and platforms where spawning is expensive.
+
+A timed-out call stops being awaited but is not interrupted: the worker keeps
+running it to completion. Callers should bound input sizes rather than rely on
+timeouts alone to limit worker time.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Literal
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+ExecutorKind = Literal["thread", "process"]
+
+
+class CPUExecutor:
+    """Runs CPU-bound functions on a lazily created thread or process pool."""
+
+    def __init__(
+        self,
+        kind: ExecutorKind = "process",
+        max_workers: int | None = None,
+        timeout: float | None = None,
+    ):
+        self.kind = kind
+        # Resolved like the pools' own defaults, so callers can size work to it
+        cpus = os.process_cpu_count() or 1
+        self.max_workers = max_workers or (
+            cpus if kind == "process" else min(32, cpus + 4)
+        )
+        self.timeout = timeout
+        self._pool: Executor | None = None
+
+    @property
+    def pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "process":
+                # Spawned workers only import the functions they run, not the app
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="cpu"
+                )
+            logger.info(
+                "Started %s pool for CPU-bound work (%s workers)",
+                self.kind,
+                self.max_workers,
+            )
+        return self._pool
+
+    def submit[T](self, function: Callable[..., T], *args) -> asyncio.Future[T]:
+        """
+        Schedule ``function(*args)`` on the pool without waiting for it.
+
+        Returns:
+            Future resolving to the function's result
+        """
+        return asyncio.get_running_loop().run_in_executor(self.pool, function, *args)
+
+    async def run[T](
+        self,
+        function: Callable[..., T],
+        *args,
+        timeout: float | None = None,
+    ) -> T:
+        """
+        Run ``function(*args)`` on the pool and wait for its result.
+
+        Args:
+            function: Function to run; must be picklable for process pools
+            *args: Positional arguments for the function
+            timeout: Seconds to wait; defaults to the executor's timeout
+
+        Returns:
+            The function's result
+
+        Raises:
+            TimeoutError: If the result is not ready within the timeout
+        """
+        return await asyncio.wait_for(
+            self.submit(function, *args),
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+
+    def shutdown(self) -> None:
+        """Stop the pool; a new one is started on next use."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+_settings = get_settings()
+cpu_executor = CPUExecutor(
+    kind=_settings.EVALUATION_EXECUTOR,
+    max_workers=_settings.EVALUATION_WORKERS,
+    timeout=_settings.EVALUATION_METRIC_TIMEOUT_SECONDS,
+)
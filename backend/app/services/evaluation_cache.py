@@ -0,0 +1,191 @@
+"""
+Cache of translation evaluation results.
+
+Evaluations are keyed on a hash of everything that determines their result:
+the texts, the languages, the project, the project's glossary version and the
+evaluator version (prompts, metrics and verdict policy). A small in-memory LRU
+tier answers repeat evaluations without any I/O; a SQLite tier keeps results
+across restarts.
+
+A project's glossary version combines a hash of its glossary terms, so edits
+made directly in Lokalise are seen, with a token in SQLite that is replaced
+whenever glossary terms are written through this backend. The token is read
+on every lookup, so a write by one worker invalidates the cached evaluations
+of the others too. Persisted entries also expire after
+``EVALUATION_CACHE_TTL_SECONDS``.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluations (
+    cache_key TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_evaluations_created ON evaluations (created_at);
+
+CREATE TABLE IF NOT EXISTS glossary_versions (
+    project_id TEXT PRIMARY KEY,
+    version TEXT NOT NULL
+);
+"""
+
+# Glossary token of projects whose glossary was never written through us
+INITIAL_GLOSSARY_VERSION = "initial"
+
+
+def evaluation_cache_key(*parts: Any) -> str:
+    """Stable SHA-256 key of the JSON-serialisable parts of an evaluation."""
+    encoded = json.dumps(parts, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class EvaluationCache:
+    """
+    Two-tier (memory LRU, then SQLite) cache of evaluation results.
+
+    SQLite is only touched through ``asyncio.to_thread`` and the database is
+    opened on first use.
+    """
+
+    def __init__(self, db_path: Path, max_entries: int, ttl_seconds: float):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Cached result for a key, or None if absent or expired."""
+        entry = self._memory.get(key)
+        if entry is None:
+            entry = await asyncio.to_thread(self._load, key)
+            if entry is not None:
+                self._remember(key, *entry)
+        if entry is None or time.time() - entry[0] > self.ttl_seconds:
+            self.misses += 1
+            return None
+        self._memory.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    async def put(self, key: str, result: dict[str, Any]) -> None:
+        """Store a result in both tiers."""
+        created_at = time.time()
+        self._remember(key, created_at, result)
+        await asyncio.to_thread(self._store, key, created_at, result)
+
+    async def glossary_version(self, project_id: str, terms: Any = None) -> str:
+        """
+        Current glossary version of a project.
+
+        Args:
+            project_id: ID of the project
+            terms: JSON-serialisable glossary terms of the project
+
+        Returns:
+            Hash of the project's write token and its terms
+        """
+        token = await asyncio.to_thread(self._load_version, project_id)
+        return evaluation_cache_key(token or INITIAL_GLOSSARY_VERSION, terms)
+
+    async def invalidate_glossary(self, project_id: str) -> None:
+        """Give a project a new glossary token, orphaning its cached results."""
+        await asyncio.to_thread(self._store_version, project_id, uuid.uuid4().hex)
+        logger.info(
+            "Glossary of project %s changed, evaluations invalidated", project_id
+        )
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_entries": len(self._memory),
+        }
+
+    def _remember(self, key: str, created_at: float, result: dict[str, Any]) -> None:
+        self._memory[key] = (created_at, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _load(self, key: str) -> tuple[float, dict[str, Any]] | None:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT created_at, payload FROM evaluations WHERE cache_key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        return None if row is None else (row[0], json.loads(row[1]))
+
+    def _store(self, key: str, created_at: float, result: dict[str, Any]) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO evaluations VALUES (?, ?, ?)",
+                    (key, created_at, json.dumps(result, ensure_ascii=False)),
+                )
+                conn.execute(
+                    "DELETE FROM evaluations WHERE created_at < ?",
+                    (created_at - self.ttl_seconds,),
+                )
+
+    def _load_version(self, project_id: str) -> str | None:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT version FROM glossary_versions WHERE project_id = ?",
+                    (project_id,),
+                )
+                .fetchone()
+            )
+        return None if row is None else row[0]
+
+    def _store_version(self, project_id: str, version: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO glossary_versions VALUES (?, ?)",
+                    (project_id, version),
+                )
+
+
+_settings = get_settings()
+evaluation_cache = EvaluationCache(
+    db_path=Path(_settings.DATA_DIR) / "evaluation_cache.sqlite3",
+    max_entries=_settings.EVALUATION_CACHE_MAX_ENTRIES,
+    ttl_seconds=_settings.EVALUATION_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,155 @@
+"""
+CPU-bound translation metrics.
+
+Functions here are pure and importable without the rest of the application so
+they can run in worker processes. Sentence- and corpus-level scores are
+derived from the same per-segment sufficient statistics (n-gram matches for
+BLEU/chrF, edit counts for TER), so a corpus score costs one pass over the
+segments however they are split across workers.
+
+Statistics are extracted through sacrebleu's ``Metric`` internals
+(``_extract_corpus_statistics`` / ``_compute_score_from_stats``), which is
+what ``sentence_score`` and ``corpus_score`` use themselves.
+"""
+
+from functools import cache
+from typing import Any
+
+from sacrebleu.metrics import BLEU, CHRF, TER
+from sacrebleu.metrics.base import Metric
+
+from app.services.levenshtein import levenshtein, levenshtein_batch
+
+CORPUS_METRICS = ("bleu", "chrf", "ter")
+# Metrics whose cost grows linearly with the text length
+CHEAP_METRICS = ("bleu", "chrf")
+
+
+@cache
+def _sentence_metrics() -> dict[str, Metric]:
+    # Same settings as sacrebleu.sentence_bleu/sentence_chrf/sentence_ter
+    return {"bleu": BLEU(effective_order=True), "chrf": CHRF(), "ter": TER()}
+
+
+@cache
+def _corpus_metrics() -> dict[str, Metric]:
+    return {"bleu": BLEU(), "chrf": CHRF(), "ter": TER()}
+
+
+def edit_distance(text1: str, text2: str) -> int:
+    """
+    Character-level Levenshtein distance.
+
+    Args:
+        text1: First text
+        text2: Second text
+
+    Returns:
+        Character-level edit distance
+    """
+    return levenshtein(text1, text2)
+
+
+def sentence_scores(
+    hypothesis: str, reference: str, cheap_only: bool = False
+) -> dict[str, Any]:
+    """
+    Sentence-level scores of one translation against its reference.
+
+    Args:
+        hypothesis: Translation to evaluate
+        reference: Reference translation
+        cheap_only: Only compute the linear-time metrics (BLEU, chrF); TER
+            and edit distance, which grow quadratically, are left as None
+
+    Returns:
+        Dictionary with bleu, ter, chrf and edit_distance
+    """
+    scores: dict[str, Any] = dict.fromkeys((*CORPUS_METRICS, "edit_distance"))
+    for name, metric in _sentence_metrics().items():
+        if cheap_only and name not in CHEAP_METRICS:
+            continue
+        scores[name] = round(metric.sentence_score(hypothesis, [reference]).score, 2)
+    if not cheap_only:
+        scores["edit_distance"] = edit_distance(hypothesis, reference)
+    return scores
+
+
+def score_segments(
+    hypotheses: list[str],
+    references: list[str],
+    max_chars: int | None = None,
+    cheap_only: bool = False,
+) -> tuple[list[dict[str, Any]], dict[str, list[float]]]:
+    """
+    Score aligned hypothesis/reference segments.
+
+    Args:
+        hypotheses: Translations to evaluate
+        references: Reference translation of each hypothesis
+        max_chars: Segments whose hypothesis or reference is longer only get
+            the linear-time metrics (BLEU, chrF); their TER and edit distance
+            stay None
+        cheap_only: Only compute the linear-time metrics for every segment
+
+    Returns:
+        Tuple of per-segment scores (bleu, chrf, ter, edit_distance) and the
+        summed corpus statistics of each metric, to be combined with
+        ``corpus_scores``. TER statistics only cover the segments it was
+        computed for, and are left out when there are none.
+    """
+    full = [
+        not cheap_only and (max_chars is None or max(len(hyp), len(ref)) <= max_chars)
+        for hyp, ref in zip(hypotheses, references, strict=True)
+    ]
+    scores: list[dict[str, Any]] = [{"edit_distance": None} for _ in hypotheses]
+    # Hypotheses sharing a reference are compared with it in one pass
+    measured = [i for i, is_full in enumerate(full) if is_full]
+    distances = levenshtein_batch((references[i], hypotheses[i]) for i in measured)
+    for i, distance in zip(measured, distances, strict=True):
+        scores[i]["edit_distance"] = distance
+    totals: dict[str, list[float]] = {}
+
+    for name, metric in _sentence_metrics().items():
+        indices = [
+            i for i, is_full in enumerate(full) if is_full or name in CHEAP_METRICS
+        ]
+        for segment in scores:
+            segment[name] = None
+        if not indices:
+            continue
+        stats = metric._extract_corpus_statistics(
+            [hypotheses[i] for i in indices], [[references[i] for i in indices]]
+        )
+        for i, segment_stats in zip(indices, stats, strict=True):
+            scores[i][name] = round(
+                metric._compute_score_from_stats(segment_stats).score, 2
+            )
+        totals[name] = [sum(column) for column in zip(*stats, strict=True)]
+
+    return scores, totals
+
+
+def merge_statistics(
+    totals: list[dict[str, list[float]]],
+) -> dict[str, list[float]]:
+    """Sum corpus statistics returned by several ``score_segments`` calls."""
+    merged: dict[str, list[float]] = {}
+    for chunk in totals:
+        for name, stats in chunk.items():
+            if name in merged:
+                merged[name] = [a + b for a, b in zip(merged[name], stats, strict=True)]
+            else:
+                merged[name] = list(stats)
+    return merged
+
+
+def corpus_scores(totals: dict[str, list[float]]) -> dict[str, float | None]:
+    """Corpus-level BLEU/chrF/TER from summed segment statistics."""
+    metrics = _corpus_metrics()
+    return {
+        name: round(metrics[name]._compute_score_from_stats(totals[name]).score, 2)
+        if name in totals
+        else None
+        for name in CORPUS_METRICS
+    }
@@ -0,0 +1,229 @@
+"""
+Project export pipeline.
+
+Starts a Lokalise async export, waits for its queued process, streams the
+resulting bundle to disk and extracts it member by member. Neither the bundle
+nor any extracted file is held in memory, and disk work runs in worker threads
+so large exports do not stall the event loop. Exports older than
+``EXPORT_RETENTION_SECONDS`` are deleted when the next export starts.
+"""
+
+import asyncio
+import re
+import shutil
+import time
+import zipfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastapi import HTTPException
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.schemas.lokalise.files import FileDownloadRequest
+from app.services.lokalise.files import lokalise_files_service
+from app.services.lokalise.processes import lokalise_processes_service
+
+logger = get_logger(__name__)
+
+# Size of the pieces the bundle is streamed and extracted in
+BUNDLE_CHUNK_SIZE = 1024 * 1024
+
+# Bundles are served from S3; allow slow transfers but not stalled connections
+BUNDLE_DOWNLOAD_TIMEOUT = httpx.Timeout(30.0, read=120.0)
+
+
+def _safe_name(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", value)
+
+
+def extract_bundle(bundle_path: Path, target_dir: Path) -> list[dict[str, Any]]:
+    """
+    Extract a zip bundle one member at a time.
+
+    Members are streamed to disk in ``BUNDLE_CHUNK_SIZE`` pieces; entries that
+    would escape ``target_dir`` (absolute paths, ``..``) are skipped.
+
+    Returns:
+        List of extracted files with their path (relative to ``target_dir``)
+        and size
+    """
+    if target_dir.exists():
+        shutil.rmtree(target_dir)
+    target_dir.mkdir(parents=True)
+    root = target_dir.resolve()
+
+    extracted = []
+    with zipfile.ZipFile(bundle_path) as bundle:
+        for member in bundle.infolist():
+            if member.is_dir():
+                continue
+            target = (root / member.filename).resolve()
+            if not target.is_relative_to(root):
+                logger.warning("Skipping unsafe bundle entry %r", member.filename)
+                continue
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with bundle.open(member) as source, open(target, "wb") as destination:
+                shutil.copyfileobj(source, destination, BUNDLE_CHUNK_SIZE)
+            extracted.append(
+                {"path": target.relative_to(root).as_posix(), "size": member.file_size}
+            )
+
+    return extracted
+
+
+def prune_exports(export_dir: Path, max_age: float) -> int:
+    """
+    Delete export directories last modified more than ``max_age`` seconds ago.
+
+    Returns:
+        Number of exports deleted
+    """
+    cutoff = time.time() - max_age
+    pruned = 0
+    for process_dir in export_dir.glob("*/*"):
+        try:
+            if process_dir.is_dir() and process_dir.stat().st_mtime < cutoff:
+                shutil.rmtree(process_dir)
+                pruned += 1
+        except OSError as e:
+            logger.warning("Could not delete export %s: %s", process_dir, e)
+    return pruned
+
+
+class FileExportService:
+    """Runs Lokalise project exports end to end."""
+
+    def __init__(self, data_dir: str | Path | None = None):
+        settings = get_settings()
+        self.export_dir = Path(data_dir or settings.DATA_DIR) / "exports"
+        self.retention = settings.EXPORT_RETENTION_SECONDS
+        self.files_service = lokalise_files_service
+        self.processes_service = lokalise_processes_service
+
+    def get_export_dir(self, project_id: str, process_id: str) -> Path:
+        """Directory holding the bundle and extracted files of an export."""
+        return self.export_dir / _safe_name(project_id) / _safe_name(process_id)
+
+    def get_bundle_path(self, project_id: str, process_id: str) -> Path:
+        """Path of a downloaded bundle; 404 if the export is not on disk."""
+        bundle_path = self.get_export_dir(project_id, process_id) / "bundle.zip"
+        if not bundle_path.is_file():
+            raise HTTPException(
+                status_code=404, detail=f"Export {process_id} not found"
+            )
+        return bundle_path
+
+    async def export_project(
+        self,
+        project_id: str,
+        request: FileDownloadRequest,
+        on_progress: Callable[[int, int | None], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Export a project and extract the bundle locally.
+
+        Args:
+            project_id: ID of the project
+            request: Lokalise download options
+            on_progress: Called with (downloaded bytes, total bytes if known)
+                while the bundle is streamed
+
+        Returns:
+            Dictionary describing the export and the extracted files
+
+        Raises:
+            HTTPException: If the export fails, times out or the bundle is invalid
+        """
+        started = time.perf_counter()
+        pruned = await asyncio.to_thread(prune_exports, self.export_dir, self.retention)
+        if pruned:
+            logger.info("Deleted %s expired exports", pruned)
+
+        export = await self.files_service.start_async_download(project_id, request)
+        process = await self.processes_service.wait_for_process(
+            project_id, export.process_id
+        )
+        details = process.details or {}
+        bundle_url = details.get("download_url")
+        if not bundle_url:
+            raise HTTPException(
+                status_code=502,
+                detail=f"Export process {export.process_id} returned no download URL",
+            )
+
+        export_dir = self.get_export_dir(project_id, export.process_id)
+        bundle_path = export_dir / "bundle.zip"
+        bundle_size = await self._download_bundle(bundle_url, bundle_path, on_progress)
+
+        try:
+            files = await asyncio.to_thread(
+                extract_bundle, bundle_path, export_dir / "files"
+            )
+        except zipfile.BadZipFile as e:
+            raise HTTPException(
+                status_code=502, detail=f"Downloaded bundle is not a valid zip: {e}"
+            ) from e
+
+        duration = round(time.perf_counter() - started, 3)
+        logger.info(
+            "Exported project %s: %s files, %s bytes in %ss",
+            project_id,
+            len(files),
+            bundle_size,
+            duration,
+        )
+        return {
+            "project_id": project_id,
+            "process_id": export.process_id,
+            "bundle_url": bundle_url,
+            "bundle_size": bundle_size,
+            "total_number_of_keys": details.get("total_number_of_keys"),
+            "files": files,
+            "duration_seconds": duration,
+        }
+
+    async def _download_bundle(
+        self,
+        url: str,
+        destination: Path,
+        on_progress: Callable[[int, int | None], None] | None,
+    ) -> int:
+        """Stream a bundle to disk, writing chunks from a worker thread."""
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        partial = destination.with_suffix(".part")
+        downloaded = 0
+
+        async with (
+            httpx.AsyncClient(timeout=BUNDLE_DOWNLOAD_TIMEOUT) as client,
+            client.stream("GET", url) as response,
+        ):
+            if not response.is_success:
+                raise HTTPException(
+                    status_code=502,
+                    detail=f"Bundle download failed with HTTP {response.status_code}",
+                )
+            total = int(response.headers.get("Content-Length", 0)) or None
+
+            try:
+                with open(partial, "wb") as output:
+                    async for chunk in response.aiter_bytes(BUNDLE_CHUNK_SIZE):
+                        await asyncio.to_thread(output.write, chunk)
+                        downloaded += len(chunk)
+                        if on_progress:
+                            on_progress(downloaded, total)
+            except BaseException:
+                # Transport errors and cancellation must not leave a partial
+                # bundle behind
+                partial.unlink(missing_ok=True)
+                raise
+
+        partial.replace(destination)
+        return downloaded
+
+
+# Create singleton instance
+file_export_service = FileExportService()
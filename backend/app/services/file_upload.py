@@ -0,0 +1,177 @@
+"""
+Localization file import pipeline.
+
+Uploaded files are streamed to a scratch directory, then sent to Lokalise with
+their base64 encoding produced chunk by chunk (see
+``LokaliseFilesService.upload_file_from_path``), so memory use does not grow
+with file size. Files for different languages are uploaded concurrently within
+the shared rate limiter and their import processes are tracked until done.
+"""
+
+import asyncio
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastapi import HTTPException, UploadFile
+
+from app.core.logging import get_logger
+from app.schemas.lokalise.files import FileUploadOptions
+from app.services.lokalise.files import lokalise_files_service
+from app.services.lokalise.processes import lokalise_processes_service
+
+logger = get_logger(__name__)
+
+# Size of the pieces uploaded files are copied to disk in
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class StagedUpload:
+    """A file copied to local disk, waiting to be imported."""
+
+    def __init__(self, path: Path, filename: str, lang_iso: str):
+        self.path = path
+        self.filename = filename
+        self.lang_iso = lang_iso
+
+
+class FileUploadService:
+    """Streams localization files to Lokalise and awaits their import."""
+
+    def __init__(self):
+        self.files_service = lokalise_files_service
+        self.processes_service = lokalise_processes_service
+
+    async def stage_uploads(
+        self, files: list[UploadFile], lang_isos: list[str]
+    ) -> tuple[Path, list[StagedUpload]]:
+        """
+        Copy uploaded files to a scratch directory in fixed-size chunks.
+
+        The copies outlive the request, so imports can continue as a
+        background job after the client disconnects.
+
+        Args:
+            files: Uploaded files
+            lang_isos: Language of each file, or a single language for all
+
+        Returns:
+            Tuple of the scratch directory (to remove once done) and the
+            staged files
+
+        Raises:
+            HTTPException: 400 if the languages do not match the files
+        """
+        if len(lang_isos) == 1:
+            lang_isos = lang_isos * len(files)
+        if len(lang_isos) != len(files):
+            raise HTTPException(
+                status_code=400,
+                detail="Provide one lang_iso per file, or a single lang_iso for all files",
+            )
+
+        work_dir = Path(await asyncio.to_thread(tempfile.mkdtemp, prefix="upload-"))
+        staged = []
+        try:
+            for index, (upload, lang_iso) in enumerate(
+                zip(files, lang_isos, strict=True)
+            ):
+                filename = upload.filename or f"file-{index}"
+                path = work_dir / f"{index}-{Path(filename).name}"
+                with open(path, "wb") as output:
+                    while chunk := await upload.read(UPLOAD_COPY_CHUNK_SIZE):
+                        await asyncio.to_thread(output.write, chunk)
+                staged.append(StagedUpload(path, filename, lang_iso))
+        except BaseException:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            raise
+
+        return work_dir, staged
+
+    async def import_files(
+        self,
+        project_id: str,
+        work_dir: Path,
+        uploads: list[StagedUpload],
+        options: FileUploadOptions | None = None,
+        on_progress: Callable[[int, int | None], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Upload staged files concurrently and wait for their import processes.
+
+        A failing file does not stop the others; its error is reported in the
+        per-file results. The scratch directory is removed afterwards.
+
+        Returns:
+            Dictionary with per-file import results
+        """
+        started = time.perf_counter()
+        finished = 0
+
+        async def import_one(upload: StagedUpload) -> dict[str, Any]:
+            nonlocal finished
+            result = await self._import_file(project_id, upload, options)
+            finished += 1
+            if on_progress:
+                on_progress(finished, len(uploads))
+            return result
+
+        try:
+            results = await asyncio.gather(*(import_one(u) for u in uploads))
+        finally:
+            await asyncio.to_thread(shutil.rmtree, work_dir, ignore_errors=True)
+
+        failed = sum(1 for result in results if result["status"] != "finished")
+        duration = round(time.perf_counter() - started, 3)
+        logger.info(
+            "Imported %s/%s files into project %s in %ss",
+            len(results) - failed,
+            len(results),
+            project_id,
+            duration,
+        )
+        return {
+            "project_id": project_id,
+            "files": results,
+            "failed": failed,
+            "duration_seconds": duration,
+        }
+
+    async def _import_file(
+        self,
+        project_id: str,
+        upload: StagedUpload,
+        options: FileUploadOptions | None,
+    ) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "filename": upload.filename,
+            "lang_iso": upload.lang_iso,
+            "process_id": None,
+            "status": "failed",
+            "message": "",
+            "details": None,
+        }
+        try:
+            response = await self.files_service.upload_file_from_path(
+                project_id, upload.path, upload.filename, upload.lang_iso, options
+            )
+            result["process_id"] = response.process.process_id
+            process = await self.processes_service.wait_for_process(
+                project_id, response.process.process_id
+            )
+            result.update(
+                status=process.status, message=process.message, details=process.details
+            )
+        except (HTTPException, httpx.HTTPError) as e:
+            message = e.detail if isinstance(e, HTTPException) else str(e)
+            result["message"] = str(message)
+            logger.error("Import of %s failed: %s", upload.filename, message)
+        return result
+
+
+# Create singleton instance
+file_upload_service = FileUploadService()
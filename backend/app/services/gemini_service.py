@@ -10,9 +10,11 @@ from tenacity import (
 )
 
 from app.core.config import get_settings
-from app.core.logging import logger
+from app.core.logging import excerpt, get_logger
 from app.services.translation_provider import TranslationProvider
 
+logger = get_logger(__name__)
+
 
 class GeminiService(TranslationProvider):
     """Service for interacting with Google Gemini API."""
@@ -72,8 +74,12 @@ class GeminiService(TranslationProvider):
                 source_text, source_lang, target_lang, system_prompt
             )
 
-            logger.info(f"Translating text from {source_lang} to {target_lang}")
-            logger.debug(f"Source text: {source_text[:100]}...")
+            logger.debug(
+                "Translating %r from %s to %s",
+                excerpt(source_text),
+                source_lang,
+                target_lang,
+            )
 
             # Generate the translation
             response = self.model.generate_content(
@@ -83,7 +89,7 @@ class GeminiService(TranslationProvider):
             # Extract the translated text
             if response.text:
                 translated_text = response.text.strip()
-                logger.debug(f"Translated text: {translated_text[:100]}...")
+                logger.debug("Translated text: %r", excerpt(translated_text))
                 return translated_text
             else:
                 raise HTTPException(
@@ -92,7 +98,7 @@ class GeminiService(TranslationProvider):
 
         except Exception as e:
             error_message = str(e)
-            logger.error(f"Gemini API error: {error_message}")
+            logger.error("Gemini API error: %s", error_message)
 
             if (
                 "API_KEY_INVALID" in error_message
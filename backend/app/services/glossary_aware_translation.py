@@ -1,10 +1,14 @@
 import re
 from typing import Any
 
-from app.core.logging import logger
+from app.core.logging import excerpt, get_logger
+from app.core.metrics import stage_labels, track_stage
+from app.core.tracing import set_span_attributes, tracer
 from app.services.gemini_service import gemini_service
 from app.services.glossary_processor import glossary_processor
 
+logger = get_logger(__name__)
+
 
 class GlossaryAwareTranslationService:
     """
@@ -18,6 +22,7 @@ class GlossaryAwareTranslationService:
         self.translation_provider = gemini_service
         self.glossary_processor = glossary_processor
 
+    @tracer.traced("translate_with_glossary")
     async def translate_with_glossary(
         self,
         source_text: str,
@@ -41,25 +46,27 @@ class GlossaryAwareTranslationService:
         Returns:
             Dictionary containing translation results and verification data
         """
-        logger.info(
-            f"=== GLOSSARY-AWARE TRANSLATION START ===\n"
-            f"Source text: '{source_text}'\n"
-            f"Source language: {source_lang}\n"
-            f"Target language: {target_lang}\n"
-            f"Project ID: {project_id}\n"
-            f"Preserve forbidden terms: {preserve_forbidden_terms}\n"
-            f"Translate allowed terms: {translate_allowed_terms}"
+        logger.debug(
+            "Translating %r from %s to %s (project %s)",
+            excerpt(source_text),
+            source_lang,
+            target_lang,
+            project_id,
+        )
+        set_span_attributes(
+            project_id=project_id, source_lang=source_lang, target_lang=target_lang
         )
 
+        labels = stage_labels(project_id, source_lang, target_lang)
+
         # If no project_id provided, proceed with regular translation
         if not project_id:
-            logger.info("No project_id provided, performing regular translation")
-            translated_text = await self.translation_provider.translate_text(
-                source_text=source_text,
-                source_lang=source_lang,
-                target_lang=target_lang,
-            )
-            logger.info(f"Regular translation completed: '{translated_text}'")
+            with track_stage("provider_call", **labels):
+                translated_text = await self.translation_provider.translate_text(
+                    source_text=source_text,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                )
 
             return {
                 "translated_text": translated_text,
@@ -79,97 +86,61 @@ class GlossaryAwareTranslationService:
             }
 
         # Step 1: Find glossary terms in source text
-        logger.info("=== STEP 1: Finding glossary terms ===")
         try:
             found_terms = await self.glossary_processor.find_terms_in_text(
                 source_text, project_id
             )
-            logger.info(f"Found {len(found_terms)} glossary terms in source text")
-            for i, term in enumerate(found_terms):
-                logger.info(
-                    f"  Term {i + 1}: '{term['term']}' -> '{term['matched_text']}' "
-                    f"(forbidden: {term['forbidden']}, translatable: {term['translatable']}, "
-                    f"position: {term['start']}-{term['end']})"
-                )
         except Exception as e:
-            logger.error(f"Error finding glossary terms: {e}", exc_info=True)
+            logger.error("Error finding glossary terms: %s", e, exc_info=True)
             raise
 
         # Step 2: Wrap terms for protection during translation
-        logger.info("=== STEP 2: Wrapping terms for translation ===")
         try:
-            wrapped_text = await self._wrap_terms_for_translation(
-                source_text,
-                found_terms,
-                preserve_forbidden_terms,
-                translate_allowed_terms,
-            )
-            logger.info(f"Original text: '{source_text}'")
-            logger.info(f"Wrapped text: '{wrapped_text}'")
-            logger.info(f"Text changed: {source_text != wrapped_text}")
+            with track_stage("wrapping", **labels):
+                wrapped_text = await self._wrap_terms_for_translation(
+                    source_text,
+                    found_terms,
+                    preserve_forbidden_terms,
+                    translate_allowed_terms,
+                )
         except Exception as e:
-            logger.error(f"Error wrapping terms: {e}", exc_info=True)
+            logger.error("Error wrapping terms: %s", e, exc_info=True)
             raise
 
         # Step 3: Create system prompt for AI translation
-        logger.info("=== STEP 3: Creating system prompt ===")
         try:
-            system_prompt = self._create_glossary_system_prompt(
-                found_terms,
-                target_lang,
-                preserve_forbidden_terms,
-                translate_allowed_terms,
-            )
-            logger.info(f"System prompt created (length: {len(system_prompt)})")
-            if system_prompt:
-                logger.info(f"System prompt preview: {system_prompt[:200]}...")
-            else:
-                logger.info("No system prompt created (no terms found)")
+            with track_stage("prompt_build", **labels):
+                system_prompt = self._create_glossary_system_prompt(
+                    found_terms,
+                    target_lang,
+                    preserve_forbidden_terms,
+                    translate_allowed_terms,
+                )
         except Exception as e:
-            logger.error(f"Error creating system prompt: {e}", exc_info=True)
+            logger.error("Error creating system prompt: %s", e, exc_info=True)
             raise
 
         # Step 4: Perform translation with system prompt
-        logger.info("=== STEP 4: Performing AI translation ===")
         try:
-            logger.info("Calling translation provider with:")
-            logger.info(f"  Source text: '{wrapped_text}'")
-            logger.info(f"  Source lang: {source_lang}")
-            logger.info(f"  Target lang: {target_lang}")
-            logger.info(
-                f"  System prompt length: {len(system_prompt) if system_prompt else 0}"
-            )
-
-            translated_text = await self.translation_provider.translate_text(
-                source_text=wrapped_text,
-                source_lang=source_lang,
-                target_lang=target_lang,
-                system_prompt=system_prompt,
-            )
-            logger.info(f"AI translation completed: '{translated_text}'")
+            with track_stage("provider_call", **labels):
+                translated_text = await self.translation_provider.translate_text(
+                    source_text=wrapped_text,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    system_prompt=system_prompt,
+                )
         except Exception as e:
-            logger.error(f"Error during AI translation: {e}", exc_info=True)
+            logger.error("Error during AI translation: %s", e, exc_info=True)
             raise
 
         # Step 5: Verify and clean up the translation
-        logger.info("=== STEP 5: Verifying translation ===")
         try:
-            verification_results = await self._verify_translation(
-                translated_text, found_terms, target_lang
-            )
-            logger.info("Verification completed:")
-            logger.info(f"  Success: {verification_results['success']}")
-            logger.info(
-                f"  Missing terms: {len(verification_results['missing_terms'])}"
-            )
-            logger.info(f"  Warnings: {len(verification_results['warnings'])}")
-            logger.info(f"  Suggestions: {len(verification_results['suggestions'])}")
-            logger.info(
-                f"  Found wrapped terms: {len(verification_results['found_wrapped_terms'])}"
-            )
-            logger.info(f"  Cleaned text: '{verification_results['cleaned_text']}'")
+            with track_stage("verification", **labels):
+                verification_results = await self._verify_translation(
+                    translated_text, found_terms, target_lang
+                )
         except Exception as e:
-            logger.error(f"Error during translation verification: {e}", exc_info=True)
+            logger.error("Error during translation verification: %s", e, exc_info=True)
             raise
 
         final_result = {
@@ -182,8 +153,14 @@ class GlossaryAwareTranslationService:
             "verification_results": verification_results,
         }
 
-        logger.info("=== GLOSSARY-AWARE TRANSLATION COMPLETED ===")
-        logger.info(f"Final translated text: '{final_result['translated_text']}'")
+        logger.info(
+            "Translated %r to %s with %d glossary terms: %r",
+            excerpt(source_text),
+            target_lang,
+            len(found_terms),
+            excerpt(verification_results["cleaned_text"]),
+            extra={"project_id": project_id},
+        )
 
         return final_result
 
@@ -206,20 +183,11 @@ class GlossaryAwareTranslationService:
         Returns:
             Text with terms wrapped in protective markers
         """
-        logger.info("=== WRAPPING TERMS FOR TRANSLATION ===")
-        logger.info(f"Input text: '{text}'")
-        logger.info(f"Found terms count: {len(found_terms)}")
-        logger.info(f"Preserve forbidden terms: {preserve_forbidden_terms}")
-        logger.info(f"Translate allowed terms: {translate_allowed_terms}")
-
         if not found_terms:
-            logger.info("No terms found, returning original text")
             return text
 
         # Sort terms by position (reverse order to maintain positions during replacement)
         sorted_terms = sorted(found_terms, key=lambda x: x["start"], reverse=True)
-        terms_summary = [f"{t['term']}@{t['start']}-{t['end']}" for t in sorted_terms]
-        logger.info(f"Terms sorted by position (reverse): {terms_summary}")
 
         wrapped_text = text
         wrapped_count = 0
@@ -229,18 +197,10 @@ class GlossaryAwareTranslationService:
             should_wrap = False
 
             # Determine if we should wrap this term
-            if term_info["forbidden"] and preserve_forbidden_terms:
-                should_wrap = True
-                reason = "forbidden term + preserve_forbidden_terms=True"
-            elif term_info["translatable"] and translate_allowed_terms:
+            if (term_info["forbidden"] and preserve_forbidden_terms) or (
+                term_info["translatable"] and translate_allowed_terms
+            ):
                 should_wrap = True
-                reason = "translatable term + translate_allowed_terms=True"
-            else:
-                reason = f"forbidden={term_info['forbidden']}, translatable={term_info['translatable']}, preserve_forbidden={preserve_forbidden_terms}, translate_allowed={translate_allowed_terms}"
-
-            logger.info(
-                f"Term '{term_info['term']}' -> should_wrap={should_wrap} ({reason})"
-            )
 
             if should_wrap:
                 start, end = term_info["start"], term_info["end"]
@@ -252,22 +212,14 @@ class GlossaryAwareTranslationService:
                     f'<GLOSSARY_TERM id="{term_id}">{matched_text}</GLOSSARY_TERM>'
                 )
 
-                old_text = wrapped_text
                 wrapped_text = wrapped_text[:start] + wrapped_term + wrapped_text[end:]
                 wrapped_count += 1
-
-                logger.info(f"  Wrapped '{matched_text}' with ID '{term_id}'")
-                logger.info(
-                    f"  Text change: '{old_text[max(0, start - 10) : end + 10]}' -> '{wrapped_text[max(0, start - 10) : start + len(wrapped_term) + 10]}'"
-                )
+                logger.debug("Wrapped %r with ID %r", matched_text, term_id)
             else:
                 skipped_count += 1
-                logger.info(f"  Skipped wrapping '{term_info['term']}'")
+                logger.debug("Skipped wrapping %r", term_info["term"])
 
-        logger.info("=== WRAPPING COMPLETED ===")
-        logger.info(f"Terms wrapped: {wrapped_count}")
-        logger.info(f"Terms skipped: {skipped_count}")
-        logger.info(f"Final wrapped text: '{wrapped_text}'")
+        logger.debug("Wrapped %d terms, skipped %d", wrapped_count, skipped_count)
 
         return wrapped_text
 
@@ -324,24 +276,15 @@ class GlossaryAwareTranslationService:
                 ]
             )
             for term in translatable_terms:
-                # Debug logging to see what translations are available
-                logger.info(
-                    f"DEBUG: Term '{term['term']}' has translations: {term['translations']}"
-                )
                 target_translation = term["translations"].get(target_lang)
-                logger.info(
-                    f"DEBUG: Looking for '{target_lang}' translation, found: '{target_translation}'"
-                )
-
                 if target_translation:
                     prompt_parts.append(f"- {term['term']} → {target_translation}")
-                    logger.info(
-                        f"DEBUG: Added translation instruction: {term['term']} → {target_translation}"
-                    )
                 else:
                     prompt_parts.append(f"- {term['term']} (translate appropriately)")
-                    logger.info(
-                        f"DEBUG: No translation found for {term['term']} in {target_lang}, using fallback"
+                    logger.debug(
+                        "No %s translation of glossary term %r",
+                        target_lang,
+                        term["term"],
                     )
             prompt_parts.append("")
 
@@ -457,9 +400,11 @@ class GlossaryAwareTranslationService:
         # Determine overall success
         success = not has_errors and len(missing_terms) == 0
 
-        logger.info(
-            f"Translation verification completed with {len(suggestions)} suggestions, "
-            f"{len(warnings)} warnings, {len(missing_terms)} missing terms. Success: {success}"
+        logger.debug(
+            "Verified translation: %d suggestions, %d warnings, %d missing terms",
+            len(suggestions),
+            len(warnings),
+            len(missing_terms),
         )
 
         return {
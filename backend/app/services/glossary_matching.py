@@ -0,0 +1,333 @@
+"""
+CPU-bound glossary term matching for project-wide compliance scans.
+
+Functions here are pure and importable without the rest of the application so
+they can run in worker processes (see ``evaluation_metrics``).
+
+Source texts are matched against every glossary term in one pass with an
+Aho-Corasick automaton built once per glossary, instead of one regex per term.
+Matches follow ``GlossaryProcessor.find_terms_in_text``: terms match on word
+boundaries (``\\b`` semantics), case-insensitively unless the term is
+case-sensitive, and case-sensitive matches win over overlapping
+case-insensitive ones.
+
+Target texts are checked with the rules of
+``TranslationEvaluationService._analyze_term_handling``: forbidden and
+non-translatable terms must be preserved, translatable terms must contain
+their glossary translation for the language (case-insensitive substring).
+A reverse index maps each term to the text it needs in each language, so a
+text is searched once per distinct needle however many terms share it.
+"""
+
+from collections import deque
+from collections.abc import Iterator
+from typing import Any, Literal, TypedDict
+
+ViolationKind = Literal["not_preserved", "missing_translation", "no_translation"]
+VIOLATION_KINDS: tuple[ViolationKind, ...] = (
+    "not_preserved",
+    "missing_translation",
+    "no_translation",
+)
+
+
+class ScanTerm(TypedDict):
+    """Glossary term as shipped to scan workers."""
+
+    term: str
+    case_sensitive: bool
+    forbidden: bool
+    translatable: bool
+    translations: dict[str, str]
+
+
+# Scan rows: key id, key name, source text, target texts by language
+ScanRow = tuple[int, str, str, dict[str, str]]
+
+
+class AhoCorasick:
+    """Multi-pattern substring automaton over (lowercased) patterns."""
+
+    def __init__(self, patterns: list[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        # Pattern indices ending at each state, including via failure links
+        self._outputs: list[tuple[int, ...]] = [()]
+        self._lengths = [len(pattern) for pattern in patterns]
+
+        for index, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._outputs.append(())
+                state = next_state
+            self._outputs[state] += (index,)
+
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._outputs[child] += self._outputs[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield ``(start, pattern_index)`` of every (overlapping) occurrence."""
+        goto, fail, outputs, lengths = (
+            self._goto,
+            self._fail,
+            self._outputs,
+            self._lengths,
+        )
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                for index in outputs[state]:
+                    yield position + 1 - lengths[index], index
+
+
+def _is_word(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _at_boundary(text: str, position: int) -> bool:
+    """Whether ``\\b`` matches at ``position`` of ``text``."""
+    before = position > 0 and _is_word(text[position - 1])
+    after = position < len(text) and _is_word(text[position])
+    return before != after
+
+
+def _lower_aligned(text: str) -> str:
+    """Lowercase ``text`` keeping every character at its position."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. "İ") lowercase to several; keep those as they are
+    return "".join(low if len(low := char.lower()) == 1 else char for char in text)
+
+
+class GlossaryMatcher:
+    """Finds glossary terms in source texts and checks their translations."""
+
+    def __init__(self, terms: list[ScanTerm]):
+        self.terms = terms
+        self._automaton = AhoCorasick([_lower_aligned(t["term"]) for t in terms])
+        # Reverse index: per language, the lowercased text each term requires
+        # (None when a translatable term has no translation for the language)
+        self._needles: dict[str, list[str | None]] = {}
+
+    def find_terms(self, text: str) -> list[int]:
+        """
+        Indices of the glossary terms occurring in ``text``.
+
+        Overlapping matches are resolved like ``find_terms_in_text``:
+        case-sensitive terms first, then longer and earlier matches.
+        """
+        if not text:
+            return []
+        terms = self.terms
+        candidates: list[tuple[bool, int, int, int]] = []
+        for start, index in self._automaton.iter_matches(_lower_aligned(text)):
+            term = terms[index]["term"]
+            end = start + len(term)
+            if not (_at_boundary(text, start) and _at_boundary(text, end)):
+                continue
+            case_sensitive = terms[index]["case_sensitive"]
+            if case_sensitive and text[start:end] != term:
+                continue
+            candidates.append((not case_sensitive, start - end, start, index))
+        if len(candidates) <= 1:
+            return [candidate[3] for candidate in candidates]
+
+        candidates.sort()
+        taken: list[tuple[int, int]] = []
+        found: list[int] = []
+        for _, negative_length, start, index in candidates:
+            end = start - negative_length
+            if any(
+                start < other_end and other_start < end
+                for other_start, other_end in taken
+            ):
+                continue
+            taken.append((start, end))
+            if index not in found:
+                found.append(index)
+        return found
+
+    def needles(self, language: str) -> list[str | None]:
+        """Lowercased text each term requires in a translation to ``language``."""
+        needles = self._needles.get(language)
+        if needles is None:
+            needles = [
+                term["translations"].get(language, "").lower() or None
+                if term["translatable"] and not term["forbidden"]
+                else term["term"].lower()
+                for term in self.terms
+            ]
+            self._needles[language] = needles
+        return needles
+
+    def check(
+        self, term_indices: list[int], translation: str, language: str
+    ) -> list[tuple[int, ViolationKind]]:
+        """
+        Violations of the given source terms in one translation.
+
+        Returns:
+            ``(term_index, kind)`` of every term handled incorrectly
+        """
+        needles = self.needles(language)
+        lowered = translation.lower()
+        present: dict[str, bool] = {}
+        violations: list[tuple[int, ViolationKind]] = []
+        for index in term_indices:
+            needle = needles[index]
+            if needle is None:
+                violations.append((index, "no_translation"))
+                continue
+            found = present.get(needle)
+            if found is None:
+                found = present[needle] = needle in lowered
+            if not found:
+                term = self.terms[index]
+                kind: ViolationKind = (
+                    "missing_translation"
+                    if term["translatable"] and not term["forbidden"]
+                    else "not_preserved"
+                )
+                violations.append((index, kind))
+        return violations
+
+
+# Matchers of the glossaries a worker has scanned, by glossary key
+_matchers: dict[str, GlossaryMatcher] = {}
+MAX_CACHED_MATCHERS = 4
+
+
+class UnknownGlossaryError(LookupError):
+    """A worker was sent a chunk without terms for a glossary it has no matcher for."""
+
+
+def _matcher(glossary_key: str, terms: list[ScanTerm] | None) -> GlossaryMatcher:
+    matcher = _matchers.get(glossary_key)
+    if matcher is None:
+        if terms is None:
+            raise UnknownGlossaryError(glossary_key)
+        if len(_matchers) >= MAX_CACHED_MATCHERS:
+            _matchers.pop(next(iter(_matchers)))
+        matcher = _matchers[glossary_key] = GlossaryMatcher(terms)
+    return matcher
+
+
+def scan_chunk(
+    glossary_key: str,
+    terms: list[ScanTerm] | None,
+    rows: list[ScanRow],
+    languages: list[str],
+    sample_limit: int,
+) -> dict[str, dict[str, Any]]:
+    """
+    Check a chunk of keys against the glossary in every target language.
+
+    Args:
+        glossary_key: Identifies ``terms``; workers reuse the matcher built
+            for a key instead of rebuilding the automaton for every chunk
+        terms: Glossary terms; may be None once the worker has a matcher for
+            ``glossary_key``, so the terms are not sent with every chunk
+        rows: ``(key_id, key_name, source_text, translations)`` of each key
+        languages: Target language codes to check
+        sample_limit: Maximum number of violations listed per language
+
+    Returns:
+        Per-language counters, to be combined with ``merge_scan_results``
+
+    Raises:
+        UnknownGlossaryError: If ``terms`` is None and this worker has no
+            matcher for ``glossary_key``
+    """
+    matcher = _matcher(glossary_key, terms)
+    results = {language: _empty_result() for language in languages}
+
+    for key_id, key_name, source_text, translations in rows:
+        term_indices = matcher.find_terms(source_text)
+        for language in languages:
+            translation = translations.get(language)
+            result = results[language]
+            if not translation:
+                result["keys_untranslated"] += 1
+                continue
+            result["keys_checked"] += 1
+            if not term_indices:
+                continue
+            result["keys_with_terms"] += 1
+            result["terms_checked"] += len(term_indices)
+            violations = matcher.check(term_indices, translation, language)
+            if not violations:
+                continue
+            result["keys_with_violations"] += 1
+            for index, kind in violations:
+                term = matcher.terms[index]["term"]
+                result["violations"][kind] += 1
+                result["terms"][term] = result["terms"].get(term, 0) + 1
+                if len(result["samples"]) < sample_limit:
+                    result["samples"].append(
+                        {
+                            "key_id": key_id,
+                            "key_name": key_name,
+                            "term": term,
+                            "kind": kind,
+                            "expected": matcher.needles(language)[index],
+                            "translation": translation,
+                        }
+                    )
+    return results
+
+
+def _empty_result() -> dict[str, Any]:
+    return {
+        "keys_checked": 0,
+        "keys_untranslated": 0,
+        "keys_with_terms": 0,
+        "keys_with_violations": 0,
+        "terms_checked": 0,
+        "violations": dict.fromkeys(VIOLATION_KINDS, 0),
+        "terms": {},
+        "samples": [],
+    }
+
+
+def merge_scan_results(
+    total: dict[str, dict[str, Any]],
+    chunk: dict[str, dict[str, Any]],
+    sample_limit: int,
+) -> None:
+    """Add the counters of one ``scan_chunk`` result to ``total`` in place."""
+    for language, result in chunk.items():
+        merged = total.setdefault(language, _empty_result())
+        for field in (
+            "keys_checked",
+            "keys_untranslated",
+            "keys_with_terms",
+            "keys_with_violations",
+            "terms_checked",
+        ):
+            merged[field] += result[field]
+        for kind, count in result["violations"].items():
+            merged["violations"][kind] += count
+        for term, count in result["terms"].items():
+            merged["terms"][term] = merged["terms"].get(term, 0) + count
+        room = sample_limit - len(merged["samples"])
+        merged["samples"].extend(result["samples"][: max(room, 0)])
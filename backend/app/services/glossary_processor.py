@@ -1,24 +1,132 @@
+import asyncio
 import re
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
+import httpx
 from fastapi import HTTPException
 
-from app.core.logging import logger
+from app.core.config import get_settings
+from app.core.logging import excerpt, get_logger
+from app.core.metrics import stage_labels, track_stage
 from app.schemas.lokalise.glossary import (
+    GlossaryTerm,
     GlossaryTermCreate,
     GlossaryTermsCreate,
-    GlossaryTermTranslation,
+    GlossaryTermsDelete,
+    GlossaryTermsUpdate,
 )
+from app.services.glossary_reader import GlossaryColumns, iter_glossary_batches
+from app.services.glossary_sync import GlossaryDiff, SyncAction, term_update
+from app.services.glossary_upload import (
+    AdaptiveBatchSize,
+    TermOutcome,
+    upload_checkpoint,
+    upload_id_for,
+)
+from app.services.language_registry import language_registry
 from app.services.lokalise.glossary import lokalise_glossary_service
+from app.services.lokalise.retry import AmbiguousWriteError
+
+logger = get_logger(__name__)
+
+# Attempts at a term batch whose creation may or may not have been applied
+GLOSSARY_UPLOAD_MAX_ATTEMPTS = 3
+# Terms read from a glossary file at a time
+GLOSSARY_READ_BLOCK_SIZE = 500
+# Error statuses of create requests Lokalise rejected as invalid; such
+# batches are split to isolate the offending terms
+GLOSSARY_REJECTED_STATUS_CODES = frozenset({400, 409})
+
+# Called with (items done, total items if known, named counters)
+ProgressCallback = Callable[[int, int | None, dict[str, int]], None]
+
+
+def _upload_report(
+    project_id: str, upload_id: str, outcomes: list[TermOutcome]
+) -> dict[str, Any]:
+    counts = dict.fromkeys(("created", "skipped", "failed"), 0)
+    for _, status, _ in outcomes:
+        counts[status] += 1
+    return {
+        "project_id": project_id,
+        "upload_id": upload_id,
+        **counts,
+        "terms": [
+            {"term": term, "status": status, "detail": detail}
+            for term, status, detail in outcomes
+        ],
+    }
+
+
+def _sync_change(
+    term: str,
+    action: SyncAction,
+    status: str,
+    fields: list[str] | None = None,
+    detail: str | None = None,
+) -> dict[str, Any]:
+    return {
+        "term": term,
+        "action": action,
+        "status": status,
+        "fields": fields or [],
+        "detail": detail,
+    }
+
+
+def _sync_report(
+    project_id: str,
+    dry_run: bool,
+    languages: list[str],
+    unchanged: int,
+    changes: list[dict[str, Any]],
+) -> dict[str, Any]:
+    counts = dict.fromkeys(("create", "update", "delete"), 0)
+    for change in changes:
+        if change["status"] != "failed":
+            counts[change["action"]] += 1
+    return {
+        "project_id": project_id,
+        "dry_run": dry_run,
+        "languages": languages,
+        "created": counts["create"],
+        "updated": counts["update"],
+        "deleted": counts["delete"],
+        "unchanged": unchanged,
+        "failed": sum(change["status"] == "failed" for change in changes),
+        "changes": changes,
+    }
+
+
+class _UploadProgress:
+    """Counters of a glossary upload, reported as batches complete."""
+
+    def __init__(self, on_progress: ProgressCallback | None):
+        self.on_progress = on_progress
+        self.counters = dict.fromkeys(
+            ("rows_parsed", "batches_uploaded", "created", "skipped", "failed"), 0
+        )
+
+    def record(self, outcomes: list[TermOutcome], *, batch: bool = False) -> None:
+        for _, status, _ in outcomes:
+            self.counters[status] += 1
+        self.counters["batches_uploaded"] += batch
+        if self.on_progress:
+            done = sum(self.counters[name] for name in ("created", "skipped", "failed"))
+            self.on_progress(done, None, dict(self.counters))
+
+
+_settings = get_settings()
 
 
 class GlossaryProcessor:
     """
     Glossary processor that uses Lokalise as backend storage.
 
-    Handles XLSX file loading to Lokalise and text processing using Lokalise API.
+    Handles XLSX/CSV file loading to Lokalise and text processing using Lokalise API.
     All operations are stateless and require project_id parameter.
     """
 
@@ -26,16 +134,33 @@ class GlossaryProcessor:
         # Remove global state - patterns will be request-scoped
         pass
 
-    async def load_glossary_from_xlsx(
-        self, file_path: str | Path, project_id: str, source_language: str = "en"
-    ) -> None:
+    async def load_glossary_file(
+        self,
+        file_path: str | Path,
+        project_id: str,
+        source_language: str = "en",
+        *,
+        on_progress: ProgressCallback | None = None,
+    ) -> dict[str, Any]:
         """
-        Load glossary data from an XLSX file and upload to Lokalise.
+        Load glossary data from an XLSX or CSV file and upload to Lokalise.
+
+        The file is read in a worker thread block by block while batches of
+        new terms are created concurrently (see ``_upload_terms``). Progress
+        is checkpointed per batch, so running the same import again resumes
+        it and only retries the terms that are not done yet.
 
         Args:
-            file_path: Path to the XLSX file
+            file_path: Path to the XLSX or CSV file
             project_id: Lokalise project ID
             source_language: Source language for terms (default: "en")
+            on_progress: Called with the number of terms done in this run and
+                the ``rows_parsed``, ``batches_uploaded``, ``created``,
+                ``skipped`` and ``failed`` counters as the upload advances
+
+        Returns:
+            Upload report with created/skipped/failed counts and the outcome
+            of every term
 
         Raises:
             HTTPException: If file cannot be read or parsed
@@ -48,195 +173,465 @@ class GlossaryProcessor:
                 )
 
             logger.info(
-                f"Loading glossary from {file_path} to Lokalise project {project_id}"
+                "Loading glossary from %s to Lokalise project %s", file_path, project_id
             )
 
-            # Read the XLSX file
-            df = pd.read_excel(file_path, engine="openpyxl")
+            columns, blocks = await self._read_glossary_file(file_path, project_id)
+            try:
+                logger.info("Found languages: %s", sorted(columns.language_codes))
 
-            # Validate required columns
-            required_columns = ["term", "casesensitive", "forbidden", "translatable"]
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Missing required columns: {missing_columns}",
+                upload_id = await asyncio.to_thread(
+                    upload_id_for, project_id, file_path
                 )
+                completed = await asyncio.to_thread(
+                    upload_checkpoint.start, upload_id, project_id
+                )
+                if completed:
+                    logger.info(
+                        "Resuming glossary upload %s: %s terms done by earlier runs",
+                        upload_id[:12],
+                        len(completed),
+                    )
 
-            # Identify language columns (exclude metadata columns)
-            metadata_columns = {
-                "term",
-                "description",
-                "part_of_speech",
-                "casesensitive",
-                "translatable",
-                "forbidden",
-                "tags",
-            }
-
-            # Find language columns (those ending with _description are descriptions)
-            language_columns = []
-            for col in df.columns:
-                if col not in metadata_columns and not col.endswith("_description"):
-                    language_columns.append(col)
+                # Get existing terms from Lokalise to avoid duplicates
+                existing_terms: set[str] = set()
+                try:
+                    existing_terms = {
+                        term.term.lower()
+                        for term in await lokalise_glossary_service.get_all_glossary_terms(
+                            project_id
+                        )
+                    }
+                    logger.info(
+                        "Found %s existing terms in Lokalise", len(existing_terms)
+                    )
+                except Exception as e:
+                    logger.warning("Could not fetch existing terms: %s", e)
+
+                await self._upload_terms(
+                    project_id,
+                    upload_id,
+                    blocks,
+                    existing_terms,
+                    completed,
+                    on_progress=on_progress,
+                )
+            finally:
+                # Closes the file when the import stops early
+                blocks.close()
 
-            logger.info(f"Found languages: {sorted(language_columns)}")
+            outcomes = await asyncio.to_thread(upload_checkpoint.finish, upload_id)
+            report = _upload_report(project_id, upload_id, outcomes)
+            logger.info(
+                "Glossary upload to project %s: %s created, %s skipped, %s failed",
+                project_id,
+                report["created"],
+                report["skipped"],
+                report["failed"],
+            )
+            return report
 
-            # Get existing terms from Lokalise to avoid duplicates
-            existing_terms = {}
-            try:
-                lokalise_response = await lokalise_glossary_service.get_glossary_terms(
-                    project_id
-                )
-                existing_terms = {
-                    term.term.lower(): term for term in lokalise_response.data
-                }
-                logger.info(f"Found {len(existing_terms)} existing terms in Lokalise")
-            except Exception as e:
-                logger.warning(f"Could not fetch existing terms: {e}")
+        except Exception as e:
+            logger.error("Failed to load glossary from %s: %s", file_path, e)
+            if isinstance(e, HTTPException):
+                raise
+            raise HTTPException(
+                status_code=500, detail=f"Failed to process glossary file: {e!s}"
+            ) from e
 
-            # Process each row and prepare for Lokalise
-            terms_to_create = []
-            skipped_terms = []
-            processed_count = 0
+    async def _read_glossary_file(
+        self, file_path: Path, project_id: str
+    ) -> tuple[GlossaryColumns, Iterator[list[GlossaryTermCreate]]]:
+        """Open a glossary file with its columns mapped to project languages."""
+        project_languages = await language_registry.get(project_id)
+        columns, blocks = await asyncio.to_thread(
+            iter_glossary_batches,
+            file_path,
+            GLOSSARY_READ_BLOCK_SIZE,
+            project_languages,
+        )
+        if columns.unknown_languages:
+            logger.warning(
+                "Ignoring glossary columns of languages not in project %s: %s",
+                project_id,
+                list(columns.unknown_languages),
+            )
+        return columns, blocks
 
-            for _, row in df.iterrows():
-                term_value = row["term"]
-                # Handle pandas scalar values properly
-                term = str(term_value).strip() if not pd.isna(term_value) else ""  # pyright: ignore[reportGeneralTypeIssues]
-                if not term:
-                    continue
+    async def _upload_terms(
+        self,
+        project_id: str,
+        upload_id: str,
+        blocks: Iterator[list[GlossaryTermCreate]],
+        existing_terms: set[str],
+        completed: set[str],
+        *,
+        on_progress: ProgressCallback | None = None,
+    ) -> None:
+        """
+        Create the new terms of a glossary file in concurrent batches.
 
-                # Skip if term exists in Lokalise
-                if term.lower() in existing_terms:
-                    skipped_terms.append(term)
-                    continue
+        Up to ``GLOSSARY_UPLOAD_CONCURRENCY`` batches are in flight (paced by
+        the shared Lokalise rate limiter); reading waits for a free slot, so
+        memory stays bounded. Each batch's outcome is checkpointed when it
+        completes.
+        """
+        progress = _UploadProgress(on_progress)
 
-                # Parse flags
-                case_sensitive = self._parse_boolean_flag(
-                    row.get("casesensitive", "no")
-                )
-                forbidden = self._parse_boolean_flag(row.get("forbidden", "no"))
-                translatable = self._parse_boolean_flag(row.get("translatable", "yes"))
-
-                # Get definition/description
-                definition = self._get_safe_string_value(row, "description")
-
-                # Extract translations from language columns
-                translations = []
-                for lang_col in language_columns:
-                    translation_text = self._get_safe_string_value(row, lang_col)
-                    if translation_text and translation_text.strip():
-                        # Get description for this language if available
-                        desc_col = f"{lang_col}_description"
-                        translation_desc = (
-                            self._get_safe_string_value(row, desc_col) or ""
-                        )
+        sizer = AdaptiveBatchSize(
+            initial=_settings.GLOSSARY_UPLOAD_BATCH_SIZE,
+            minimum=_settings.GLOSSARY_UPLOAD_MIN_BATCH_SIZE,
+            maximum=_settings.GLOSSARY_UPLOAD_MAX_BATCH_SIZE,
+            target_seconds=_settings.GLOSSARY_UPLOAD_TARGET_BATCH_SECONDS,
+        )
+        slots = asyncio.Semaphore(_settings.GLOSSARY_UPLOAD_CONCURRENCY)
+        tasks: set[asyncio.Task[None]] = set()
+        # Terms done earlier or already taken from the file (first row wins)
+        seen = set(completed)
+        pending: list[GlossaryTermCreate] = []
 
-                        # Create translation object
-                        # Map common language codes to names
-                        lang_name_map = {
-                            "en": "English",
-                            "en_US": "English (US)",
-                            "fr": "French",
-                            "fr_CA": "French (Canada)",
-                            "es": "Spanish",
-                            "es_419": "Spanish (Latin America)",
-                            "it": "Italian",
-                            "ko": "Korean",
-                            "zh_CN": "Chinese (Simplified)",
-                            "zh_TW": "Chinese (Traditional)",
-                        }
+        async def upload(batch: list[GlossaryTermCreate]) -> None:
+            try:
+                outcomes = await self._upload_batch(project_id, batch, sizer)
+                await asyncio.to_thread(upload_checkpoint.record, upload_id, outcomes)
+                progress.record(outcomes, batch=True)
+            finally:
+                slots.release()
+
+        async def submit(batch: list[GlossaryTermCreate]) -> None:
+            await slots.acquire()
+            task = asyncio.create_task(upload(batch))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
 
-                        translation = GlossaryTermTranslation(
-                            lang_id=1,  # Use 1 as default - Lokalise will handle mapping
-                            lang_name=lang_name_map.get(lang_col, lang_col)
-                            or lang_col,  # Ensure it's always a string
-                            lang_iso=lang_col,
-                            translation=translation_text.strip(),
-                            description=translation_desc.strip()
-                            if translation_desc
-                            else "",
-                        )
-                        translations.append(translation)
-                        logger.debug(
-                            f"Added translation for {lang_col}: {translation_text.strip()}"
+        try:
+            while block := await asyncio.to_thread(next, blocks, None):
+                progress.counters["rows_parsed"] += len(block)
+                skipped: list[TermOutcome] = []
+                for term in block:
+                    key = term.term.lower()
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    if key in existing_terms:
+                        skipped.append(
+                            (term.term, "skipped", "Already in the Lokalise glossary")
                         )
+                    else:
+                        pending.append(term)
+                if skipped:
+                    await asyncio.to_thread(
+                        upload_checkpoint.record, upload_id, skipped
+                    )
+                progress.record(skipped)
+                while len(pending) >= (size := sizer.size):
+                    batch, pending = pending[:size], pending[size:]
+                    await submit(batch)
+            if pending:
+                await submit(pending)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _upload_batch(
+        self,
+        project_id: str,
+        batch: list[GlossaryTermCreate],
+        sizer: AdaptiveBatchSize,
+    ) -> list[TermOutcome]:
+        """
+        Create a batch of terms and report the outcome of each.
 
-                # Create glossary term with translations
-                glossary_term = GlossaryTermCreate(
-                    term=term,
-                    description=definition or f"Glossary term: {term}",
-                    case_sensitive=case_sensitive,
-                    translatable=translatable,
-                    forbidden=forbidden,
-                    translations=translations,
-                )
+        Batches Lokalise rejects as invalid are split in halves and retried
+        until the offending terms are isolated; other failures (after the
+        client's retries) fail the whole batch.
+        """
+        started = time.monotonic()
+        try:
+            created = await self._upload_term_batch(project_id, batch)
+        except (HTTPException, httpx.HTTPError) as e:
+            sizer.record_failure()
+            message = str(e.detail if isinstance(e, HTTPException) else e)
+            rejected = (
+                isinstance(e, HTTPException)
+                and e.status_code in GLOSSARY_REJECTED_STATUS_CODES
+            )
+            if rejected and len(batch) > 1:
+                middle = len(batch) // 2
+                return [
+                    *await self._upload_batch(project_id, batch[:middle], sizer),
+                    *await self._upload_batch(project_id, batch[middle:], sizer),
+                ]
+            logger.error("Failed to upload %s glossary terms: %s", len(batch), message)
+            return [(term.term, "failed", message) for term in batch]
+
+        sizer.record_success(time.monotonic() - started)
+        logger.info(
+            "Uploaded batch of %s terms with translations to Lokalise", len(created)
+        )
+        return [
+            (term.term, "created", None)
+            if term.term.lower() in created
+            else (term.term, "failed", "Not created by Lokalise")
+            for term in batch
+        ]
+
+    async def _upload_term_batch(
+        self, project_id: str, batch: list[GlossaryTermCreate]
+    ) -> set[str]:
+        """
+        Create a batch of terms in Lokalise.
+
+        Creation is not idempotent, so a request that failed in a way that may
+        have applied it is not resent as is: the terms that now exist in
+        Lokalise are dropped from the batch and only the rest is sent again.
 
-                # Add detailed logging for debugging
-                logger.info(f"Created term: {term}")
-                logger.info(f"  - Description: {definition}")
-                logger.info(f"  - Translations count: {len(translations)}")
-                logger.info(
-                    f"  - Translation languages: {[t.lang_iso for t in translations]}"
+        Returns:
+            Lowercased names of the terms created
+        """
+        created: set[str] = set()
+        for attempt in range(1, GLOSSARY_UPLOAD_MAX_ATTEMPTS + 1):
+            try:
+                created_response = (
+                    await lokalise_glossary_service.create_glossary_terms(
+                        project_id, GlossaryTermsCreate(terms=batch)
+                    )
                 )
-                # Log actual translation content
-                for t in translations:
-                    logger.info(
-                        f"  - Translation {t.lang_iso}: '{t.translation}' (desc: '{t.description}')"
+                if created_response.meta.errors:
+                    logger.warning(
+                        "Lokalise reported errors for a term batch: %s",
+                        created_response.meta.errors,
                     )
-                logger.debug(f"  - Full term object: {glossary_term}")
+                return created | {term.term.lower() for term in created_response.data}
+            except AmbiguousWriteError:
+                if attempt == GLOSSARY_UPLOAD_MAX_ATTEMPTS:
+                    raise
+
+            existing = {
+                term.term.lower()
+                for term in await lokalise_glossary_service.get_all_glossary_terms(
+                    project_id
+                )
+            }
+            remaining = [term for term in batch if term.term.lower() not in existing]
+            created |= {term.term.lower() for term in batch} - {
+                term.term.lower() for term in remaining
+            }
+            logger.warning(
+                "Term batch may have been applied; %s of %s terms exist, resending %s",
+                len(batch) - len(remaining),
+                len(batch),
+                len(remaining),
+            )
+            if not remaining:
+                break
+            batch = remaining
 
-                terms_to_create.append(glossary_term)
-                processed_count += 1
+        return created
 
-            if not terms_to_create:
-                logger.info(
-                    f"No new terms to upload. {len(skipped_terms)} terms already exist in Lokalise."
-                )
-                return
+    async def sync_glossary_file(
+        self,
+        file_path: str | Path,
+        project_id: str,
+        *,
+        dry_run: bool = False,
+        delete_missing: bool = False,
+        on_progress: ProgressCallback | None = None,
+    ) -> dict[str, Any]:
+        """
+        Make the glossary of a Lokalise project match a glossary file.
 
-            # Upload terms to Lokalise in batches
-            batch_size = 50  # Conservative batch size
-            uploaded_count = 0
+        The file is diffed against the project glossary by content hash (see
+        ``app.services.glossary_sync``) and only the differences are sent:
+        new terms are created, changed terms updated and, with
+        ``delete_missing``, terms missing from the file deleted, each in as
+        few bulk requests as the batch size allows.
 
-            for i in range(0, len(terms_to_create), batch_size):
-                batch = terms_to_create[i : i + batch_size]
+        Args:
+            file_path: Path to the XLSX or CSV file
+            project_id: Lokalise project ID
+            dry_run: Only compute the diff; nothing is changed in Lokalise
+            delete_missing: Delete project terms that are not in the file
+            on_progress: Called with the number of changes applied, the
+                number of changes and the ``rows_parsed``, ``created``,
+                ``updated``, ``deleted`` and ``failed`` counters
 
-                try:
-                    # Create terms with translations
-                    create_request = GlossaryTermsCreate(terms=batch)
-                    created_response = (
-                        await lokalise_glossary_service.create_glossary_terms(
-                            project_id, create_request
-                        )
-                    )
-                    uploaded_count += len(created_response.data)
-                    logger.info(
-                        f"Uploaded batch of {len(created_response.data)} terms with translations to Lokalise"
-                    )
+        Returns:
+            Sync report with counts per action and every change
 
-                except Exception as e:
-                    logger.error(f"Error uploading batch {i // batch_size + 1}: {e}")
-                    raise HTTPException(
-                        status_code=500, detail=f"Failed to upload glossary terms: {e}"
-                    ) from e
+        Raises:
+            HTTPException: If the file cannot be read or the project glossary
+                cannot be fetched
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise HTTPException(
+                status_code=404, detail=f"Glossary file not found: {file_path}"
+            )
 
-            logger.info(
-                f"Successfully uploaded {uploaded_count} terms with translations to Lokalise project {project_id}"
+        columns, blocks = await self._read_glossary_file(file_path, project_id)
+        try:
+            existing = await lokalise_glossary_service.get_all_glossary_terms(
+                project_id
+            )
+            diff = await asyncio.to_thread(
+                GlossaryDiff.for_glossary, existing, columns.language_codes
             )
-            logger.info(f"Skipped {len(skipped_terms)} existing terms")
+            rows_parsed = 0
+            while block := await asyncio.to_thread(next, blocks, None):
+                diff.add(block)
+                rows_parsed += len(block)
+                if on_progress:
+                    on_progress(0, None, {"rows_parsed": rows_parsed})
+        finally:
+            blocks.close()
+
+        deletions = diff.delete if delete_missing else []
+        logger.info(
+            "Glossary sync for project %s: %s to create, %s to update, %s to delete, %s unchanged",
+            project_id,
+            len(diff.create),
+            len(diff.update),
+            len(deletions),
+            diff.unchanged,
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to load glossary from {file_path}: {e}")
-            if isinstance(e, HTTPException):
-                raise
-            raise HTTPException(
-                status_code=500, detail=f"Failed to process glossary file: {e!s}"
-            ) from e
+        changes: list[dict[str, Any]] = []
+        if dry_run:
+            changes = [
+                _sync_change(term.term, "create", "planned") for term in diff.create
+            ]
+            changes += [
+                _sync_change(term.term, "update", "planned", fields=fields)
+                for term, _, fields in diff.update
+            ]
+            changes += [
+                _sync_change(term.term, "delete", "planned") for term in deletions
+            ]
+        else:
+            total = len(diff.create) + len(diff.update) + len(deletions)
+            for batch in (
+                self._sync_creates(project_id, diff.create),
+                self._sync_updates(project_id, diff),
+                self._sync_deletes(project_id, deletions),
+            ):
+                async for batch_changes in batch:
+                    changes += batch_changes
+                    if on_progress:
+                        report = _sync_report(project_id, dry_run, [], 0, changes)
+                        counters = {
+                            name: report[name]
+                            for name in ("created", "updated", "deleted", "failed")
+                        }
+                        on_progress(len(changes), total, counters)
+
+        return _sync_report(
+            project_id, dry_run, columns.language_codes, diff.unchanged, changes
+        )
+
+    async def _sync_creates(
+        self, project_id: str, terms: list[GlossaryTermCreate]
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        sizer = AdaptiveBatchSize(
+            initial=_settings.GLOSSARY_UPLOAD_MAX_BATCH_SIZE,
+            minimum=_settings.GLOSSARY_UPLOAD_MIN_BATCH_SIZE,
+            maximum=_settings.GLOSSARY_UPLOAD_MAX_BATCH_SIZE,
+            target_seconds=_settings.GLOSSARY_UPLOAD_TARGET_BATCH_SECONDS,
+        )
+        while terms:
+            batch, terms = terms[: sizer.size], terms[sizer.size :]
+            yield [
+                _sync_change(
+                    term,
+                    "create",
+                    "applied" if status == "created" else "failed",
+                    detail=detail,
+                )
+                for term, status, detail in await self._upload_batch(
+                    project_id, batch, sizer
+                )
+            ]
+
+    async def _sync_updates(
+        self, project_id: str, diff: GlossaryDiff
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        batch_size = _settings.GLOSSARY_UPLOAD_MAX_BATCH_SIZE
+        for start in range(0, len(diff.update), batch_size):
+            batch = diff.update[start : start + batch_size]
+            request = GlossaryTermsUpdate(
+                terms=[
+                    term_update(term, current, fields)
+                    for term, current, fields in batch
+                ]
+            )
+            try:
+                response = await lokalise_glossary_service.update_glossary_terms(
+                    project_id, request
+                )
+            except (HTTPException, httpx.HTTPError) as e:
+                message = str(e.detail if isinstance(e, HTTPException) else e)
+                logger.error(
+                    "Failed to update %s glossary terms: %s", len(batch), message
+                )
+                yield [
+                    _sync_change(term.term, "update", "failed", fields, message)
+                    for term, _, fields in batch
+                ]
+                continue
+
+            updated = {term.id for term in response.data}
+            errors = str(response.meta.errors) if response.meta.errors else None
+            yield [
+                _sync_change(term.term, "update", "applied", fields)
+                if current.id in updated
+                else _sync_change(
+                    term.term,
+                    "update",
+                    "failed",
+                    fields,
+                    errors or "Not updated by Lokalise",
+                )
+                for term, current, fields in batch
+            ]
+
+    async def _sync_deletes(
+        self, project_id: str, terms: list[GlossaryTerm]
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        batch_size = _settings.GLOSSARY_UPLOAD_MAX_BATCH_SIZE
+        for start in range(0, len(terms), batch_size):
+            batch = terms[start : start + batch_size]
+            try:
+                response = await lokalise_glossary_service.delete_glossary_terms(
+                    project_id, GlossaryTermsDelete(terms=[term.id for term in batch])
+                )
+            except (HTTPException, httpx.HTTPError) as e:
+                message = str(e.detail if isinstance(e, HTTPException) else e)
+                logger.error(
+                    "Failed to delete %s glossary terms: %s", len(batch), message
+                )
+                yield [
+                    _sync_change(term.term, "delete", "failed", detail=message)
+                    for term in batch
+                ]
+                continue
+
+            failed = response.data.failed
+            yield [
+                _sync_change(
+                    term.term, "delete", "failed", detail=failed.message or None
+                )
+                if term.id in failed.ids
+                else _sync_change(term.term, "delete", "applied")
+                for term in batch
+            ]
 
     async def find_terms_in_text(
-        self, text: str, project_id: str
+        self,
+        text: str,
+        project_id: str,
+        terms_data: dict[str, dict[str, Any]] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Find all glossary terms in the given text using Lokalise data.
@@ -244,50 +639,51 @@ class GlossaryProcessor:
         Args:
             text: Text to search for terms
             project_id: Lokalise project ID
+            terms_data: Terms already loaded with ``get_terms_data``; fetched
+                from Lokalise when not given
 
         Returns:
             List of dictionaries containing found terms with their positions and metadata
         """
-        logger.info("=== FINDING TERMS IN TEXT ===")
-        logger.info(f"Text to search: '{text}'")
-        logger.info(f"Project ID: {project_id}")
-
         if not text:
-            logger.info("Empty text provided, returning no terms")
             return []
 
+        labels = stage_labels(project_id)
+
         # Get terms from Lokalise
-        logger.info("Fetching terms data from Lokalise...")
-        terms_data = await self._get_terms_data(project_id)
+        if terms_data is None:
+            with track_stage("glossary_load", **labels):
+                terms_data = await self.get_terms_data(project_id)
         if not terms_data:
             logger.warning("No terms data retrieved from Lokalise")
             return []
 
-        logger.info(f"Retrieved {len(terms_data)} terms from Lokalise")
-        for term, data in list(terms_data.items())[:5]:  # Log first 5 terms
-            logger.info(
-                f"  Term: '{term}' -> case_sensitive: {data['case_sensitive']}, "
-                f"forbidden: {data['forbidden']}, translatable: {data['translatable']}"
-            )
+        with track_stage("term_matching", **labels):
+            found_terms = self._match_terms(text, terms_data)
 
-        if len(terms_data) > 5:
-            logger.info(f"  ... and {len(terms_data) - 5} more terms")
+        logger.info(
+            "Found %d of %d glossary terms in %r",
+            len(found_terms),
+            len(terms_data),
+            excerpt(text),
+            extra={"project_id": project_id},
+        )
+        return found_terms
 
+    def _match_terms(
+        self, text: str, terms_data: dict[str, dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Matches of glossary terms in a text, by position."""
         # Request-scoped pattern cache for performance within this request
         request_patterns: dict[str, re.Pattern[str]] = {}
 
         found_terms = []
 
         # Process case-sensitive terms first
-        logger.info("Processing case-sensitive terms...")
-        case_sensitive_count = 0
         for term, term_data in terms_data.items():
             if not term_data["case_sensitive"]:
                 continue
 
-            case_sensitive_count += 1
-            logger.debug(f"Checking case-sensitive term: '{term}'")
-
             pattern = self._get_word_boundary_pattern_cached(
                 term, case_sensitive=True, cache=request_patterns
             )
@@ -305,24 +701,18 @@ class GlossaryProcessor:
                     "translations": term_data["translations"],
                 }
                 found_terms.append(found_term)
-                logger.info(
-                    f"  Found case-sensitive match: '{match.group()}' at position {match.start()}-{match.end()}"
+                logger.debug(
+                    "Found case-sensitive match %r at %d-%d",
+                    match.group(),
+                    match.start(),
+                    match.end(),
                 )
 
-        logger.info(
-            f"Processed {case_sensitive_count} case-sensitive terms, found {len([t for t in found_terms if t['case_sensitive']])} matches"
-        )
-
         # Process case-insensitive terms
-        logger.info("Processing case-insensitive terms...")
-        case_insensitive_count = 0
         for term, term_data in terms_data.items():
             if term_data["case_sensitive"]:
                 continue
 
-            case_insensitive_count += 1
-            logger.debug(f"Checking case-insensitive term: '{term}'")
-
             pattern = self._get_word_boundary_pattern_cached(
                 term, case_sensitive=False, cache=request_patterns
             )
@@ -348,27 +738,22 @@ class GlossaryProcessor:
                         "translations": term_data["translations"],
                     }
                     found_terms.append(found_term)
-                    logger.info(
-                        f"  Found case-insensitive match: '{match.group()}' at position {match.start()}-{match.end()}"
+                    logger.debug(
+                        "Found case-insensitive match %r at %d-%d",
+                        match.group(),
+                        match.start(),
+                        match.end(),
                     )
                 else:
                     logger.debug(
-                        f"  Skipped overlapping match: '{match.group()}' at position {match.start()}-{match.end()}"
+                        "Skipped overlapping match %r at %d-%d",
+                        match.group(),
+                        match.start(),
+                        match.end(),
                     )
 
-        logger.info(f"Processed {case_insensitive_count} case-insensitive terms")
-
         # Sort by position
         found_terms.sort(key=lambda x: x["start"])
-
-        logger.info("=== TERM FINDING COMPLETED ===")
-        logger.info(f"Total terms found: {len(found_terms)}")
-        for i, term in enumerate(found_terms):
-            logger.info(
-                f"  {i + 1}. '{term['matched_text']}' ({term['term']}) at {term['start']}-{term['end']} "
-                f"[forbidden: {term['forbidden']}, translatable: {term['translatable']}]"
-            )
-
         return found_terms
 
     async def replace_terms_in_text(
@@ -405,7 +790,7 @@ class GlossaryProcessor:
                 start, end = term_info["start"], term_info["end"]
                 result_text = result_text[:start] + translation + result_text[end:]
                 logger.debug(
-                    f"Replaced '{term_info['matched_text']}' with '{translation}'"
+                    "Replaced %r with %r", term_info["matched_text"], translation
                 )
 
         return result_text
@@ -443,7 +828,7 @@ class GlossaryProcessor:
                 matched_text = term_info["matched_text"]
                 wrapped_text = f"<{wrapper_tag}>{matched_text}</{wrapper_tag}>"
                 result_text = result_text[:start] + wrapped_text + result_text[end:]
-                logger.debug(f"Wrapped term '{matched_text}' with {wrapper_tag} tags")
+                logger.debug("Wrapped term %r with %s tags", matched_text, wrapper_tag)
 
         return result_text
 
@@ -458,7 +843,7 @@ class GlossaryProcessor:
         Returns:
             Dictionary with term information or None if not found
         """
-        terms_data = await self._get_terms_data(project_id)
+        terms_data = await self.get_terms_data(project_id)
         if not terms_data:
             return None
 
@@ -483,7 +868,7 @@ class GlossaryProcessor:
         Returns:
             Sorted list of available language codes
         """
-        terms_data = await self._get_terms_data(project_id)
+        terms_data = await self.get_terms_data(project_id)
         if not terms_data:
             return []
 
@@ -503,7 +888,7 @@ class GlossaryProcessor:
         Returns:
             Dictionary with glossary statistics
         """
-        terms_data = await self._get_terms_data(project_id)
+        terms_data = await self.get_terms_data(project_id)
         if not terms_data:
             return {
                 "total_terms": 0,
@@ -538,7 +923,7 @@ class GlossaryProcessor:
             "language_count": len(languages),
         }
 
-    async def _get_terms_data(self, project_id: str) -> dict[str, dict[str, Any]]:
+    async def get_terms_data(self, project_id: str) -> dict[str, dict[str, Any]]:
         """
         Get terms data from Lokalise.
 
@@ -548,55 +933,34 @@ class GlossaryProcessor:
         Returns:
             Dictionary mapping term names to term data
         """
-        logger.info("=== FETCHING TERMS DATA FROM LOKALISE ===")
-        logger.info(f"Project ID: {project_id}")
-
         try:
             # Fetch from Lokalise
-            logger.info("Calling Lokalise glossary service...")
             lokalise_response = await lokalise_glossary_service.get_glossary_terms(
                 project_id
             )
 
-            logger.info("Lokalise response received:")
-            logger.info(f"  Number of terms: {len(lokalise_response.data)}")
-            logger.info(f"  Response meta: {lokalise_response.meta}")
-
             terms_data = {}
             processed_count = 0
 
             for term in lokalise_response.data:
                 if not term.term:
-                    logger.warning(f"Skipping term with empty name: {term}")
+                    logger.warning("Skipping term with empty name: %s", term)
                     continue
 
                 processed_count += 1
-                logger.debug(f"Processing term {processed_count}: '{term.term}'")
 
                 # Create term data structure using the updated schema fields
                 translations_dict: dict[str, str] = {}
 
                 # Add translations from the term's translations field
-                if term.translations:
-                    logger.debug(
-                        f"  Found {len(term.translations)} translations for '{term.term}'"
-                    )
-                    for translation in term.translations:
-                        translations_dict[translation.lang_iso] = (
-                            translation.translation
-                        )
-                        logger.debug(
-                            f"    {translation.lang_iso}: '{translation.translation}'"
-                        )
-                else:
-                    logger.debug(f"  No translations found for '{term.term}'")
+                for translation in term.translations or ():
+                    translations_dict[translation.lang_iso] = translation.translation
 
                 # Add the base term as a translation (usually the primary language)
                 if term.project_id:  # Use project_id as indicator of valid term
                     # For now, we'll assume the term itself is in English (this could be configurable)
                     if "en" not in translations_dict:
                         translations_dict["en"] = term.term
-                        logger.debug(f"    Added base translation en: '{term.term}'")
 
                 term_data = {
                     "translations": translations_dict,
@@ -611,56 +975,21 @@ class GlossaryProcessor:
                 }
 
                 terms_data[term.term] = term_data
-                logger.debug(f"  Processed '{term.term}': {term_data}")
-
-            logger.info("=== TERMS DATA PROCESSING COMPLETED ===")
-            logger.info(
-                f"Processed {processed_count} terms from Lokalise project {project_id}"
-            )
-            logger.info(f"Final terms data contains {len(terms_data)} entries")
 
-            # Log summary of term types
-            case_sensitive_count = sum(
-                1 for data in terms_data.values() if data["case_sensitive"]
+            logger.debug(
+                "Processed %d glossary terms of project %s",
+                processed_count,
+                project_id,
             )
-            forbidden_count = sum(
-                1 for data in terms_data.values() if data["forbidden"]
-            )
-            translatable_count = sum(
-                1 for data in terms_data.values() if data["translatable"]
-            )
-
-            logger.info("Term type summary:")
-            logger.info(f"  Case sensitive: {case_sensitive_count}")
-            logger.info(f"  Forbidden: {forbidden_count}")
-            logger.info(f"  Translatable: {translatable_count}")
-
             return terms_data
 
-        except Exception as e:
-            logger.error("=== FAILED TO FETCH TERMS FROM LOKALISE ===")
-            logger.error(f"Error type: {type(e).__name__}")
-            logger.error(f"Error message: {e!s}")
-            logger.error(f"Project ID: {project_id}")
-            logger.error("Full error details:", exc_info=True)
+        except Exception:
+            logger.exception(
+                "Failed to fetch glossary terms of project %s from Lokalise",
+                project_id,
+            )
             return {}
 
-    def _parse_boolean_flag(self, value: Any) -> bool:
-        """Parse boolean flags from various string representations."""
-        if pd.isna(value):
-            return False
-
-        str_value = str(value).lower().strip()
-        return str_value in {"yes", "true", "1", "y", "on"}
-
-    def _get_safe_string_value(self, row: pd.Series, column: str) -> str | None:
-        """Safely extract string value from pandas row, handling NaN values."""
-        value = row.get(column)
-        if pd.isna(value):  # pyright: ignore[reportGeneralTypeIssues]
-            return None
-        str_value = str(value).strip()
-        return str_value if str_value else None
-
     def _get_word_boundary_pattern(
         self, term: str, case_sensitive: bool = True
     ) -> re.Pattern[str]:
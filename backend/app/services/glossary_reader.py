@@ -0,0 +1,287 @@
+"""
+Streaming readers for glossary spreadsheets.
+
+Glossaries are read row by row, so memory stays flat however many terms a
+file holds: XLSX workbooks through openpyxl's read-only mode, CSV files
+(the format of the glossary export) through the ``csv`` module.
+
+Both formats share one layout: a header row with the metadata columns
+(``term``, ``description``, ``part_of_speech``, ``casesensitive``,
+``translatable``, ``forbidden``, ``tags``), then one column per language code
+optionally followed by a ``<code>_description`` column. Columns are resolved
+once from the header, along with the Lokalise language of each language
+column, and every row is converted by position.
+"""
+
+import csv
+import os
+import tempfile
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Self
+
+from fastapi import HTTPException
+from openpyxl import load_workbook
+
+from app.schemas.lokalise.glossary import GlossaryTermCreate, GlossaryTermTranslation
+from app.schemas.lokalise.languages import BaseLanguage
+
+GLOSSARY_FILE_SUFFIXES = (".xlsx", ".csv")
+REQUIRED_COLUMNS = ("term", "casesensitive", "forbidden", "translatable")
+METADATA_COLUMNS = frozenset(
+    {
+        "term",
+        "description",
+        "part_of_speech",
+        "casesensitive",
+        "translatable",
+        "forbidden",
+        "tags",
+    }
+)
+TRUE_VALUES = frozenset({"yes", "true", "1", "y", "on"})
+# Size of the pieces uploaded glossary files are copied to disk in
+STAGE_CHUNK_SIZE = 1024 * 1024
+
+
+def _text(value: Any) -> str:
+    """Cell value as stripped text (empty for blank cells)."""
+    return "" if value is None else str(value).strip()
+
+
+@dataclass(frozen=True)
+class GlossaryColumns:
+    """Positions of the glossary columns in a header row."""
+
+    term: int
+    case_sensitive: int
+    forbidden: int
+    translatable: int
+    description: int | None
+    # (language, translation column, description column)
+    languages: tuple[tuple[BaseLanguage, int, int | None], ...]
+    # Language columns that are not languages of the project (ignored)
+    unknown_languages: tuple[str, ...] = ()
+
+    @classmethod
+    def from_header(
+        cls, header: Sequence[Any], project_languages: Mapping[str, BaseLanguage]
+    ) -> Self:
+        """
+        Resolve column positions from a header row.
+
+        Args:
+            header: Header row
+            project_languages: Languages of the project by ISO code
+
+        Raises:
+            HTTPException: If a required column is missing
+        """
+        names = [_text(name) for name in header]
+        positions: dict[str, int] = {}
+        for index, name in enumerate(names):
+            if name:
+                positions.setdefault(name, index)
+
+        missing = [name for name in REQUIRED_COLUMNS if name not in positions]
+        if missing:
+            raise HTTPException(
+                status_code=400, detail=f"Missing required columns: {missing}"
+            )
+
+        codes = [
+            name
+            for name in positions
+            if name not in METADATA_COLUMNS and not name.endswith("_description")
+        ]
+        return cls(
+            term=positions["term"],
+            case_sensitive=positions["casesensitive"],
+            forbidden=positions["forbidden"],
+            translatable=positions["translatable"],
+            description=positions.get("description"),
+            languages=tuple(
+                (
+                    project_languages[code],
+                    positions[code],
+                    positions.get(f"{code}_description"),
+                )
+                for code in codes
+                if code in project_languages
+            ),
+            unknown_languages=tuple(
+                code for code in codes if code not in project_languages
+            ),
+        )
+
+    @property
+    def language_codes(self) -> list[str]:
+        return [language.lang_iso for language, _, _ in self.languages]
+
+    def to_term(self, row: Sequence[Any]) -> GlossaryTermCreate | None:
+        """Convert a data row into a term to create (None for rows without a term)."""
+        width = len(row)
+
+        def cell(index: int | None) -> str:
+            return _text(row[index]) if index is not None and index < width else ""
+
+        term = cell(self.term)
+        if not term:
+            return None
+
+        translations = []
+        for language, index, description_index in self.languages:
+            translation = cell(index)
+            if translation:
+                # Field values are built here, so validation is skipped
+                translations.append(
+                    GlossaryTermTranslation.model_construct(
+                        lang_id=language.lang_id,
+                        lang_name=language.lang_name,
+                        lang_iso=language.lang_iso,
+                        translation=translation,
+                        description=cell(description_index),
+                    )
+                )
+
+        return GlossaryTermCreate.model_construct(
+            term=term,
+            description=cell(self.description) or f"Glossary term: {term}",
+            case_sensitive=cell(self.case_sensitive).lower() in TRUE_VALUES,
+            translatable=cell(self.translatable).lower() in TRUE_VALUES,
+            forbidden=cell(self.forbidden).lower() in TRUE_VALUES,
+            translations=translations,
+            tags=[],
+        )
+
+
+def stage_glossary_file(
+    source: BinaryIO, filename: str | None, max_bytes: int, size: int | None = None
+) -> Path:
+    """
+    Copy an uploaded glossary file to a temporary file in fixed-size chunks.
+
+    Blocking; meant to run in a worker thread. The size limit is checked
+    against the declared size before copying and against the bytes copied
+    while copying, so an oversized upload is never copied whole. The upload
+    has already been received by then; requests are rejected by their size
+    before that in the upload endpoints. The caller removes the file once it
+    has been processed.
+
+    Args:
+        source: Binary file object of the upload
+        filename: Name of the uploaded file (its suffix selects the reader)
+        max_bytes: Largest accepted file size
+        size: Size of the upload, if known
+
+    Returns:
+        Path of the copy
+
+    Raises:
+        HTTPException: 400 if the file is not an XLSX or CSV file, 413 if it
+            is larger than ``max_bytes``
+    """
+    suffix = Path(filename or "").suffix.lower()
+    if suffix not in GLOSSARY_FILE_SUFFIXES:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Please upload an XLSX or CSV file.",
+        )
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Glossary file is larger than the {max_bytes} byte limit",
+    )
+    if size is not None and size > max_bytes:
+        raise too_large
+
+    fd, name = tempfile.mkstemp(prefix="glossary-", suffix=suffix)
+    path = Path(name)
+    try:
+        with os.fdopen(fd, "wb") as output:
+            copied = 0
+            while chunk := source.read(STAGE_CHUNK_SIZE):
+                copied += len(chunk)
+                if copied > max_bytes:
+                    raise too_large
+                output.write(chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def _iter_xlsx_rows(path: Path) -> Iterator[tuple[Any, ...]]:
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from workbook.worksheets[0].iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _iter_csv_rows(path: Path) -> Iterator[list[str]]:
+    with path.open(newline="", encoding="utf-8-sig") as file:
+        yield from csv.reader(file)
+
+
+def iter_glossary_rows(path: Path) -> Iterator[Sequence[Any]]:
+    """
+    Rows of a glossary file, header first.
+
+    Raises:
+        HTTPException: If the file type is not supported
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".xlsx":
+        return _iter_xlsx_rows(path)
+    if suffix == ".csv":
+        return _iter_csv_rows(path)
+    raise HTTPException(
+        status_code=400,
+        detail=f"Unsupported glossary file type {suffix or '(none)'}; "
+        f"expected one of {', '.join(GLOSSARY_FILE_SUFFIXES)}",
+    )
+
+
+def iter_glossary_batches(
+    path: Path, batch_size: int, project_languages: Mapping[str, BaseLanguage]
+) -> tuple[GlossaryColumns, Iterator[list[GlossaryTermCreate]]]:
+    """
+    Read a glossary file as batches of terms to create.
+
+    The header is read immediately so layout errors surface before any
+    batch; the rest of the file is only read as batches are consumed.
+
+    Args:
+        path: XLSX or CSV glossary file
+        batch_size: Number of terms per batch
+        project_languages: Languages of the project by ISO code; columns of
+            other languages are ignored
+
+    Returns:
+        Tuple of the resolved columns and an iterator over term batches
+
+    Raises:
+        HTTPException: If the file type is unsupported, the file is empty or
+            required columns are missing
+    """
+    rows = iter_glossary_rows(path)
+    header = next(rows, None)
+    if header is None:
+        raise HTTPException(status_code=400, detail="Glossary file is empty")
+    columns = GlossaryColumns.from_header(header, project_languages)
+
+    def batches() -> Iterator[list[GlossaryTermCreate]]:
+        batch: list[GlossaryTermCreate] = []
+        for row in rows:
+            term = columns.to_term(row)
+            if term is None:
+                continue
+            batch.append(term)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    return columns, batches()
@@ -0,0 +1,241 @@
+"""
+Project-wide glossary compliance scan.
+
+Checks every key of a project in every target language against the glossary,
+reading keys and translations from the local key mirror. Keys are read in
+chunks and each chunk is matched on the CPU executor (see
+``glossary_matching``) while the next chunks are read, so the scan runs on
+every worker in parallel and the event loop stays free. Workers keep the
+glossary matcher between chunks, so the terms only go with the first chunks;
+a worker that has not seen them yet gets its chunk again with the terms.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import HTTPException
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.services.cpu_executor import CPUExecutor, cpu_executor
+from app.services.evaluation_cache import evaluation_cache_key
+from app.services.glossary_matching import (
+    VIOLATION_KINDS,
+    ScanTerm,
+    UnknownGlossaryError,
+    merge_scan_results,
+    scan_chunk,
+)
+from app.services.key_mirror import KeyMirrorService, key_mirror_service
+from app.services.lokalise.glossary import lokalise_glossary_service
+
+logger = get_logger(__name__)
+
+# Terms with the most violations listed per language in the report
+TOP_TERMS_LIMIT = 10
+
+
+class GlossaryScanService:
+    """Runs glossary compliance scans over mirrored project keys."""
+
+    def __init__(
+        self,
+        mirror: KeyMirrorService,
+        executor: CPUExecutor,
+        chunk_size: int,
+        sample_limit: int,
+    ):
+        self.mirror = mirror
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.sample_limit = sample_limit
+
+    async def scan_project(
+        self,
+        project_id: str,
+        source_lang: str,
+        target_langs: list[str] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Check all keys of a project against its glossary.
+
+        Args:
+            project_id: Lokalise project ID
+            source_lang: Language whose translations are searched for terms
+            target_langs: Languages to check (default: every project language
+                except the source language)
+            on_progress: Called with (keys scanned, total keys) after each chunk
+
+        Returns:
+            Scan report with per-language counters and sample violations
+
+        Raises:
+            HTTPException: If the glossary or the keys cannot be loaded
+        """
+        started = time.perf_counter()
+        terms = await self._load_terms(project_id)
+        await self.mirror.ensure_fresh(project_id)
+        store = self.mirror.get_store(project_id)
+
+        languages = await asyncio.to_thread(store.get_language_isos)
+        if target_langs is None:
+            target_langs = [lang for lang in languages if lang != source_lang]
+        unknown = sorted(set(target_langs) - set(languages))
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Languages not in project {project_id}: {', '.join(unknown)}",
+            )
+        total_keys = await asyncio.to_thread(store.count_active_keys)
+
+        # Workers cache one matcher per glossary content
+        glossary_key = evaluation_cache_key(terms)
+        results: dict[str, dict[str, Any]] = {}
+        pending: set[asyncio.Future[tuple[int, dict[str, dict[str, Any]]]]] = set()
+        # Keep every worker busy while the next chunk is read
+        max_pending = 2 * self.executor.max_workers
+        keys_scanned = 0
+        after_key_id = 0
+        chunks_sent = 0
+
+        async def collect(return_when: str) -> None:
+            nonlocal keys_scanned
+            done, _ = await asyncio.wait(pending, return_when=return_when)
+            for future in done:
+                pending.discard(future)
+                chunk_keys, chunk_results = future.result()
+                merge_scan_results(results, chunk_results, self.sample_limit)
+                keys_scanned += chunk_keys
+            if on_progress:
+                on_progress(keys_scanned, total_keys)
+
+        try:
+            while True:
+                page = await asyncio.to_thread(
+                    store.get_key_texts,
+                    after_key_id=after_key_id,
+                    limit=self.chunk_size,
+                )
+                if not page:
+                    break
+                after_key_id = page[-1][0]
+                rows = [
+                    (key_id, key_name, texts.get(source_lang, ""), texts)
+                    for key_id, key_name, texts in page
+                ]
+                # One chunk per worker carries the terms to build the matcher
+                send_terms = chunks_sent < self.executor.max_workers
+                chunks_sent += 1
+                pending.add(
+                    asyncio.ensure_future(
+                        self._scan(glossary_key, terms, rows, target_langs, send_terms)
+                    )
+                )
+                if len(pending) >= max_pending:
+                    await collect(asyncio.FIRST_COMPLETED)
+            if pending:
+                await collect(asyncio.ALL_COMPLETED)
+        finally:
+            for future in pending:
+                future.cancel()
+
+        duration = time.perf_counter() - started
+        logger.info(
+            "Glossary scan of project %s: %s keys x %s languages in %.1fs",
+            project_id,
+            keys_scanned,
+            len(target_langs),
+            duration,
+        )
+        return {
+            "project_id": project_id,
+            "source_lang": source_lang,
+            "glossary_terms": len(terms),
+            "keys_scanned": keys_scanned,
+            "languages": [
+                self._language_report(language, results.get(language))
+                for language in target_langs
+            ],
+            "duration_seconds": round(duration, 3),
+        }
+
+    async def _scan(
+        self,
+        glossary_key: str,
+        terms: list[ScanTerm],
+        rows: list[tuple[int, str, str, dict[str, str]]],
+        languages: list[str],
+        send_terms: bool,
+    ) -> tuple[int, dict[str, dict[str, Any]]]:
+        try:
+            result = await self.executor.submit(
+                scan_chunk,
+                glossary_key,
+                terms if send_terms else None,
+                rows,
+                languages,
+                self.sample_limit,
+            )
+        except UnknownGlossaryError:
+            # The chunk went to a worker that has not built the matcher yet
+            result = await self.executor.submit(
+                scan_chunk, glossary_key, terms, rows, languages, self.sample_limit
+            )
+        return len(rows), result
+
+    async def _load_terms(self, project_id: str) -> list[ScanTerm]:
+        glossary = await lokalise_glossary_service.get_all_glossary_terms(project_id)
+        return [
+            {
+                "term": term.term,
+                "case_sensitive": term.case_sensitive,
+                "forbidden": term.forbidden,
+                "translatable": term.translatable,
+                "translations": {
+                    translation.lang_iso: translation.translation
+                    for translation in term.translations
+                    if translation.translation
+                },
+            }
+            for term in glossary
+            if term.term
+        ]
+
+    def _language_report(
+        self, language: str, result: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        result = result or {}
+        terms_checked = result.get("terms_checked", 0)
+        violations = result.get("violations", dict.fromkeys(VIOLATION_KINDS, 0))
+        violation_count = sum(violations.values())
+        top_terms = sorted(
+            result.get("terms", {}).items(), key=lambda item: (-item[1], item[0])
+        )[:TOP_TERMS_LIMIT]
+        return {
+            "language_iso": language,
+            "keys_checked": result.get("keys_checked", 0),
+            "keys_untranslated": result.get("keys_untranslated", 0),
+            "keys_with_terms": result.get("keys_with_terms", 0),
+            "keys_with_violations": result.get("keys_with_violations", 0),
+            "terms_checked": terms_checked,
+            "violations": violations,
+            "compliance_score": round(
+                (terms_checked - violation_count) / terms_checked * 100, 1
+            )
+            if terms_checked
+            else None,
+            "top_terms": [{"term": term, "violations": n} for term, n in top_terms],
+            "samples": result.get("samples", []),
+        }
+
+
+_settings = get_settings()
+glossary_scan_service = GlossaryScanService(
+    mirror=key_mirror_service,
+    executor=cpu_executor,
+    chunk_size=_settings.GLOSSARY_SCAN_CHUNK_SIZE,
+    sample_limit=_settings.GLOSSARY_SCAN_SAMPLE_LIMIT,
+)
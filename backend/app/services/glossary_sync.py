@@ -0,0 +1,156 @@
+"""
+Diff of a glossary file against the glossary of a Lokalise project.
+
+Every term is reduced to the fields a glossary file defines (name,
+description, flags and the translations of the file's languages) and hashed,
+so comparing a file with the project glossary is one hash comparison per
+term. Terms are matched by lowercased name, like the importer does; the diff
+sorts them into terms to create, update and delete and unchanged terms.
+
+Tags are not part of glossary files and translations of languages the file
+has no column for are not compared, so neither is ever changed by a sync.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Literal, Self
+
+from app.schemas.lokalise.glossary import (
+    GlossaryTerm,
+    GlossaryTermCreate,
+    GlossaryTermTranslationUpdate,
+    GlossaryTermUpdate,
+)
+
+SyncAction = Literal["create", "update", "delete"]
+# Term fields compared by a sync, in report order
+SYNC_FIELDS = ("term", "description", "case_sensitive", "translatable", "forbidden")
+
+
+def term_fields(
+    term: GlossaryTerm | GlossaryTermCreate, languages: Iterable[str]
+) -> dict[str, Any]:
+    """Fields of a term a glossary file defines, for the given languages."""
+    wanted = set(languages)
+    return {
+        **{name: getattr(term, name) for name in SYNC_FIELDS},
+        "translations": {
+            trans.lang_iso: [trans.translation, trans.description or ""]
+            for trans in term.translations
+            if trans.lang_iso in wanted and trans.translation
+        },
+    }
+
+
+def fields_hash(fields: dict[str, Any]) -> str:
+    """Content hash of term fields."""
+    encoded = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def changed_fields(old: dict[str, Any], new: dict[str, Any]) -> list[str]:
+    """Names of the fields that differ (``<lang>`` for translations)."""
+    changed = [name for name in SYNC_FIELDS if old[name] != new[name]]
+    old_translations, new_translations = old["translations"], new["translations"]
+    changed += sorted(
+        lang
+        for lang in old_translations.keys() | new_translations.keys()
+        if old_translations.get(lang) != new_translations.get(lang)
+    )
+    return changed
+
+
+@dataclass
+class GlossaryDiff:
+    """
+    Changes that make a project glossary match a glossary file.
+
+    Built incrementally: the project glossary is indexed first, then the file
+    is fed block by block, so only changed terms are kept in memory.
+    """
+
+    languages: list[str]
+    existing: dict[str, GlossaryTerm]
+    create: list[GlossaryTermCreate] = field(default_factory=list)
+    # (file term, project term, changed fields)
+    update: list[tuple[GlossaryTermCreate, GlossaryTerm, list[str]]] = field(
+        default_factory=list
+    )
+    unchanged: int = 0
+    # Content hashes of the project terms, and file terms compared so far
+    _hashes: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _seen: set[str] = field(default_factory=set, init=False, repr=False)
+
+    @classmethod
+    def for_glossary(
+        cls, existing: Iterable[GlossaryTerm], languages: list[str]
+    ) -> Self:
+        """Start a diff against the terms of a project glossary."""
+        index: dict[str, GlossaryTerm] = {}
+        for term in existing:
+            index.setdefault(term.term.lower(), term)
+        diff = cls(languages=languages, existing=index)
+        diff._hashes = {
+            key: fields_hash(term_fields(term, languages))
+            for key, term in index.items()
+        }
+        return diff
+
+    def add(self, terms: Iterable[GlossaryTermCreate]) -> None:
+        """Compare a block of file terms (the first row of a term wins)."""
+        for term in terms:
+            key = term.term.lower()
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            current = self.existing.get(key)
+            if current is None:
+                self.create.append(term)
+                continue
+            fields = term_fields(term, self.languages)
+            if fields_hash(fields) == self._hashes[key]:
+                self.unchanged += 1
+            else:
+                old = term_fields(current, self.languages)
+                self.update.append((term, current, changed_fields(old, fields)))
+
+    @property
+    def delete(self) -> list[GlossaryTerm]:
+        """Project terms missing from the file (once the file is fully read)."""
+        return [term for key, term in self.existing.items() if key not in self._seen]
+
+
+def term_update(
+    term: GlossaryTermCreate, current: GlossaryTerm, changed: list[str]
+) -> GlossaryTermUpdate:
+    """
+    Update request bringing a project term in line with a file term.
+
+    Only changed translations are sent; a translation removed from the file
+    is cleared.
+    """
+    translations = {trans.lang_iso: trans for trans in term.translations}
+    current_translations = {trans.lang_iso: trans for trans in current.translations}
+    updates = []
+    for lang in changed:
+        if lang in SYNC_FIELDS:
+            continue
+        trans = translations.get(lang)
+        updates.append(
+            GlossaryTermTranslationUpdate(
+                lang_id=(trans or current_translations[lang]).lang_id,
+                translation=trans.translation if trans else "",
+                description=trans.description if trans else "",
+            )
+        )
+    return GlossaryTermUpdate(
+        id=current.id,
+        term=term.term,
+        description=term.description,
+        case_sensitive=term.case_sensitive,
+        translatable=term.translatable,
+        forbidden=term.forbidden,
+        translations=updates or None,
+    )
@@ -0,0 +1,188 @@
+"""
+Bookkeeping for resumable glossary uploads.
+
+An upload is identified by the project and the content hash of the glossary
+file, so running the same import again resumes it: terms recorded as created
+or skipped by an earlier run are not sent again, failed ones are retried. The
+outcome of every term is written to SQLite as soon as its batch completes,
+which also makes it the per-term report of the upload.
+
+Batch sizes adapt to how Lokalise responds: they grow while batches complete
+quickly and shrink when batches are slow or fail.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Literal
+
+from app.core.config import get_settings
+
+TermStatus = Literal["created", "skipped", "failed"]
+# (term, status, detail)
+TermOutcome = tuple[str, TermStatus, str | None]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    upload_id TEXT PRIMARY KEY,
+    project_id TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL
+);
+
+CREATE TABLE IF NOT EXISTS upload_terms (
+    upload_id TEXT NOT NULL,
+    term_key TEXT NOT NULL,
+    term TEXT NOT NULL,
+    status TEXT NOT NULL,
+    detail TEXT,
+    PRIMARY KEY (upload_id, term_key)
+);
+"""
+
+# Checkpoints of uploads started longer ago are dropped
+CHECKPOINT_RETENTION_SECONDS = 7 * 86400
+# Bytes hashed per read when identifying a glossary file
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def upload_id_for(project_id: str, file_path: Path) -> str:
+    """Identify an upload by project and file content."""
+    digest = hashlib.sha256(project_id.encode() + b"\0")
+    with file_path.open("rb") as file:
+        while chunk := file.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class UploadCheckpoint:
+    """
+    SQLite store of per-term upload outcomes.
+
+    All methods are synchronous and are meant to be called through
+    ``asyncio.to_thread``; the database is opened on first use.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def start(self, upload_id: str, project_id: str) -> set[str]:
+        """
+        Register an upload (or a re-run of it) and drop expired checkpoints.
+
+        Returns:
+            Lowercased terms completed (created or skipped) by earlier runs
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                expired = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT upload_id FROM uploads WHERE started_at < ?",
+                        (now - CHECKPOINT_RETENTION_SECONDS,),
+                    )
+                ]
+                for expired_id in expired:
+                    conn.execute(
+                        "DELETE FROM upload_terms WHERE upload_id = ?", (expired_id,)
+                    )
+                    conn.execute(
+                        "DELETE FROM uploads WHERE upload_id = ?", (expired_id,)
+                    )
+                conn.execute(
+                    "INSERT INTO uploads (upload_id, project_id, started_at) "
+                    "VALUES (?, ?, ?) ON CONFLICT(upload_id) DO UPDATE SET "
+                    "finished_at = NULL",
+                    (upload_id, project_id, now),
+                )
+            rows = conn.execute(
+                "SELECT term_key FROM upload_terms "
+                "WHERE upload_id = ? AND status != 'failed'",
+                (upload_id,),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def record(self, upload_id: str, outcomes: list[TermOutcome]) -> None:
+        """Persist the outcome of a completed batch."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO upload_terms VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (upload_id, term.lower(), term, status, detail)
+                        for term, status, detail in outcomes
+                    ],
+                )
+
+    def finish(self, upload_id: str) -> list[TermOutcome]:
+        """
+        Mark an upload run as finished.
+
+        Returns:
+            Outcome of every term of the upload, across all runs
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "UPDATE uploads SET finished_at = ? WHERE upload_id = ?",
+                    (time.time(), upload_id),
+                )
+            rows = conn.execute(
+                "SELECT term, status, detail FROM upload_terms "
+                "WHERE upload_id = ? ORDER BY rowid",
+                (upload_id,),
+            ).fetchall()
+        return [(term, status, detail) for term, status, detail in rows]
+
+
+class AdaptiveBatchSize:
+    """
+    Terms per create request, adjusted from batch latencies and failures.
+
+    Batches finishing within ``target_seconds`` grow the size additively;
+    slower batches shrink it in proportion to the overrun and failures halve
+    it (additive increase, multiplicative decrease).
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int, target_seconds: float):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+        self.step = max(1, initial // 2)
+        self._size = float(min(max(initial, minimum), maximum))
+
+    @property
+    def size(self) -> int:
+        return int(self._size)
+
+    def record_success(self, seconds: float) -> None:
+        if seconds <= self.target_seconds:
+            self._size = min(self.maximum, self._size + self.step)
+        else:
+            self._size = max(self.minimum, self._size * self.target_seconds / seconds)
+
+    def record_failure(self) -> None:
+        self._size = max(self.minimum, self._size / 2)
+
+
+_settings = get_settings()
+upload_checkpoint = UploadCheckpoint(
+    Path(_settings.DATA_DIR) / "glossary_uploads.sqlite3"
+)
@@ -0,0 +1,179 @@
+"""
+In-process runner for long-running background jobs.
+
+Jobs run as asyncio tasks on the server's event loop, so they keep going when
+the client that started them disconnects. A job runs in a span of the trace of
+the request that submitted it. Clients poll the job status by id
+or follow it with ``JobRunner.watch`` (served as server-sent events).
+"""
+
+import asyncio
+import contextlib
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from fastapi import HTTPException
+
+from app.core.logging import get_logger
+from app.core.tracing import current_trace_id, tracer
+from app.schemas.jobs import JobProgress, JobStatus
+
+logger = get_logger(__name__)
+
+# Finished jobs kept around for status polling before the oldest are dropped
+MAX_FINISHED_JOBS = 200
+# Seconds after which watchers get the status again even if nothing changed
+WATCH_HEARTBEAT_SECONDS = 15.0
+FINISHED_STATES = frozenset({"completed", "failed"})
+
+
+class Job:
+    """Handle passed to job functions for progress reporting."""
+
+    def __init__(self, kind: str, total: int | None = None):
+        self.status = JobStatus(
+            job_id=uuid.uuid4().hex,
+            kind=kind,
+            status="queued",
+            progress=JobProgress(total=total),
+            created_at=datetime.now(UTC),
+        )
+        # Set (and replaced) whenever the status changes
+        self._changed = asyncio.Event()
+
+    @property
+    def job_id(self) -> str:
+        return self.status.job_id
+
+    def report_progress(
+        self,
+        completed: int,
+        total: int | None = None,
+        counters: dict[str, int] | None = None,
+    ) -> None:
+        """Update the processed item count (and optionally the total and counters)."""
+        self.status.progress.completed = completed
+        if total is not None:
+            self.status.progress.total = total
+        if counters:
+            self.status.progress.counters.update(counters)
+        self.notify()
+
+    @property
+    def changed(self) -> asyncio.Event:
+        """Event set at the next status change."""
+        return self._changed
+
+    def notify(self) -> None:
+        """Wake up the watchers of the job."""
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+
+class JobRunner:
+    """Starts background jobs and keeps their status for polling."""
+
+    def __init__(self, max_finished_jobs: int = MAX_FINISHED_JOBS):
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs: dict[str, Job] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+
+    def submit(
+        self,
+        kind: str,
+        work: Callable[[Job], Awaitable[dict[str, Any]]],
+        total: int | None = None,
+    ) -> JobStatus:
+        """
+        Start ``work`` as a background job.
+
+        Args:
+            kind: Short job type label (e.g. "keys.create")
+            work: Coroutine function receiving the job handle and returning
+                the job result
+            total: Total number of items to process, if known upfront
+
+        Returns:
+            Initial job status (including the job id to poll)
+        """
+        job = Job(kind, total=total)
+        job.status.trace_id = current_trace_id()
+        self._jobs[job.job_id] = job
+        self._tasks[job.job_id] = asyncio.create_task(self._run(job, work))
+        self._prune()
+        logger.info("Submitted %s job %s", kind, job.job_id)
+        return job.status.model_copy(deep=True)
+
+    def get(self, job_id: str) -> JobStatus:
+        """Return the current status of a job."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        return job.status.model_copy(deep=True)
+
+    async def watch(
+        self, job_id: str, heartbeat: float = WATCH_HEARTBEAT_SECONDS
+    ) -> AsyncIterator[JobStatus]:
+        """
+        Yield the status of a job whenever it changes, until it finishes.
+
+        Changes made while a status is being consumed are coalesced into the
+        next one; the status is also repeated every ``heartbeat`` seconds.
+        Stopping the iteration (e.g. the client disconnecting) does not
+        affect the job.
+
+        Raises:
+            HTTPException: If the job does not exist
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        while True:
+            changed = job.changed
+            yield job.status.model_copy(deep=True)
+            if job.status.status in FINISHED_STATES:
+                return
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(changed.wait(), timeout=heartbeat)
+
+    async def _run(
+        self, job: Job, work: Callable[[Job], Awaitable[dict[str, Any]]]
+    ) -> None:
+        # The task runs in a copy of the submitting request's context, so the
+        # span continues its trace
+        with tracer.span(f"job {job.status.kind}", job_id=job.job_id) as span:
+            job.status.status = "running"
+            job.status.started_at = datetime.now(UTC)
+            job.status.trace_id = span.trace_id
+            job.notify()
+            try:
+                job.status.result = await work(job)
+                job.status.status = "completed"
+                logger.info("%s job %s completed", job.status.kind, job.job_id)
+            except Exception as e:
+                detail = e.detail if isinstance(e, HTTPException) else str(e)
+                job.status.error = str(detail)
+                job.status.status = "failed"
+                span.status, span.error = "error", str(detail)
+                logger.error(
+                    "%s job %s failed: %s", job.status.kind, job.job_id, detail
+                )
+            finally:
+                job.status.finished_at = datetime.now(UTC)
+                self._tasks.pop(job.job_id, None)
+                job.notify()
+
+    def _prune(self) -> None:
+        finished = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.status.status in FINISHED_STATES
+        ]
+        for job_id in finished[: max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+
+# Create singleton instance
+job_runner = JobRunner()
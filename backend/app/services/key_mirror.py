@@ -0,0 +1,1347 @@
+"""
+Local SQLite mirror of Lokalise project keys and translations.
+
+Lokalise asks clients not to call the keys endpoint on every user visit. The
+mirror bulk-loads a project once through cursor pagination, then keeps itself
+current with incremental syncs that only re-fetch keys whose
+``modified_at_timestamp`` or ``translations_modified_at_timestamp`` moved.
+The list endpoints are served from indexed local queries, including an FTS5 full-text index over key names,
+descriptions and translations.
+"""
+
+import asyncio
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any, Literal
+
+from fastapi import HTTPException
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.schemas.lokalise.keys import ProjectKeysResponse
+from app.schemas.lokalise.translations import TranslationsResponse
+from app.services.language_registry import language_registry
+from app.services.lokalise.keys import key_names, lokalise_keys_service
+from app.services.lokalise.languages import lokalise_languages_service
+from app.services.lokalise.translations import lokalise_translations_service
+
+logger = get_logger(__name__)
+
+# Number of changed keys re-fetched per request during an incremental sync
+# (kept well below the page limit so the filter_key_ids query string stays short)
+CHANGED_KEYS_CHUNK_SIZE = 200
+
+SearchField = Literal["name", "description", "translation"]
+SEARCH_FIELDS: tuple[SearchField, ...] = ("name", "description", "translation")
+
+# BM25 column weights of the key index (name, description); translation hits
+# use the default weight of 1.0
+KEY_NAME_WEIGHT = 10.0
+KEY_DESCRIPTION_WEIGHT = 2.0
+
+HIGHLIGHT_OPEN = "<mark>"
+HIGHLIGHT_CLOSE = "</mark>"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS keys (
+    key_id INTEGER PRIMARY KEY,
+    is_archived INTEGER NOT NULL DEFAULT 0,
+    modified_at_timestamp INTEGER NOT NULL DEFAULT 0,
+    translations_modified_at_timestamp INTEGER NOT NULL DEFAULT 0,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_keys_archived ON keys (is_archived, key_id);
+
+CREATE TABLE IF NOT EXISTS key_names (
+    name TEXT NOT NULL,
+    key_id INTEGER NOT NULL,
+    PRIMARY KEY (name, key_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_key_names_key ON key_names (key_id);
+
+CREATE TABLE IF NOT EXISTS key_tags (
+    tag TEXT NOT NULL,
+    key_id INTEGER NOT NULL,
+    PRIMARY KEY (tag, key_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_key_tags_key ON key_tags (key_id);
+
+CREATE TABLE IF NOT EXISTS key_filenames (
+    filename TEXT NOT NULL,
+    key_id INTEGER NOT NULL,
+    platform TEXT NOT NULL,
+    PRIMARY KEY (filename, key_id, platform)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_key_filenames_key ON key_filenames (key_id);
+
+CREATE TABLE IF NOT EXISTS key_platforms (
+    platform TEXT NOT NULL,
+    key_id INTEGER NOT NULL,
+    PRIMARY KEY (platform, key_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_key_platforms_key ON key_platforms (key_id);
+
+CREATE TABLE IF NOT EXISTS translations (
+    translation_id INTEGER PRIMARY KEY,
+    key_id INTEGER NOT NULL,
+    language_iso TEXT NOT NULL,
+    is_untranslated INTEGER NOT NULL DEFAULT 0,
+    is_reviewed INTEGER NOT NULL DEFAULT 0,
+    is_unverified INTEGER NOT NULL DEFAULT 0,
+    task_id INTEGER,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_translations_key ON translations (key_id, language_iso);
+CREATE INDEX IF NOT EXISTS ix_translations_untranslated
+    ON translations (is_untranslated, language_iso, key_id);
+CREATE INDEX IF NOT EXISTS ix_translations_language
+    ON translations (language_iso, translation_id);
+
+CREATE TABLE IF NOT EXISTS languages (
+    lang_id INTEGER PRIMARY KEY,
+    lang_iso TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_languages_iso ON languages (lang_iso);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS key_search USING fts5(
+    name, description, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS translation_search USING fts5(
+    text, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    last_full_sync_at REAL,
+    last_sync_at REAL
+);
+"""
+
+
+def _split_csv(value: str | None) -> list[str]:
+    """Split a comma separated query parameter into its non-empty items."""
+    if not value:
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _placeholders(values: Iterable[Any]) -> str:
+    return ",".join("?" for _ in values)
+
+
+def _key_filters(
+    archived: Literal["include", "exclude", "only"],
+    columns: dict[str, list[Any] | None],
+    key_ids: list[int] | None,
+) -> tuple[list[str], list[Any]]:
+    """
+    WHERE clauses and parameters of the ``query_keys`` key filters.
+
+    Args:
+        archived: Whether to include, exclude or only return archived keys
+        columns: Values to match by ``(table, column)`` of the key child
+            tables, e.g. ``{("key_tags", "tag"): ["ios"]}``
+        key_ids: Key IDs to match
+    """
+    where: list[str] = []
+    params: list[Any] = []
+
+    if archived == "exclude":
+        where.append("k.is_archived = 0")
+    elif archived == "only":
+        where.append("k.is_archived = 1")
+
+    for (table, column), values in columns.items():
+        if values:
+            where.append(
+                f"k.key_id IN (SELECT key_id FROM {table} "
+                f"WHERE {column} IN ({_placeholders(values)}))"
+            )
+            params.extend(values)
+
+    if key_ids:
+        where.append(f"k.key_id IN ({_placeholders(key_ids)})")
+        params.extend(key_ids)
+
+    return where, params
+
+
+def _search_hit_queries(
+    match: str,
+    key_columns: list[str],
+    search_translations: bool,
+    language_sql: str,
+    language_isos: list[str] | None,
+) -> tuple[list[str], list[Any]]:
+    """Queries (with their parameters) yielding ``(key_id, score)`` search hits."""
+    hit_queries: list[str] = []
+    params: list[Any] = []
+
+    if key_columns:
+        hit_queries.append(
+            "SELECT rowid AS key_id, bm25(key_search, "
+            f"{KEY_NAME_WEIGHT}, {KEY_DESCRIPTION_WEIGHT}) AS score "
+            "FROM key_search WHERE key_search MATCH ?"
+        )
+        params.append(f"{{{' '.join(key_columns)}}} : ({match})")
+
+    if search_translations:
+        # CROSS JOIN keeps the full-text match as the driving table; probing
+        # FTS5 by rowid from the language index re-evaluates the whole
+        # MATCH for every translation row
+        hit_queries.append(
+            "SELECT t.key_id AS key_id, bm25(translation_search) AS score "
+            "FROM translation_search CROSS JOIN translations t "
+            "ON t.translation_id = translation_search.rowid "
+            f"WHERE translation_search MATCH ?{language_sql}"
+        )
+        params.append(match)
+        params.extend(language_isos or [])
+
+    return hit_queries, params
+
+
+def _translation_text(translation: Any) -> str:
+    """Flatten a translation value (plain or plural object) into searchable text."""
+    if isinstance(translation, dict):
+        return " ".join(str(form) for form in translation.values() if form)
+    return str(translation or "")
+
+
+def build_match_query(query: str, prefix: bool = True) -> str | None:
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Every word becomes a quoted token (so FTS5 operators in user input are
+    inert); with ``prefix`` each token also matches as a prefix.
+
+    Returns:
+        The MATCH expression, or None if the query contains no searchable words
+    """
+    tokens = re.findall(r"\w+", query)
+    if not tokens:
+        return None
+    suffix = "*" if prefix else ""
+    return " ".join(f'"{token}"{suffix}' for token in tokens)
+
+
+def _is_untranslated(translation: Any) -> bool:
+    """Whether a translation value (plain or plural object) is empty."""
+    if isinstance(translation, dict):
+        return not any(str(form).strip() for form in translation.values())
+    return not str(translation or "").strip()
+
+
+def _passthrough_params(params: dict[str, Any]) -> dict[str, Any]:
+    """Query parameters of a request passed through to the live API."""
+    params = {
+        name: int(value) if isinstance(value, bool) else value
+        for name, value in params.items()
+    }
+    if params.get("pagination") == "offset":
+        params.pop("cursor", None)
+    return params
+
+
+def _pagination_passthrough(headers: Mapping[str, str]) -> dict[str, str]:
+    """Pagination headers of a live API response, to send on."""
+    return {
+        name: value
+        for name, value in headers.items()
+        if name.lower().startswith("x-pagination")
+    }
+
+
+class KeyMirrorStore:
+    """
+    SQLite storage for one project's keys, translations and languages.
+
+    All methods are synchronous and are meant to be called through
+    ``asyncio.to_thread`` so SQLite I/O never runs on the event loop.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._ensure_search_index()
+
+    def _ensure_search_index(self) -> None:
+        """Backfill the full-text index for mirrors created before it existed."""
+        with self._lock:
+            has_keys = self._conn.execute("SELECT 1 FROM keys LIMIT 1").fetchone()
+            has_index = self._conn.execute(
+                "SELECT 1 FROM key_search LIMIT 1"
+            ).fetchone()
+        if has_keys and not has_index:
+            logger.info("Building full-text index for key mirror %s", self.db_path)
+            self.rebuild_search_index()
+
+    def rebuild_search_index(self) -> None:
+        """Recreate the full-text index from the stored keys and translations."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM key_search")
+            self._conn.execute("DELETE FROM translation_search")
+            self._conn.executemany(
+                "INSERT INTO key_search (rowid, name, description) VALUES (?, ?, ?)",
+                (
+                    (
+                        key_id,
+                        " ".join(sorted(key_names(key))),
+                        key.get("description") or "",
+                    )
+                    for key_id, key in (
+                        (row[0], json.loads(row[1]))
+                        for row in self._conn.execute(
+                            "SELECT key_id, payload FROM keys"
+                        ).fetchall()
+                    )
+                ),
+            )
+            self._conn.executemany(
+                "INSERT INTO translation_search (rowid, text) VALUES (?, ?)",
+                (
+                    (row[0], _translation_text(json.loads(row[1]).get("translation")))
+                    for row in self._conn.execute(
+                        "SELECT translation_id, payload FROM translations"
+                    ).fetchall()
+                ),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ----- Sync bookkeeping -----
+
+    def get_sync_state(self) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_full_sync_at, last_sync_at FROM sync_state WHERE id = 1"
+            ).fetchone()
+        return dict(row) if row else None
+
+    def mark_synced(self, full: bool) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO sync_state (id, last_full_sync_at, last_sync_at) "
+                "VALUES (1, ?, ?) ON CONFLICT(id) DO UPDATE SET "
+                "last_sync_at = excluded.last_sync_at, "
+                "last_full_sync_at = COALESCE(?, last_full_sync_at)",
+                (now if full else None, now, now if full else None),
+            )
+
+    def get_counts(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("keys", "translations", "languages")
+            }
+
+    def get_key_versions(self) -> dict[int, tuple[int, int]]:
+        """Map every stored key to its (modified, translations modified) timestamps."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key_id, modified_at_timestamp, "
+                "translations_modified_at_timestamp FROM keys"
+            ).fetchall()
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    # ----- Writes -----
+
+    def replace_languages(self, languages: list[dict[str, Any]]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM languages")
+            self._conn.executemany(
+                "INSERT INTO languages (lang_id, lang_iso, payload) VALUES (?, ?, ?)",
+                [
+                    (lang["lang_id"], lang["lang_iso"], json.dumps(lang))
+                    for lang in languages
+                ],
+            )
+
+    def upsert_keys(self, keys: list[dict[str, Any]]) -> int:
+        """
+        Insert or replace keys together with their translations and lookup rows.
+
+        Returns:
+            Number of translations written
+        """
+        key_rows = []
+        name_rows = []
+        tag_rows = []
+        filename_rows = []
+        platform_rows = []
+        translation_rows = []
+        key_search_rows = []
+        translation_search_rows = []
+
+        for key in keys:
+            key_id = key["key_id"]
+            translations = key.get("translations") or []
+            payload = {k: v for k, v in key.items() if k != "translations"}
+
+            key_rows.append(
+                (
+                    key_id,
+                    int(bool(key.get("is_archived"))),
+                    key.get("modified_at_timestamp") or 0,
+                    key.get("translations_modified_at_timestamp") or 0,
+                    json.dumps(payload),
+                )
+            )
+
+            names = key_names(key)
+            name_rows.extend((name, key_id) for name in names)
+            key_search_rows.append(
+                (key_id, " ".join(sorted(names)), key.get("description") or "")
+            )
+
+            tag_rows.extend((tag, key_id) for tag in set(key.get("tags") or []))
+            platform_rows.extend(
+                (platform, key_id) for platform in set(key.get("platforms") or [])
+            )
+
+            filenames = key.get("filenames") or {}
+            filename_maps = filenames if isinstance(filenames, list) else [filenames]
+            filename_rows.extend(
+                {
+                    (filename, key_id, platform)
+                    for filename_map in filename_maps
+                    for platform, filename in filename_map.items()
+                    if filename
+                }
+            )
+
+            for translation in translations:
+                translation_rows.append(
+                    (
+                        translation["translation_id"],
+                        key_id,
+                        translation["language_iso"],
+                        int(_is_untranslated(translation.get("translation"))),
+                        int(bool(translation.get("is_reviewed"))),
+                        int(bool(translation.get("is_unverified"))),
+                        translation.get("task_id"),
+                        json.dumps(translation),
+                    )
+                )
+                translation_search_rows.append(
+                    (
+                        translation["translation_id"],
+                        _translation_text(translation.get("translation")),
+                    )
+                )
+
+        key_ids = [(row[0],) for row in key_rows]
+        with self._lock, self._conn:
+            for table in ("key_names", "key_tags", "key_filenames", "key_platforms"):
+                self._conn.executemany(f"DELETE FROM {table} WHERE key_id = ?", key_ids)
+            # Translations are only part of the payload when they were requested
+            with_translations = [
+                (key["key_id"],) for key in keys if key.get("translations") is not None
+            ]
+            self._conn.executemany("DELETE FROM key_search WHERE rowid = ?", key_ids)
+            self._conn.executemany(
+                "DELETE FROM translation_search WHERE rowid IN "
+                "(SELECT translation_id FROM translations WHERE key_id = ?)",
+                with_translations,
+            )
+            self._conn.executemany(
+                "DELETE FROM translations WHERE key_id = ?", with_translations
+            )
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO keys (key_id, is_archived, modified_at_timestamp, "
+                "translations_modified_at_timestamp, payload) VALUES (?, ?, ?, ?, ?)",
+                key_rows,
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO key_names (name, key_id) VALUES (?, ?)",
+                name_rows,
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO key_tags (tag, key_id) VALUES (?, ?)", tag_rows
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO key_filenames (filename, key_id, platform) "
+                "VALUES (?, ?, ?)",
+                filename_rows,
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO key_platforms (platform, key_id) VALUES (?, ?)",
+                platform_rows,
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (translation_id, key_id, "
+                "language_iso, is_untranslated, is_reviewed, is_unverified, task_id, "
+                "payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                translation_rows,
+            )
+            self._conn.executemany(
+                "INSERT INTO key_search (rowid, name, description) VALUES (?, ?, ?)",
+                key_search_rows,
+            )
+            self._conn.executemany(
+                "INSERT INTO translation_search (rowid, text) VALUES (?, ?)",
+                translation_search_rows,
+            )
+
+        return len(translation_rows)
+
+    def delete_keys(self, key_ids: Iterable[int]) -> int:
+        rows = [(key_id,) for key_id in key_ids]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM key_search WHERE rowid = ?", rows)
+            self._conn.executemany(
+                "DELETE FROM translation_search WHERE rowid IN "
+                "(SELECT translation_id FROM translations WHERE key_id = ?)",
+                rows,
+            )
+            for table in (
+                "keys",
+                "key_names",
+                "key_tags",
+                "key_filenames",
+                "key_platforms",
+                "translations",
+            ):
+                self._conn.executemany(f"DELETE FROM {table} WHERE key_id = ?", rows)
+        return len(rows)
+
+    # ----- Reads -----
+
+    def _language_isos(self, lang_ids: list[int]) -> list[str]:
+        rows = self._conn.execute(
+            f"SELECT lang_iso FROM languages WHERE lang_id IN ({_placeholders(lang_ids)})",
+            lang_ids,
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_language_isos(self) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT lang_iso FROM languages ORDER BY lang_iso"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def count_active_keys(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM keys WHERE is_archived = 0"
+            ).fetchone()[0]
+
+    def get_key_texts(
+        self, *, after_key_id: int = 0, limit: int = 1000
+    ) -> list[tuple[int, str, dict[str, str]]]:
+        """
+        Page through non-archived keys with their translations as plain text.
+
+        Returns:
+            ``(key_id, key_name, texts by language)`` of up to ``limit`` keys
+            with ids above ``after_key_id``, in key id order
+        """
+        with self._lock:
+            key_rows = self._conn.execute(
+                "SELECT keys.key_id, MIN(key_names.name) FROM keys "
+                "LEFT JOIN key_names ON key_names.key_id = keys.key_id "
+                "WHERE keys.is_archived = 0 AND keys.key_id > ? "
+                "GROUP BY keys.key_id ORDER BY keys.key_id LIMIT ?",
+                (after_key_id, limit),
+            ).fetchall()
+            if not key_rows:
+                return []
+            translation_rows = self._conn.execute(
+                "SELECT key_id, language_iso, payload FROM translations "
+                "WHERE key_id BETWEEN ? AND ?",
+                (key_rows[0][0], key_rows[-1][0]),
+            ).fetchall()
+
+        texts: dict[int, dict[str, str]] = {row[0]: {} for row in key_rows}
+        for key_id, language_iso, payload in translation_rows:
+            if key_id in texts:
+                texts[key_id][language_iso] = _translation_text(
+                    json.loads(payload).get("translation")
+                )
+        return [(key_id, name or "", texts[key_id]) for key_id, name in key_rows]
+
+    def query_keys(
+        self,
+        *,
+        include_translations: bool = False,
+        include_comments: bool = False,
+        include_screenshots: bool = False,
+        translation_lang_ids: list[int] | None = None,
+        tags: list[str] | None = None,
+        filenames: list[str] | None = None,
+        key_names: list[str] | None = None,
+        key_ids: list[int] | None = None,
+        platforms: list[str] | None = None,
+        untranslated: bool = False,
+        archived: Literal["include", "exclude", "only"] = "include",
+        limit: int = 100,
+        offset: int = 0,
+        after_key_id: int | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Query stored keys using the same filters as the Lokalise keys endpoint.
+
+        Returns:
+            Tuple of the page of key objects and the total number of matches
+        """
+        where, params = _key_filters(
+            archived,
+            {
+                ("key_tags", "tag"): tags,
+                ("key_filenames", "filename"): filenames,
+                ("key_names", "name"): key_names,
+                ("key_platforms", "platform"): platforms,
+            },
+            key_ids,
+        )
+
+        with self._lock:
+            language_isos = (
+                self._language_isos(translation_lang_ids)
+                if translation_lang_ids
+                else None
+            )
+
+            if untranslated:
+                clause = (
+                    "EXISTS (SELECT 1 FROM translations t "
+                    "WHERE t.is_untranslated = 1 AND t.key_id = k.key_id"
+                )
+                if language_isos is not None:
+                    clause += f" AND t.language_iso IN ({_placeholders(language_isos)})"
+                    params.extend(language_isos)
+                where.append(clause + ")")
+
+            where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM keys k {where_sql}", params
+            ).fetchone()[0]
+
+            page_where = list(where)
+            page_params = list(params)
+            if after_key_id is not None:
+                page_where.append("k.key_id > ?")
+                page_params.append(after_key_id)
+                offset = 0
+            page_where_sql = f"WHERE {' AND '.join(page_where)}" if page_where else ""
+            rows = self._conn.execute(
+                f"SELECT k.key_id, k.payload FROM keys k {page_where_sql} "
+                "ORDER BY k.key_id LIMIT ? OFFSET ?",
+                [*page_params, limit, offset],
+            ).fetchall()
+
+            translations_by_key: dict[int, list[dict[str, Any]]] = {}
+            page_key_ids = [row[0] for row in rows]
+            if include_translations and page_key_ids:
+                sql = (
+                    "SELECT key_id, payload FROM translations "
+                    f"WHERE key_id IN ({_placeholders(page_key_ids)})"
+                )
+                sql_params: list[Any] = list(page_key_ids)
+                if language_isos is not None:
+                    sql += f" AND language_iso IN ({_placeholders(language_isos)})"
+                    sql_params.extend(language_isos)
+                for key_id, payload in self._conn.execute(
+                    sql + " ORDER BY translation_id", sql_params
+                ):
+                    translations_by_key.setdefault(key_id, []).append(
+                        json.loads(payload)
+                    )
+
+        keys = []
+        for key_id, payload in rows:
+            key = json.loads(payload)
+            key["translations"] = translations_by_key.get(key_id, [])
+            if not include_comments:
+                key["comments"] = []
+            if not include_screenshots:
+                key["screenshots"] = []
+            keys.append(key)
+
+        return keys, total
+
+    def query_translations(
+        self,
+        *,
+        lang_id: int | None = None,
+        reviewed: bool = False,
+        unverified: bool = False,
+        untranslated: bool = False,
+        task_id: int | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_translation_id: int | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Query stored translations using the Lokalise translations endpoint filters.
+
+        Returns:
+            Tuple of the page of translation objects and the total number of matches
+        """
+        where: list[str] = []
+        params: list[Any] = []
+
+        if lang_id is not None:
+            where.append(
+                "language_iso IN (SELECT lang_iso FROM languages WHERE lang_id = ?)"
+            )
+            params.append(lang_id)
+        if reviewed:
+            where.append("is_reviewed = 1")
+        if unverified:
+            where.append("is_unverified = 1")
+        if untranslated:
+            where.append("is_untranslated = 1")
+        if task_id is not None:
+            where.append("task_id = ?")
+            params.append(task_id)
+
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+        page_where = list(where)
+        page_params = list(params)
+        if after_translation_id is not None:
+            page_where.append("translation_id > ?")
+            page_params.append(after_translation_id)
+            offset = 0
+        page_where_sql = f"WHERE {' AND '.join(page_where)}" if page_where else ""
+
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM translations {where_sql}", params
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT payload FROM translations {page_where_sql} "
+                "ORDER BY translation_id LIMIT ? OFFSET ?",
+                [*page_params, limit, offset],
+            ).fetchall()
+
+        translations = []
+        for (payload,) in rows:
+            translation = json.loads(payload)
+            # Key-embedded translations carry no segment number; unsegmented
+            # translations always report segment 1
+            translation.setdefault("segment_number", 1)
+            translations.append(translation)
+
+        return translations, total
+
+    def search(
+        self,
+        match: str,
+        *,
+        fields: Iterable[SearchField] = SEARCH_FIELDS,
+        language_isos: list[str] | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Rank keys by full-text relevance across names, descriptions and translations.
+
+        A key's score is its best BM25 score over all matching fields; key name
+        hits weigh more than description hits. Translation hits can be limited
+        to ``language_isos``.
+
+        Args:
+            match: FTS5 MATCH expression (see ``build_match_query``)
+            fields: Which of "name", "description" and "translation" to search
+            language_isos: Only consider translations in these languages
+            limit: Page size
+            offset: Number of ranked keys to skip
+
+        Returns:
+            Tuple of the page of hits (key payload fields, score and
+            highlighted matches) and the total number of matching keys
+        """
+        fields = set(fields)
+        key_columns = [field for field in ("name", "description") if field in fields]
+        language_sql = ""
+        if language_isos:
+            language_sql = f" AND t.language_iso IN ({_placeholders(language_isos)})"
+        hit_queries, params = _search_hit_queries(
+            match, key_columns, "translation" in fields, language_sql, language_isos
+        )
+
+        if not hit_queries:
+            return [], 0
+
+        # bm25() cannot be evaluated once the hit queries are flattened into
+        # the aggregate, so the hits are materialized first
+        hits_sql = " UNION ALL ".join(hit_queries)
+        with self._lock:
+            ranked = self._conn.execute(
+                f"WITH hits AS MATERIALIZED ({hits_sql}) "
+                "SELECT key_id, MIN(score) AS score, COUNT(*) OVER () "
+                "FROM hits GROUP BY key_id "
+                "ORDER BY score, key_id LIMIT ? OFFSET ?",
+                [*params, limit, offset],
+            ).fetchall()
+            if ranked:
+                total = ranked[0][2]
+            else:
+                total = self._conn.execute(
+                    f"WITH hits AS MATERIALIZED ({hits_sql}) "
+                    "SELECT COUNT(DISTINCT key_id) FROM hits",
+                    params,
+                ).fetchone()[0]
+            if not ranked:
+                return [], total
+
+            page_ids = [row[0] for row in ranked]
+            id_sql = _placeholders(page_ids)
+            payloads = dict(
+                self._conn.execute(
+                    f"SELECT key_id, payload FROM keys WHERE key_id IN ({id_sql})",
+                    page_ids,
+                ).fetchall()
+            )
+            matches: dict[int, list[dict[str, Any]]] = {
+                key_id: [] for key_id in page_ids
+            }
+            if key_columns:
+                for key_id, name, description in self._conn.execute(
+                    "SELECT rowid, "
+                    f"highlight(key_search, 0, '{HIGHLIGHT_OPEN}', '{HIGHLIGHT_CLOSE}'), "
+                    f"highlight(key_search, 1, '{HIGHLIGHT_OPEN}', '{HIGHLIGHT_CLOSE}') "
+                    f"FROM key_search WHERE key_search MATCH ? AND rowid IN ({id_sql})",
+                    [params[0], *page_ids],
+                ):
+                    for field, text in (("name", name), ("description", description)):
+                        if field in key_columns and HIGHLIGHT_OPEN in text:
+                            matches[key_id].append(
+                                {"field": field, "language_iso": None, "snippet": text}
+                            )
+            if "translation" in fields:
+                for key_id, language_iso, snippet in self._conn.execute(
+                    "SELECT t.key_id, t.language_iso, snippet(translation_search, 0, "
+                    f"'{HIGHLIGHT_OPEN}', '{HIGHLIGHT_CLOSE}', '…', 24) "
+                    "FROM translation_search CROSS JOIN translations t "
+                    "ON t.translation_id = translation_search.rowid "
+                    f"WHERE translation_search MATCH ?{language_sql} "
+                    f"AND t.key_id IN ({id_sql}) ORDER BY t.language_iso",
+                    [match, *(language_isos or []), *page_ids],
+                ):
+                    matches[key_id].append(
+                        {
+                            "field": "translation",
+                            "language_iso": language_iso,
+                            "snippet": snippet,
+                        }
+                    )
+
+        results = []
+        for key_id, score, _ in ranked:
+            key = json.loads(payloads[key_id])
+            results.append(
+                {
+                    "key_id": key_id,
+                    "key_name": key.get("key_name"),
+                    "description": key.get("description"),
+                    "is_archived": bool(key.get("is_archived")),
+                    # bm25() is lower-is-better; expose higher-is-better
+                    "score": round(-score, 4),
+                    "matches": matches[key_id],
+                }
+            )
+        return results, total
+
+
+class KeyMirrorService:
+    """
+    Keeps per-project SQLite mirrors in sync with Lokalise and serves queries.
+
+    The first request for a project performs a full bulk load. Afterwards the
+    mirror is served as-is while an incremental sync runs in the background
+    whenever it is older than ``KEY_MIRROR_SYNC_INTERVAL_SECONDS``.
+    """
+
+    def __init__(self, data_dir: str | Path | None = None):
+        settings = get_settings()
+        self.data_dir = Path(data_dir or settings.DATA_DIR) / "key_mirror"
+        self.sync_interval = settings.KEY_MIRROR_SYNC_INTERVAL_SECONDS
+        self.keys_service = lokalise_keys_service
+        self.languages_service = lokalise_languages_service
+        self._stores: dict[str, KeyMirrorStore] = {}
+        self._sync_locks: dict[str, asyncio.Lock] = {}
+        self._background_syncs: dict[str, asyncio.Task[Any]] = {}
+
+    def get_store(self, project_id: str) -> KeyMirrorStore:
+        """Return (opening if needed) the mirror store of a project."""
+        store = self._stores.get(project_id)
+        if store is None:
+            safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", project_id)
+            store = KeyMirrorStore(self.data_dir / f"{safe_name}.sqlite3")
+            self._stores[project_id] = store
+        return store
+
+    def is_syncing(self, project_id: str) -> bool:
+        lock = self._sync_locks.get(project_id)
+        return bool(lock and lock.locked())
+
+    async def sync_project(
+        self, project_id: str, full: bool = False, max_age: float | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Bring the mirror of a project up to date.
+
+        Args:
+            project_id: Lokalise project ID
+            full: Force a full reload instead of an incremental sync
+            max_age: Skip the sync if the mirror was synced less than this
+                many seconds ago, e.g. by a request that held the lock first
+
+        Returns:
+            Dictionary with sync statistics, or None if the sync was skipped
+        """
+        lock = self._sync_locks.setdefault(project_id, asyncio.Lock())
+        async with lock:
+            store = self.get_store(project_id)
+            state = await asyncio.to_thread(store.get_sync_state)
+            if (
+                max_age is not None
+                and state is not None
+                and time.time() - (state["last_sync_at"] or 0) < max_age
+            ):
+                logger.debug(
+                    "Key mirror for project %s is fresh, skipping sync", project_id
+                )
+                return None
+            mode = "full" if full or state is None else "incremental"
+            started = time.perf_counter()
+
+            logger.info("Starting %s key mirror sync for project %s", mode, project_id)
+
+            languages = await self.languages_service.list_project_languages(project_id)
+            language_registry.prime(project_id, languages.languages)
+            await asyncio.to_thread(
+                store.replace_languages,
+                [lang.model_dump() for lang in languages.languages],
+            )
+
+            if mode == "full":
+                stats = await self._full_sync(project_id, store)
+            else:
+                stats = await self._incremental_sync(project_id, store)
+
+            await asyncio.to_thread(store.mark_synced, mode == "full")
+
+            stats.update(
+                {
+                    "project_id": project_id,
+                    "mode": mode,
+                    "duration_seconds": round(time.perf_counter() - started, 3),
+                }
+            )
+            logger.info(
+                "Key mirror sync finished for project %s: %s", project_id, stats
+            )
+            return stats
+
+    async def _full_sync(
+        self, project_id: str, store: KeyMirrorStore
+    ) -> dict[str, Any]:
+        existing = await asyncio.to_thread(store.get_key_versions)
+        seen: set[int] = set()
+        keys_upserted = 0
+        translations_upserted = 0
+
+        async for page in self.keys_service.iter_key_pages(project_id):
+            translations_upserted += await asyncio.to_thread(store.upsert_keys, page)
+            keys_upserted += len(page)
+            seen.update(key["key_id"] for key in page)
+
+        keys_deleted = await asyncio.to_thread(
+            store.delete_keys, existing.keys() - seen
+        )
+        return {
+            "keys_fetched": keys_upserted,
+            "keys_upserted": keys_upserted,
+            "translations_upserted": translations_upserted,
+            "keys_deleted": keys_deleted,
+        }
+
+    async def _incremental_sync(
+        self, project_id: str, store: KeyMirrorStore
+    ) -> dict[str, Any]:
+        existing = await asyncio.to_thread(store.get_key_versions)
+        seen: set[int] = set()
+        changed: list[int] = []
+        keys_fetched = 0
+
+        # Pass 1: walk lightweight key headers (no translations, comments or
+        # screenshots) and compare modification timestamps
+        async for page in self.keys_service.iter_key_pages(
+            project_id,
+            include_translations=False,
+            include_comments=False,
+            include_screenshots=False,
+        ):
+            keys_fetched += len(page)
+            for key in page:
+                key_id = key["key_id"]
+                seen.add(key_id)
+                version = (
+                    key.get("modified_at_timestamp") or 0,
+                    key.get("translations_modified_at_timestamp") or 0,
+                )
+                if existing.get(key_id) != version:
+                    changed.append(key_id)
+
+        # Pass 2: fetch full payloads for new and modified keys only
+        keys_upserted = 0
+        translations_upserted = 0
+        for i in range(0, len(changed), CHANGED_KEYS_CHUNK_SIZE):
+            chunk = changed[i : i + CHANGED_KEYS_CHUNK_SIZE]
+            async for page in self.keys_service.iter_key_pages(
+                project_id, filter_key_ids=chunk
+            ):
+                translations_upserted += await asyncio.to_thread(
+                    store.upsert_keys, page
+                )
+                keys_upserted += len(page)
+
+        keys_deleted = await asyncio.to_thread(
+            store.delete_keys, existing.keys() - seen
+        )
+        return {
+            "keys_fetched": keys_fetched,
+            "keys_upserted": keys_upserted,
+            "translations_upserted": translations_upserted,
+            "keys_deleted": keys_deleted,
+        }
+
+    async def ensure_fresh(self, project_id: str) -> None:
+        """
+        Make sure a project can be served from the mirror.
+
+        Never-synced projects are loaded synchronously; stale ones get a
+        background incremental sync while the current data is served.
+        """
+        store = self.get_store(project_id)
+        state = await asyncio.to_thread(store.get_sync_state)
+        if state is None:
+            # Concurrent first requests queue on the sync lock; only the
+            # first one loads the project
+            await self.sync_project(project_id, max_age=self.sync_interval)
+            return
+
+        age = time.time() - (state["last_sync_at"] or 0)
+        if age < self.sync_interval or self.is_syncing(project_id):
+            return
+
+        task = self._background_syncs.get(project_id)
+        if task is None or task.done():
+            logger.info(
+                "Key mirror for project %s is %.0fs old, scheduling background sync",
+                project_id,
+                age,
+            )
+            self._background_syncs[project_id] = asyncio.create_task(
+                self._background_sync(project_id)
+            )
+
+    async def _background_sync(self, project_id: str) -> None:
+        try:
+            await self.sync_project(project_id, max_age=self.sync_interval)
+        except Exception as e:
+            logger.error("Background key mirror sync failed for %s: %s", project_id, e)
+
+    async def apply_written_keys(
+        self, project_id: str, keys: list[dict[str, Any]]
+    ) -> None:
+        """
+        Store keys returned by create/update calls in an already loaded mirror.
+
+        This makes writes visible to mirror queries right away instead of after
+        the next sync; mirrors that were never loaded are left alone.
+        """
+        if not keys:
+            return
+        store = self.get_store(project_id)
+        if await asyncio.to_thread(store.get_sync_state) is not None:
+            await asyncio.to_thread(store.upsert_keys, keys)
+
+    async def get_status(self, project_id: str) -> dict[str, Any]:
+        """Return sync state and row counts for a project mirror."""
+        store = self.get_store(project_id)
+        state = await asyncio.to_thread(store.get_sync_state)
+        counts = await asyncio.to_thread(store.get_counts)
+        return {
+            "project_id": project_id,
+            "synced": state is not None,
+            "syncing": self.is_syncing(project_id),
+            "last_full_sync_at": state["last_full_sync_at"] if state else None,
+            "last_sync_at": state["last_sync_at"] if state else None,
+            "key_count": counts["keys"],
+            "translation_count": counts["translations"],
+            "language_count": counts["languages"],
+        }
+
+    async def search_keys(
+        self,
+        project_id: str,
+        query: str,
+        *,
+        fields: str | None = None,
+        filter_lang_iso: str | None = None,
+        prefix: bool = True,
+        limit: int = 20,
+        page: int = 1,
+    ) -> dict[str, Any]:
+        """
+        Full-text search over the keys and translations of a project.
+
+        Args:
+            project_id: Lokalise project ID
+            query: Free-text query; every word must match
+            fields: Comma-separated subset of "name", "description" and
+                "translation" to search (default: all)
+            filter_lang_iso: Comma-separated languages to match translations in
+            prefix: Match words as prefixes (search-as-you-type)
+            limit: Page size
+            page: 1-based page number
+
+        Returns:
+            Dictionary with the ranked hits, total count and query time
+        """
+        match = build_match_query(query, prefix=prefix)
+        if match is None:
+            raise HTTPException(
+                status_code=400, detail="Search query contains no searchable words"
+            )
+        search_fields = _split_csv(fields) or list(SEARCH_FIELDS)
+        unknown = set(search_fields) - set(SEARCH_FIELDS)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown search fields: {', '.join(sorted(unknown))}",
+            )
+        language_isos = _split_csv(filter_lang_iso) or None
+
+        await self.ensure_fresh(project_id)
+        store = self.get_store(project_id)
+
+        started = time.perf_counter()
+        results, total = await asyncio.to_thread(
+            lambda: store.search(
+                match,
+                fields=search_fields,
+                language_isos=language_isos,
+                limit=limit,
+                offset=(page - 1) * limit,
+            )
+        )
+        return {
+            "project_id": project_id,
+            "query": query,
+            "total_count": total,
+            "page": page,
+            "limit": limit,
+            "took_ms": round((time.perf_counter() - started) * 1000, 2),
+            "results": results,
+        }
+
+    async def list_keys(
+        self,
+        project_id: str,
+        *,
+        include_comments: bool = False,
+        include_screenshots: bool = False,
+        include_translations: bool = False,
+        filter_translation_lang_ids: str | None = None,
+        filter_tags: str | None = None,
+        filter_filenames: str | None = None,
+        filter_keys: str | None = None,
+        filter_key_ids: str | None = None,
+        filter_platforms: str | None = None,
+        filter_untranslated: bool = False,
+        filter_qa_issues: str | None = None,
+        filter_archived: Literal["include", "exclude", "only"] = "include",
+        pagination: Literal["offset", "cursor"] = "offset",
+        limit: int = 100,
+        page: int = 1,
+        cursor: str | None = None,
+        disable_references: int | None = None,
+    ) -> tuple[ProjectKeysResponse, dict[str, str]]:
+        """
+        List project keys from the mirror.
+
+        QA issue filters depend on Lokalise-side QA data that is not mirrored,
+        so those requests are passed through to the live API.
+
+        Returns:
+            Tuple of the keys response and the pagination headers to send
+        """
+        if filter_qa_issues:
+            params = {
+                "include_comments": include_comments,
+                "include_screenshots": include_screenshots,
+                "include_translations": include_translations,
+                "filter_translation_lang_ids": filter_translation_lang_ids,
+                "filter_tags": filter_tags,
+                "filter_filenames": filter_filenames,
+                "filter_keys": filter_keys,
+                "filter_key_ids": filter_key_ids,
+                "filter_platforms": filter_platforms,
+                "filter_untranslated": filter_untranslated,
+                "filter_qa_issues": filter_qa_issues,
+                "filter_archived": filter_archived,
+                "pagination": pagination,
+                "limit": limit,
+                "page": page,
+                "cursor": cursor,
+                "disable_references": disable_references,
+            }
+            response, headers = await self.keys_service.list_keys(
+                project_id, _passthrough_params(params)
+            )
+            return response, _pagination_passthrough(headers)
+
+        await self.ensure_fresh(project_id)
+        store = self.get_store(project_id)
+
+        try:
+            lang_ids = [int(v) for v in _split_csv(filter_translation_lang_ids)]
+            key_ids = [int(v) for v in _split_csv(filter_key_ids)]
+            after_key_id = int(cursor) if pagination == "cursor" and cursor else None
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid identifier in filter: {e}"
+            ) from e
+
+        keys, total = await asyncio.to_thread(
+            lambda: store.query_keys(
+                include_translations=include_translations,
+                include_comments=include_comments,
+                include_screenshots=include_screenshots,
+                translation_lang_ids=lang_ids or None,
+                tags=_split_csv(filter_tags),
+                filenames=_split_csv(filter_filenames),
+                key_names=_split_csv(filter_keys),
+                key_ids=key_ids,
+                platforms=_split_csv(filter_platforms),
+                untranslated=filter_untranslated,
+                archived=filter_archived,
+                limit=limit,
+                offset=(page - 1) * limit,
+                after_key_id=after_key_id,
+            )
+        )
+
+        headers = self._pagination_headers(total, limit, page, pagination)
+        if pagination == "cursor" and len(keys) == limit:
+            headers["X-Pagination-Next-Cursor"] = str(keys[-1]["key_id"])
+
+        response = ProjectKeysResponse.model_validate(
+            {"project_id": project_id, "keys": keys}
+        )
+        return response, headers
+
+    async def list_translations(
+        self,
+        project_id: str,
+        *,
+        filter_lang_id: int | None = None,
+        filter_is_reviewed: bool = False,
+        filter_unverified: bool = False,
+        filter_untranslated: bool = False,
+        filter_qa_issues: str | None = None,
+        filter_active_task_id: int | None = None,
+        pagination: str = "offset",
+        limit: int = 100,
+        page: int = 1,
+        cursor: str | None = None,
+        disable_references: int | None = None,
+    ) -> tuple[TranslationsResponse, dict[str, str]]:
+        """
+        List project translations from the mirror.
+
+        Returns:
+            Tuple of the translations response and the pagination headers to send
+        """
+        if filter_qa_issues:
+            params = {
+                "filter_lang_id": filter_lang_id,
+                "filter_is_reviewed": filter_is_reviewed,
+                "filter_unverified": filter_unverified,
+                "filter_untranslated": filter_untranslated,
+                "filter_qa_issues": filter_qa_issues,
+                "filter_active_task_id": filter_active_task_id,
+                "pagination": pagination,
+                "limit": limit,
+                "page": page,
+                "cursor": cursor,
+                "disable_references": disable_references,
+            }
+            response, headers = await lokalise_translations_service.list_translations(
+                project_id, _passthrough_params(params)
+            )
+            return response, _pagination_passthrough(headers)
+
+        await self.ensure_fresh(project_id)
+        store = self.get_store(project_id)
+
+        try:
+            after_id = int(cursor) if pagination == "cursor" and cursor else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}") from e
+
+        translations, total = await asyncio.to_thread(
+            lambda: store.query_translations(
+                lang_id=filter_lang_id,
+                reviewed=filter_is_reviewed,
+                unverified=filter_unverified,
+                untranslated=filter_untranslated,
+                task_id=filter_active_task_id,
+                limit=limit,
+                offset=(page - 1) * limit,
+                after_translation_id=after_id,
+            )
+        )
+
+        headers = self._pagination_headers(total, limit, page, pagination)
+        if pagination == "cursor" and len(translations) == limit:
+            headers["X-Pagination-Next-Cursor"] = str(
+                translations[-1]["translation_id"]
+            )
+
+        response = TranslationsResponse.model_validate(
+            {"project_id": project_id, "translations": translations}
+        )
+        return response, headers
+
+    def _pagination_headers(
+        self, total: int, limit: int, page: int, pagination: str
+    ) -> dict[str, str]:
+        headers = {"X-Total-Count": str(total), "X-Pagination-Limit": str(limit)}
+        if pagination == "offset":
+            headers.update(
+                {
+                    "X-Pagination-Total-Count": str(total),
+                    "X-Pagination-Page": str(page),
+                    "X-Pagination-Page-Count": str(max(1, -(-total // limit))),
+                }
+            )
+        return headers
+
+
+# Create singleton instance
+key_mirror_service = KeyMirrorService()
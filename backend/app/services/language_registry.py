@@ -0,0 +1,144 @@
+"""
+Per-project registry of Lokalise languages.
+
+Glossary translations are addressed by Lokalise language ID while files,
+keys and clients use ISO codes. The registry loads a project's languages
+once through the languages endpoint, caches them for
+``LANGUAGE_REGISTRY_TTL_SECONDS`` and resolves ISO codes with dictionary
+lookups, so whole batches are resolved without extra requests. Concurrent
+loads of the same project share one request, and key mirror syncs, which
+fetch the languages anyway, refresh the cache. Unknown codes reload a
+project's languages at most once per
+``LANGUAGE_REGISTRY_RELOAD_INTERVAL_SECONDS``.
+"""
+
+import asyncio
+import time
+from collections.abc import Iterable, Iterator, Mapping
+
+from fastapi import HTTPException
+
+from app.core.config import get_settings
+from app.schemas.lokalise.languages import BaseLanguage
+from app.services.lokalise.languages import lokalise_languages_service
+
+
+class ProjectLanguages(Mapping[str, BaseLanguage]):
+    """Languages of one project by ISO code."""
+
+    def __init__(self, languages: Iterable[BaseLanguage]):
+        self._by_iso = {lang.lang_iso: lang for lang in languages if lang.lang_iso}
+
+    def __getitem__(self, lang_iso: str) -> BaseLanguage:
+        return self._by_iso[lang_iso]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._by_iso)
+
+    def __len__(self) -> int:
+        return len(self._by_iso)
+
+    def lang_ids(self, lang_isos: Iterable[str]) -> dict[str, int]:
+        """IDs of the given languages (unknown codes are left out)."""
+        by_iso = self._by_iso
+        return {iso: by_iso[iso].lang_id for iso in lang_isos if iso in by_iso}
+
+    def unknown(self, lang_isos: Iterable[str]) -> list[str]:
+        """Codes that are not languages of the project, sorted."""
+        return sorted({iso for iso in lang_isos if iso not in self._by_iso})
+
+
+class LanguageRegistry:
+    """Caches the languages of each project."""
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        reload_interval: float = 0.0,
+        languages_service=lokalise_languages_service,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.reload_interval = reload_interval
+        self.languages_service = languages_service
+        # project_id -> (loaded at, languages)
+        self._entries: dict[str, tuple[float, ProjectLanguages]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def get(self, project_id: str) -> ProjectLanguages:
+        """
+        Languages of a project, loaded on first use and after expiry.
+
+        Raises:
+            HTTPException: If the languages cannot be fetched
+        """
+        entry = self._entries.get(project_id)
+        if entry and time.monotonic() - entry[0] < self.ttl_seconds:
+            return entry[1]
+
+        lock = self._locks.setdefault(project_id, asyncio.Lock())
+        async with lock:
+            # Another request may have loaded them while this one waited
+            entry = self._entries.get(project_id)
+            if entry and time.monotonic() - entry[0] < self.ttl_seconds:
+                return entry[1]
+            response = await self.languages_service.list_project_languages(project_id)
+            return self.prime(project_id, response.languages)
+
+    def prime(
+        self, project_id: str, languages: Iterable[BaseLanguage]
+    ) -> ProjectLanguages:
+        """Store languages fetched elsewhere (e.g. by a key mirror sync)."""
+        project_languages = ProjectLanguages(languages)
+        self._entries[project_id] = (time.monotonic(), project_languages)
+        return project_languages
+
+    def invalidate(self, project_id: str | None = None) -> None:
+        """Drop the cached languages of a project (or of every project)."""
+        if project_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(project_id, None)
+
+    async def unknown(self, project_id: str, lang_isos: Iterable[str]) -> list[str]:
+        """
+        Codes that are not languages of a project, sorted.
+
+        Codes unknown to the cached languages trigger one reload, in case
+        the languages were added to the project since, unless the cache was
+        loaded less than ``reload_interval`` seconds ago.
+
+        Raises:
+            HTTPException: If the languages cannot be fetched
+        """
+        lang_isos = set(lang_isos)
+        unknown = (await self.get(project_id)).unknown(lang_isos)
+        entry = self._entries.get(project_id)
+        if unknown and entry and time.monotonic() - entry[0] >= self.reload_interval:
+            self.invalidate(project_id)
+            unknown = (await self.get(project_id)).unknown(lang_isos)
+        return unknown
+
+    async def resolve(
+        self, project_id: str, lang_isos: Iterable[str]
+    ) -> dict[str, int]:
+        """
+        Resolve ISO codes to language IDs.
+
+        Raises:
+            HTTPException: 400 if some codes are not languages of the project
+        """
+        lang_isos = set(lang_isos)
+        unknown = await self.unknown(project_id, lang_isos)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Languages not in project {project_id}: {', '.join(unknown)}",
+            )
+        return (await self.get(project_id)).lang_ids(lang_isos)
+
+
+_settings = get_settings()
+language_registry = LanguageRegistry(
+    ttl_seconds=_settings.LANGUAGE_REGISTRY_TTL_SECONDS,
+    reload_interval=_settings.LANGUAGE_REGISTRY_RELOAD_INTERVAL_SECONDS,
+)
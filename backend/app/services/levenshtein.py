@@ -0,0 +1,292 @@
+"""
+Levenshtein edit distance at character and word level.
+
+Distances are exact (unit-cost insertions, deletions and substitutions) and
+work on any sequences of hashable items: strings compare characters, lists of
+words compare words.
+
+- Without a bound, the bit-parallel algorithm of Myers (in Hyyrö's
+  formulation) computes a whole DP column per step with integer operations.
+  Python integers are arbitrary-precision, so one "word" holds the whole
+  pattern; up to 64 items this is a single machine word.
+- With ``max_distance``, the computation stops as soon as the bound can no
+  longer be met. When the band of width ``2 * max_distance + 1`` is narrow
+  compared to a long pattern, only that diagonal band of the DP matrix is
+  computed instead; otherwise the bit-parallel algorithm, whose big-integer
+  steps run in C, is faster even though it covers the whole matrix.
+
+Common prefixes and suffixes are stripped first, which makes near-identical
+texts cheap regardless of their length.
+"""
+
+from collections.abc import Hashable, Iterable, Sequence
+
+# Pattern length up to which bounded distances always use the bit-parallel
+# algorithm
+MACHINE_WORD_BITS = 64
+# In CPython a bit-parallel step over a pattern of n items costs about as much
+# as n / 800 banded DP cells
+BANDED_CELLS_PER_PATTERN_ITEM = 1 / 800
+# Bits per packed vector when scoring one query against many candidates
+LANE_GROUP_BITS = 4096
+
+
+def _strip_affixes(
+    a: Sequence[Hashable], b: Sequence[Hashable]
+) -> tuple[Sequence[Hashable], Sequence[Hashable]]:
+    start = 0
+    end_a, end_b = len(a), len(b)
+    while start < end_a and start < end_b and a[start] == b[start]:
+        start += 1
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    return a[start:end_a], b[start:end_b]
+
+
+def _pattern_masks(pattern: Sequence[Hashable]) -> dict[Hashable, int]:
+    """Bit mask of the positions of each item in the pattern."""
+    masks: dict[Hashable, int] = {}
+    for position, item in enumerate(pattern):
+        masks[item] = masks.get(item, 0) | (1 << position)
+    return masks
+
+
+def _bit_parallel(
+    pattern: Sequence[Hashable],
+    text: Sequence[Hashable],
+    max_distance: int | None = None,
+    masks: dict[Hashable, int] | None = None,
+) -> int:
+    """Myers/Hyyrö bit-vector distance; ``pattern`` must not be empty."""
+    length = len(pattern)
+    if masks is None:
+        masks = _pattern_masks(pattern)
+    all_ones = (1 << length) - 1
+    last = 1 << (length - 1)
+    positive, negative = all_ones, 0
+    distance = length
+    remaining = len(text)
+
+    for item in text:
+        match = masks.get(item, 0)
+        vertical = match | negative
+        horizontal = (((match & positive) + positive) ^ positive) | match
+        plus = negative | ~(horizontal | positive)
+        minus = positive & horizontal
+        if plus & last:
+            distance += 1
+        elif minus & last:
+            distance -= 1
+        remaining -= 1
+        # Each remaining item lowers the final distance by at most one
+        if max_distance is not None and distance - remaining > max_distance:
+            return max_distance + 1
+        plus = (plus << 1) | 1
+        minus <<= 1
+        positive = (minus | ~(vertical | plus)) & all_ones
+        negative = plus & vertical & all_ones
+
+    return distance
+
+
+def _banded(a: Sequence[Hashable], b: Sequence[Hashable], max_distance: int) -> int:
+    """DP restricted to the diagonal band ``|i - j| <= max_distance``."""
+    beyond = max_distance + 1
+    # Each row holds columns first..first + len(row) - 1 of the DP matrix
+    previous_first = 0
+    previous = list(range(min(len(b), max_distance) + 1))
+
+    for i, item in enumerate(a, start=1):
+        first = max(0, i - max_distance)
+        last = min(len(b), i + max_distance)
+        previous_last = previous_first + len(previous) - 1
+        current: list[int] = []
+        for j in range(first, last + 1):
+            if j == 0:
+                current.append(i)
+                continue
+            cost = beyond
+            if previous_first <= j - 1 <= previous_last:
+                cost = previous[j - 1 - previous_first] + (item != b[j - 1])
+            if j <= previous_last:
+                cost = min(cost, previous[j - previous_first] + 1)
+            if j > first:
+                cost = min(cost, current[-1] + 1)
+            current.append(cost)
+        # Distances never decrease along a path, so the bound is already lost
+        if min(current) > max_distance:
+            return beyond
+        previous, previous_first = current, first
+
+    return min(previous[len(b) - previous_first], beyond)
+
+
+def levenshtein(
+    a: Sequence[Hashable],
+    b: Sequence[Hashable],
+    max_distance: int | None = None,
+) -> int:
+    """
+    Levenshtein distance between two sequences.
+
+    Args:
+        a: First sequence (string or list of tokens)
+        b: Second sequence
+        max_distance: Optional bound; larger distances are reported as
+            ``max_distance + 1`` without being computed in full
+
+    Returns:
+        Number of insertions, deletions and substitutions turning ``a`` into
+        ``b`` (capped at ``max_distance + 1`` when a bound is given)
+    """
+    if max_distance is not None and abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    a, b = _strip_affixes(a, b)
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return len(b)
+    if max_distance is not None and _prefer_banded(len(a), max_distance):
+        return _banded(a, b, max_distance)
+    return _bit_parallel(a, b, max_distance)
+
+
+def _prefer_banded(pattern_length: int, max_distance: int) -> bool:
+    return (
+        pattern_length > MACHINE_WORD_BITS
+        and 2 * max_distance + 1 < pattern_length * BANDED_CELLS_PER_PATTERN_ITEM
+    )
+
+
+def _bit_parallel_lanes(
+    text: Sequence[Hashable], patterns: list[Sequence[Hashable]]
+) -> list[int]:
+    """
+    Distances of ``text`` to several non-empty patterns in one pass.
+
+    The patterns are packed side by side into one bit vector, each lane
+    followed by a zero guard bit that absorbs the carry of the addition, so
+    every step advances all patterns at once. The distance of each lane is
+    read from its final vertical deltas: ``len(text) + #plus - #minus``.
+    """
+    masks: dict[Hashable, int] = {}
+    lanes: list[tuple[int, int]] = []
+    lane_starts = 0
+    all_ones = 0
+    offset = 0
+    for pattern in patterns:
+        for item, mask in _pattern_masks(pattern).items():
+            masks[item] = masks.get(item, 0) | (mask << offset)
+        lanes.append((offset, offset + len(pattern)))
+        lane_starts |= 1 << offset
+        all_ones |= ((1 << len(pattern)) - 1) << offset
+        offset += len(pattern) + 1
+
+    positive, negative = all_ones, 0
+    for item in text:
+        match = masks.get(item, 0)
+        vertical = match | negative
+        horizontal = ((((match & positive) + positive) ^ positive) | match) & all_ones
+        plus = (negative | ~(horizontal | positive)) & all_ones
+        minus = positive & horizontal
+        plus = (plus << 1) | lane_starts
+        minus <<= 1
+        positive = (minus | ~(vertical | plus)) & all_ones
+        negative = plus & vertical & all_ones
+
+    # Bit i of the vectors is character i of these strings
+    plus_bits = format(positive, "b").zfill(offset)[::-1]
+    minus_bits = format(negative, "b").zfill(offset)[::-1]
+    return [
+        len(text) + plus_bits.count("1", start, end) - minus_bits.count("1", start, end)
+        for start, end in lanes
+    ]
+
+
+def levenshtein_many(
+    query: Sequence[Hashable],
+    candidates: Sequence[Sequence[Hashable]],
+    max_distance: int | None = None,
+) -> list[int]:
+    """
+    Distances of one query to many candidates, computed lane-parallel.
+
+    Candidates are packed into bit vectors of about ``LANE_GROUP_BITS`` bits
+    and each group is scored in one pass over the query, which is what fuzzy
+    lookups of a text against stored segments need.
+
+    Args:
+        query: Sequence compared against every candidate
+        candidates: Sequences to compare the query with
+        max_distance: Optional bound, as for ``levenshtein``; candidates
+            whose length alone rules them out are not scored
+
+    Returns:
+        Distance of each candidate, in order
+    """
+    beyond = None if max_distance is None else max_distance + 1
+    distances: list[int] = [0] * len(candidates)
+    group: list[int] = []
+    group_bits = 0
+
+    def flush() -> None:
+        scores = _bit_parallel_lanes(query, [candidates[i] for i in group])
+        for index, score in zip(group, scores, strict=True):
+            distances[index] = score if beyond is None else min(score, beyond)
+        group.clear()
+
+    for index, candidate in enumerate(candidates):
+        if beyond is not None and abs(len(query) - len(candidate)) >= beyond:
+            distances[index] = beyond
+        elif not candidate:
+            distances[index] = len(query)
+        else:
+            if group and group_bits + len(candidate) > LANE_GROUP_BITS:
+                flush()
+                group_bits = 0
+            group.append(index)
+            group_bits += len(candidate) + 1
+    if group:
+        flush()
+    return distances
+
+
+def levenshtein_batch(
+    pairs: Iterable[tuple[str, str]],
+    max_distance: int | None = None,
+    words: bool = False,
+) -> list[int]:
+    """
+    Distances of many text pairs.
+
+    Pairs sharing their first text (one query against many candidates, or
+    many hypotheses of one reference) are scored lane-parallel with
+    ``levenshtein_many``; other pairs are scored one by one.
+
+    Args:
+        pairs: ``(a, b)`` pairs of texts
+        max_distance: Optional bound, as for ``levenshtein``
+        words: Compare words instead of characters
+
+    Returns:
+        Distance of each pair, in order
+    """
+    groups: dict[str, list[tuple[int, str]]] = {}
+    count = 0
+    for count, (a, b) in enumerate(pairs, start=1):
+        groups.setdefault(a, []).append((count - 1, b))
+
+    distances = [0] * count
+    for a, members in groups.items():
+        query: Sequence[Hashable] = a.split() if words else a
+        candidates: list[Sequence[Hashable]] = [
+            b.split() if words else b for _, b in members
+        ]
+        if len(members) == 1:
+            scores = [levenshtein(query, candidates[0], max_distance)]
+        else:
+            scores = levenshtein_many(query, candidates, max_distance)
+        for (index, _), score in zip(members, scores, strict=True):
+            distances[index] = score
+    return distances
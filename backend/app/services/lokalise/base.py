@@ -1,10 +1,38 @@
-from typing import Any
+import asyncio
+import time
+from collections.abc import AsyncIterable, Callable
+from typing import Any, TypeVar
 
 import httpx
+import pydantic_core
 from fastapi import HTTPException
+from pydantic import BaseModel
 
 from app.core.config import get_settings
-from app.core.logging import logger
+from app.core.logging import get_logger
+from app.core.metrics import lokalise_request_duration_seconds
+from app.core.serialization import validate_json
+from app.core.tracing import set_span_attributes, tracer
+
+from .rate_limiter import lokalise_rate_limiter
+from .retry import (
+    AmbiguousWriteError,
+    lokalise_retry_policy,
+    lokalise_retry_stats,
+    parse_retry_after,
+)
+
+logger = get_logger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _endpoint_label(endpoint: str) -> str:
+    """Endpoint path with IDs replaced, e.g. ``projects/{id}/keys/{id}``."""
+    return "/".join(
+        "{id}" if any(char.isdigit() for char in segment) else segment
+        for segment in endpoint.strip("/").split("/")
+    )
 
 
 class LokaliseBaseService:
@@ -22,6 +50,7 @@ class LokaliseBaseService:
             "content-type": "application/json",
             "X-Api-Token": self.api_token,
         }
+        self.retry_policy = lokalise_retry_policy
 
     async def _make_request(
         self,
@@ -31,35 +60,234 @@ class LokaliseBaseService:
         json_data: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Make HTTP request to Lokalise API."""
+        data, _ = await self._make_request_with_headers(
+            method, endpoint, params=params, json_data=json_data
+        )
+        return data
+
+    async def _make_request_with_headers(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        content: Callable[[], AsyncIterable[bytes]] | None = None,
+        content_length: int | None = None,
+    ) -> tuple[dict[str, Any], httpx.Headers]:
+        """
+        Make HTTP request to Lokalise API and keep the response headers.
+
+        Lokalise returns pagination state (e.g. ``X-Pagination-Next-Cursor``)
+        in headers, which callers walking large collections need. Requests are
+        paced by the shared ``lokalise_rate_limiter``.
+
+        Large JSON bodies can be streamed via ``content``, a function
+        returning pre-encoded JSON chunks, instead of ``json_data``. It is
+        called once per attempt, so a retried request sends the body again
+        from the start. Pass ``content_length`` so the body
+        is not sent with chunked transfer encoding.
+        """
+        response = await self._send(
+            method,
+            endpoint,
+            params=params,
+            json_data=json_data,
+            content=content,
+            content_length=content_length,
+        )
+        return pydantic_core.from_json(response.content), response.headers
+
+    async def _make_request_model(
+        self,
+        method: str,
+        endpoint: str,
+        model: type[ModelT],
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> tuple[ModelT, httpx.Headers]:
+        """
+        Make HTTP request to Lokalise API and validate the response as ``model``.
+
+        The raw response bytes are parsed and validated in a single
+        pydantic-core pass, without building an intermediate dict first.
+        Callers should hand the result to ``ModelResponse`` rather than let
+        FastAPI validate it again.
+        """
+        response = await self._send(
+            method, endpoint, params=params, json_data=json_data
+        )
+        return validate_json(model, response.content), response.headers
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        content: Callable[[], AsyncIterable[bytes]] | None = None,
+        content_length: int | None = None,
+    ) -> httpx.Response:
+        """
+        Send a request through the rate limiter, retrying transient failures.
+
+        Retries follow ``self.retry_policy`` (see ``app.services.lokalise.retry``).
+        A write that fails in a way that may have applied it raises
+        ``AmbiguousWriteError`` instead of being resent. Streamed bodies are
+        rebuilt from the ``content`` factory for every attempt.
+
+        Raises:
+            HTTPException: If the API call fails
+            httpx.TransportError: If Lokalise could not be reached
+        """
+        method = method.upper()
+        with tracer.span(
+            "lokalise.request", method=method, endpoint=_endpoint_label(endpoint)
+        ) as span:
+            response = await self._send_with_retries(
+                method,
+                endpoint,
+                params=params,
+                json_data=json_data,
+                content=content,
+                content_length=content_length,
+            )
+            span.set_attributes(status_code=response.status_code)
+            return response
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+        content: Callable[[], AsyncIterable[bytes]] | None,
+        content_length: int | None,
+    ) -> httpx.Response:
+        policy = self.retry_policy
+        max_attempts = policy.max_attempts
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        headers = self.headers
+        if content_length is not None:
+            headers = {**headers, "content-length": str(content_length)}
+
+        endpoint_label = _endpoint_label(endpoint)
+        attempt = 1
+        delay = policy.base_delay
+        while True:
+            retry_after = None
+            set_span_attributes(attempts=attempt)
+            started = time.perf_counter()
+            try:
+                response = await self._send_once(
+                    method,
+                    url,
+                    headers,
+                    params,
+                    json_data,
+                    content() if content is not None else None,
+                )
+            except httpx.TransportError as e:
+                reason = type(e).__name__
+                lokalise_request_duration_seconds.observe(
+                    time.perf_counter() - started,
+                    method=method,
+                    endpoint=endpoint_label,
+                    status=reason,
+                )
+                if attempt == max_attempts or not policy.is_retryable_error(method, e):
+                    self._give_up(method, endpoint, reason, attempt)
+                    if policy.is_ambiguous(method, error=e):
+                        raise self._ambiguous_write(method, endpoint, reason) from e
+                    raise
+            else:
+                lokalise_request_duration_seconds.observe(
+                    time.perf_counter() - started,
+                    method=method,
+                    endpoint=endpoint_label,
+                    status=str(response.status_code),
+                )
+                if response.is_success:
+                    return response
+
+                status_code = response.status_code
+                reason = str(status_code)
+                retryable = policy.is_retryable_status(method, status_code)
+                if retryable:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    retryable = (
+                        retry_after is None or retry_after <= policy.max_retry_after
+                    )
+                if attempt == max_attempts or not retryable:
+                    self._give_up(method, endpoint, reason, attempt)
+                    if policy.is_ambiguous(method, status_code=status_code):
+                        await self._log_error(response, endpoint)
+                        raise self._ambiguous_write(method, endpoint, reason)
+                    await self._handle_http_error(response, endpoint)
+
+            delay = policy.next_delay(delay, retry_after)
+            if retry_after is not None:
+                # Throttling applies to the whole token, not just this request
+                lokalise_rate_limiter.defer(delay)
+            lokalise_retry_stats.record_retry(method, reason)
+            logger.warning(
+                "Lokalise %s %s failed (%s), retrying in %.2fs (attempt %s/%s)",
+                method,
+                endpoint,
+                reason,
+                delay,
+                attempt + 1,
+                max_attempts,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
 
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
+    async def _send_once(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+        content: AsyncIterable[bytes] | None,
+    ) -> httpx.Response:
+        async with lokalise_rate_limiter.acquire(), httpx.AsyncClient() as client:
+            return await client.request(
                 method=method,
                 url=url,
-                headers=self.headers,
+                headers=headers,
                 params=params,
                 json=json_data,
+                content=content,
                 timeout=30.0,
             )
 
-            await self._handle_http_error(response, endpoint)
-            return response.json()
+    def _give_up(self, method: str, endpoint: str, reason: str, attempt: int) -> None:
+        if attempt > 1:
+            lokalise_retry_stats.record_exhausted(method, reason)
+            logger.error(
+                "Lokalise %s %s still failing (%s) after %s attempts",
+                method,
+                endpoint,
+                reason,
+                attempt,
+            )
+
+    def _ambiguous_write(
+        self, method: str, endpoint: str, reason: str
+    ) -> AmbiguousWriteError:
+        lokalise_retry_stats.record_ambiguous_write()
+        return AmbiguousWriteError(
+            f"Lokalise {method} {endpoint} failed ({reason}) and may have been "
+            "applied; check for already written items before retrying"
+        )
 
     async def _handle_http_error(self, response: httpx.Response, endpoint: str) -> None:
         """Handle HTTP errors and convert to appropriate FastAPI exceptions."""
         if response.is_success:
             return
 
-        try:
-            error_data = response.json()
-            error_message = error_data.get("error", {}).get(
-                "message", str(response.text)
-            )
-        except Exception:
-            error_message = f"HTTP {response.status_code}: {response.text}"
-
-        logger.error(f"Lokalise API error for {endpoint}: {error_message}")
+        error_message = await self._log_error(response, endpoint)
 
         if response.status_code == 401:
             raise HTTPException(status_code=401, detail="Invalid Lokalise API token")
@@ -79,3 +307,16 @@ class LokaliseBaseService:
             raise HTTPException(
                 status_code=500, detail=f"Lokalise API error: {error_message}"
             )
+
+    async def _log_error(self, response: httpx.Response, endpoint: str) -> str:
+        """Extract and log the error message of a failed response."""
+        try:
+            error_data = response.json()
+            error_message = error_data.get("error", {}).get(
+                "message", str(response.text)
+            )
+        except Exception:
+            error_message = f"HTTP {response.status_code}: {response.text}"
+
+        logger.error("Lokalise API error for %s: %s", endpoint, error_message)
+        return error_message
@@ -0,0 +1,181 @@
+"""
+Lokalise files service for importing and exporting project files via direct
+API calls.
+"""
+
+import asyncio
+import base64
+import json
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from app.core.logging import get_logger
+from app.schemas.lokalise.files import (
+    FileDownloadRequest,
+    FileDownloadResponse,
+    FileSyncDownloadResponse,
+    FileUploadOptions,
+    FileUploadRequest,
+    FileUploadResponse,
+)
+
+from .base import LokaliseBaseService
+
+logger = get_logger(__name__)
+
+# Raw bytes encoded per step when streaming a file as base64; a multiple of 3
+# so the encoded pieces concatenate without padding in between
+BASE64_CHUNK_SIZE = 3 * 256 * 1024
+
+
+def _read_base64_chunk(handle: BinaryIO) -> bytes:
+    return base64.b64encode(handle.read(BASE64_CHUNK_SIZE))
+
+
+async def iter_base64_file(path: Path) -> AsyncIterator[bytes]:
+    """Yield the base64 encoding of a file chunk by chunk.
+
+    Reading and encoding happen in a worker thread, so only one chunk is in
+    memory at a time and the event loop stays free.
+    """
+    handle = await asyncio.to_thread(open, path, "rb")
+    try:
+        while chunk := await asyncio.to_thread(_read_base64_chunk, handle):
+            yield chunk
+    finally:
+        await asyncio.to_thread(handle.close)
+
+
+class LokaliseFilesService(LokaliseBaseService):
+    """Service for managing Lokalise project files via direct API calls."""
+
+    @staticmethod
+    def _download_payload(request: FileDownloadRequest) -> dict[str, Any]:
+        return request.model_dump(exclude_none=True)
+
+    async def start_async_download(
+        self, project_id: str, request: FileDownloadRequest
+    ) -> FileDownloadResponse:
+        """
+        Start an asynchronous project export.
+
+        Args:
+            project_id: ID of the project
+            request: Export options (all Lokalise download options are passed on)
+
+        Returns:
+            FileDownloadResponse with the queued process ID to poll
+
+        Raises:
+            HTTPException: If the API call fails
+        """
+        logger.info(
+            "Starting async export of project %s as %s", project_id, request.format
+        )
+        data = await self._make_request(
+            "POST",
+            f"/projects/{project_id}/files/async-download",
+            json_data=self._download_payload(request),
+        )
+        return FileDownloadResponse.model_validate(data)
+
+    async def download(
+        self, project_id: str, request: FileDownloadRequest
+    ) -> FileSyncDownloadResponse:
+        """
+        Export project files synchronously and return the bundle URL.
+
+        Raises:
+            HTTPException: If the API call fails
+        """
+        logger.info("Exporting project %s as %s", project_id, request.format)
+        data = await self._make_request(
+            "POST",
+            f"/projects/{project_id}/files/download",
+            json_data=self._download_payload(request),
+        )
+        return FileSyncDownloadResponse.model_validate(data)
+
+    async def upload_file(
+        self, project_id: str, request: FileUploadRequest
+    ) -> FileUploadResponse:
+        """
+        Queue an already base64-encoded file for import.
+
+        Raises:
+            HTTPException: If the API call fails
+        """
+        logger.info(
+            "Uploading %s (%s) to project %s",
+            request.filename,
+            request.lang_iso,
+            project_id,
+        )
+        data = await self._make_request(
+            "POST",
+            f"/projects/{project_id}/files/upload",
+            json_data=request.model_dump(exclude_none=True),
+        )
+        return FileUploadResponse.model_validate(data)
+
+    async def upload_file_from_path(
+        self,
+        project_id: str,
+        path: Path,
+        filename: str,
+        lang_iso: str,
+        options: FileUploadOptions | None = None,
+    ) -> FileUploadResponse:
+        """
+        Queue a file on disk for import without loading it into memory.
+
+        The JSON request body is streamed: the base64 ``data`` field is
+        produced chunk by chunk from the file while the request is being sent.
+        A throttled attempt re-reads the file, so the upload can be retried.
+
+        Args:
+            project_id: ID of the project
+            path: Local file to upload
+            filename: Filename to store in Lokalise
+            lang_iso: Language code of the translations in the file
+            options: Additional import options
+
+        Returns:
+            FileUploadResponse with the queued import process
+
+        Raises:
+            HTTPException: If the API call fails
+        """
+        payload = options.model_dump(exclude_none=True) if options else {}
+        payload.update({"filename": filename, "lang_iso": lang_iso})
+        prefix = json.dumps(payload)[:-1].encode() + b', "data": "'
+        suffix = b'"}'
+
+        size = path.stat().st_size
+        encoded_size = 4 * ((size + 2) // 3)
+
+        async def body() -> AsyncIterator[bytes]:
+            yield prefix
+            async for chunk in iter_base64_file(path):
+                yield chunk
+            yield suffix
+
+        logger.info(
+            "Uploading %s (%s, %s bytes) to project %s",
+            filename,
+            lang_iso,
+            size,
+            project_id,
+        )
+        data, _ = await self._make_request_with_headers(
+            "POST",
+            f"/projects/{project_id}/files/upload",
+            content=body,
+            content_length=len(prefix) + encoded_size + len(suffix),
+        )
+        return FileUploadResponse.model_validate(data)
+
+
+# Create singleton instance
+lokalise_files_service = LokaliseFilesService()
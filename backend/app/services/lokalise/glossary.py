@@ -1,12 +1,25 @@
 """
 Lokalise glossary service for managing glossary terms.
+
+The glossary endpoints use camelCase field names (``caseSensitive``,
+``langIso``, ...), unlike the rest of the Lokalise API; responses are mapped
+onto the snake_case schemas here.
+
+Translations of terms to create or update may give a language ISO code
+instead of a Lokalise language ID; the code is resolved through the
+project's language registry.
+
+Every write, including failed ones that may have been applied, invalidates
+the project's cached translation evaluations.
 """
 
+from collections.abc import Sequence
 from typing import Any
 
-from app.core.logging import logger
+from app.core.logging import get_logger
 from app.schemas.lokalise.glossary import (
     GlossaryTerm,
+    GlossaryTermCreate,
     GlossaryTermFilters,
     GlossaryTermMeta,
     GlossaryTermsCreate,
@@ -22,10 +35,70 @@ from app.schemas.lokalise.glossary import (
     GlossaryTermsUpdateMeta,
     GlossaryTermsUpdateResponse,
     GlossaryTermTranslation,
+    GlossaryTermUpdate,
 )
+from app.services.evaluation_cache import evaluation_cache
+from app.services.language_registry import language_registry
 
 from .base import LokaliseBaseService
 
+logger = get_logger(__name__)
+
+# Largest page Lokalise serves for glossary terms
+GLOSSARY_PAGE_LIMIT = 500
+
+
+def _parse_term(item: dict[str, Any], project_id: str) -> GlossaryTerm:
+    """Convert a Lokalise glossary term object to our schema."""
+    translations = [
+        GlossaryTermTranslation(
+            lang_id=trans.get("langId", 0),
+            lang_name=trans.get("langName", "") or "",
+            lang_iso=trans.get("langIso", "") or "",
+            translation=trans.get("translation", "") or "",
+            description=trans.get("description", "") or "",
+        )
+        for trans in item.get("translations") or []
+    ]
+    return GlossaryTerm(
+        id=item.get("id", 0),
+        term=item.get("term", ""),
+        description=item.get("description", "") or "",
+        case_sensitive=item.get("caseSensitive", False),
+        translatable=item.get("translatable", True),
+        forbidden=item.get("forbidden", False),
+        translations=translations,
+        tags=list(item.get("tags") or []),
+        project_id=str(item.get("projectId") or project_id),
+        created_at=item.get("createdAt"),
+        updated_at=item.get("updatedAt"),
+    )
+
+
+def _meta_errors(meta: dict[str, Any]) -> dict[str, Any]:
+    errors = meta.get("errors") or {}
+    return errors if isinstance(errors, dict) else {"items": errors}
+
+
+async def _resolve_lang_ids(
+    project_id: str, terms: Sequence[GlossaryTermCreate | GlossaryTermUpdate]
+) -> dict[str, int]:
+    """
+    Language IDs of the translations that only give an ISO code.
+
+    Raises:
+        HTTPException: 400 if a code is not a language of the project
+    """
+    lang_isos = {
+        trans.lang_iso
+        for term in terms
+        for trans in term.translations or ()
+        if not trans.lang_id
+    }
+    if not lang_isos:
+        return {}
+    return await language_registry.resolve(project_id, lang_isos)
+
 
 class LokaliseGlossaryService(LokaliseBaseService):
     """Service for managing Lokalise glossary terms."""
@@ -34,7 +107,7 @@ class LokaliseGlossaryService(LokaliseBaseService):
         self, project_id: str, limit: int | None = None, cursor: int | None = None
     ) -> GlossaryTermsResponse:
         """
-        Fetch all glossary terms for a project.
+        Fetch a page of glossary terms for a project.
 
         Args:
             project_id: ID of the project
@@ -47,65 +120,55 @@ class LokaliseGlossaryService(LokaliseBaseService):
         Raises:
             HTTPException: If the API call fails
         """
-        try:
-            # Use proper schema for parameters
-            filters = GlossaryTermFilters(limit=limit, cursor=cursor)
-            params = filters.model_dump(exclude_none=True)
+        # Use proper schema for parameters
+        filters = GlossaryTermFilters(limit=limit, cursor=cursor)
+        params = filters.model_dump(exclude_none=True)
 
-            logger.info(
-                f"Fetching glossary terms for project {project_id} with params: {params}"
-            )
+        logger.info(
+            "Fetching glossary terms for project %s with params: %s", project_id, params
+        )
 
-            response = self.client.glossary_terms(project_id, params)
-
-            # Convert Lokalise response to our schema
-            terms = []
-            for item in response.items:
-                # Create proper GlossaryTermTranslation objects
-                translations = []
-                for trans in getattr(item, "translations", []) or []:
-                    translation = GlossaryTermTranslation(
-                        lang_id=getattr(trans, "lang_id", 0),
-                        lang_name=getattr(trans, "lang_name", ""),
-                        lang_iso=getattr(trans, "lang_iso", ""),
-                        translation=getattr(trans, "translation", ""),
-                        description=getattr(trans, "description", "") or "",
-                    )
-                    translations.append(translation)
-
-                term = GlossaryTerm(
-                    id=getattr(item, "id", 0),
-                    term=getattr(item, "term", ""),
-                    description=getattr(item, "description", "") or "",
-                    case_sensitive=getattr(item, "case_sensitive", False),
-                    translatable=getattr(item, "translatable", True),
-                    forbidden=getattr(item, "forbidden", False),
-                    translations=translations,
-                    tags=list(getattr(item, "tags", [])),
-                    project_id=project_id,
-                    created_at=getattr(item, "created_at", None),
-                    updated_at=getattr(item, "updated_at", None),
-                )
-                terms.append(term)
-
-            # Build metadata using proper schema
-            meta = GlossaryTermMeta(
-                count=getattr(response, "count", len(terms)),
-                limit=limit,
-                cursor=cursor,
-                has_more=getattr(response, "has_more", False),
-                next_cursor=getattr(response, "next_cursor", None),
-            )
+        data = await self._make_request(
+            "GET", f"/projects/{project_id}/glossary-terms", params=params
+        )
 
-            logger.info(f"Retrieved {len(terms)} glossary terms from Lokalise")
+        terms = [_parse_term(item, project_id) for item in data.get("data", [])]
+        raw_meta = data.get("meta") or {}
+        meta = GlossaryTermMeta(
+            count=raw_meta.get("count", len(terms)),
+            limit=raw_meta.get("limit", limit),
+            cursor=raw_meta.get("cursor", cursor),
+            has_more=raw_meta.get("hasMore", False),
+            next_cursor=raw_meta.get("nextCursor"),
+        )
 
-            return GlossaryTermsResponse(data=terms, meta=meta)
+        logger.info("Retrieved %s glossary terms from Lokalise", len(terms))
 
-        except Exception as e:
-            self._handle_api_error(e, "get_glossary_terms", project_id)
-            # This line will never be reached due to _handle_api_error raising HTTPException
-            # But we need it to satisfy the type checker
-            raise  # pragma: no cover
+        return GlossaryTermsResponse(data=terms, meta=meta)
+
+    async def get_all_glossary_terms(self, project_id: str) -> list[GlossaryTerm]:
+        """
+        Fetch every glossary term of a project, following the cursor.
+
+        Args:
+            project_id: ID of the project
+
+        Returns:
+            List of all glossary terms
+
+        Raises:
+            HTTPException: If the API call fails
+        """
+        terms: list[GlossaryTerm] = []
+        cursor: int | None = None
+        while True:
+            page = await self.get_glossary_terms(
+                project_id, limit=GLOSSARY_PAGE_LIMIT, cursor=cursor
+            )
+            terms.extend(page.data)
+            cursor = page.meta.next_cursor
+            if not page.meta.has_more or cursor is None or not page.data:
+                return terms
 
     async def get_glossary_term(self, project_id: str, term_id: int) -> GlossaryTerm:
         """
@@ -121,45 +184,15 @@ class LokaliseGlossaryService(LokaliseBaseService):
         Raises:
             HTTPException: If the API call fails
         """
-        try:
-            logger.info(f"Fetching glossary term {term_id} for project {project_id}")
-
-            item = self.client.glossary_term(project_id, term_id)
-
-            # Create proper GlossaryTermTranslation objects
-            translations = []
-            for trans in getattr(item, "translations", []) or []:
-                translation = GlossaryTermTranslation(
-                    lang_id=getattr(trans, "lang_id", 0),
-                    lang_name=getattr(trans, "lang_name", ""),
-                    lang_iso=getattr(trans, "lang_iso", ""),
-                    translation=getattr(trans, "translation", ""),
-                    description=getattr(trans, "description", "") or "",
-                )
-                translations.append(translation)
-
-            term = GlossaryTerm(
-                id=getattr(item, "id", 0),
-                term=getattr(item, "term", ""),
-                description=getattr(item, "description", "") or "",
-                case_sensitive=getattr(item, "case_sensitive", False),
-                translatable=getattr(item, "translatable", True),
-                forbidden=getattr(item, "forbidden", False),
-                translations=translations,
-                tags=list(getattr(item, "tags", [])),
-                project_id=project_id,
-                created_at=getattr(item, "created_at", None),
-                updated_at=getattr(item, "updated_at", None),
-            )
+        logger.info("Fetching glossary term %s for project %s", term_id, project_id)
 
-            logger.info(f"Retrieved glossary term: {term.term}")
-            return term
+        data = await self._make_request(
+            "GET", f"/projects/{project_id}/glossary-terms/{term_id}"
+        )
+        term = _parse_term(data.get("data", {}), project_id)
 
-        except Exception as e:
-            self._handle_api_error(e, "get_glossary_term", f"{project_id}/{term_id}")
-            # This line will never be reached due to _handle_api_error raising HTTPException
-            # But we need it to satisfy the type checker
-            raise  # pragma: no cover
+        logger.info("Retrieved glossary term: %s", term.term)
+        return term
 
     async def create_glossary_terms(
         self, project_id: str, request: GlossaryTermsCreate
@@ -167,6 +200,10 @@ class LokaliseGlossaryService(LokaliseBaseService):
         """
         Create one or more glossary terms.
 
+        Creation is not idempotent: if the request fails in a way that may
+        have applied it, ``AmbiguousWriteError`` is raised rather than the
+        request being retried (see ``app.services.lokalise.retry``).
+
         Args:
             project_id: ID of the project
             request: GlossaryTermsCreate with terms to create
@@ -177,85 +214,59 @@ class LokaliseGlossaryService(LokaliseBaseService):
         Raises:
             HTTPException: If the API call fails
         """
-        try:
-            logger.info(
-                f"Creating {len(request.terms)} glossary terms for project {project_id}"
-            )
+        logger.info(
+            "Creating %s glossary terms for project %s", len(request.terms), project_id
+        )
+
+        # Translations given by ISO code only are resolved to language IDs
+        lang_ids = await _resolve_lang_ids(project_id, request.terms)
+
+        # Convert our schema to Lokalise API format
+        terms_data = []
+        for term in request.terms:
+            term_data: dict[str, Any] = {
+                "term": term.term,
+                "description": term.description,
+                "caseSensitive": term.case_sensitive,
+                "forbidden": term.forbidden,
+                "translatable": term.translatable,
+                "tags": term.tags,
+            }
+
+            # Add translations if present
+            if term.translations:
+                term_data["translations"] = [
+                    {
+                        "langId": trans.lang_id or lang_ids[trans.lang_iso],
+                        "translation": trans.translation,
+                        "description": trans.description or "",
+                    }
+                    for trans in term.translations
+                ]
+
+            terms_data.append(term_data)
 
-            # Convert our schema to Lokalise API format
-            terms_data = []
-            for term in request.terms:
-                term_data: dict[str, Any] = {
-                    "term": term.term,
-                    "description": term.description,
-                    "caseSensitive": term.case_sensitive,
-                    "forbidden": term.forbidden,
-                    "translatable": term.translatable,
-                    "tags": term.tags,
-                }
-
-                # Add translations if present
-                if term.translations:
-                    term_data["translations"] = [
-                        {
-                            "langId": trans.lang_id,
-                            "translation": trans.translation,
-                            "description": trans.description or "",
-                        }
-                        for trans in term.translations
-                    ]
-
-                terms_data.append(term_data)
-
-            response = self.client.create_glossary_terms(project_id, terms_data)
-
-            # Convert response to our schema
-            created_terms = []
-            for item in getattr(response, "items", []):
-                # Create proper GlossaryTermTranslation objects
-                translations = []
-                for trans in getattr(item, "translations", []) or []:
-                    translation = GlossaryTermTranslation(
-                        lang_id=getattr(trans, "lang_id", 0),
-                        lang_name=getattr(trans, "lang_name", ""),
-                        lang_iso=getattr(trans, "lang_iso", ""),
-                        translation=getattr(trans, "translation", ""),
-                        description=getattr(trans, "description", "") or "",
-                    )
-                    translations.append(translation)
-
-                term = GlossaryTerm(
-                    id=getattr(item, "id", 0),
-                    term=getattr(item, "term", ""),
-                    description=getattr(item, "description", "") or "",
-                    case_sensitive=getattr(item, "case_sensitive", False),
-                    translatable=getattr(item, "translatable", True),
-                    forbidden=getattr(item, "forbidden", False),
-                    translations=translations,
-                    tags=list(getattr(item, "tags", [])),
-                    project_id=project_id,
-                    created_at=getattr(item, "created_at", None),
-                    updated_at=getattr(item, "updated_at", None),
-                )
-                created_terms.append(term)
-
-            # Build metadata using proper schema
-            meta = GlossaryTermsCreateMeta(
-                count=len(created_terms),
-                created=len(created_terms),
-                limit=None,
-                errors={},
+        try:
+            data = await self._make_request(
+                "POST",
+                f"/projects/{project_id}/glossary-terms",
+                json_data={"terms": terms_data},
             )
+        finally:
+            await evaluation_cache.invalidate_glossary(project_id)
 
-            logger.info(f"Successfully created {len(created_terms)} glossary terms")
+        created_terms = [_parse_term(item, project_id) for item in data.get("data", [])]
+        raw_meta = data.get("meta") or {}
+        meta = GlossaryTermsCreateMeta(
+            count=raw_meta.get("count", len(created_terms)),
+            created=raw_meta.get("created", len(created_terms)),
+            limit=raw_meta.get("limit"),
+            errors=_meta_errors(raw_meta),
+        )
 
-            return GlossaryTermsCreateResponse(data=created_terms, meta=meta)
+        logger.info("Successfully created %s glossary terms", len(created_terms))
 
-        except Exception as e:
-            self._handle_api_error(e, "create_glossary_terms", project_id)
-            # This line will never be reached due to _handle_api_error raising HTTPException
-            # But we need it to satisfy the type checker
-            raise  # pragma: no cover
+        return GlossaryTermsCreateResponse(data=created_terms, meta=meta)
 
     async def update_glossary_terms(
         self, project_id: str, request: GlossaryTermsUpdate
@@ -273,93 +284,65 @@ class LokaliseGlossaryService(LokaliseBaseService):
         Raises:
             HTTPException: If the API call fails
         """
-        try:
-            logger.info(
-                f"Updating {len(request.terms)} glossary terms for project {project_id}"
-            )
-
-            # Convert our schema to Lokalise API format
-            terms_data = []
-            for term in request.terms:
-                term_data: dict[str, Any] = {"id": term.id}
-
-                if term.term is not None:
-                    term_data["term"] = term.term
-                if term.description is not None:
-                    term_data["description"] = term.description
-                if term.case_sensitive is not None:
-                    term_data["caseSensitive"] = term.case_sensitive
-                if term.translatable is not None:
-                    term_data["translatable"] = term.translatable
-                if term.forbidden is not None:
-                    term_data["forbidden"] = term.forbidden
-                if term.tags is not None:
-                    term_data["tags"] = term.tags
-
-                # Add translations if present
-                if term.translations:
-                    term_data["translations"] = [
-                        {
-                            "langId": trans.lang_id,
-                            "translation": trans.translation,
-                            "description": trans.description or "",
-                        }
-                        for trans in term.translations
-                    ]
-
-                terms_data.append(term_data)
-
-            response = self.client.update_glossary_terms(
-                project_id, {"terms": terms_data}
-            )
+        logger.info(
+            "Updating %s glossary terms for project %s", len(request.terms), project_id
+        )
+
+        # Translations given by ISO code only are resolved to language IDs
+        lang_ids = await _resolve_lang_ids(project_id, request.terms)
+
+        # Convert our schema to Lokalise API format
+        terms_data = []
+        for term in request.terms:
+            term_data: dict[str, Any] = {"id": term.id}
+
+            if term.term is not None:
+                term_data["term"] = term.term
+            if term.description is not None:
+                term_data["description"] = term.description
+            if term.case_sensitive is not None:
+                term_data["caseSensitive"] = term.case_sensitive
+            if term.translatable is not None:
+                term_data["translatable"] = term.translatable
+            if term.forbidden is not None:
+                term_data["forbidden"] = term.forbidden
+            if term.tags is not None:
+                term_data["tags"] = term.tags
+
+            # Add translations if present
+            if term.translations:
+                term_data["translations"] = [
+                    {
+                        "langId": trans.lang_id or lang_ids[trans.lang_iso],
+                        "translation": trans.translation,
+                        "description": trans.description or "",
+                    }
+                    for trans in term.translations
+                ]
+
+            terms_data.append(term_data)
 
-            # Convert response to our schema
-            updated_terms = []
-            for item in getattr(response, "items", []):
-                # Create proper GlossaryTermTranslation objects
-                translations = []
-                for trans in getattr(item, "translations", []) or []:
-                    translation = GlossaryTermTranslation(
-                        lang_id=getattr(trans, "lang_id", 0),
-                        lang_name=getattr(trans, "lang_name", ""),
-                        lang_iso=getattr(trans, "lang_iso", ""),
-                        translation=getattr(trans, "translation", ""),
-                        description=getattr(trans, "description", "") or "",
-                    )
-                    translations.append(translation)
-
-                term = GlossaryTerm(
-                    id=getattr(item, "id", 0),
-                    term=getattr(item, "term", ""),
-                    description=getattr(item, "description", "") or "",
-                    case_sensitive=getattr(item, "case_sensitive", False),
-                    translatable=getattr(item, "translatable", True),
-                    forbidden=getattr(item, "forbidden", False),
-                    translations=translations,
-                    tags=list(getattr(item, "tags", [])),
-                    project_id=project_id,
-                    created_at=getattr(item, "created_at", None),
-                    updated_at=getattr(item, "updated_at", None),
-                )
-                updated_terms.append(term)
-
-            # Build metadata using proper schema
-            meta = GlossaryTermsUpdateMeta(
-                count=len(updated_terms),
-                updated=len(updated_terms),
-                limit=None,
-                errors={},
+        try:
+            data = await self._make_request(
+                "PUT",
+                f"/projects/{project_id}/glossary-terms",
+                json_data={"terms": terms_data},
             )
+        finally:
+            await evaluation_cache.invalidate_glossary(project_id)
 
-            logger.info(f"Successfully updated {len(updated_terms)} glossary terms")
+        updated_terms = [_parse_term(item, project_id) for item in data.get("data", [])]
+        raw_meta = data.get("meta") or {}
+        meta = GlossaryTermsUpdateMeta(
+            count=raw_meta.get("count", len(updated_terms)),
+            updated=raw_meta.get("updated", len(updated_terms)),
+            limit=raw_meta.get("limit"),
+            errors=_meta_errors(raw_meta),
+        )
 
-            return GlossaryTermsUpdateResponse(data=updated_terms, meta=meta)
+        logger.info("Successfully updated %s glossary terms", len(updated_terms))
 
-        except Exception as e:
-            self._handle_api_error(e, "update_glossary_terms", project_id)
-            # This line will never be reached due to _handle_api_error raising HTTPException
-            # But we need it to satisfy the type checker
-            raise  # pragma: no cover
+        return GlossaryTermsUpdateResponse(data=updated_terms, meta=meta)
 
     async def delete_glossary_terms(
         self, project_id: str, request: GlossaryTermsDelete
@@ -377,42 +360,40 @@ class LokaliseGlossaryService(LokaliseBaseService):
         Raises:
             HTTPException: If the API call fails
         """
+        logger.info(
+            "Deleting %s glossary terms from project %s", len(request.terms), project_id
+        )
+
         try:
-            logger.info(
-                f"Deleting {len(request.terms)} glossary terms from project {project_id}"
+            response = await self._make_request(
+                "DELETE",
+                f"/projects/{project_id}/glossary-terms",
+                json_data={"terms": list(request.terms)},
             )
-
-            # Convert to proper type for API
-            term_ids: list[str | int] = list(request.terms)
-            response = self.client.delete_glossary_terms(project_id, term_ids)
-
-            # Extract deletion info from response
-            deleted_info = response.get("data", {}).get("deleted", {})
-            failed_info = response.get("data", {}).get("failed", {})
-
-            logger.info(f"Successfully deleted {deleted_info.get('count', 0)} terms")
-            if failed_info.get("count", 0) > 0:
-                logger.warning(f"Failed to delete {failed_info.get('count', 0)} terms")
-
-            return GlossaryTermsDeleteResponse(
-                data=GlossaryTermsDeleteData(
-                    deleted=GlossaryTermsDeletedInfo(
-                        count=deleted_info.get("count", 0),
-                        ids=deleted_info.get("ids", []),
-                    ),
-                    failed=GlossaryTermsDeleteFailedInfo(
-                        count=failed_info.get("count", 0),
-                        ids=failed_info.get("ids", []),
-                        message=failed_info.get("message", ""),
-                    ),
-                )
+        finally:
+            await evaluation_cache.invalidate_glossary(project_id)
+
+        # Extract deletion info from response
+        deleted_info = response.get("data", {}).get("deleted", {})
+        failed_info = response.get("data", {}).get("failed", {})
+
+        logger.info("Successfully deleted %s terms", deleted_info.get("count", 0))
+        if failed_info.get("count", 0) > 0:
+            logger.warning("Failed to delete %s terms", failed_info.get("count", 0))
+
+        return GlossaryTermsDeleteResponse(
+            data=GlossaryTermsDeleteData(
+                deleted=GlossaryTermsDeletedInfo(
+                    count=deleted_info.get("count", 0),
+                    ids=deleted_info.get("ids", []),
+                ),
+                failed=GlossaryTermsDeleteFailedInfo(
+                    count=failed_info.get("count", 0),
+                    ids=failed_info.get("ids", []),
+                    message=failed_info.get("message", ""),
+                ),
             )
-
-        except Exception as e:
-            self._handle_api_error(e, "delete_glossary_terms", project_id)
-            # This line will never be reached due to _handle_api_error raising HTTPException
-            # But we need it to satisfy the type checker
-            raise  # pragma: no cover
+        )
 
 
 # Create singleton instance
@@ -0,0 +1,406 @@
+"""
+Lokalise keys service for reading and bulk-writing project keys via direct API
+calls.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import Any, Literal
+
+import httpx
+from fastapi import HTTPException
+
+from app.core.logging import get_logger
+from app.schemas.lokalise.keys import ProjectKeysResponse
+from app.services.language_registry import language_registry
+
+from .base import LokaliseBaseService
+from .retry import AmbiguousWriteError
+
+logger = get_logger(__name__)
+
+# Maximum page size accepted by the keys endpoint
+KEYS_PAGE_LIMIT = 500
+
+# Keys per create/update request (Lokalise recommends at most 500)
+KEYS_BULK_CHUNK_SIZE = 500
+
+# Attempts at a chunk whose creation may or may not have been applied
+KEYS_BULK_MAX_ATTEMPTS = 3
+
+
+def key_names(key: dict[str, Any]) -> set[str]:
+    """All names of a key (per-platform names collapse to a set)."""
+    key_name = key.get("key_name")
+    names = set(key_name.values()) if isinstance(key_name, dict) else {key_name}
+    return {name for name in names if name}
+
+
+class LokaliseKeysService(LokaliseBaseService):
+    """Service for managing Lokalise keys via direct API calls."""
+
+    async def list_keys(
+        self, project_id: str, params: dict[str, Any]
+    ) -> tuple[ProjectKeysResponse, httpx.Headers]:
+        """
+        Fetch a single page of keys straight from Lokalise.
+
+        Args:
+            project_id: ID of the project
+            params: Query parameters as accepted by the Lokalise keys endpoint
+
+        Returns:
+            Tuple of the parsed response and the raw response headers (which
+            carry the pagination state)
+
+        Raises:
+            HTTPException: If the API call fails
+        """
+        params = {k: v for k, v in params.items() if v is not None}
+
+        logger.info("Fetching keys for project %s with params: %s", project_id, params)
+
+        keys_response, headers = await self._make_request_model(
+            "GET", f"/projects/{project_id}/keys", ProjectKeysResponse, params=params
+        )
+
+        logger.info("Retrieved %s keys from Lokalise", len(keys_response.keys))
+        return keys_response, headers
+
+    async def iter_key_pages(
+        self,
+        project_id: str,
+        include_translations: bool = True,
+        include_comments: bool = True,
+        include_screenshots: bool = True,
+        filter_key_ids: list[int] | None = None,
+        limit: int = KEYS_PAGE_LIMIT,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Walk every key of a project using cursor pagination.
+
+        Pages are yielded as raw key dictionaries so bulk consumers (such as the
+        local key mirror) can store them without a validation round trip.
+
+        Args:
+            project_id: ID of the project
+            include_translations: Whether to include translations
+            include_comments: Whether to include comments
+            include_screenshots: Whether to include screenshots
+            filter_key_ids: Restrict the walk to these key identifiers
+            limit: Page size (max 500)
+
+        Yields:
+            Lists of raw key objects, one list per page
+        """
+        params: dict[str, Any] = {
+            "pagination": "cursor",
+            "limit": limit,
+            "include_translations": int(include_translations),
+            "include_comments": int(include_comments),
+            "include_screenshots": int(include_screenshots),
+        }
+        if filter_key_ids:
+            params["filter_key_ids"] = ",".join(str(k) for k in filter_key_ids)
+
+        cursor: str | None = None
+        page_count = 0
+        while True:
+            if cursor:
+                params["cursor"] = cursor
+
+            data, headers = await self._make_request_with_headers(
+                "GET", f"/projects/{project_id}/keys", params=params
+            )
+            keys: list[dict[str, Any]] = data.get("keys", [])
+            page_count += 1
+            logger.debug(
+                "Fetched keys page %d (%d keys) for project %s",
+                page_count,
+                len(keys),
+                project_id,
+            )
+
+            if keys:
+                yield keys
+
+            cursor = headers.get("X-Pagination-Next-Cursor")
+            if not cursor or not keys:
+                break
+
+    async def create_keys(
+        self,
+        project_id: str,
+        keys: list[dict[str, Any]],
+        use_automations: bool | None = None,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Create any number of keys, split into API-sized chunks.
+
+        See ``write_keys`` for chunking, retry and error semantics.
+        """
+        return await self.write_keys(
+            project_id,
+            "POST",
+            keys,
+            use_automations=use_automations,
+            on_progress=on_progress,
+        )
+
+    async def update_keys(
+        self,
+        project_id: str,
+        keys: list[dict[str, Any]],
+        use_automations: bool | None = None,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Update any number of keys, split into API-sized chunks.
+
+        See ``write_keys`` for chunking, retry and error semantics.
+        """
+        return await self.write_keys(
+            project_id,
+            "PUT",
+            keys,
+            use_automations=use_automations,
+            on_progress=on_progress,
+        )
+
+    async def _check_languages(
+        self, project_id: str, keys: list[dict[str, Any]]
+    ) -> None:
+        """
+        Reject translations in languages the project does not have.
+
+        Lokalise would report each such translation as a per-key error after
+        the whole request has been sent; the codes are checked upfront
+        against the language registry instead. If the project's languages
+        cannot be fetched, the keys are written unchecked.
+
+        Raises:
+            HTTPException: 400 if some languages are not in the project
+        """
+        lang_isos = {
+            translation["language_iso"]
+            for key in keys
+            for translation in key.get("translations") or ()
+            if translation.get("language_iso")
+        }
+        if not lang_isos:
+            return
+        try:
+            unknown = await language_registry.unknown(project_id, lang_isos)
+        except (HTTPException, httpx.HTTPError) as e:
+            logger.warning(
+                "Could not check the languages of project %s: %s", project_id, e
+            )
+            return
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Languages not in project {project_id}: {', '.join(unknown)}",
+            )
+
+    async def write_keys(
+        self,
+        project_id: str,
+        method: Literal["POST", "PUT"],
+        keys: list[dict[str, Any]],
+        *,
+        use_automations: bool | None = None,
+        on_progress: Callable[[int], None] | None = None,
+        chunk_size: int = KEYS_BULK_CHUNK_SIZE,
+    ) -> dict[str, Any]:
+        """
+        Create (POST) or update (PUT) keys in chunks submitted concurrently.
+
+        Chunks are sent at once and paced by the shared Lokalise rate limiter.
+        Transient failures are retried per chunk by the Lokalise client; a
+        create that may already have been applied is deduped against the keys
+        now in the project before the rest is resent. Matching keys created
+        since the chunk was sent count as written, older ones are reported as
+        already existing. If a chunk still fails its keys are reported as
+        errors while the other chunks go through.
+
+        Args:
+            project_id: ID of the project
+            method: "POST" to create keys, "PUT" to update them
+            keys: Key payloads as accepted by the Lokalise keys endpoint
+            use_automations: Whether to run automations on the written keys
+            on_progress: Called with the number of processed keys after each chunk
+            chunk_size: Keys per request
+
+        Returns:
+            Dictionary with the project ID, the written keys and the merged
+            per-key errors of all chunks
+
+        Raises:
+            HTTPException: 400 if translations are in languages the project
+                does not have
+        """
+        await self._check_languages(project_id, keys)
+        chunks = [keys[i : i + chunk_size] for i in range(0, len(keys), chunk_size)]
+        processed = 0
+
+        logger.info(
+            "Writing %s keys (%s) to project %s in %s chunks",
+            len(keys),
+            method,
+            project_id,
+            len(chunks),
+        )
+
+        async def write(index: int, chunk: list[dict[str, Any]]):
+            nonlocal processed
+            result = await self._write_chunk(
+                project_id, method, chunk, use_automations, index
+            )
+            processed += len(chunk)
+            if on_progress:
+                on_progress(processed)
+            return result
+
+        results = await asyncio.gather(
+            *(write(index, chunk) for index, chunk in enumerate(chunks))
+        )
+
+        written: list[dict[str, Any]] = []
+        errors: list[dict[str, Any]] = []
+        for chunk_keys, chunk_errors in results:
+            written.extend(chunk_keys)
+            errors.extend(chunk_errors)
+
+        logger.info(
+            "Wrote %s keys to project %s (%s errors)",
+            len(written),
+            project_id,
+            len(errors),
+        )
+        return {"project_id": project_id, "keys": written, "errors": errors}
+
+    async def _write_chunk(
+        self,
+        project_id: str,
+        method: Literal["POST", "PUT"],
+        chunk: list[dict[str, Any]],
+        use_automations: bool | None,
+        index: int,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        body: dict[str, Any] = {"keys": chunk}
+        if use_automations is not None:
+            body["use_automations"] = use_automations
+
+        written: list[dict[str, Any]] = []
+        errors: list[dict[str, Any]] = []
+        # Lokalise timestamps are whole seconds
+        sent_at = int(time.time())
+        for attempt in range(1, KEYS_BULK_MAX_ATTEMPTS + 1):
+            try:
+                data = await self._make_request(
+                    method, f"/projects/{project_id}/keys", json_data=body
+                )
+                return written + data.get("keys", []), errors + data.get("errors", [])
+            except AmbiguousWriteError as e:
+                if attempt == KEYS_BULK_MAX_ATTEMPTS:
+                    return written, errors + self._chunk_errors(index, chunk, e)
+            except (HTTPException, httpx.TransportError) as e:
+                return written, errors + self._chunk_errors(index, chunk, e)
+
+            chunk_names = set().union(*map(key_names, chunk))
+            try:
+                existing = await self._find_keys_by_name(project_id, chunk_names)
+            except (HTTPException, httpx.TransportError) as e:
+                return written, errors + self._chunk_errors(index, chunk, e)
+
+            # Only keys created since the chunk was sent can be ours
+            created = [
+                key
+                for key in existing
+                if (key.get("created_at_timestamp") or 0) >= sent_at
+            ]
+            created_names = set().union(*map(key_names, created))
+            existing_names = set().union(*map(key_names, existing))
+            remaining = [key for key in chunk if not key_names(key) & existing_names]
+            written.extend(key for key in created if key_names(key) & chunk_names)
+            errors.extend(
+                self._existing_key_error(key)
+                for key in chunk
+                if key_names(key) & existing_names
+                and not key_names(key) & created_names
+            )
+            logger.warning(
+                "Key chunk %s may have been applied; %s of %s keys exist, resending %s",
+                index,
+                len(chunk) - len(remaining),
+                len(chunk),
+                len(remaining),
+            )
+            if not remaining:
+                break
+            chunk = remaining
+            body["keys"] = chunk
+
+        return written, errors
+
+    async def _find_keys_by_name(
+        self, project_id: str, names: set[str]
+    ) -> list[dict[str, Any]]:
+        """Fetch the keys of a project that carry any of the given names."""
+        found: list[dict[str, Any]] = []
+        ordered = sorted(names)
+        # Keep the comma separated filter within URL length limits
+        for i in range(0, len(ordered), 100):
+            data = await self._make_request(
+                "GET",
+                f"/projects/{project_id}/keys",
+                params={
+                    "filter_keys": ",".join(ordered[i : i + 100]),
+                    "include_translations": 1,
+                    "limit": KEYS_PAGE_LIMIT,
+                },
+            )
+            found.extend(data.get("keys", []))
+        return found
+
+    def _existing_key_error(self, key: dict[str, Any]) -> dict[str, Any]:
+        """Report a key whose name was taken before its chunk was sent."""
+        return {
+            "message": "This key name is already taken",
+            "code": 400,
+            "key": {
+                field: key[field] for field in ("key_id", "key_name") if field in key
+            },
+        }
+
+    def _chunk_errors(
+        self,
+        index: int,
+        chunk: list[dict[str, Any]],
+        error: HTTPException | httpx.TransportError,
+    ) -> list[dict[str, Any]]:
+        """Report every key of a failed chunk as an error."""
+        if isinstance(error, HTTPException):
+            status_code, message = error.status_code, str(error.detail)
+        else:
+            status_code, message = 500, str(error) or type(error).__name__
+
+        logger.error("Key chunk %s (%s keys) failed: %s", index, len(chunk), message)
+        return [
+            {
+                "message": message,
+                "code": status_code,
+                "key": {
+                    field: key[field]
+                    for field in ("key_id", "key_name")
+                    if field in key
+                },
+            }
+            for key in chunk
+        ]
+
+
+# Create singleton instance
+lokalise_keys_service = LokaliseKeysService()
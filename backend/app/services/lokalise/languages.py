@@ -0,0 +1,56 @@
+"""
+Lokalise languages service for reading project languages via direct API calls.
+"""
+
+from app.core.logging import get_logger
+from app.schemas.lokalise.languages import ProjectLanguagesResponse
+
+from .base import LokaliseBaseService
+
+logger = get_logger(__name__)
+
+
+class LokaliseLanguagesService(LokaliseBaseService):
+    """Service for managing Lokalise project languages via direct API calls."""
+
+    async def list_project_languages(
+        self,
+        project_id: str,
+        limit: int | None = 5000,
+        page: int | None = None,
+    ) -> ProjectLanguagesResponse:
+        """
+        Fetch the languages configured for a project.
+
+        Args:
+            project_id: ID of the project
+            limit: Number of items to include (max 5000)
+            page: Return results starting from this page
+
+        Returns:
+            ProjectLanguagesResponse with the project languages
+
+        Raises:
+            HTTPException: If the API call fails
+        """
+        params = {
+            k: v for k, v in {"limit": limit, "page": page}.items() if v is not None
+        }
+
+        logger.info("Fetching languages for project %s", project_id)
+
+        languages_response, _ = await self._make_request_model(
+            "GET",
+            f"/projects/{project_id}/languages",
+            ProjectLanguagesResponse,
+            params=params,
+        )
+
+        logger.info(
+            "Retrieved %s languages from Lokalise", len(languages_response.languages)
+        )
+        return languages_response
+
+
+# Create singleton instance
+lokalise_languages_service = LokaliseLanguagesService()
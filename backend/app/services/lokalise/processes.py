@@ -0,0 +1,134 @@
+"""
+Lokalise queued processes service for tracking background processes (file
+imports, async exports, ...) via direct API calls.
+"""
+
+import asyncio
+import time
+
+from fastapi import HTTPException
+
+from app.core.logging import get_logger
+from app.schemas.lokalise.queued_processes import (
+    ProjectProcessesResponse,
+    ProjectProcessResponse,
+    QueuedProcess,
+)
+
+from .base import LokaliseBaseService
+
+logger = get_logger(__name__)
+
+# Terminal process states
+PROCESS_FINISHED = "finished"
+PROCESS_FAILED_STATES = {"failed", "cancelled"}
+
+# Polling backoff: start quickly, then back off to spare the rate limit
+PROCESS_POLL_INITIAL_DELAY = 1.0
+PROCESS_POLL_MAX_DELAY = 15.0
+PROCESS_POLL_BACKOFF = 1.5
+PROCESS_POLL_TIMEOUT = 1800.0
+
+
+class LokaliseProcessesService(LokaliseBaseService):
+    """Service for reading and awaiting Lokalise queued processes."""
+
+    async def list_processes(
+        self,
+        project_id: str,
+        limit: int | None = None,
+        page: int | None = None,
+    ) -> ProjectProcessesResponse:
+        """
+        Fetch the queued processes of a project.
+
+        Args:
+            project_id: ID of the project
+            limit: Number of items to include (max 5000)
+            page: Return results starting from this page
+
+        Returns:
+            ProjectProcessesResponse with the processes
+
+        Raises:
+            HTTPException: If the API call fails
+        """
+        params = {
+            k: v for k, v in {"limit": limit, "page": page}.items() if v is not None
+        }
+        data = await self._make_request(
+            "GET", f"/projects/{project_id}/processes", params=params
+        )
+        return ProjectProcessesResponse.model_validate(data)
+
+    async def get_process(
+        self, project_id: str, process_id: str
+    ) -> ProjectProcessResponse:
+        """
+        Fetch a single queued process, including its type specific details.
+
+        Raises:
+            HTTPException: If the API call fails
+        """
+        data = await self._make_request(
+            "GET", f"/projects/{project_id}/processes/{process_id}"
+        )
+        return ProjectProcessResponse.model_validate(data)
+
+    async def wait_for_process(
+        self,
+        project_id: str,
+        process_id: str,
+        timeout: float = PROCESS_POLL_TIMEOUT,
+    ) -> QueuedProcess:
+        """
+        Poll a queued process with exponential backoff until it finishes.
+
+        Args:
+            project_id: ID of the project
+            process_id: ID of the queued process
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            The finished process (with details)
+
+        Raises:
+            HTTPException: 502 if the process failed or was cancelled, 504 if it
+                did not finish within ``timeout``
+        """
+        deadline = time.monotonic() + timeout
+        delay = PROCESS_POLL_INITIAL_DELAY
+
+        while True:
+            process = (await self.get_process(project_id, process_id)).process
+
+            if process.status == PROCESS_FINISHED:
+                logger.info("Process %s (%s) finished", process_id, process.type)
+                return process
+            if process.status in PROCESS_FAILED_STATES:
+                raise HTTPException(
+                    status_code=502,
+                    detail=f"Lokalise process {process_id} {process.status}: "
+                    f"{process.message}",
+                )
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise HTTPException(
+                    status_code=504,
+                    detail=f"Lokalise process {process_id} did not finish within "
+                    f"{timeout:.0f}s (last status: {process.status})",
+                )
+
+            logger.debug(
+                "Process %s is %s, polling again in %.1fs",
+                process_id,
+                process.status,
+                delay,
+            )
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * PROCESS_POLL_BACKOFF, PROCESS_POLL_MAX_DELAY)
+
+
+# Create singleton instance
+lokalise_processes_service = LokaliseProcessesService()
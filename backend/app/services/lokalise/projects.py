@@ -2,7 +2,7 @@
 Lokalise projects service for managing projects via direct API calls.
 """
 
-from app.core.logging import logger
+from app.core.logging import get_logger
 from app.schemas.lokalise.projects import (
     ProjectResponse,
     ProjectsResponse,
@@ -10,6 +10,8 @@ from app.schemas.lokalise.projects import (
 
 from .base import LokaliseBaseService
 
+logger = get_logger(__name__)
+
 
 class LokaliseProjectsService(LokaliseBaseService):
     """Service for managing Lokalise projects via direct API calls."""
@@ -54,16 +56,15 @@ class LokaliseProjectsService(LokaliseBaseService):
             if v is not None
         }
 
-        logger.info(f"Fetching projects with params: {params}")
-
-        # Make direct API call
-        data = await self._make_request("GET", "/projects", params=params)
+        logger.info("Fetching projects with params: %s", params)
 
-        # Convert response directly to Pydantic model
-        projects_response = ProjectsResponse.model_validate(data)
+        # Parse and validate the raw response in one pass
+        projects_response, _ = await self._make_request_model(
+            "GET", "/projects", ProjectsResponse, params=params
+        )
 
         logger.info(
-            f"Retrieved {len(projects_response.projects)} projects from Lokalise"
+            "Retrieved %s projects from Lokalise", len(projects_response.projects)
         )
         return projects_response
 
@@ -80,15 +81,14 @@ class LokaliseProjectsService(LokaliseBaseService):
         Raises:
             HTTPException: If the API call fails
         """
-        logger.info(f"Fetching project {project_id}")
+        logger.info("Fetching project %s", project_id)
 
-        # Make direct API call
-        data = await self._make_request("GET", f"/projects/{project_id}")
-
-        # Convert response directly to Pydantic model
-        project_response = ProjectResponse.model_validate(data)
+        # Parse and validate the raw response in one pass
+        project_response, _ = await self._make_request_model(
+            "GET", f"/projects/{project_id}", ProjectResponse
+        )
 
-        logger.info(f"Retrieved project: {project_response.project.name}")
+        logger.info("Retrieved project: %s", project_response.project.name)
         return project_response
 
 
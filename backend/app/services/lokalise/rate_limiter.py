@@ -0,0 +1,63 @@
+"""
+Process-wide limiter for Lokalise API traffic.
+
+Lokalise throttles each API token to a fixed request rate and answers excess
+requests with 429. Every Lokalise call goes through a single limiter so that
+concurrent work (bulk key writes, mirror syncs, ...) shares the budget instead
+of tripping the limit.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from app.core.config import get_settings
+
+
+class LokaliseRateLimiter:
+    """Caps Lokalise requests at a steady rate and a maximum concurrency."""
+
+    def __init__(self, requests_per_second: float, max_concurrent: int):
+        self.interval = 1.0 / requests_per_second
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._next_slot = 0.0
+        self._waiting = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests currently waiting for a slot."""
+        return self._waiting
+
+    def defer(self, seconds: float) -> None:
+        """Hold back all callers for ``seconds`` (e.g. after Lokalise sent a 429)."""
+        self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Wait for a concurrency slot and the next free rate slot."""
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        try:
+            # Reserve the next slot before sleeping so concurrent callers queue
+            # up behind each other instead of waking at the same time
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            if slot > now:
+                await asyncio.sleep(slot - now)
+            yield
+        finally:
+            self._semaphore.release()
+
+
+_settings = get_settings()
+lokalise_rate_limiter = LokaliseRateLimiter(
+    _settings.LOKALISE_MAX_REQUESTS_PER_SECOND,
+    _settings.LOKALISE_MAX_CONCURRENT_REQUESTS,
+)
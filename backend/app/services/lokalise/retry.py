@@ -0,0 +1,135 @@
+"""
+Retry policy for Lokalise API calls.
+
+Transient failures (throttling, 5xx, timeouts, dropped connections) are retried
+with decorrelated-jitter backoff, honouring ``Retry-After`` when Lokalise sends
+it. Whether a failed request may be resent depends on the HTTP method:
+
+- Throttled (429) requests and requests that never reached Lokalise (connect
+  errors) are retried for every method; Lokalise did not process them.
+- Other transient failures are retried for idempotent methods only.
+- A failed non-idempotent write (POST) may already have been applied, so it is
+  not resent blindly; ``AmbiguousWriteError`` is raised instead and the caller
+  dedupes the payload against Lokalise before sending what is left.
+"""
+
+import random
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+from fastapi import HTTPException
+
+from app.core.config import get_settings
+
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Errors raised before the request was sent; safe to retry for any method
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class AmbiguousWriteError(HTTPException):
+    """A non-idempotent write failed in a way that may still have applied it."""
+
+    def __init__(self, detail: str):
+        super().__init__(status_code=502, detail=detail)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait according to a ``Retry-After`` header (seconds or date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Decides which failures are retried and how long to back off."""
+
+    def __init__(
+        self,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        max_retry_after: float,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+
+    def is_retryable_status(self, method: str, status_code: int) -> bool:
+        if status_code == 429:
+            return True
+        return status_code in RETRYABLE_STATUS_CODES and method in IDEMPOTENT_METHODS
+
+    def is_retryable_error(self, method: str, error: httpx.TransportError) -> bool:
+        return isinstance(error, UNSENT_ERRORS) or method in IDEMPOTENT_METHODS
+
+    def is_ambiguous(
+        self,
+        method: str,
+        status_code: int | None = None,
+        error: httpx.TransportError | None = None,
+    ) -> bool:
+        """Whether a failed write may nevertheless have been applied."""
+        if method in IDEMPOTENT_METHODS:
+            return False
+        if error is not None:
+            return not isinstance(error, UNSENT_ERRORS)
+        return status_code in RETRYABLE_STATUS_CODES - {429}
+
+    def next_delay(self, previous: float, retry_after: float | None = None) -> float:
+        """
+        Decorrelated jitter: a random delay between the base delay and three
+        times the previous one, capped; never shorter than ``Retry-After``.
+        """
+        delay = min(self.max_delay, random.uniform(self.base_delay, previous * 3))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class RetryStats:
+    """Counters of retried, exhausted and ambiguous Lokalise requests."""
+
+    def __init__(self):
+        self.retries: Counter[str] = Counter()
+        self.exhausted: Counter[str] = Counter()
+        self.ambiguous_writes = 0
+
+    def record_retry(self, method: str, reason: str) -> None:
+        self.retries[f"{method} {reason}"] += 1
+
+    def record_exhausted(self, method: str, reason: str) -> None:
+        self.exhausted[f"{method} {reason}"] += 1
+
+    def record_ambiguous_write(self) -> None:
+        self.ambiguous_writes += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "retries_total": sum(self.retries.values()),
+            "retries": dict(self.retries),
+            "exhausted": dict(self.exhausted),
+            "ambiguous_writes": self.ambiguous_writes,
+        }
+
+
+_settings = get_settings()
+lokalise_retry_policy = RetryPolicy(
+    max_attempts=_settings.LOKALISE_RETRY_MAX_ATTEMPTS,
+    base_delay=_settings.LOKALISE_RETRY_BASE_DELAY_SECONDS,
+    max_delay=_settings.LOKALISE_RETRY_MAX_DELAY_SECONDS,
+    max_retry_after=_settings.LOKALISE_RETRY_MAX_RETRY_AFTER_SECONDS,
+)
+lokalise_retry_stats = RetryStats()
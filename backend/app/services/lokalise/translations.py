@@ -0,0 +1,57 @@
+"""
+Lokalise translations service for reading project translations via direct API calls.
+"""
+
+from typing import Any
+
+import httpx
+
+from app.core.logging import get_logger
+from app.schemas.lokalise.translations import TranslationsResponse
+
+from .base import LokaliseBaseService
+
+logger = get_logger(__name__)
+
+
+class LokaliseTranslationsService(LokaliseBaseService):
+    """Service for managing Lokalise translations via direct API calls."""
+
+    async def list_translations(
+        self, project_id: str, params: dict[str, Any]
+    ) -> tuple[TranslationsResponse, httpx.Headers]:
+        """
+        Fetch a single page of translations straight from Lokalise.
+
+        Args:
+            project_id: ID of the project
+            params: Query parameters as accepted by the Lokalise translations endpoint
+
+        Returns:
+            Tuple of the parsed response and the raw response headers
+
+        Raises:
+            HTTPException: If the API call fails
+        """
+        params = {k: v for k, v in params.items() if v is not None}
+
+        logger.info(
+            "Fetching translations for project %s with params: %s", project_id, params
+        )
+
+        translations_response, headers = await self._make_request_model(
+            "GET",
+            f"/projects/{project_id}/translations",
+            TranslationsResponse,
+            params=params,
+        )
+
+        logger.info(
+            "Retrieved %s translations from Lokalise",
+            len(translations_response.translations),
+        )
+        return translations_response, headers
+
+
+# Create singleton instance
+lokalise_translations_service = LokaliseTranslationsService()
@@ -1,14 +1,78 @@
+import asyncio
 import json
 import re
-from difflib import SequenceMatcher
+import time
+from collections.abc import AsyncIterator, Coroutine
 from typing import Any
 
-import sacrebleu
-
-from app.core.logging import logger
+import google.generativeai as genai
+from pydantic import ValidationError
+
+from app.core.config import get_settings
+from app.core.logging import excerpt, get_logger
+from app.core.metrics import stage_labels, timed, track_stage
+from app.core.tracing import set_span_attributes, tracer
+from app.schemas.translation_evaluation import LLMFeedback
+from app.services.cpu_executor import cpu_executor
+from app.services.evaluation_cache import evaluation_cache, evaluation_cache_key
+from app.services.evaluation_metrics import (
+    corpus_scores,
+    edit_distance,
+    merge_statistics,
+    score_segments,
+    sentence_scores,
+)
 from app.services.gemini_service import gemini_service
 from app.services.glossary_processor import glossary_processor
 
+logger = get_logger(__name__)
+
+# Bump when prompts, metrics or the result format change so that cached
+# evaluations made by the previous evaluator are no longer served
+EVALUATOR_VERSION = "1"
+
+# Segments scored per worker task in batch evaluations
+BATCH_EVALUATION_CHUNK_SIZE = 250
+
+# Rough characters per token, used to size LLM judge batches
+CHARS_PER_TOKEN = 4
+# Estimated tokens of the batched judge prompt around the segments
+JUDGE_PROMPT_OVERHEAD_TOKENS = 400
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+# Structured output schema of a batched judge response
+JUDGE_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "evaluations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "strengths": _STRING_LIST,
+                    "weaknesses": _STRING_LIST,
+                    "specific_comments": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "part": {"type": "string"},
+                                "comment": {"type": "string"},
+                            },
+                            "required": ["part", "comment"],
+                        },
+                    },
+                    "suggestions": _STRING_LIST,
+                    "summary": {"type": "string"},
+                },
+                "required": ["id", "summary"],
+            },
+        }
+    },
+    "required": ["evaluations"],
+}
+
 
 class TranslationEvaluationService:
     """Service for evaluating translation quality using objective metrics."""
@@ -16,7 +80,32 @@ class TranslationEvaluationService:
     def __init__(self):
         self.glossary_processor = glossary_processor
         self.llm_service = gemini_service
+        self.executor = cpu_executor
+        settings = get_settings()
+        self.full_metrics_max_chars = settings.EVALUATION_FULL_METRICS_MAX_CHARS
+        self.stage_timeouts = {
+            "metric_scores": None,  # bounded by the CPU executor timeout
+            "glossary_compliance": settings.EVALUATION_GLOSSARY_TIMEOUT_SECONDS,
+            "llm_feedback": settings.EVALUATION_LLM_TIMEOUT_SECONDS,
+        }
+        self.deadline = settings.EVALUATION_DEADLINE_SECONDS
+        self.chrf_fail_below = settings.EVALUATION_CHRF_FAIL_BELOW
+        self.chrf_pass_above = settings.EVALUATION_CHRF_PASS_ABOVE
+        self.glossary_fail_below = settings.EVALUATION_GLOSSARY_FAIL_BELOW
+        self.cache = evaluation_cache
+        self.judge_input_token_budget = settings.LLM_JUDGE_INPUT_TOKEN_BUDGET
+        self.judge_output_tokens_per_item = settings.LLM_JUDGE_OUTPUT_TOKENS_PER_ITEM
+        self.judge_generation_config = genai.types.GenerationConfig(
+            temperature=0.1,
+            max_output_tokens=settings.LLM_JUDGE_MAX_OUTPUT_TOKENS,
+            response_mime_type="application/json",
+            response_schema=JUDGE_RESPONSE_SCHEMA,
+        )
+        self._judge_semaphore = asyncio.Semaphore(
+            settings.LLM_JUDGE_MAX_CONCURRENT_REQUESTS
+        )
 
+    @tracer.traced("evaluate_translation")
     async def evaluate_translation(
         self,
         source_text: str,
@@ -25,10 +114,25 @@ class TranslationEvaluationService:
         target_lang: str,
         reference_text: str | None = None,
         project_id: str | None = None,
+        force_llm: bool = False,
     ) -> dict[str, Any]:
         """
         Evaluate translation quality using objective metrics.
 
+        Evaluation is tiered. Metrics and glossary compliance are cheap and
+        run first, concurrently; when they give a clear verdict (see
+        ``_cheap_verdict``) the LLM judge is skipped unless ``force_llm`` is
+        set. Otherwise LLM feedback decides. ``decided_by`` reports the tier
+        that produced the verdict. When the judge is likely to be needed
+        (``force_llm``, or no reference text for chrF) it starts together
+        with the cheap stages; unless forced, it is cancelled if they turn out
+        to be conclusive.
+
+        Each stage has its own timeout and all of them share a deadline of
+        ``deadline`` seconds. A stage that fails, times out or misses the
+        deadline is left out of the result and listed in
+        ``incomplete_stages``, with ``partial`` set.
+
         Args:
             source_text: Original text to be translated
             source_lang: Source language code
@@ -36,41 +140,126 @@ class TranslationEvaluationService:
             target_lang: Target language code
             reference_text: Optional reference translation for comparison
             project_id: Optional Lokalise project ID for glossary checking
+            force_llm: Get LLM feedback even when cheap signals are conclusive
 
         Returns:
             Dictionary containing evaluation results
         """
-        logger.info("=== STARTING TRANSLATION EVALUATION ===")
-        logger.info(f"Source: '{source_text}' ({source_lang})")
-        logger.info(f"Translation: '{translated_text}' ({target_lang})")
-        logger.info(f"Reference: '{reference_text}'")
-        logger.info(f"Project ID: '{project_id}'")
-
-        # Step 1: Compute objective metrics
-        metric_scores = self._compute_metrics(translated_text, reference_text)
-        logger.info(f"Computed metrics: {metric_scores}")
-
-        # Step 2: Check glossary compliance (if project_id provided)
-        glossary_compliance = None
+        logger.debug(
+            "Evaluating %r (%s) -> %r (%s) against %r",
+            excerpt(source_text),
+            source_lang,
+            excerpt(translated_text),
+            target_lang,
+            excerpt(reference_text),
+        )
+        set_span_attributes(
+            project_id=project_id, source_lang=source_lang, target_lang=target_lang
+        )
+
+        # The glossary is loaded up front: its content is part of the cache key
+        terms_data = None
+        glossary_version = None
         if project_id:
-            logger.info("=== CHECKING GLOSSARY COMPLIANCE ===")
-            glossary_compliance = await self._check_glossary_compliance(
-                source_text, translated_text, source_lang, target_lang, project_id
+            with track_stage("glossary_load", **stage_labels(project_id)):
+                terms_data = await self.glossary_processor.get_terms_data(project_id)
+            glossary_version = await self.cache.glossary_version(project_id, terms_data)
+
+        cache_key = evaluation_cache_key(
+            source_text,
+            translated_text,
+            reference_text,
+            source_lang,
+            target_lang,
+            project_id,
+            glossary_version,
+            self._evaluator_version(),
+            force_llm,
+        )
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Translation evaluation served from cache")
+            set_span_attributes(cached=True)
+            return {**cached, "cached": True}
+
+        started = time.perf_counter()
+
+        # Steps 1-2: Metrics and glossary compliance (if project_id provided),
+        # concurrently
+        labels = stage_labels(project_id, source_lang, target_lang)
+
+        def llm_stage() -> Coroutine[Any, Any, dict[str, Any]]:
+            return timed(
+                self._get_llm_feedback(
+                    source_text,
+                    translated_text,
+                    source_lang,
+                    target_lang,
+                    reference_text,
+                ),
+                "llm_judge",
+                **labels,
             )
-            logger.info(f"Glossary compliance: {glossary_compliance}")
 
-        # Step 3: Get LLM qualitative feedback
-        logger.info("=== GETTING LLM FEEDBACK ===")
-        llm_feedback = await self._get_llm_feedback(
-            source_text, translated_text, source_lang, target_lang, reference_text
+        stages = {
+            "metric_scores": timed(
+                self._compute_metrics(translated_text, reference_text),
+                "evaluation_metrics",
+                **labels,
+            )
+        }
+        if project_id:
+            stages["glossary_compliance"] = timed(
+                self._check_glossary_compliance(
+                    source_text,
+                    translated_text,
+                    source_lang,
+                    target_lang,
+                    project_id,
+                    terms_data=terms_data,
+                ),
+                "glossary_compliance",
+                **labels,
+            )
+        # When the LLM judge is likely to be needed (forced, or no reference to
+        # compute chrF from, so only a glossary failure is conclusive), it
+        # starts alongside the cheap tier rather than after it
+        llm_tasks = None
+        if force_llm or not reference_text:
+            llm_tasks = self._start_stages({"llm_feedback": llm_stage()})
+        results, incomplete_stages = await self._run_stages(stages, self.deadline)
+
+        metric_scores = results.get("metric_scores") or dict.fromkeys(
+            ("bleu", "ter", "chrf", "edit_distance")
         )
-        logger.info(f"LLM feedback: {llm_feedback}")
+        glossary_compliance = results.get("glossary_compliance")
+        llm_feedback = None
+        logger.debug("Metric scores: %s", metric_scores)
+        verdict, decided_by = self._cheap_verdict(metric_scores, glossary_compliance)
+
+        # Step 3: LLM qualitative feedback, only when the cheap tier is not
+        # conclusive (or the caller asks for it); a judge started early is
+        # cancelled otherwise
+        if verdict == "uncertain" or force_llm:
+            results, incomplete = await self._finish_stages(
+                llm_tasks or self._start_stages({"llm_feedback": llm_stage()}),
+                self.deadline - (time.perf_counter() - started),
+            )
+            incomplete_stages += incomplete
+            llm_feedback = results.get("llm_feedback")
+        else:
+            if llm_tasks is not None:
+                llm_tasks["llm_feedback"].cancel()
+            logger.debug("Skipping LLM feedback, %s verdict: %s", decided_by, verdict)
+        logger.debug("LLM feedback: %s", llm_feedback)
+        if verdict == "uncertain" and llm_feedback:
+            verdict = self._llm_verdict(llm_feedback)
+            decided_by = "llm" if verdict != "uncertain" else None
 
         # Step 4: Determine overall assessment based on all factors
         overall_assessment = self._determine_overall_assessment(
             metric_scores, glossary_compliance, llm_feedback
         )
-        logger.info(f"Overall assessment: {overall_assessment}")
 
         result = {
             "source_text": source_text,
@@ -82,10 +271,268 @@ class TranslationEvaluationService:
             "glossary_compliance": glossary_compliance,
             "llm_feedback": llm_feedback,
             "overall_assessment": overall_assessment,
+            "verdict": verdict,
+            "decided_by": decided_by,
+            "partial": bool(incomplete_stages),
+            "incomplete_stages": incomplete_stages,
+        }
+
+        set_span_attributes(
+            verdict=verdict, decided_by=decided_by, partial=bool(incomplete_stages)
+        )
+
+        # Partial results would pin a transient failure; evaluate them again
+        if not incomplete_stages:
+            await self.cache.put(cache_key, result)
+
+        logger.info(
+            "Evaluated translation of %r: %s (decided by %s)",
+            excerpt(source_text),
+            verdict,
+            decided_by,
+            extra={"project_id": project_id, "partial": bool(incomplete_stages)},
+        )
+        return {**result, "cached": False}
+
+    def _evaluator_version(self) -> str:
+        """
+        Version of everything besides the inputs that shapes a result: the
+        evaluator code and prompts, the LLM model and the verdict settings.
+        """
+        return evaluation_cache_key(
+            EVALUATOR_VERSION,
+            getattr(self.llm_service.model, "model_name", None),
+            self.full_metrics_max_chars,
+            self.chrf_fail_below,
+            self.chrf_pass_above,
+            self.glossary_fail_below,
+        )
+
+    def _cheap_verdict(
+        self,
+        metric_scores: dict[str, Any],
+        glossary_compliance: dict[str, Any] | None,
+    ) -> tuple[str, str | None]:
+        """
+        Verdict from metrics and glossary compliance alone.
+
+        Poor glossary compliance fails the translation outright. Otherwise
+        chrF against the reference passes or fails it when outside the
+        uncertainty band ``[chrf_fail_below, chrf_pass_above]``. chrF is
+        used rather than BLEU as it is more stable on single sentences.
+
+        Returns:
+            Tuple of the verdict ("pass", "fail" or "uncertain") and the tier
+            that decided it ("glossary", "metrics" or None if uncertain)
+        """
+        compliance = (glossary_compliance or {}).get("compliance_score")
+        if compliance is not None and compliance < self.glossary_fail_below:
+            return "fail", "glossary"
+
+        chrf = metric_scores.get("chrf")
+        if chrf is None:
+            return "uncertain", None
+        if chrf < self.chrf_fail_below:
+            return "fail", "metrics"
+        if chrf > self.chrf_pass_above:
+            return "pass", "metrics"
+        return "uncertain", None
+
+    def _llm_verdict(self, llm_feedback: dict[str, Any]) -> str:
+        """Verdict from LLM feedback: more weaknesses than strengths fails."""
+        strengths = len(llm_feedback.get("strengths") or [])
+        weaknesses = len(llm_feedback.get("weaknesses") or [])
+        if weaknesses > strengths:
+            return "fail"
+        if strengths > weaknesses:
+            return "pass"
+        return "uncertain"
+
+    async def _run_stages(
+        self, stages: dict[str, Coroutine[Any, Any, Any]], deadline: float
+    ) -> tuple[dict[str, Any], list[str]]:
+        """
+        Run evaluation stages concurrently within a deadline.
+
+        Args:
+            stages: Coroutine of each stage, by name
+            deadline: Seconds to wait for all stages
+
+        Returns:
+            Tuple of the results of the stages that completed and the names
+            of the stages that failed, timed out or missed the deadline
+        """
+        return await self._finish_stages(self._start_stages(stages), deadline)
+
+    def _start_stages(
+        self, stages: dict[str, Coroutine[Any, Any, Any]]
+    ) -> dict[str, asyncio.Task[Any]]:
+        """Start evaluation stages as tasks, each bounded by its own timeout."""
+        return {
+            name: asyncio.create_task(
+                asyncio.wait_for(stage, timeout=self.stage_timeouts.get(name))
+            )
+            for name, stage in stages.items()
+        }
+
+    async def _finish_stages(
+        self, tasks: dict[str, asyncio.Task[Any]], deadline: float
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Wait for started stages within a deadline (see ``_run_stages``)."""
+        started = time.perf_counter()
+        await asyncio.wait(tasks.values(), timeout=max(deadline, 0))
+
+        results: dict[str, Any] = {}
+        incomplete: list[str] = []
+        for name, task in tasks.items():
+            if not task.done():
+                task.cancel()
+                logger.warning("Evaluation stage %s missed the deadline", name)
+                incomplete.append(name)
+            elif task.exception() is not None:
+                logger.error("Evaluation stage %s failed: %r", name, task.exception())
+                incomplete.append(name)
+            else:
+                results[name] = task.result()
+
+        logger.debug(
+            "Evaluation stages finished in %.2fs, incomplete: %s",
+            time.perf_counter() - started,
+            incomplete or "none",
+        )
+        return results, incomplete
+
+    async def evaluate_batch(
+        self,
+        hypotheses: list[str],
+        references: list[str],
+        *,
+        chunk_size: int = BATCH_EVALUATION_CHUNK_SIZE,
+        sources: list[str] | None = None,
+        source_lang: str = "",
+        target_lang: str = "",
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Score many translations against references in worker processes.
+
+        Segments are split into chunks scored in parallel by a process pool;
+        results are yielded in input order as soon as their chunk is done, so
+        callers can stream them. Corpus-level scores are combined from the
+        per-chunk statistics without another pass over the segments.
+
+        As in ``_compute_metrics``, segments longer than
+        ``full_metrics_max_chars`` only get BLEU and chrF, and a chunk that
+        is not scored within the executor timeout is scored again with BLEU
+        and chrF only. Corpus TER then covers the segments it was computed
+        for.
+
+        Args:
+            hypotheses: Translations to evaluate
+            references: Reference translation of each hypothesis
+            chunk_size: Segments per worker task
+            sources: Source text of each hypothesis; when given, every
+                segment also gets batched LLM feedback
+            source_lang: Source language code (for LLM feedback)
+            target_lang: Target language code (for LLM feedback)
+
+        Yields:
+            One dictionary per segment (``type`` "segment", its ``index``,
+            BLEU/chrF/TER/edit distance and optional ``llm_feedback``), then a
+            single ``type`` "corpus" dictionary with corpus-level BLEU/chrF/TER
+        """
+        started = time.perf_counter()
+        bounds = [
+            (i, min(i + chunk_size, len(hypotheses)))
+            for i in range(0, len(hypotheses), chunk_size)
+        ]
+        futures = [
+            self.executor.submit(
+                score_segments,
+                hypotheses[start:end],
+                references[start:end],
+                self.full_metrics_max_chars,
+            )
+            for start, end in bounds
+        ]
+        judgements: list[asyncio.Task[list[dict[str, Any]]]] = []
+        if sources is not None:
+            judgements = [
+                asyncio.create_task(
+                    self._get_llm_feedback_batch(
+                        [
+                            {
+                                "source_text": sources[i],
+                                "translated_text": hypotheses[i],
+                                "reference_text": references[i],
+                            }
+                            for i in range(start, end)
+                        ],
+                        source_lang,
+                        target_lang,
+                    )
+                )
+                for start, end in bounds
+            ]
+        logger.info("Scoring %s segments in %s chunks", len(hypotheses), len(futures))
+
+        totals = []
+        index = 0
+        try:
+            for chunk, (future, (start, end)) in enumerate(
+                zip(futures, bounds, strict=True)
+            ):
+                scores, chunk_totals = await self._chunk_scores(
+                    future, hypotheses[start:end], references[start:end]
+                )
+                totals.append(chunk_totals)
+                if judgements:
+                    for score, feedback in zip(
+                        scores, await judgements[chunk], strict=True
+                    ):
+                        score["llm_feedback"] = feedback
+                for score in scores:
+                    yield {"type": "segment", "index": index, **score}
+                    index += 1
+        finally:
+            # Drop queued chunks if the consumer went away
+            for future in futures:
+                future.cancel()
+            for judgement in judgements:
+                judgement.cancel()
+
+        duration = round(time.perf_counter() - started, 3)
+        logger.info("Scored %s segments in %ss", index, duration)
+        yield {
+            "type": "corpus",
+            "segments": index,
+            **corpus_scores(merge_statistics(totals)),
+            "duration_seconds": duration,
         }
 
-        logger.info("=== TRANSLATION EVALUATION COMPLETED ===")
-        return result
+    async def _chunk_scores(
+        self,
+        future: asyncio.Future[tuple[list[dict[str, Any]], dict[str, list[float]]]],
+        hypotheses: list[str],
+        references: list[str],
+    ) -> tuple[list[dict[str, Any]], dict[str, list[float]]]:
+        """
+        Wait for a chunk scored by ``score_segments``, within the executor
+        timeout.
+
+        Raises:
+            TimeoutError: If even BLEU and chrF time out
+        """
+        try:
+            return await asyncio.wait_for(future, timeout=self.executor.timeout)
+        except TimeoutError:
+            logger.warning(
+                "Scoring %d segments timed out after %ss, computing BLEU and chrF only",
+                len(hypotheses),
+                self.executor.timeout,
+            )
+            return await self.executor.run(
+                score_segments, hypotheses, references, None, True
+            )
 
     async def _check_glossary_compliance(
         self,
@@ -94,6 +541,8 @@ class TranslationEvaluationService:
         source_lang: str,
         target_lang: str,
         project_id: str,
+        *,
+        terms_data: dict[str, dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """
         Check glossary compliance by analyzing how terms were handled.
@@ -104,81 +553,71 @@ class TranslationEvaluationService:
             source_lang: Source language code
             target_lang: Target language code
             project_id: Lokalise project ID
+            terms_data: Glossary terms of the project, if already loaded
 
         Returns:
             Dictionary containing glossary compliance results
-        """
-        try:
-            # Find glossary terms in source text
-            logger.info("Finding glossary terms in source text...")
-            found_terms = await self.glossary_processor.find_terms_in_text(
-                source_text, project_id
-            )
-            logger.info(f"Found {len(found_terms)} glossary terms in source text")
-
-            if not found_terms:
-                return {
-                    "terms_found_in_source": [],
-                    "terms_correctly_handled": [],
-                    "terms_incorrectly_handled": [],
-                    "compliance_score": None,
-                    "compliance_summary": "No glossary terms found in source text",
-                }
-
-            # Analyze each term's handling in the translation
-            correctly_handled = []
-            incorrectly_handled = []
-
-            for term_info in found_terms:
-                logger.info(f"Analyzing term: '{term_info['term']}'")
-                logger.info(f"  - Forbidden: {term_info['forbidden']}")
-                logger.info(f"  - Translatable: {term_info['translatable']}")
-                logger.info(f"  - Matched text: '{term_info['matched_text']}'")
-
-                # Check how this term was handled in the translation
-                is_correctly_handled = await self._analyze_term_handling(
-                    term_info, source_text, translated_text, target_lang, project_id
-                )
-
-                if is_correctly_handled:
-                    correctly_handled.append(term_info)
-                    logger.info("  ✓ Term correctly handled")
-                else:
-                    incorrectly_handled.append(term_info)
-                    logger.info("  ✗ Term incorrectly handled")
-
-            # Calculate compliance score
-            total_terms = len(found_terms)
-            correct_terms = len(correctly_handled)
-            compliance_score = (
-                (correct_terms / total_terms * 100) if total_terms > 0 else None
-            )
 
-            # Generate compliance summary
-            compliance_summary = self._generate_compliance_summary(
-                total_terms, correct_terms, incorrectly_handled
-            )
-
-            return {
-                "terms_found_in_source": found_terms,
-                "terms_correctly_handled": correctly_handled,
-                "terms_incorrectly_handled": incorrectly_handled,
-                "compliance_score": round(compliance_score, 1)
-                if compliance_score is not None
-                else None,
-                "compliance_summary": compliance_summary,
-            }
+        Raises:
+            Exception: Glossary lookup errors propagate, so the stage is
+                reported incomplete
+        """
+        # Find glossary terms in source text
+        found_terms = await self.glossary_processor.find_terms_in_text(
+            source_text, project_id, terms_data
+        )
 
-        except Exception as e:
-            logger.error(f"Error checking glossary compliance: {e}", exc_info=True)
+        if not found_terms:
             return {
                 "terms_found_in_source": [],
                 "terms_correctly_handled": [],
                 "terms_incorrectly_handled": [],
                 "compliance_score": None,
-                "compliance_summary": f"Error checking glossary compliance: {e}",
+                "compliance_summary": "No glossary terms found in source text",
             }
 
+        # Analyze each term's handling in the translation
+        correctly_handled = []
+        incorrectly_handled = []
+
+        for term_info in found_terms:
+            # Check how this term was handled in the translation
+            is_correctly_handled = await self._analyze_term_handling(
+                term_info, source_text, translated_text, target_lang, project_id
+            )
+
+            logger.debug(
+                "Glossary term %r handled %s",
+                term_info["term"],
+                "correctly" if is_correctly_handled else "incorrectly",
+            )
+            if is_correctly_handled:
+                correctly_handled.append(term_info)
+            else:
+                incorrectly_handled.append(term_info)
+
+        # Calculate compliance score
+        total_terms = len(found_terms)
+        correct_terms = len(correctly_handled)
+        compliance_score = (
+            (correct_terms / total_terms * 100) if total_terms > 0 else None
+        )
+
+        # Generate compliance summary
+        compliance_summary = self._generate_compliance_summary(
+            total_terms, correct_terms, incorrectly_handled
+        )
+
+        return {
+            "terms_found_in_source": found_terms,
+            "terms_correctly_handled": correctly_handled,
+            "terms_incorrectly_handled": incorrectly_handled,
+            "compliance_score": round(compliance_score, 1)
+            if compliance_score is not None
+            else None,
+            "compliance_summary": compliance_summary,
+        }
+
     async def _analyze_term_handling(
         self,
         term_info: dict[str, Any],
@@ -205,67 +644,36 @@ class TranslationEvaluationService:
         forbidden = term_info["forbidden"]
         translatable = term_info["translatable"]
 
-        logger.info(
-            f"Analyzing term handling for: '{term}' (matched: '{matched_text}')"
-        )
-
         # Case 1: Forbidden terms should be preserved exactly
         if forbidden:
-            logger.info("Term is forbidden - checking if preserved exactly")
             # Check if the exact matched text appears in translation
-            if matched_text.lower() in translated_text.lower():
-                logger.info(
-                    f"Forbidden term '{matched_text}' found preserved in translation"
-                )
-                return True
-            else:
-                logger.info(f"Forbidden term '{matched_text}' NOT found in translation")
-                return False
+            return matched_text.lower() in translated_text.lower()
 
         # Case 2: Translatable terms should be translated according to glossary
         if translatable:
-            logger.info("Term is translatable - checking if properly translated")
             # Check if we have translation data in the term_info itself
             if term_info.get("translations"):
                 translations = term_info["translations"]
                 expected_translation = translations.get(target_lang)
 
                 if expected_translation:
-                    logger.info(f"Expected translation: '{expected_translation}'")
                     # Check if expected translation appears in the translated text
                     # Use case-insensitive search but be more precise about word boundaries
                     pattern = re.compile(
                         re.escape(expected_translation.lower()), re.IGNORECASE
                     )
-                    if pattern.search(translated_text.lower()):
-                        logger.info(
-                            f"Expected translation '{expected_translation}' found in translation"
-                        )
-                        return True
-                    else:
-                        logger.info(
-                            f"Expected translation '{expected_translation}' NOT found in translation"
-                        )
-                        logger.info(f"Actual translation contains: '{translated_text}'")
-                        return False
+                    return bool(pattern.search(translated_text.lower()))
                 else:
-                    logger.info(
-                        f"No translation found for language '{target_lang}' in glossary"
+                    logger.debug(
+                        "No %s translation of glossary term %r", target_lang, term
                     )
                     # If no specific translation available, we can't verify compliance
                     return False
             else:
-                logger.info("No translation data found in term info")
                 return False
 
         # Case 3: Non-translatable, non-forbidden terms should be preserved
-        logger.info("Term is non-translatable, non-forbidden - checking if preserved")
-        if matched_text.lower() in translated_text.lower():
-            logger.info(f"Non-translatable term '{matched_text}' found preserved")
-            return True
-        else:
-            logger.info(f"Non-translatable term '{matched_text}' NOT found preserved")
-            return False
+        return matched_text.lower() in translated_text.lower()
 
     def _generate_compliance_summary(
         self,
@@ -288,18 +696,26 @@ class TranslationEvaluationService:
         else:
             return f"Poor compliance: Only {correct_terms}/{total_terms} terms handled correctly ({compliance_percentage:.1f}%)"
 
-    def _compute_metrics(
+    async def _compute_metrics(
         self, translated_text: str, reference_text: str | None
     ) -> dict[str, Any]:
         """
         Compute objective translation metrics using sacrebleu.
 
+        Metrics are computed on the CPU executor so the event loop stays
+        responsive. TER and edit distance grow quadratically with the text
+        length; above ``full_metrics_max_chars``, or when the full computation
+        times out, only BLEU and chrF are computed and the others stay None.
+
         Args:
             translated_text: The translated text to evaluate
             reference_text: Optional reference translation
 
         Returns:
             Dictionary containing computed metric scores
+
+        Raises:
+            TimeoutError: If even BLEU and chrF time out
         """
         scores: dict[str, float | int | None] = {
             "bleu": None,
@@ -309,39 +725,39 @@ class TranslationEvaluationService:
         }
 
         if not reference_text:
-            logger.info("No reference text provided, skipping metric computation")
+            logger.debug("No reference text provided, skipping metric computation")
             return scores
 
-        try:
-            # BLEU score (sentence-level)
-            bleu = sacrebleu.sentence_bleu(translated_text, [reference_text])
-            scores["bleu"] = round(bleu.score, 2)
-            logger.info(f"BLEU score: {scores['bleu']}")
-
-            # TER score (sentence-level)
-            ter = sacrebleu.sentence_ter(translated_text, [reference_text])
-            scores["ter"] = round(ter.score, 2)
-            logger.info(f"TER score: {scores['ter']}")
-
-            # chrF score (sentence-level)
-            chrf = sacrebleu.sentence_chrf(translated_text, [reference_text])
-            scores["chrf"] = round(chrf.score, 2)
-            logger.info(f"chrF score: {scores['chrf']}")
-
-            # Character-level edit distance
-            scores["edit_distance"] = self._compute_edit_distance(
-                translated_text, reference_text
+        longest = max(len(translated_text), len(reference_text))
+        cheap_only = longest > self.full_metrics_max_chars
+        if cheap_only:
+            logger.info(
+                "Texts of %d characters exceed %d, computing BLEU and chrF only",
+                longest,
+                self.full_metrics_max_chars,
             )
-            logger.info(f"Edit distance: {scores['edit_distance']}")
 
-        except Exception as e:
-            logger.error(f"Error computing metrics: {e}", exc_info=True)
+        try:
+            scores = await self.executor.run(
+                sentence_scores, translated_text, reference_text, cheap_only
+            )
+        except TimeoutError:
+            if cheap_only:
+                raise
+            logger.warning(
+                "Metric computation timed out after %ss, computing BLEU and chrF only",
+                self.executor.timeout,
+            )
+            scores = await self.executor.run(
+                sentence_scores, translated_text, reference_text, True
+            )
+        logger.debug("Metric scores: %s", scores)
 
         return scores
 
     def _compute_edit_distance(self, text1: str, text2: str) -> int:
         """
-        Compute character-level edit distance using difflib.
+        Compute character-level Levenshtein distance.
 
         Args:
             text1: First text
@@ -350,15 +766,7 @@ class TranslationEvaluationService:
         Returns:
             Character-level edit distance
         """
-        # Use SequenceMatcher to compute similarity ratio
-        matcher = SequenceMatcher(None, text1, text2)
-        # Convert similarity ratio to edit distance
-        max_len = max(len(text1), len(text2))
-        if max_len == 0:
-            return 0
-        similarity = matcher.ratio()
-        edit_distance = int(max_len * (1 - similarity))
-        return edit_distance
+        return edit_distance(text1, text2)
 
     async def _get_llm_feedback(
         self,
@@ -380,70 +788,234 @@ class TranslationEvaluationService:
 
         Returns:
             Dictionary containing LLM feedback
+
+        Raises:
+            ValueError: If the LLM response is empty or not JSON; like API
+                errors, this makes the stage incomplete rather than turning a
+                failure into feedback
         """
+        # Create evaluation prompt
+        evaluation_prompt = self._create_evaluation_prompt(
+            source_text, translated_text, source_lang, target_lang, reference_text
+        )
+
+        # Get LLM response using the model directly
+        response = await self.llm_service.model.generate_content_async(
+            evaluation_prompt, generation_config=self.llm_service.generation_config
+        )
+
+        if not response.text:
+            raise ValueError("LLM returned empty response")
+
+        llm_response = response.text.strip()
+
+        logger.debug("LLM response: %r", excerpt(llm_response))
+
+        # Clean up the response - remove markdown code blocks if present
+        cleaned_response = llm_response
+        if "```json" in llm_response:
+            # Extract JSON from markdown code blocks
+            start = llm_response.find("```json") + 7
+            end = llm_response.find("```", start)
+            if end != -1:
+                cleaned_response = llm_response[start:end].strip()
+        elif "```" in llm_response:
+            # Handle generic code blocks
+            start = llm_response.find("```") + 3
+            end = llm_response.find("```", start)
+            if end != -1:
+                cleaned_response = llm_response[start:end].strip()
+
         try:
-            # Create evaluation prompt
-            evaluation_prompt = self._create_evaluation_prompt(
-                source_text, translated_text, source_lang, target_lang, reference_text
-            )
+            feedback_data = json.loads(cleaned_response)
+        except json.JSONDecodeError as e:
+            raise ValueError(
+                f"LLM response is not valid JSON ({e}): {str(excerpt(cleaned_response))!r}"
+            ) from e
+
+        # Remove numerical scores from the response if they exist
+        feedback_data.pop("fluency_score", None)
+        feedback_data.pop("accuracy_score", None)
+        feedback_data.pop("style_score", None)
+        feedback_data.pop("overall_score", None)
+
+        return feedback_data
+
+    async def _get_llm_feedback_batch(
+        self,
+        segments: list[dict[str, Any]],
+        source_lang: str,
+        target_lang: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Get LLM feedback for many translations with few LLM requests.
 
-            logger.info("Sending evaluation request to LLM...")
-            logger.info(f"Prompt length: {len(evaluation_prompt)}")
+        Segments are packed into as few requests as the token budget allows
+        (see ``_plan_judge_batches``); each request asks for a JSON response
+        constrained by ``JUDGE_RESPONSE_SCHEMA`` and results are mapped back to
+        segments by id. Segments whose feedback is missing or malformed get
+        fallback feedback; the others keep theirs.
 
-            # Get LLM response using the model directly
-            response = self.llm_service.model.generate_content(
-                evaluation_prompt, generation_config=self.llm_service.generation_config
+        Args:
+            segments: Dictionaries with source_text, translated_text and
+                optional reference_text
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            Feedback dictionary of each segment, in order
+        """
+        batches = self._plan_judge_batches(segments)
+        logger.info(
+            "Requesting LLM feedback for %s segments in %s requests",
+            len(segments),
+            len(batches),
+        )
+        results = await asyncio.gather(
+            *(
+                self._judge_batch(
+                    [segments[i] for i in batch], source_lang, target_lang
+                )
+                for batch in batches
             )
+        )
+        feedback: list[dict[str, Any]] = [{}] * len(segments)
+        for batch, batch_feedback in zip(batches, results, strict=True):
+            for index, item in zip(batch, batch_feedback, strict=True):
+                feedback[index] = item
+        return feedback
+
+    def _plan_judge_batches(self, segments: list[dict[str, Any]]) -> list[list[int]]:
+        """
+        Group segment indices into LLM requests that fit the token budget.
 
+        A request takes segments until their estimated prompt tokens would
+        exceed the input budget or their expected feedback would exceed the
+        output token limit; a segment too large for any budget gets a request
+        of its own.
+        """
+        max_items = max(
+            1,
+            self.judge_generation_config.max_output_tokens
+            // self.judge_output_tokens_per_item,
+        )
+        input_budget = self.judge_input_token_budget - JUDGE_PROMPT_OVERHEAD_TOKENS
+        batches: list[list[int]] = []
+        current: list[int] = []
+        current_tokens = 0
+        for index, segment in enumerate(segments):
+            characters = sum(
+                len(segment.get(field) or "")
+                for field in ("source_text", "translated_text", "reference_text")
+            )
+            tokens = characters // CHARS_PER_TOKEN + 20
+            if current and (
+                current_tokens + tokens > input_budget or len(current) >= max_items
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _judge_batch(
+        self,
+        segments: list[dict[str, Any]],
+        source_lang: str,
+        target_lang: str,
+    ) -> list[dict[str, Any]]:
+        """Send one batched judge request and parse its per-segment feedback."""
+        prompt = self._create_batch_evaluation_prompt(
+            segments, source_lang, target_lang
+        )
+        try:
+            async with self._judge_semaphore:
+                with track_stage(
+                    "llm_judge", **stage_labels(None, source_lang, target_lang)
+                ):
+                    response = await self.llm_service.model.generate_content_async(
+                        prompt, generation_config=self.judge_generation_config
+                    )
             if not response.text:
                 raise Exception("LLM returned empty response")
+        except Exception as e:
+            logger.error("Error getting batched LLM feedback: %s", e, exc_info=True)
+            return [self._create_error_feedback(str(e)) for _ in segments]
 
-            llm_response = response.text.strip()
+        return self._parse_judge_response(response.text, len(segments))
 
-            logger.info(f"LLM response received (length: {len(llm_response)})")
-            logger.info(f"LLM response preview: {llm_response[:200]}...")
+    def _parse_judge_response(
+        self, raw_response: str, count: int
+    ) -> list[dict[str, Any]]:
+        """
+        Map a batched judge response back to its ``count`` segments by id.
 
-            # Parse JSON response
-            cleaned_response = llm_response  # Initialize here to avoid scope issues
+        Segments without a valid evaluation get ``_create_fallback_feedback``
+        for their own entry (or the whole response if they have none).
+        """
+        try:
+            evaluations = json.loads(raw_response)["evaluations"]
+            if not isinstance(evaluations, list):
+                raise TypeError("evaluations is not a list")
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error("Failed to parse batched LLM response: %s", e)
+            return [self._create_fallback_feedback(raw_response) for _ in range(count)]
+
+        by_id: dict[str, Any] = {}
+        for evaluation in evaluations:
+            if isinstance(evaluation, dict):
+                by_id.setdefault(str(evaluation.get("id")), evaluation)
+
+        feedback = []
+        for item_id in range(count):
+            evaluation = by_id.get(str(item_id))
             try:
-                # Clean up the response - remove markdown code blocks if present
-                if "```json" in llm_response:
-                    # Extract JSON from markdown code blocks
-                    start = llm_response.find("```json") + 7
-                    end = llm_response.find("```", start)
-                    if end != -1:
-                        cleaned_response = llm_response[start:end].strip()
-                elif "```" in llm_response:
-                    # Handle generic code blocks
-                    start = llm_response.find("```") + 3
-                    end = llm_response.find("```", start)
-                    if end != -1:
-                        cleaned_response = llm_response[start:end].strip()
-
-                logger.info(f"Cleaned response: {cleaned_response[:200]}...")
-                feedback_data = json.loads(cleaned_response)
-                logger.info("Successfully parsed LLM feedback JSON")
-
-                # Remove numerical scores from the response if they exist
-                feedback_data.pop("fluency_score", None)
-                feedback_data.pop("accuracy_score", None)
-                feedback_data.pop("style_score", None)
-                feedback_data.pop("overall_score", None)
-
-                return feedback_data
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse LLM response as JSON: {e}")
-                logger.error(f"Raw response: {llm_response}")
-                try:
-                    logger.error(f"Cleaned response: {cleaned_response}")
-                except NameError:
-                    logger.error("Cleaned response variable not available")
-                # Return fallback feedback
-                return self._create_fallback_feedback(llm_response)
+                feedback.append(LLMFeedback.model_validate(evaluation).model_dump())
+            except ValidationError:
+                logger.warning("Invalid LLM feedback for batch item %s", item_id)
+                raw_item = (
+                    raw_response if evaluation is None else json.dumps(evaluation)
+                )
+                feedback.append(self._create_fallback_feedback(raw_item))
+        return feedback
 
-        except Exception as e:
-            logger.error(f"Error getting LLM feedback: {e}", exc_info=True)
-            return self._create_error_feedback(str(e))
+    def _create_batch_evaluation_prompt(
+        self,
+        segments: list[dict[str, Any]],
+        source_lang: str,
+        target_lang: str,
+    ) -> str:
+        """Create a prompt asking for feedback on several translations at once."""
+        items = [
+            {
+                "id": str(item_id),
+                "source": segment["source_text"],
+                "translation": segment["translated_text"],
+                **(
+                    {"reference": segment["reference_text"]}
+                    if segment.get("reference_text")
+                    else {}
+                ),
+            }
+            for item_id, segment in enumerate(segments)
+        ]
+
+        return f"""Please evaluate each of the following translations from {source_lang} to {target_lang} and provide qualitative feedback.
+
+Analyze each translation considering:
+1. **Fluency**: How natural and well-flowing is the translation in the target language?
+2. **Accuracy**: How well does the translation convey the meaning of the source text?
+3. **Style**: How appropriate is the style and register for the context?
+4. **Terminology**: Are technical terms and specialized vocabulary handled correctly?
+
+Translations (JSON, one object per item; "reference" is an optional reference translation):
+{json.dumps(items, ensure_ascii=False)}
+
+Return one evaluation per item in "evaluations", with the item's "id" unchanged, lists of
+"strengths", "weaknesses", "suggestions", "specific_comments" (objects with "part" and
+"comment") and a 1-2 sentence "summary". Be constructive and specific; keep each evaluation brief."""
 
     def _create_evaluation_prompt(
         self,
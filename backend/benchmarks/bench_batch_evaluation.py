@@ -0,0 +1,95 @@
+"""
+Benchmark corpus-level batch evaluation.
+Run with: python -m benchmarks.bench_batch_evaluation [--segments 10000] [--workers N]
+
+Compares scoring segments one by one with ``sacrebleu.sentence_*`` plus three
+``corpus_*`` passes (what evaluating segment by segment costs) with
+``TranslationEvaluationService.evaluate_batch``, which derives sentence and
+corpus scores from one pass of sufficient statistics in worker processes.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+import sacrebleu
+
+from app.services.cpu_executor import CPUExecutor
+from app.services.translation_evaluation_service import TranslationEvaluationService
+
+WORDS = (
+    "the a project key translation file language review save open close user "
+    "account settings button click error message download upload glossary term "
+    "please your our new old update delete create value name team"
+).split()
+
+
+def make_pair(rng: random.Random) -> tuple[str, str]:
+    reference = rng.choices(WORDS, k=rng.randint(5, 30))
+    hypothesis = [
+        word if rng.random() < 0.8 else rng.choice(WORDS) for word in reference
+    ]
+    if rng.random() < 0.3:
+        del hypothesis[rng.randrange(len(hypothesis))]
+    return " ".join(hypothesis).capitalize() + ".", " ".join(
+        reference
+    ).capitalize() + "."
+
+
+def sequential(hypotheses: list[str], references: list[str]) -> dict[str, float]:
+    for hyp, ref in zip(hypotheses, references, strict=True):
+        sacrebleu.sentence_bleu(hyp, [ref])
+        sacrebleu.sentence_chrf(hyp, [ref])
+        sacrebleu.sentence_ter(hyp, [ref])
+    return {
+        "bleu": round(sacrebleu.corpus_bleu(hypotheses, [references]).score, 2),
+        "chrf": round(sacrebleu.corpus_chrf(hypotheses, [references]).score, 2),
+        "ter": round(sacrebleu.corpus_ter(hypotheses, [references]).score, 2),
+    }
+
+
+async def batched(
+    service: TranslationEvaluationService,
+    hypotheses: list[str],
+    references: list[str],
+) -> dict:
+    corpus = {}
+    async for result in service.evaluate_batch(hypotheses, references):
+        corpus = result
+    return corpus
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--segments", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    hypotheses, references = zip(
+        *(make_pair(rng) for _ in range(args.segments)), strict=True
+    )
+    hypotheses, references = list(hypotheses), list(references)
+    print(f"{args.segments} segments, {os.cpu_count()} CPUs\n")
+
+    started = time.perf_counter()
+    expected = sequential(hypotheses, references)
+    print(f"{'sequential sacrebleu':<24} {time.perf_counter() - started:8.2f} s")
+
+    service = TranslationEvaluationService()
+    service.executor = CPUExecutor("process", max_workers=args.workers)
+    # Spawn the workers before timing
+    service.executor.pool.submit(int).result()
+    started = time.perf_counter()
+    corpus = asyncio.run(batched(service, hypotheses, references))
+    label = f"evaluate_batch ({service.executor.pool._max_workers}w)"
+    print(f"{label:<24} {time.perf_counter() - started:8.2f} s")
+
+    assert {name: corpus[name] for name in expected} == expected, "Scores differ"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark the project-wide glossary compliance scan.
+Run with: python -m benchmarks.bench_glossary_scan [--keys 100000] [--languages 10]
+
+Builds a synthetic project in a temporary key mirror and compares matching
+source texts with one word-boundary regex per term (what
+``find_terms_in_text`` does, timed on a sample of keys and extrapolated) with
+``GlossaryScanService.scan_project``, which matches all terms with one
+automaton and checks every target language in worker processes.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import re
+import tempfile
+import time
+
+from app.schemas.lokalise.glossary import GlossaryTerm
+from app.services.cpu_executor import CPUExecutor
+from app.services.glossary_scan import GlossaryScanService
+from app.services.key_mirror import KeyMirrorService
+from app.services.lokalise.glossary import lokalise_glossary_service
+
+WORDS = (
+    "the a project key translation file language review save open close user "
+    "account settings button click error message download upload glossary term "
+    "please your our new old update delete create value name team"
+).split()
+# Sample of keys the per-term regex baseline is timed on
+BASELINE_SAMPLE = 1000
+
+
+def make_terms(rng: random.Random, count: int) -> list[str]:
+    terms = {f"{rng.choice(WORDS)}{i}" for i in range(count - len(WORDS))}
+    return sorted(terms | set(WORDS))
+
+
+def make_text(rng: random.Random, terms: list[str]) -> str:
+    words = rng.choices(WORDS, k=rng.randint(5, 20))
+    words.insert(rng.randrange(len(words)), rng.choice(terms))
+    return " ".join(words).capitalize() + "."
+
+
+def make_key(key_id: int, texts: dict[str, str]) -> dict:
+    return {
+        "key_id": key_id,
+        "key_name": {"web": f"key_{key_id}"},
+        "is_archived": False,
+        "translations": [
+            {
+                "translation_id": key_id * 100 + i,
+                "language_iso": iso,
+                "translation": text,
+            }
+            for i, (iso, text) in enumerate(texts.items())
+        ],
+    }
+
+
+def regex_baseline(terms: list[str], texts: list[str]) -> float:
+    started = time.perf_counter()
+    for text in texts:
+        for term in terms:
+            list(re.compile(rf"\b{re.escape(term)}\b", re.IGNORECASE).finditer(text))
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--languages", type=int, default=10)
+    parser.add_argument("--terms", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    languages = [f"l{i}" for i in range(args.languages)]
+    terms = make_terms(rng, args.terms)
+    glossary = [
+        GlossaryTerm(
+            id=i,
+            term=term,
+            description="",
+            project_id="bench",
+            translatable=i % 5 != 0,
+            translations=[
+                {"lang_id": j, "lang_iso": iso, "translation": f"{term}_{iso}"}
+                for j, iso in enumerate(languages)
+            ],
+        )
+        for i, term in enumerate(terms)
+    ]
+    print(
+        f"{args.keys} keys x {args.languages} languages, {len(terms)} terms, "
+        f"{os.cpu_count()} CPUs\n"
+    )
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        mirror = KeyMirrorService(data_dir)
+        store = mirror.get_store("bench")
+        store.replace_languages(
+            [
+                {"lang_id": i, "lang_iso": iso}
+                for i, iso in enumerate(["en", *languages])
+            ]
+        )
+        sources = []
+        for start in range(1, args.keys + 1, 5000):
+            keys = []
+            for key_id in range(start, min(start + 5000, args.keys + 1)):
+                source = make_text(rng, terms)
+                sources.append(source)
+                keys.append(
+                    make_key(key_id, {"en": source} | dict.fromkeys(languages, source))
+                )
+            store.upsert_keys(keys)
+        store.mark_synced(full=True)
+
+        sample = sources[:BASELINE_SAMPLE]
+        elapsed = regex_baseline(terms, sample) * args.keys / len(sample)
+        print(f"{'regex per term (est.)':<24} {elapsed:8.2f} s  (source matching only)")
+
+        async def fake_terms(project_id: str) -> list[GlossaryTerm]:
+            return glossary
+
+        lokalise_glossary_service.get_all_glossary_terms = fake_terms
+        executor = CPUExecutor("process", max_workers=args.workers)
+        # Spawn the workers before timing
+        executor.pool.submit(int).result()
+        service = GlossaryScanService(
+            mirror, executor, chunk_size=2000, sample_limit=20
+        )
+        started = time.perf_counter()
+        report = asyncio.run(service.scan_project("bench", "en"))
+        label = f"scan_project ({executor.pool._max_workers}w)"
+        print(f"{label:<24} {time.perf_counter() - started:8.2f} s  (all languages)")
+        executor.shutdown()
+        store.close()
+
+    assert report["keys_scanned"] == args.keys, "Not every key was scanned"
+
+
+if __name__ == "__main__":
+    main()
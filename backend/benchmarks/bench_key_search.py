@@ -0,0 +1,125 @@
+"""
+Benchmark full-text search over a synthetic key mirror.
+Run with: python -m benchmarks.bench_key_search [--keys 100000] [--languages 10]
+"""
+
+import argparse
+import itertools
+import random
+import statistics
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from app.services.key_mirror import KeyMirrorStore, build_match_query
+
+COMMON_WORDS = (
+    "account settings password welcome login logout profile payment invoice "
+    "order cart checkout shipping address delivery error warning success "
+    "confirm cancel delete save upload download search filter language "
+    "notification message inbox subscription trial premium support help"
+).split()
+LANGUAGES = ["en", "fr", "de", "es", "it", "pt", "nl", "sv", "pl", "ja", "ko", "zh"]
+QUERIES = ["welcome", "pass", "checkout error", "ship addr", "premium trial support"]
+BATCH_SIZE = 5000
+
+
+class Vocabulary:
+    """Pseudo-words drawn with a Zipf-like frequency distribution."""
+
+    def __init__(self, rng: random.Random, common: list[str], size: int = 20_000):
+        tail = {
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+            for _ in range(size - len(common))
+        }
+        self.words = common + sorted(tail)
+        self.cum_weights = list(
+            itertools.accumulate(1 / (rank + 10) for rank in range(len(self.words)))
+        )
+        self.rng = rng
+
+    def sample(self, count: int) -> list[str]:
+        return self.rng.choices(self.words, cum_weights=self.cum_weights, k=count)
+
+
+def build_keys(
+    first_key_id: int,
+    count: int,
+    vocabularies: dict[str, Vocabulary],
+) -> list[dict]:
+    source = vocabularies["en"]
+    keys = []
+    for key_id in range(first_key_id, first_key_id + count):
+        name = ".".join(source.sample(3)) + f".{key_id}"
+        keys.append(
+            {
+                "key_id": key_id,
+                "key_name": {"ios": name, "android": name, "web": name, "other": name},
+                "filenames": {"ios": "", "android": "", "web": "", "other": ""},
+                "description": " ".join(source.sample(6)),
+                "platforms": ["web"],
+                "tags": [],
+                "modified_at_timestamp": 0,
+                "translations_modified_at_timestamp": 0,
+                "translations": [
+                    {
+                        "translation_id": key_id * 100 + i,
+                        "key_id": key_id,
+                        "language_iso": iso,
+                        "translation": " ".join(vocabulary.sample(8)),
+                        "is_reviewed": False,
+                        "is_unverified": False,
+                        "task_id": None,
+                    }
+                    for i, (iso, vocabulary) in enumerate(vocabularies.items())
+                ],
+            }
+        )
+    return keys
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--languages", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    languages = LANGUAGES[: args.languages]
+    # Every language gets its own vocabulary; common UI words are English
+    vocabularies = {
+        iso: Vocabulary(rng, COMMON_WORDS if iso == "en" else []) for iso in languages
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = KeyMirrorStore(Path(tmp) / "bench.sqlite3")
+        started = time.perf_counter()
+        for first in range(1, args.keys + 1, BATCH_SIZE):
+            count = min(BATCH_SIZE, args.keys + 1 - first)
+            store.upsert_keys(build_keys(first, count, vocabularies))
+        print(
+            f"Loaded {args.keys} keys x {len(languages)} languages "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+
+        for query in QUERIES:
+            for label, isos in (("all languages", None), ("en only", ["en"])):
+                timings = []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    _, total = store.search(
+                        build_match_query(query), language_isos=isos, limit=20
+                    )
+                    timings.append((time.perf_counter() - started) * 1000)
+                print(
+                    f"{query!r:24} {label:14} {total:>7} hits  "
+                    f"median {statistics.median(timings):7.1f} ms  "
+                    f"max {max(timings):7.1f} ms"
+                )
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
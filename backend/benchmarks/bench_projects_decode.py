@@ -0,0 +1,157 @@
+"""
+Benchmark decoding, validating and serving a large Lokalise projects response.
+Run with: python -m benchmarks.bench_projects_decode [--projects 5000] [--rounds 5]
+
+Compares the previous path (``json.loads`` + ``model_validate`` + FastAPI
+response_model validation and encoding) with the single-pass path
+(``validate_json`` + ``ModelResponse``).
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.serialization import ModelResponse, get_type_adapter, validate_json
+from app.schemas.lokalise.projects import ProjectsResponse
+
+LANGUAGES = ["en", "fr", "de", "es", "it", "pt", "nl", "sv", "pl", "ja", "ko", "zh"]
+QA_ISSUE_FIELDS = [
+    "not_reviewed",
+    "unverified",
+    "spelling_grammar",
+    "inconsistent_placeholders",
+    "inconsistent_html",
+    "different_number_of_urls",
+    "different_urls",
+    "leading_whitespace",
+    "trailing_whitespace",
+    "different_number_of_email_address",
+    "different_email_address",
+    "different_brackets",
+    "different_numbers",
+    "double_space",
+    "special_placeholder",
+    "unbalanced_brackets",
+]
+SETTING_FIELDS = [
+    "per_platform_key_names",
+    "reviewing",
+    "auto_toggle_unverified",
+    "offline_translation",
+    "key_editing",
+    "inline_machine_translations",
+    "branching",
+    "segmentation",
+    "custom_translation_statuses",
+    "custom_translation_statuses_allow_multiple",
+    "contributor_preview_download_enabled",
+]
+
+
+def make_project(rng: random.Random, index: int) -> dict:
+    languages = rng.sample(LANGUAGES, rng.randint(2, len(LANGUAGES)))
+    return {
+        "project_id": f"{rng.randrange(10**9)}.{index:08d}",
+        "project_type": "localization_files",
+        "name": f"Project {index}",
+        "description": f"Synthetic project number {index}",
+        "created_at": "2024-01-01 00:00:00 (Etc/UTC)",
+        "created_at_timestamp": 1704067200 + index,
+        "created_by": rng.randrange(10**6),
+        "created_by_email": f"user{index}@example.com",
+        "team_id": rng.randrange(10**5),
+        "team_uuid": f"team-{index}",
+        "base_project_language_id": rng.randrange(10**6),
+        "base_project_language_uuid": f"lang-{index}",
+        "base_language_id": 640,
+        "base_language_iso": "en",
+        "uuid": f"uuid-{index}",
+        "settings": {field: rng.random() < 0.5 for field in SETTING_FIELDS},
+        "statistics": {
+            "progress_total": rng.randint(0, 100),
+            "keys_total": rng.randrange(10**5),
+            "team": rng.randint(1, 50),
+            "base_words": rng.randrange(10**6),
+            "qa_issues_total": rng.randrange(1000),
+            "qa_issues": {field: rng.randrange(100) for field in QA_ISSUE_FIELDS},
+            "languages": [
+                {
+                    "language_id": position,
+                    "project_language_id": rng.randrange(10**6),
+                    "project_language_uuid": f"pl-{index}-{iso}",
+                    "language_iso": iso,
+                    "progress": rng.randint(0, 100),
+                    "words_to_do": rng.randrange(10**5),
+                }
+                for position, iso in enumerate(languages)
+            ],
+        },
+    }
+
+
+def time_call(function: Callable[[], object], rounds: int) -> float:
+    """Median wall time of ``function`` in milliseconds."""
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    raw = json.dumps(
+        {"projects": [make_project(rng, i) for i in range(args.projects)]}
+    ).encode()
+    print(f"{args.projects} projects, {len(raw) / 1024 / 1024:.1f} MiB of JSON\n")
+
+    adapter = get_type_adapter(ProjectsResponse)
+    model = adapter.validate_json(raw)
+    stages = {
+        "decode json.loads": lambda: json.loads(raw),
+        "decode + validate (dict)": lambda: ProjectsResponse.model_validate(
+            json.loads(raw)
+        ),
+        "decode + validate (bytes)": lambda: adapter.validate_json(raw),
+        "validate_json (GC paused)": lambda: validate_json(ProjectsResponse, raw),
+        "encode ModelResponse": lambda: ModelResponse(model).body,
+    }
+    for label, function in stages.items():
+        print(f"{label:<28} {time_call(function, args.rounds):8.1f} ms")
+
+    app = FastAPI()
+
+    @app.get("/previous", response_model=ProjectsResponse)
+    def previous():
+        return ProjectsResponse.model_validate(json.loads(raw))
+
+    @app.get("/single-pass", response_model=ProjectsResponse)
+    def single_pass():
+        return ModelResponse(validate_json(ProjectsResponse, raw))
+
+    client = TestClient(app)
+    bodies = {}
+    print()
+    for path in ("/previous", "/single-pass"):
+        bodies[path] = json.loads(client.get(path).content)
+        elapsed = time_call(lambda path=path: client.get(path), args.rounds)
+        print(f"GET {path:<24} {elapsed:8.1f} ms")
+
+    assert bodies["/previous"] == bodies["/single-pass"], "Responses differ"
+
+
+if __name__ == "__main__":
+    main()
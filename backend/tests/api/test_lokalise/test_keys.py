@@ -5,6 +5,8 @@ Run with: pytest tests/api/test_lokalise/test_keys.py -v
 
 import pytest
 
+from ...utils.test_parity import manual_comparison, tester
+
 
 class TestKeysAPI:
     """Test suite for Lokalise keys API endpoints."""
@@ -12,9 +14,23 @@ class TestKeysAPI:
     @pytest.mark.asyncio
     @pytest.mark.lokalise
     async def test_project_keys_list(self):
-        """Test project keys list endpoint."""
-        # TODO: Implement when keys endpoint is ready
-        pytest.skip("Keys endpoint not yet implemented")
+        """Test project keys list endpoint (served from the local mirror)."""
+        projects_data = await tester.call_lokalise_api("projects", {"limit": 1})
+
+        if not projects_data.get("projects"):
+            pytest.skip("No projects available for testing")
+
+        project_id = projects_data["projects"][0]["project_id"]
+
+        result = await manual_comparison(
+            lokalise_endpoint=f"projects/{project_id}/keys",
+            our_endpoint=f"api/v1/lokalise/projects/{project_id}/keys",
+            params={"limit": 5, "include_translations": 1},
+        )
+
+        assert result["matches"], (
+            f"Keys list endpoint mismatch: {result['differences']}"
+        )
 
     @pytest.mark.asyncio
     @pytest.mark.lokalise
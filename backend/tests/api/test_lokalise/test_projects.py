@@ -177,25 +177,6 @@ class TestProjectCRUDOperations:
 class TestFutureEndpoints:
     """Test suite for endpoints that will be implemented in the future."""
 
-    @pytest.mark.asyncio
-    async def test_project_keys_not_implemented(self):
-        """Test that project keys endpoint is not yet implemented."""
-        # Get a project ID first
-        projects_data = await tester.call_lokalise_api("projects", {"limit": 1})
-
-        if not projects_data.get("projects"):
-            pytest.skip("No projects available for testing")
-
-        project_id = projects_data["projects"][0]["project_id"]
-
-        # This should fail until you implement the keys endpoint
-        with pytest.raises(AssertionError, match="501"):
-            await manual_comparison(
-                lokalise_endpoint=f"projects/{project_id}/keys",
-                our_endpoint=f"api/v1/lokalise/projects/{project_id}/keys",
-                params={"limit": 5},
-            )
-
     @pytest.mark.asyncio
     async def test_project_languages_not_implemented(self):
         """Test that project languages endpoint is not yet implemented."""
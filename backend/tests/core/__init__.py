@@ -0,0 +1,3 @@
+"""
+Unit tests for the core modules of the Lokalize AI Translator backend.
+"""
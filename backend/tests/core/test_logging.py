@@ -0,0 +1,109 @@
+"""
+Pytest tests for the queued, structured logging pipeline.
+Run with: pytest tests/core/test_logging.py -v
+"""
+
+import json
+import logging
+
+import pytest
+
+from app.core import logging as logging_module
+from app.core.logging import JsonFormatter, SamplingFilter, excerpt
+
+
+def make_record(msg="message %s", args=("arg",), level=logging.DEBUG, lineno=1):
+    return logging.LogRecord("app.test", level, "test.py", lineno, msg, args, None)
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    """Log to a temporary directory, restoring the configuration afterwards."""
+    monkeypatch.setattr(logging_module, "logs_dir", tmp_path)
+    yield tmp_path
+    monkeypatch.undo()
+    logging_module.configure_logging()
+
+
+@pytest.mark.unit
+class TestLogging:
+    """Test suite for log formatting, sampling and the background writer."""
+
+    def test_json_format(self):
+        """Records become JSON objects with their extra fields."""
+        record = make_record(level=logging.INFO)
+        record.project_id = "p"
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        assert entry["message"] == "message arg"
+        assert (entry["level"], entry["logger"]) == ("INFO", "app.test")
+        assert entry["project_id"] == "p"
+
+    def test_sampling(self):
+        """Debug records are limited per call site; other levels always pass."""
+        sampler = SamplingFilter(limit=2, interval_seconds=60)
+
+        kept = [sampler.filter(make_record()) for _ in range(5)]
+        other_site = sampler.filter(make_record(lineno=2))
+        info = sampler.filter(make_record(level=logging.INFO))
+
+        assert kept == [True, True, False, False, False]
+        assert other_site and info
+
+    def test_sampling_reports_dropped(self):
+        """The first record of a new interval counts the dropped ones."""
+        sampler = SamplingFilter(limit=1, interval_seconds=0)
+        sampler.interval_seconds = 60
+        sampler.filter(make_record())
+        sampler.filter(make_record())
+        sampler.interval_seconds = 0
+
+        record = make_record()
+        assert sampler.filter(record)
+        assert record.sampled_out == 1
+
+    def test_excerpt(self, monkeypatch):
+        """Texts are cut to the configured length, or hidden."""
+        monkeypatch.setattr(logging_module, "_text_max_chars", 5)
+
+        assert str(excerpt("short")) == "short"
+        assert str(excerpt("a longer text")) == "a lon… (+8 chars)"
+
+        monkeypatch.setattr(logging_module, "_redact_text", True)
+        assert str(excerpt("secret")) == "<6 chars>"
+
+    def test_writes_in_background(self, log_dir):
+        """Records reach the log file once the listener has drained the queue."""
+        logger = logging_module.setup_logging(
+            "INFO",
+            "test.log",
+            module_levels={"app.test.quiet": "WARNING"},
+        )
+        logging.getLogger("app.test").info("kept %d", 1, extra={"stage": "x"})
+        logging.getLogger("app.test.quiet").info("filtered")
+        logging_module.shutdown_logging()
+
+        lines = (log_dir / "test.log").read_text().splitlines()
+        entries = [json.loads(line) for line in lines]
+        assert [(e["message"], e["stage"]) for e in entries] == [("kept 1", "x")]
+        assert len(logger.handlers) == 1
+
+    def test_arguments_are_rendered_when_queued(self, log_dir):
+        """Arguments changed after the call are logged as they were."""
+        logging_module.setup_logging("INFO", "test.log")
+        stages = ["metric_scores"]
+        logger = logging.getLogger("app.test")
+        logger.info("incomplete: %s", stages)
+        stages.append("llm_feedback")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        logging_module.shutdown_logging()
+
+        lines = (log_dir / "test.log").read_text().splitlines()
+        first, second = (json.loads(line) for line in lines)
+        assert first["message"] == "incomplete: ['metric_scores']"
+        assert second["message"] == "failed"
+        assert "ValueError: boom" in second["exception"]
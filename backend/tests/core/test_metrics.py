@@ -0,0 +1,79 @@
+"""
+Pytest tests for the Prometheus metrics registry and endpoint.
+Run with: pytest tests/core/test_metrics.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.metrics import MetricsRegistry, stage_duration_seconds, timed, track_stage
+from app.services.lokalise.base import _endpoint_label
+
+
+@pytest.mark.unit
+class TestMetrics:
+    """Test suite for recording and rendering metrics."""
+
+    def test_histogram_rendering(self):
+        """Histograms render cumulative buckets, sum and count per label set."""
+        registry = MetricsRegistry(max_series=10)
+        histogram = registry.histogram(
+            "stage_seconds", "Stage duration.", ("stage",), buckets=(0.1, 1.0)
+        )
+        histogram.observe(0.05, stage="a")
+        histogram.observe(0.5, stage="a")
+        histogram.observe(5, stage="a")
+
+        lines = registry.render().splitlines()
+
+        assert "# TYPE stage_seconds histogram" in lines
+        assert 'stage_seconds_bucket{stage="a",le="0.1"} 1' in lines
+        assert 'stage_seconds_bucket{stage="a",le="1.0"} 2' in lines
+        assert 'stage_seconds_bucket{stage="a",le="+Inf"} 3' in lines
+        assert 'stage_seconds_count{stage="a"} 3' in lines
+
+    def test_series_cap(self):
+        """Label sets beyond the cap are counted under "other"."""
+        registry = MetricsRegistry(max_series=2)
+        counter = registry.counter("calls_total", "Calls.", ("project",))
+        for project in ["a", "b", "c", "d", "a"]:
+            counter.inc(project=project)
+
+        assert counter.value(project="a") == 2
+        assert counter.value(project="other") == 2
+
+    def test_track_stage(self):
+        """Stages are timed whether they succeed or fail."""
+        labels = {"project": "metrics-test", "lang_pair": "en-fr"}
+
+        async def fail():
+            raise ValueError
+
+        asyncio.run(timed(asyncio.sleep(0), "unit_stage", **labels))
+        with pytest.raises(ValueError):
+            asyncio.run(timed(fail(), "unit_stage", **labels))
+        with track_stage("unit_stage", **labels):
+            pass
+
+        assert stage_duration_seconds.count(stage="unit_stage", **labels) == 3
+
+    def test_endpoint_label(self):
+        """IDs are dropped from Lokalise endpoint labels."""
+        label = _endpoint_label("/projects/123abc.456/glossary-terms/789")
+
+        assert label == "projects/{id}/glossary-terms/{id}"
+
+    def test_metrics_endpoint(self, test_client):
+        """The endpoint exposes stage histograms and service counters."""
+        response = test_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        for name in [
+            "pipeline_stage_duration_seconds",
+            "evaluation_cache_hits_total",
+            "lokalise_rate_limiter_queue_depth",
+            "lokalise_retries_total",
+        ]:
+            assert f"# TYPE {name} " in response.text
@@ -0,0 +1,118 @@
+"""
+Pytest tests for on-demand request profiling.
+Run with: pytest tests/core/test_profiling.py -v
+"""
+
+import pstats
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.profiling import ProfilingMiddleware, RequestProfiler, StackSampler
+
+TOKEN = "profiling-secret"
+
+
+def busy_wait(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@pytest.fixture
+def profiled_app(tmp_path):
+    """App with a blocking endpoint behind the profiling middleware."""
+    profiler = RequestProfiler(tmp_path, TOKEN, sample_interval_seconds=0.002, keep=2)
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, profiler=profiler)
+
+    @app.get("/slow")
+    async def slow():
+        busy_wait(0.1)
+        return {"ok": True}
+
+    return TestClient(app), profiler
+
+
+@pytest.mark.unit
+class TestProfiling:
+    """Test suite for request profiling and event loop lag measurement."""
+
+    def test_stack_sampler(self):
+        """Samples of a thread are collapsed into flamegraph stacks."""
+        sampler = StackSampler(threading.get_ident(), interval_seconds=0.001)
+        sampler.start()
+        busy_wait(0.05)
+        sampler.stop()
+
+        assert sampler.samples > 0
+        lines = sampler.collapsed().splitlines()
+        assert any("busy_wait (test_profiling.py:" in line for line in lines)
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert ";" in stack
+
+    def test_requests_without_header_pass_through(self, profiled_app):
+        """Requests that do not ask for a profile are not profiled."""
+        client, profiler = profiled_app
+
+        response = client.get("/slow")
+
+        assert response.status_code == 200  # noqa: PLR2004
+        assert "X-Profile-Id" not in response.headers
+        assert profiler.profiles() == []
+
+    def test_profiling_requires_token(self, profiled_app):
+        """Profiling without the right token is rejected."""
+        client, _ = profiled_app
+
+        response = client.get(
+            "/slow", headers={"X-Profile": "sample", "X-Profile-Token": "wrong"}
+        )
+        assert response.status_code == 403  # noqa: PLR2004
+        response = client.get(
+            "/slow", headers={"X-Profile": "gprof", "X-Profile-Token": TOKEN}
+        )
+        assert response.status_code == 400  # noqa: PLR2004
+
+    def test_sampled_profile(self, profiled_app):
+        """Sampled profiles are stored with the event loop blocking time."""
+        client, profiler = profiled_app
+
+        response = client.get(
+            "/slow", headers={"X-Profile": "sample", "X-Profile-Token": TOKEN}
+        )
+
+        profile = profiler.get(response.headers["X-Profile-Id"])
+        assert profile.status_code == 200  # noqa: PLR2004
+        assert profile.samples > 0
+        assert "busy_wait" in profile.file.read_text()
+        assert profile.loop_lag_max_ms >= 50  # noqa: PLR2004
+        assert profile.loop_blocks >= 1
+
+    def test_cprofile_profile(self, profiled_app):
+        """Deterministic profiles are stored as pstats files."""
+        client, profiler = profiled_app
+
+        response = client.get(
+            "/slow", headers={"X-Profile": "cprofile", "X-Profile-Token": TOKEN}
+        )
+
+        profile = profiler.get(response.headers["X-Profile-Id"])
+        stats = pstats.Stats(str(profile.file))
+        assert any(func[2] == "busy_wait" for func in stats.stats)
+
+    def test_old_profiles_are_removed(self, profiled_app):
+        """Only the latest profiles are kept."""
+        client, profiler = profiled_app
+        headers = {"X-Profile": "sample", "X-Profile-Token": TOKEN}
+        ids = [
+            client.get("/slow", headers=headers).headers["X-Profile-Id"]
+            for _ in range(3)
+        ]
+
+        assert [p.profile_id for p in profiler.profiles()] == ids[:0:-1]
+        assert not list(profiler.directory.glob(f"{ids[0]}.*"))
@@ -0,0 +1,154 @@
+"""
+Pytest tests for request tracing.
+Run with: pytest tests/core/test_tracing.py -v
+"""
+
+import asyncio
+import json
+import logging
+
+import pytest
+
+from app.core.config import get_settings
+from app.core.tracing import (
+    OTLPFileExporter,
+    TraceBuffer,
+    Tracer,
+    current_trace_id,
+    parse_traceparent,
+    tracer,
+)
+from app.services.job_runner import JobRunner
+
+
+@pytest.mark.unit
+class TestTracing:
+    """Test suite for spans, sampling, export and trace propagation."""
+
+    def test_nested_spans(self):
+        """Spans opened within a span share its trace and point at it."""
+        local = Tracer(sample_rate=1.0, buffer=TraceBuffer(max_traces=10))
+
+        with local.span("request") as root, local.span("stage", stage="a") as child:
+            assert current_trace_id() == root.trace_id
+
+        assert current_trace_id() is None
+        assert child.trace_id == root.trace_id
+        assert child.parent_id == root.span_id
+        assert child.attributes == {"stage": "a"}
+        spans = local.buffer.get(root.trace_id)
+        assert [span.name for span in spans] == ["request", "stage"]
+
+    def test_errors_and_sampling(self):
+        """Failing spans are marked; unsampled traces are not recorded."""
+        local = Tracer(sample_rate=1.0, buffer=TraceBuffer(max_traces=10))
+        with pytest.raises(ValueError), local.span("failing") as span:
+            raise ValueError("boom")
+        assert span.status == "error"
+        assert span.error == "ValueError: boom"
+
+        local.sample_rate = 0.0
+        with local.span("unsampled") as span:
+            pass
+        assert local.buffer.get(span.trace_id) is None
+
+    def test_buffer_keeps_latest_traces(self):
+        """The ring buffer drops the oldest traces first."""
+        local = Tracer(sample_rate=1.0, buffer=TraceBuffer(max_traces=2))
+        trace_ids = []
+        for name in ["a", "b", "c"]:
+            with local.span(name) as span:
+                trace_ids.append(span.trace_id)
+
+        assert local.buffer.get(trace_ids[0]) is None
+        recent = local.buffer.recent(10)
+        assert [spans[0].name for spans in recent] == ["c", "b"]
+
+    def test_otlp_export(self, tmp_path):
+        """Finished spans are written as OTLP/JSON export requests."""
+        exporter = OTLPFileExporter(tmp_path / "traces.jsonl", "test-service")
+        local = Tracer(sample_rate=1.0, buffer=TraceBuffer(10), exporter=exporter)
+        with local.span("request", retries=2):
+            pass
+        exporter.shutdown()
+
+        request = json.loads((tmp_path / "traces.jsonl").read_text())
+        resource_spans = request["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0]["value"] == {
+            "stringValue": "test-service"
+        }
+        (span,) = resource_spans["scopeSpans"][0]["spans"]
+        assert span["name"] == "request"
+        assert span["attributes"] == [{"key": "retries", "value": {"intValue": "2"}}]
+        assert span["status"] == {"code": 1}
+
+    def test_export_failure_is_logged(self, tmp_path, monkeypatch):
+        """Spans that cannot be written are reported through the app logger."""
+        warnings = []
+        monkeypatch.setattr(
+            logging.getLogger("app.core.tracing"),
+            "warning",
+            lambda msg, *args: warnings.append(msg % args),
+        )
+        # A directory cannot be opened for appending
+        exporter = OTLPFileExporter(tmp_path, "test-service")
+        local = Tracer(sample_rate=1.0, buffer=TraceBuffer(10), exporter=exporter)
+        with local.span("request"):
+            pass
+        exporter.shutdown()
+
+        (warning,) = warnings
+        assert warning.startswith("Could not export 1 spans")
+
+    def test_parse_traceparent(self):
+        """Valid W3C trace context headers are parsed, others ignored."""
+        header = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+        assert parse_traceparent(header) == (
+            "4bf92f3577b34da6a3ce929d0e0e4736",
+            "00f067aa0ba902b7",
+            True,
+        )
+        assert parse_traceparent("00-abc-def-01") is None
+        assert parse_traceparent(f"00-{'0' * 32}-00f067aa0ba902b7-01") is None
+
+    def test_request_trace(self, test_client, monkeypatch):
+        """Requests continue the caller's trace and return its id."""
+        monkeypatch.setattr(get_settings(), "TRACING_TOKEN", "tracing-secret")
+        headers = {"X-Trace-Token": "tracing-secret"}
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        response = test_client.get(
+            "/", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"}
+        )
+
+        assert response.headers["X-Trace-Id"] == trace_id
+        detail = test_client.get(f"/debug/traces/{trace_id}", headers=headers).json()
+        assert detail["name"] == "GET /"
+        assert detail["spans"][0]["attributes"]["http.status_code"] == 200
+        missing = test_client.get(f"/debug/traces/{'f' * 32}", headers=headers)
+        assert missing.status_code == 404
+
+    def test_trace_viewer_requires_token(self, test_client, monkeypatch):
+        """Traces are not served without the configured token."""
+        assert test_client.get("/debug/traces").status_code == 403
+
+        monkeypatch.setattr(get_settings(), "TRACING_TOKEN", "tracing-secret")
+        response = test_client.get("/debug/traces", headers={"X-Trace-Token": "wrong"})
+        assert response.status_code == 403
+
+    def test_job_continues_trace(self):
+        """Background jobs run in a span of the submitting trace."""
+        runner = JobRunner()
+
+        async def work(job):
+            return {"trace_id": current_trace_id()}
+
+        async def submit_and_wait():
+            with tracer.span("request") as span:
+                status = runner.submit("unit.test", work)
+            await asyncio.sleep(0)
+            return span, status, runner.get(status.job_id)
+
+        span, submitted, finished = asyncio.run(submit_and_wait())
+
+        assert submitted.trace_id == span.trace_id
+        assert finished.result == {"trace_id": span.trace_id}
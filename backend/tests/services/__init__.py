@@ -0,0 +1,3 @@
+"""
+Service-level unit tests for the Lokalize AI Translator backend.
+"""
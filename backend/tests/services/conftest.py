@@ -0,0 +1,59 @@
+"""
+Shared fixtures for the service tests.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def make_key():
+    """Builder of raw Lokalise key payloads."""
+
+    def build_key(key_id: int, name: str, translations: dict[str, str], **extra):
+        key = {
+            "key_id": key_id,
+            "created_at": "2024-01-01 00:00:00 (Etc/UTC)",
+            "created_at_timestamp": 1704067200,
+            "key_name": {"ios": name, "android": name, "web": name, "other": name},
+            "filenames": {"ios": "", "android": "", "web": "web.json", "other": ""},
+            "description": "",
+            "platforms": ["web"],
+            "tags": [],
+            "comments": [],
+            "screenshots": [],
+            "is_plural": False,
+            "plural_name": "",
+            "is_hidden": False,
+            "is_archived": False,
+            "context": "",
+            "base_words": 1,
+            "char_limit": 0,
+            "custom_attributes": "",
+            "modified_at": "2024-01-01 00:00:00 (Etc/UTC)",
+            "modified_at_timestamp": 1704067200,
+            "translations_modified_at": "2024-01-01 00:00:00 (Etc/UTC)",
+            "translations_modified_at_timestamp": 1704067200,
+            "translations": [
+                {
+                    "translation_id": key_id * 100 + i,
+                    "key_id": key_id,
+                    "language_iso": iso,
+                    "translation": text,
+                    "modified_by": 1,
+                    "modified_by_email": "user@example.com",
+                    "modified_at": "2024-01-01 00:00:00 (Etc/UTC)",
+                    "modified_at_timestamp": 1704067200,
+                    "is_reviewed": False,
+                    "is_unverified": False,
+                    "reviewed_by": None,
+                    "words": 1,
+                    "custom_translation_statuses": [],
+                    "task_id": None,
+                }
+                for i, (iso, text) in enumerate(translations.items())
+            ],
+        }
+        key.update(extra)
+        return key
+
+    return build_key
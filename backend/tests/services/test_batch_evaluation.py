@@ -0,0 +1,152 @@
+"""
+Pytest tests for corpus-level batch translation evaluation.
+Run with: pytest tests/services/test_batch_evaluation.py -v
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+import sacrebleu
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import translation_evaluation_service as evaluation_module
+from app.services.cpu_executor import CPUExecutor
+from app.services.evaluation_metrics import (
+    corpus_scores,
+    edit_distance,
+    merge_statistics,
+    score_segments,
+)
+from app.services.translation_evaluation_service import TranslationEvaluationService
+
+HYPOTHESES = [
+    "The cat sat on the mat.",
+    "Click the button to save your changes",
+    "",
+    "Der Bericht wurde gestern veröffentlicht.",
+]
+REFERENCES = [
+    "The cat is sitting on the mat.",
+    "Click the button to save the changes.",
+    "Nothing was translated.",
+    "Der Bericht wurde gestern veröffentlicht.",
+]
+
+
+@pytest.mark.unit
+class TestEvaluationMetrics:
+    """Test suite for sufficient-statistics metric computation."""
+
+    def test_segment_scores_match_sacrebleu(self):
+        """Per-segment scores equal sacrebleu's sentence-level scores."""
+        scores, _ = score_segments(HYPOTHESES, REFERENCES)
+
+        for score, hyp, ref in zip(scores, HYPOTHESES, REFERENCES, strict=True):
+            assert score["bleu"] == round(sacrebleu.sentence_bleu(hyp, [ref]).score, 2)
+            assert score["chrf"] == round(sacrebleu.sentence_chrf(hyp, [ref]).score, 2)
+            assert score["ter"] == round(sacrebleu.sentence_ter(hyp, [ref]).score, 2)
+
+    def test_edit_distances_match_pairwise(self):
+        """Batched edit distances, also against a shared reference, are exact."""
+        hypotheses = [*HYPOTHESES, *HYPOTHESES]
+        references = [*REFERENCES, *[REFERENCES[1]] * len(HYPOTHESES)]
+
+        scores, _ = score_segments(hypotheses, references)
+
+        assert [score["edit_distance"] for score in scores] == [
+            edit_distance(hyp, ref)
+            for hyp, ref in zip(hypotheses, references, strict=True)
+        ]
+
+    def test_chunked_corpus_scores_match_sacrebleu(self):
+        """Statistics merged across chunks give sacrebleu's corpus scores."""
+        totals = [
+            score_segments(HYPOTHESES[:1], REFERENCES[:1])[1],
+            score_segments(HYPOTHESES[1:], REFERENCES[1:])[1],
+        ]
+
+        scores = corpus_scores(merge_statistics(totals))
+
+        assert scores == {
+            "bleu": round(sacrebleu.corpus_bleu(HYPOTHESES, [REFERENCES]).score, 2),
+            "chrf": round(sacrebleu.corpus_chrf(HYPOTHESES, [REFERENCES]).score, 2),
+            "ter": round(sacrebleu.corpus_ter(HYPOTHESES, [REFERENCES]).score, 2),
+        }
+
+    def test_long_segments_get_cheap_metrics_only(self):
+        """TER and edit distance are skipped for segments over the length cap."""
+        scores, totals = score_segments(HYPOTHESES, REFERENCES, max_chars=30)
+
+        assert scores[1]["ter"] is None
+        assert scores[1]["edit_distance"] is None
+        assert scores[1]["chrf"] == round(
+            sacrebleu.sentence_chrf(HYPOTHESES[1], [REFERENCES[1]]).score, 2
+        )
+        assert scores[0]["ter"] is not None
+        full = [0, 2]
+        assert corpus_scores(totals)["ter"] == round(
+            sacrebleu.corpus_ter(
+                [HYPOTHESES[i] for i in full], [[REFERENCES[i] for i in full]]
+            ).score,
+            2,
+        )
+
+    def test_timed_out_chunk_falls_back_to_cheap_metrics(self, monkeypatch):
+        """A chunk missing the executor timeout is rescored with BLEU and chrF."""
+
+        def slow_score_segments(
+            hypotheses, references, max_chars=None, cheap_only=False
+        ):
+            if not cheap_only:
+                time.sleep(0.5)
+            return score_segments(hypotheses, references, max_chars, cheap_only)
+
+        monkeypatch.setattr(evaluation_module, "score_segments", slow_score_segments)
+        service = TranslationEvaluationService()
+        service.executor = CPUExecutor("thread", timeout=0.1)
+
+        async def collect():
+            return [
+                line async for line in service.evaluate_batch(HYPOTHESES, REFERENCES)
+            ]
+
+        try:
+            lines = asyncio.run(collect())
+        finally:
+            service.executor.shutdown()
+
+        assert [line["ter"] for line in lines[:-1]] == [None] * 4
+        assert lines[0]["bleu"] is not None
+        assert lines[-1]["ter"] is None
+
+    def test_endpoint_streams_ndjson(self):
+        """The batch endpoint streams one line per segment, then the corpus."""
+        client = TestClient(app)
+        segments = [
+            {
+                "id": f"s{i}",
+                "source_text": "src",
+                "translated_text": hyp,
+                "reference_text": ref,
+            }
+            for i, (hyp, ref) in enumerate(zip(HYPOTHESES, REFERENCES, strict=True))
+        ]
+
+        response = client.post(
+            "/api/v1/translation/evaluate/batch",
+            json={"source_lang": "en", "target_lang": "en", "segments": segments},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["id"] for line in lines[:-1]] == ["s0", "s1", "s2", "s3"]
+        assert lines[3]["bleu"] == 100.0
+        assert lines[-1]["type"] == "corpus"
+        assert lines[-1]["segments"] == 4
+        assert lines[-1]["bleu"] == round(
+            sacrebleu.corpus_bleu(HYPOTHESES, [REFERENCES]).score, 2
+        )
@@ -0,0 +1,73 @@
+"""
+Pytest tests for running evaluation metrics on the CPU executor.
+Run with: pytest tests/services/test_cpu_executor.py -v
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services import translation_evaluation_service as evaluation_module
+from app.services.cpu_executor import CPUExecutor
+from app.services.evaluation_metrics import sentence_scores
+from app.services.translation_evaluation_service import TranslationEvaluationService
+
+HYPOTHESIS = "The cat sat on the mat."
+REFERENCE = "The cat is sitting on the mat."
+
+
+@pytest.fixture
+def service():
+    """Evaluation service using a thread pool so tests can patch the metrics."""
+    service = TranslationEvaluationService()
+    service.executor = CPUExecutor("thread", max_workers=2, timeout=0.2)
+    yield service
+    service.executor.shutdown()
+
+
+@pytest.mark.unit
+class TestCPUExecutor:
+    """Test suite for off-loop metric computation."""
+
+    def test_process_pool_runs_metrics(self):
+        """Metrics computed in a worker process match in-process results."""
+        executor = CPUExecutor("process", max_workers=1, timeout=30)
+        try:
+            scores = asyncio.run(executor.run(sentence_scores, HYPOTHESIS, REFERENCE))
+        finally:
+            executor.shutdown()
+
+        assert scores == sentence_scores(HYPOTHESIS, REFERENCE)
+
+    def test_full_metrics_for_short_texts(self, service):
+        """Short texts get every metric."""
+        scores = asyncio.run(service._compute_metrics(HYPOTHESIS, REFERENCE))
+
+        assert scores == sentence_scores(HYPOTHESIS, REFERENCE)
+        assert scores["ter"] is not None
+
+    def test_cheap_metrics_above_cutoff(self, service):
+        """Texts longer than the cutoff skip TER and edit distance."""
+        service.full_metrics_max_chars = 10
+
+        scores = asyncio.run(service._compute_metrics(HYPOTHESIS, REFERENCE))
+
+        assert scores["bleu"] == sentence_scores(HYPOTHESIS, REFERENCE)["bleu"]
+        assert scores["ter"] is None
+        assert scores["edit_distance"] is None
+
+    def test_cheap_metrics_after_timeout(self, service, monkeypatch):
+        """A full computation that times out falls back to the cheap metrics."""
+
+        def slow_scores(hypothesis, reference, cheap_only=False):
+            if not cheap_only:
+                time.sleep(1)
+            return sentence_scores(hypothesis, reference, cheap_only)
+
+        monkeypatch.setattr(evaluation_module, "sentence_scores", slow_scores)
+
+        scores = asyncio.run(service._compute_metrics(HYPOTHESIS, REFERENCE))
+
+        assert scores["chrf"] is not None
+        assert scores["ter"] is None
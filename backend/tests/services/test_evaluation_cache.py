@@ -0,0 +1,192 @@
+"""
+Pytest tests for the translation evaluation cache.
+Run with: pytest tests/services/test_evaluation_cache.py -v
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.schemas.lokalise.glossary import GlossaryTermsDelete
+from app.services.evaluation_cache import EvaluationCache
+from app.services.lokalise.glossary import lokalise_glossary_service
+from app.services.translation_evaluation_service import TranslationEvaluationService
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Fresh cache, also used by glossary writes."""
+    cache = EvaluationCache(tmp_path / "cache.sqlite3", max_entries=2, ttl_seconds=60)
+    monkeypatch.setattr(
+        "app.services.lokalise.glossary.evaluation_cache", cache, raising=True
+    )
+    return cache
+
+
+@pytest.fixture
+def service(cache, monkeypatch):
+    """Evaluation service counting how often its stages run."""
+    service = TranslationEvaluationService()
+    service.cache = cache
+    service.runs = 0
+    service.terms = {"Save": {"translations": {"fr": "Enregistrer"}}}
+
+    async def metrics(translated_text, reference_text):
+        service.runs += 1
+        return {"bleu": 90.0, "ter": 5.0, "chrf": 90.0, "edit_distance": 1}
+
+    async def glossary(*args, **kwargs):
+        return {"compliance_score": 100, "compliance_summary": ""}
+
+    async def terms(project_id):
+        return service.terms
+
+    monkeypatch.setattr(service, "_compute_metrics", metrics)
+    monkeypatch.setattr(service, "_check_glossary_compliance", glossary)
+    monkeypatch.setattr(service.glossary_processor, "get_terms_data", terms)
+    return service
+
+
+def fake_llm_service(text=None, error=None):
+    """LLM service whose model answers with ``text`` or raises ``error``."""
+
+    async def generate_content_async(prompt, generation_config=None):
+        if error is not None:
+            raise error
+        return SimpleNamespace(text=text)
+
+    return SimpleNamespace(
+        model=SimpleNamespace(generate_content_async=generate_content_async),
+        generation_config=None,
+    )
+
+
+def evaluate(service, translated_text="Enregistrer"):
+    return asyncio.run(
+        service.evaluate_translation(
+            source_text="Save",
+            source_lang="en",
+            translated_text=translated_text,
+            target_lang="fr",
+            reference_text="Enregistrer",
+            project_id="p",
+        )
+    )
+
+
+@pytest.mark.unit
+class TestEvaluationCache:
+    """Test suite for caching evaluation results."""
+
+    def test_repeat_evaluation_is_cached(self, service):
+        """The second identical evaluation is served without running stages."""
+        first = evaluate(service)
+        second = evaluate(service)
+
+        assert service.runs == 1
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert second["verdict"] == first["verdict"]
+
+    def test_persistent_tier_survives_memory_eviction(self, service):
+        """Results evicted from the LRU are reloaded from SQLite."""
+        for text in ("a", "b", "c"):
+            evaluate(service, translated_text=text)
+        assert len(service.cache._memory) == 2
+
+        result = evaluate(service, translated_text="a")
+
+        assert result["cached"] is True
+        assert service.runs == 3
+
+    def test_evaluator_version_invalidates(self, service, monkeypatch):
+        """Changing the evaluator version re-runs the evaluation."""
+        evaluate(service)
+        monkeypatch.setattr(
+            "app.services.translation_evaluation_service.EVALUATOR_VERSION", "next"
+        )
+
+        assert evaluate(service)["cached"] is False
+        assert service.runs == 2
+
+    def test_glossary_write_invalidates(self, service, monkeypatch):
+        """Writing glossary terms of the project invalidates its evaluations."""
+        evaluate(service)
+
+        async def fake_send_once(method, url, headers, params, json_data, content):
+            return httpx.Response(200, json={"data": {"deleted": {"count": 1}}})
+
+        monkeypatch.setattr(lokalise_glossary_service, "_send_once", fake_send_once)
+        asyncio.run(
+            lokalise_glossary_service.delete_glossary_terms(
+                "p", GlossaryTermsDelete(terms=[1])
+            )
+        )
+
+        assert evaluate(service)["cached"] is False
+        assert service.runs == 2
+
+    def test_glossary_write_by_other_worker_invalidates(self, service, cache):
+        """Glossary tokens are re-read, so writes by other processes are seen."""
+        evaluate(service)
+        other_worker = EvaluationCache(cache.db_path, max_entries=2, ttl_seconds=60)
+
+        asyncio.run(other_worker.invalidate_glossary("p"))
+
+        assert evaluate(service)["cached"] is False
+        assert service.runs == 2
+
+    def test_glossary_edit_in_lokalise_invalidates(self, service):
+        """A changed glossary invalidates evaluations without any write through us."""
+        evaluate(service)
+        service.terms = {"Save": {"translations": {"fr": "Sauvegarder"}}}
+
+        assert evaluate(service)["cached"] is False
+        assert service.runs == 2
+
+    def test_failed_llm_stage_is_not_cached(self, service, monkeypatch):
+        """A Gemini failure is retried by the next evaluation, not cached."""
+
+        async def uncertain_metrics(translated_text, reference_text):
+            service.runs += 1
+            return {"bleu": 50.0, "ter": 40.0, "chrf": 60.0, "edit_distance": 4}
+
+        monkeypatch.setattr(service, "_compute_metrics", uncertain_metrics)
+        monkeypatch.setattr(
+            service, "llm_service", fake_llm_service(error=RuntimeError("quota"))
+        )
+
+        first = evaluate(service)
+        second = evaluate(service)
+
+        assert first["incomplete_stages"] == ["llm_feedback"]
+        assert first["verdict"] == "uncertain"
+        assert second["cached"] is False
+        assert second["partial"] is True
+        assert service.runs == 2
+
+    def test_failed_metrics_stage_is_not_cached(self, service, monkeypatch):
+        """A metric computation failure is retried by the next evaluation."""
+
+        async def failing_run(*args):
+            service.runs += 1
+            raise RuntimeError("worker crashed")
+
+        monkeypatch.delattr(service, "_compute_metrics")
+        monkeypatch.setattr(service, "executor", SimpleNamespace(run=failing_run))
+        feedback = {"strengths": ["Accurate"], "weaknesses": [], "summary": "Good."}
+        monkeypatch.setattr(
+            service, "llm_service", fake_llm_service(text=json.dumps(feedback))
+        )
+
+        first = evaluate(service)
+        second = evaluate(service)
+
+        assert first["incomplete_stages"] == ["metric_scores"]
+        assert first["metric_scores"]["chrf"] is None
+        assert second["cached"] is False
+        assert second["partial"] is True
+        assert service.runs == 2
@@ -0,0 +1,214 @@
+"""
+Pytest tests for concurrent evaluation stages.
+Run with: pytest tests/services/test_evaluation_stages.py -v
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.metrics import stage_failures_total
+from app.services.evaluation_cache import EvaluationCache
+from app.services.translation_evaluation_service import TranslationEvaluationService
+
+STAGE_SECONDS = 0.3
+
+
+async def no_terms(project_id):
+    return {}
+
+
+@pytest.fixture
+def service(monkeypatch, tmp_path):
+    """Evaluation service whose stages each take STAGE_SECONDS."""
+    service = TranslationEvaluationService()
+    service.cache = EvaluationCache(tmp_path / "cache.sqlite3", 10, 60)
+
+    async def metrics(translated_text, reference_text):
+        await asyncio.sleep(STAGE_SECONDS)
+        return {"bleu": 50.0, "ter": 40.0, "chrf": 60.0, "edit_distance": 3}
+
+    async def glossary(*args, **kwargs):
+        await asyncio.sleep(STAGE_SECONDS)
+        return {"compliance_score": 100, "compliance_summary": "All good"}
+
+    async def feedback(*args):
+        await asyncio.sleep(STAGE_SECONDS)
+        return {"strengths": ["Accurate"], "weaknesses": [], "summary": "Good."}
+
+    monkeypatch.setattr(service, "_compute_metrics", metrics)
+    monkeypatch.setattr(service, "_check_glossary_compliance", glossary)
+    monkeypatch.setattr(service, "_get_llm_feedback", feedback)
+    monkeypatch.setattr(service.glossary_processor, "get_terms_data", no_terms)
+    return service
+
+
+def evaluate(service, reference_text=None, **kwargs):
+    return asyncio.run(
+        service.evaluate_translation(
+            source_text="Save",
+            source_lang="en",
+            translated_text="Enregistrer",
+            target_lang="fr",
+            reference_text=reference_text,
+            project_id="p",
+            **kwargs,
+        )
+    )
+
+
+def set_scores(service, monkeypatch, chrf, compliance=100):
+    """Make the cheap stages return the given chrF and glossary compliance."""
+
+    async def metrics(translated_text, reference_text):
+        return {"bleu": None, "ter": None, "chrf": chrf, "edit_distance": None}
+
+    async def glossary(*args, **kwargs):
+        return {"compliance_score": compliance, "compliance_summary": ""}
+
+    monkeypatch.setattr(service, "_compute_metrics", metrics)
+    monkeypatch.setattr(service, "_check_glossary_compliance", glossary)
+
+
+@pytest.mark.unit
+class TestEvaluationStages:
+    """Test suite for running evaluation stages concurrently."""
+
+    def test_stages_run_concurrently(self, service):
+        """Latency is that of the slowest stage, not the sum of all stages."""
+        started = time.perf_counter()
+        result = evaluate(service)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 2 * STAGE_SECONDS
+        assert result["partial"] is False
+        assert result["metric_scores"]["bleu"] == 50.0
+        assert result["glossary_compliance"]["compliance_score"] == 100
+        assert result["llm_feedback"]["summary"] == "Good."
+
+    def test_stage_timeout_gives_partial_result(self, service):
+        """A stage exceeding its timeout is dropped and reported."""
+        service.stage_timeouts["llm_feedback"] = STAGE_SECONDS / 3
+
+        result = evaluate(service)
+
+        assert result["partial"] is True
+        assert result["incomplete_stages"] == ["llm_feedback"]
+        assert result["llm_feedback"] is None
+        assert result["metric_scores"]["bleu"] == 50.0
+
+    def test_deadline_cancels_unfinished_stages(self, service):
+        """Stages still running at the deadline are cancelled."""
+        service.deadline = STAGE_SECONDS / 3
+
+        started = time.perf_counter()
+        result = evaluate(service)
+
+        assert time.perf_counter() - started < STAGE_SECONDS
+        assert sorted(result["incomplete_stages"]) == [
+            "glossary_compliance",
+            "llm_feedback",
+            "metric_scores",
+        ]
+        assert result["metric_scores"]["bleu"] is None
+        assert result["overall_assessment"] == "No evaluation criteria available"
+
+    def test_stage_failure_is_counted(self, service, monkeypatch):
+        """A failing stage increments the pipeline stage failure counter."""
+        labels = {"project": "p", "lang_pair": "en-fr"}
+        before = stage_failures_total.value(stage="llm_judge", **labels)
+
+        async def failing_feedback(*args):
+            raise RuntimeError("Gemini unavailable")
+
+        monkeypatch.setattr(service, "_get_llm_feedback", failing_feedback)
+
+        result = evaluate(service)
+
+        assert result["incomplete_stages"] == ["llm_feedback"]
+        assert stage_failures_total.value(stage="llm_judge", **labels) == before + 1
+
+
+@pytest.mark.unit
+class TestTieredEvaluation:
+    """Test suite for skipping the LLM judge on conclusive cheap signals."""
+
+    @pytest.mark.parametrize(
+        ("chrf", "compliance", "verdict", "decided_by"),
+        [
+            (90.0, 100, "pass", "metrics"),
+            (20.0, 100, "fail", "metrics"),
+            (90.0, 50, "fail", "glossary"),
+        ],
+    )
+    def test_conclusive_cheap_tier_skips_llm(
+        self, service, monkeypatch, chrf, compliance, verdict, decided_by
+    ):
+        """A clear pass or fail is decided without calling the LLM."""
+        set_scores(service, monkeypatch, chrf, compliance)
+
+        result = evaluate(service, reference_text="Enregistrer")
+
+        assert result["verdict"] == verdict
+        assert result["decided_by"] == decided_by
+        assert result["llm_feedback"] is None
+        assert result["partial"] is False
+
+    def test_uncertain_band_calls_llm(self, service, monkeypatch):
+        """Scores inside the uncertainty band are decided by the LLM."""
+        set_scores(service, monkeypatch, chrf=60.0)
+
+        result = evaluate(service, reference_text="Enregistrer")
+
+        assert result["verdict"] == "pass"
+        assert result["decided_by"] == "llm"
+        assert result["llm_feedback"]["summary"] == "Good."
+
+    def test_force_llm(self, service, monkeypatch):
+        """Forcing the LLM adds feedback but keeps the cheap verdict."""
+        set_scores(service, monkeypatch, chrf=20.0)
+
+        result = evaluate(service, reference_text="Enregistrer", force_llm=True)
+
+        assert result["verdict"] == "fail"
+        assert result["decided_by"] == "metrics"
+        assert result["llm_feedback"]["summary"] == "Good."
+
+    def test_forced_llm_runs_with_cheap_stages(self, service):
+        """A judge that runs anyway does not wait for the cheap tier."""
+        started = time.perf_counter()
+        result = evaluate(service, reference_text="Enregistrer", force_llm=True)
+
+        assert time.perf_counter() - started < 2 * STAGE_SECONDS
+        assert result["llm_feedback"]["summary"] == "Good."
+
+    def test_early_judge_cancelled_when_cheap_tier_is_conclusive(
+        self, service, monkeypatch
+    ):
+        """Without a reference, a glossary failure cancels the started judge."""
+        set_scores(service, monkeypatch, chrf=None, compliance=50)
+
+        started = time.perf_counter()
+        result = evaluate(service)
+
+        assert time.perf_counter() - started < STAGE_SECONDS
+        assert result["verdict"] == "fail"
+        assert result["llm_feedback"] is None
+        assert result["incomplete_stages"] == []
+
+    def test_llm_failure_keeps_verdict_uncertain(self, service, monkeypatch):
+        """A failed judge leaves the verdict open and the stage incomplete."""
+        set_scores(service, monkeypatch, chrf=60.0)
+
+        async def failing_feedback(*args):
+            raise RuntimeError("Gemini unavailable")
+
+        monkeypatch.setattr(service, "_get_llm_feedback", failing_feedback)
+
+        result = evaluate(service, reference_text="Enregistrer")
+
+        assert result["verdict"] == "uncertain"
+        assert result["decided_by"] is None
+        assert result["llm_feedback"] is None
+        assert result["incomplete_stages"] == ["llm_feedback"]
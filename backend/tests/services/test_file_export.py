@@ -0,0 +1,131 @@
+"""
+Pytest tests for the project export pipeline.
+Run with: pytest tests/services/test_file_export.py -v
+"""
+
+import asyncio
+import os
+import time
+import zipfile
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.lokalise.queued_processes import ProjectProcessResponse
+from app.services import file_export as file_export_module
+from app.services.file_export import FileExportService, extract_bundle, prune_exports
+from app.services.lokalise.processes import lokalise_processes_service
+
+
+def make_process(status: str, **details) -> ProjectProcessResponse:
+    return ProjectProcessResponse.model_validate(
+        {
+            "project_id": "p1",
+            "process": {
+                "process_id": "proc1",
+                "type": "async-export",
+                "status": status,
+                "message": "",
+                "created_by": 1,
+                "created_by_email": "user@example.com",
+                "created_at": "2024-01-01 00:00:00 (Etc/UTC)",
+                "created_at_timestamp": 1704067200,
+                "details": details or None,
+            },
+        }
+    )
+
+
+@pytest.mark.unit
+class TestFileExport:
+    """Test suite for bundle extraction and process polling."""
+
+    def test_extract_bundle_skips_unsafe_entries(self, tmp_path):
+        """Members are extracted under the target directory only."""
+        bundle = tmp_path / "bundle.zip"
+        with zipfile.ZipFile(bundle, "w") as archive:
+            archive.writestr("locale/en.json", '{"hello": "Hello"}')
+            archive.writestr("locale/fr.json", '{"hello": "Bonjour"}')
+            archive.writestr("../escape.json", "{}")
+
+        files = extract_bundle(bundle, tmp_path / "files")
+
+        assert sorted(f["path"] for f in files) == ["locale/en.json", "locale/fr.json"]
+        assert (tmp_path / "files/locale/fr.json").read_text() == '{"hello": "Bonjour"}'
+        assert not (tmp_path / "escape.json").exists()
+
+    def test_failed_download_removes_partial_bundle(self, tmp_path, monkeypatch):
+        """A connection lost mid-stream leaves no partial bundle on disk."""
+
+        async def broken_stream():
+            yield b"PK"
+            raise httpx.ReadError("connection lost")
+
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=broken_stream())
+        )
+        client_class = httpx.AsyncClient
+        monkeypatch.setattr(
+            file_export_module.httpx,
+            "AsyncClient",
+            lambda **kwargs: client_class(transport=transport, **kwargs),
+        )
+        destination = tmp_path / "export" / "bundle.zip"
+
+        with pytest.raises(httpx.ReadError):
+            asyncio.run(
+                FileExportService(tmp_path)._download_bundle(
+                    "https://example.com/b.zip", destination, None
+                )
+            )
+
+        assert list(destination.parent.iterdir()) == []
+
+    def test_prune_exports_deletes_expired_exports(self, tmp_path):
+        """Export directories older than the retention period are deleted."""
+        expired = tmp_path / "p1" / "old"
+        recent = tmp_path / "p1" / "new"
+        for process_dir in (expired, recent):
+            (process_dir / "files").mkdir(parents=True)
+            (process_dir / "bundle.zip").write_bytes(b"PK")
+        day_ago = time.time() - 86400
+        os.utime(expired, (day_ago, day_ago))
+
+        assert prune_exports(tmp_path, 3600) == 1
+        assert not expired.exists()
+        assert (recent / "bundle.zip").exists()
+
+    def test_wait_for_process_backs_off_until_finished(self, monkeypatch):
+        """Polling waits longer between checks and returns the finished process."""
+        statuses = ["queued", "running", "running", "finished"]
+        delays = []
+
+        async def fake_get_process(project_id, process_id):
+            status = statuses.pop(0)
+            return make_process(status, download_url="https://example.com/b.zip")
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(lokalise_processes_service, "get_process", fake_get_process)
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        process = asyncio.run(
+            lokalise_processes_service.wait_for_process("p1", "proc1")
+        )
+
+        assert process.details["download_url"] == "https://example.com/b.zip"
+        assert len(delays) == 3 and delays[0] < delays[1] < delays[2]
+
+    def test_wait_for_process_raises_on_failure(self, monkeypatch):
+        """Failed processes surface as a 502."""
+
+        async def fake_get_process(project_id, process_id):
+            return make_process("failed")
+
+        monkeypatch.setattr(lokalise_processes_service, "get_process", fake_get_process)
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(lokalise_processes_service.wait_for_process("p1", "proc1"))
+        assert exc_info.value.status_code == 502
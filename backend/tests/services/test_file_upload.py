@@ -0,0 +1,51 @@
+"""
+Pytest tests for the streaming file import pipeline.
+Run with: pytest tests/services/test_file_upload.py -v
+"""
+
+import asyncio
+import base64
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app.services.file_upload import file_upload_service
+from app.services.lokalise.files import BASE64_CHUNK_SIZE, iter_base64_file
+
+
+async def collect(path) -> bytes:
+    return b"".join([chunk async for chunk in iter_base64_file(path)])
+
+
+@pytest.mark.unit
+class TestFileUpload:
+    """Test suite for chunked base64 encoding and upload staging."""
+
+    def test_chunked_base64_matches_whole_file(self, tmp_path):
+        """Chunk-wise encoding equals encoding the file in one go."""
+        path = tmp_path / "en.json"
+        data = bytes(range(256)) * (BASE64_CHUNK_SIZE // 256 * 2 + 7)
+        path.write_bytes(data)
+
+        assert asyncio.run(collect(path)) == base64.b64encode(data)
+
+    def test_stage_uploads_copies_files_per_language(self):
+        """Uploads are copied to disk; a single language applies to all files."""
+        files = [
+            UploadFile(io.BytesIO(b'{"a": "A"}'), filename="en.json"),
+            UploadFile(io.BytesIO(b'{"a": "B"}'), filename="fr.json"),
+        ]
+
+        work_dir, staged = asyncio.run(file_upload_service.stage_uploads(files, ["en"]))
+
+        try:
+            assert [s.lang_iso for s in staged] == ["en", "en"]
+            assert staged[1].path.read_bytes() == b'{"a": "B"}'
+        finally:
+            for upload in staged:
+                upload.path.unlink()
+            work_dir.rmdir()
+
+        with pytest.raises(HTTPException):
+            asyncio.run(file_upload_service.stage_uploads(files, ["en", "fr", "de"]))
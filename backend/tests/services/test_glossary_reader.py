@@ -0,0 +1,248 @@
+"""
+Pytest tests for the streaming glossary file readers and importer.
+Run with: pytest tests/services/test_glossary_reader.py -v
+"""
+
+import asyncio
+import csv
+import io
+
+import pytest
+from fastapi import HTTPException
+from openpyxl import Workbook
+
+from app.api.v1.endpoints import glossary_processor as glossary_endpoints
+from app.core.config import get_settings
+from app.schemas.lokalise.languages import BaseLanguage
+from app.services import glossary_processor as glossary_processor_module
+from app.services import glossary_reader as glossary_reader_module
+from app.services.glossary_processor import glossary_processor
+from app.services.glossary_reader import iter_glossary_batches, stage_glossary_file
+from app.services.glossary_upload import UploadCheckpoint
+from app.services.language_registry import ProjectLanguages, language_registry
+from app.services.lokalise.glossary import lokalise_glossary_service
+
+HEADER = [
+    "term",
+    "description",
+    "part_of_speech",
+    "casesensitive",
+    "translatable",
+    "forbidden",
+    "tags",
+    "fr",
+    "fr_description",
+    "es",
+]
+ROWS = [
+    [
+        "crypto dust",
+        "Small balance",
+        "(n.)",
+        "no",
+        "yes",
+        "",
+        "App",
+        "poussière",
+        "",
+        "",
+    ],
+    ["Defi Staking", "", "", "yes", "no", "no", "", "", "", "Defi Staking"],
+    ["", "row without a term", "", "", "", "", "", "", "", ""],
+    [
+        "auto top-up",
+        "Feature",
+        "",
+        "no",
+        "yes",
+        "no",
+        "",
+        "recharge",
+        "Note",
+        "recarga",
+    ],
+]
+
+PROJECT_LANGUAGES = ProjectLanguages(
+    BaseLanguage(lang_id=lang_id, lang_iso=iso, lang_name=name)
+    for iso, lang_id, name in [
+        ("fr", 673, "French"),
+        ("es", 640, "Spanish"),
+        ("de", 597, "German"),
+    ]
+)
+
+
+def use_project_languages(monkeypatch, languages=PROJECT_LANGUAGES):
+    """Serve the languages of every project from memory."""
+
+    async def get(project_id):
+        return languages
+
+    monkeypatch.setattr(language_registry, "get", get)
+
+
+def write_csv(path, rows):
+    with path.open("w", newline="", encoding="utf-8") as file:
+        csv.writer(file).writerows(rows)
+    return path
+
+
+def write_xlsx(path, rows):
+    workbook = Workbook()
+    for row in rows:
+        workbook.active.append([value if value != "" else None for value in row])
+    workbook.save(path)
+    return path
+
+
+@pytest.mark.unit
+class TestGlossaryReader:
+    """Test suite for reading glossary files in batches."""
+
+    @pytest.mark.parametrize(
+        "writer,suffix", [(write_csv, ".csv"), (write_xlsx, ".xlsx")]
+    )
+    def test_reads_terms_in_batches(self, tmp_path, writer, suffix):
+        """Both formats yield the same terms, skipping rows without a term."""
+        path = writer(tmp_path / f"glossary{suffix}", [HEADER, *ROWS])
+
+        columns, batches = iter_glossary_batches(path, 2, PROJECT_LANGUAGES)
+        batches = list(batches)
+
+        assert columns.language_codes == ["fr", "es"]
+        assert [len(batch) for batch in batches] == [2, 1]
+        first, second, third = [term for batch in batches for term in batch]
+        assert first.term == "crypto dust"
+        assert (first.case_sensitive, first.translatable, first.forbidden) == (
+            False,
+            True,
+            False,
+        )
+        assert [(t.lang_id, t.lang_iso, t.translation) for t in first.translations] == [
+            (673, "fr", "poussière")
+        ]
+        assert second.description == "Glossary term: Defi Staking"
+        assert second.case_sensitive
+        assert third.translations[0].description == "Note"
+
+    def test_ignores_unknown_languages(self, tmp_path):
+        """Columns of languages the project does not have are set aside."""
+        header = [*HEADER[:7], "it", "fr"]
+        path = write_csv(tmp_path / "glossary.csv", [header, [*ROWS[0][:7], "x", "y"]])
+
+        columns, batches = iter_glossary_batches(path, 10, PROJECT_LANGUAGES)
+
+        assert columns.language_codes == ["fr"]
+        assert columns.unknown_languages == ("it",)
+        [[term]] = list(batches)
+        assert [t.lang_iso for t in term.translations] == ["fr"]
+
+    def test_missing_columns(self, tmp_path):
+        """Files without the required columns are rejected upfront."""
+        path = write_csv(tmp_path / "glossary.csv", [["term", "fr"], ["a", "b"]])
+
+        with pytest.raises(HTTPException) as error:
+            iter_glossary_batches(path, 10, PROJECT_LANGUAGES)
+
+        assert error.value.status_code == 400
+        assert "casesensitive" in error.value.detail
+
+    def test_unsupported_type(self, tmp_path):
+        """Only XLSX and CSV files are accepted."""
+        path = tmp_path / "glossary.xls"
+        path.write_bytes(b"")
+
+        with pytest.raises(HTTPException) as error:
+            iter_glossary_batches(path, 10, PROJECT_LANGUAGES)
+
+        assert error.value.status_code == 400
+
+
+@pytest.mark.unit
+class TestGlossaryStaging:
+    """Test suite for copying uploaded glossary files to disk."""
+
+    def test_copies_upload(self, monkeypatch):
+        """Uploads are copied chunk by chunk to a file with their suffix."""
+        monkeypatch.setattr(glossary_reader_module, "STAGE_CHUNK_SIZE", 4)
+        content = b"term,casesensitive\nalpha,no\n"
+
+        path = stage_glossary_file(io.BytesIO(content), "Glossary.CSV", 100)
+        try:
+            assert path.suffix == ".csv"
+            assert path.read_bytes() == content
+        finally:
+            path.unlink()
+
+    @pytest.mark.parametrize("declared_size", [None, 10])
+    def test_rejects_oversized_upload(self, tmp_path, monkeypatch, declared_size):
+        """Oversized uploads fail with 413, by declared or copied size."""
+        monkeypatch.setattr(glossary_reader_module.tempfile, "tempdir", str(tmp_path))
+
+        with pytest.raises(HTTPException) as error:
+            stage_glossary_file(io.BytesIO(b"x" * 10), "g.csv", 5, declared_size)
+
+        assert error.value.status_code == 413
+        assert list(tmp_path.iterdir()) == []
+
+    def test_rejects_oversized_request_before_parsing(self, test_client, monkeypatch):
+        """Requests declaring an oversized body get 413 before being parsed."""
+        monkeypatch.setattr(get_settings(), "GLOSSARY_MAX_FILE_BYTES", 5)
+        staged = []
+
+        async def save_glossary_file(file):
+            staged.append(file)
+
+        monkeypatch.setattr(
+            glossary_endpoints, "save_glossary_file", save_glossary_file
+        )
+        content = b"x" * (glossary_endpoints.MULTIPART_OVERHEAD_BYTES + 10)
+
+        response = test_client.post(
+            "/api/v1/glossary/load",
+            params={"project_id": "p"},
+            files={"file": ("glossary.csv", content, "text/csv")},
+        )
+
+        assert response.status_code == 413
+        assert staged == []
+
+    def test_rejects_unsupported_type(self):
+        """Only XLSX and CSV uploads are staged."""
+        with pytest.raises(HTTPException) as error:
+            stage_glossary_file(io.BytesIO(b""), "glossary.xls", 100)
+
+        assert error.value.status_code == 400
+
+
+@pytest.mark.unit
+class TestGlossaryImport:
+    """Test suite for uploading glossary files batch by batch."""
+
+    def test_uploads_new_terms(self, tmp_path, monkeypatch):
+        """Existing terms are skipped and the rest uploaded in batches."""
+        path = write_csv(tmp_path / "glossary.csv", [HEADER, *ROWS])
+        uploaded = []
+
+        async def fake_existing(project_id):
+            return [type("Term", (), {"term": "DEFI STAKING"})()]
+
+        async def fake_upload(project_id, batch):
+            uploaded.append([term.term for term in batch])
+            return {term.term.lower() for term in batch}
+
+        monkeypatch.setattr(
+            lokalise_glossary_service, "get_all_glossary_terms", fake_existing
+        )
+        monkeypatch.setattr(glossary_processor, "_upload_term_batch", fake_upload)
+        use_project_languages(monkeypatch)
+        monkeypatch.setattr(
+            glossary_processor_module,
+            "upload_checkpoint",
+            UploadCheckpoint(tmp_path / "uploads.sqlite3"),
+        )
+
+        asyncio.run(glossary_processor.load_glossary_file(path, "p"))
+
+        assert uploaded == [["crypto dust", "auto top-up"]]
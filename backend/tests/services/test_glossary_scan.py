@@ -0,0 +1,183 @@
+"""
+Pytest tests for the project-wide glossary compliance scan.
+Run with: pytest tests/services/test_glossary_scan.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from app.schemas.lokalise.glossary import GlossaryTerm
+from app.services import glossary_scan as glossary_scan_module
+from app.services.cpu_executor import CPUExecutor
+from app.services.glossary_matching import (
+    AhoCorasick,
+    GlossaryMatcher,
+    UnknownGlossaryError,
+    scan_chunk,
+)
+from app.services.glossary_scan import GlossaryScanService
+from app.services.key_mirror import KeyMirrorService
+from app.services.lokalise.glossary import lokalise_glossary_service
+
+
+def term(text, *, case_sensitive=False, forbidden=False, translatable=True, **tr):
+    return {
+        "term": text,
+        "case_sensitive": case_sensitive,
+        "forbidden": forbidden,
+        "translatable": translatable,
+        "translations": tr,
+    }
+
+
+TERMS = [
+    term("Lokalise", translatable=False),
+    term("API", case_sensitive=True, forbidden=True),
+    term("project", fr="projet"),
+    term("project key", fr="clé de projet"),
+    term("dashboard"),
+]
+
+
+@pytest.mark.unit
+class TestGlossaryMatcher:
+    """Test suite for automaton-based term matching."""
+
+    def test_automaton_finds_overlapping_patterns(self):
+        """Every occurrence of every pattern is reported."""
+        automaton = AhoCorasick(["he", "she", "hers"])
+
+        assert sorted(automaton.iter_matches("ushers")) == [(1, 1), (2, 0), (2, 2)]
+
+    def test_word_boundaries_and_case(self):
+        """Terms match whole words; case-sensitive terms match exact case."""
+        matcher = GlossaryMatcher(TERMS)
+
+        assert matcher.find_terms("Open the LOKALISE projects") == [0]
+        assert matcher.find_terms("the api and the API") == [1]
+        assert matcher.find_terms("Rapid") == []
+
+    def test_prefers_longest_match(self):
+        """Overlapping terms resolve to the longest match."""
+        matcher = GlossaryMatcher(TERMS)
+
+        assert matcher.find_terms("Copy the project key") == [3]
+        assert matcher.find_terms("A project and a project key") == [3, 2]
+
+    def test_check_rules(self):
+        """Translations must keep preserved terms and use glossary translations."""
+        matcher = GlossaryMatcher(TERMS)
+
+        assert (
+            matcher.check([0, 1, 2], "Ouvrez le projet Lokalise via l'API", "fr") == []
+        )
+        assert matcher.check([0, 2], "Ouvrez le dossier", "fr") == [
+            (0, "not_preserved"),
+            (2, "missing_translation"),
+        ]
+        assert matcher.check([2], "Öffne das Projekt", "de") == [(2, "no_translation")]
+
+    def test_scan_chunk_counts(self):
+        """Chunk results count keys, terms and violations per language."""
+        rows = [
+            (1, "open", "Open the project", {"fr": "Ouvrir le projet"}),
+            (2, "close", "Close the project", {"fr": "Fermer le dossier"}),
+            (3, "plain", "Nothing here", {"fr": "Rien"}),
+            (4, "todo", "The dashboard", {"fr": ""}),
+        ]
+
+        result = scan_chunk("g", TERMS, rows, ["fr"], sample_limit=5)["fr"]
+
+        assert result["keys_checked"] == 3
+        assert result["keys_untranslated"] == 1
+        assert result["keys_with_terms"] == 2
+        assert result["terms_checked"] == 2
+        assert result["violations"]["missing_translation"] == 1
+        assert result["terms"] == {"project": 1}
+        assert result["samples"][0]["key_name"] == "close"
+        assert result["samples"][0]["expected"] == "projet"
+
+    def test_scan_chunk_reuses_sent_terms(self):
+        """Terms can be left out once a worker has built their matcher."""
+        rows = [(1, "open", "Open the project", {"fr": "Ouvrir"})]
+
+        with pytest.raises(UnknownGlossaryError):
+            scan_chunk("unsent", None, rows, ["fr"], sample_limit=5)
+
+        scan_chunk("sent", TERMS, rows, ["fr"], sample_limit=5)
+        result = scan_chunk("sent", None, rows, ["fr"], sample_limit=5)["fr"]
+        assert result["terms"] == {"project": 1}
+
+
+@pytest.mark.unit
+class TestGlossaryScanService:
+    """Test suite for scanning a mirrored project."""
+
+    def test_scan_project_report(self, tmp_path, monkeypatch, make_key):
+        """Scans every mirrored key and reports compliance per language."""
+        mirror = KeyMirrorService(tmp_path)
+        store = mirror.get_store("p")
+        store.replace_languages(
+            [
+                {"lang_id": 640, "lang_iso": "en"},
+                {"lang_id": 673, "lang_iso": "fr"},
+                {"lang_id": 597, "lang_iso": "de"},
+            ]
+        )
+        store.upsert_keys(
+            [
+                make_key(i, f"key_{i}", {"en": "Open the project", "fr": fr, "de": ""})
+                for i, fr in enumerate(["Ouvrir le projet", "Ouvrir"] * 5, start=1)
+            ]
+        )
+        store.mark_synced(full=True)
+
+        async def fake_terms(project_id):
+            return [
+                GlossaryTerm(
+                    id=1,
+                    term="project",
+                    description="",
+                    project_id=project_id,
+                    translations=[
+                        {"lang_id": 673, "lang_iso": "fr", "translation": "projet"}
+                    ],
+                )
+            ]
+
+        monkeypatch.setattr(
+            lokalise_glossary_service, "get_all_glossary_terms", fake_terms
+        )
+        sent_terms = []
+
+        def recording_scan_chunk(glossary_key, terms, *args):
+            sent_terms.append(terms is not None)
+            return scan_chunk(glossary_key, terms, *args)
+
+        monkeypatch.setattr(glossary_scan_module, "scan_chunk", recording_scan_chunk)
+        progress = []
+        service = GlossaryScanService(
+            mirror=mirror,
+            executor=CPUExecutor(kind="thread", max_workers=2),
+            chunk_size=3,
+            sample_limit=2,
+        )
+
+        report = asyncio.run(
+            service.scan_project(
+                "p", "en", on_progress=lambda done, total: progress.append(done)
+            )
+        )
+
+        assert report["keys_scanned"] == 10
+        by_language = {lang["language_iso"]: lang for lang in report["languages"]}
+        assert by_language["fr"]["terms_checked"] == 10
+        assert by_language["fr"]["violations"]["missing_translation"] == 5
+        assert by_language["fr"]["compliance_score"] == 50.0
+        assert len(by_language["fr"]["samples"]) == 2
+        assert by_language["de"]["keys_untranslated"] == 10
+        assert by_language["de"]["compliance_score"] is None
+        assert progress[-1] == 10
+        # Four chunks, the terms only going to one per worker
+        assert sorted(sent_terms) == [False, False, True, True]
@@ -0,0 +1,198 @@
+"""
+Pytest tests for diff-based glossary sync.
+Run with: pytest tests/services/test_glossary_sync.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from app.schemas.lokalise.glossary import (
+    GlossaryTerm,
+    GlossaryTermsCreateMeta,
+    GlossaryTermsCreateResponse,
+    GlossaryTermsDeleteData,
+    GlossaryTermsDeletedInfo,
+    GlossaryTermsDeleteFailedInfo,
+    GlossaryTermsDeleteResponse,
+    GlossaryTermsUpdateMeta,
+    GlossaryTermsUpdateResponse,
+)
+from app.services.glossary_processor import glossary_processor
+from app.services.glossary_reader import iter_glossary_batches
+from app.services.glossary_sync import GlossaryDiff, term_update
+from app.services.lokalise.glossary import lokalise_glossary_service
+from tests.services.test_glossary_reader import (
+    HEADER,
+    PROJECT_LANGUAGES,
+    use_project_languages,
+    write_csv,
+)
+
+
+def row(term, description="", *, fr="", es=""):
+    return [term, description, "", "no", "yes", "no", "", fr, "", es]
+
+
+def existing_term(term_id, term, description, **translations):
+    return GlossaryTerm(
+        id=term_id,
+        term=term,
+        description=description,
+        project_id="p",
+        tags=["kept"],
+        translations=[
+            {
+                "lang_id": {"fr": 673, "es": 640, "de": 597}[iso],
+                "lang_iso": iso,
+                "translation": text,
+            }
+            for iso, text in translations.items()
+        ],
+    )
+
+
+EXISTING = [
+    existing_term(1, "wallet", "A wallet", fr="portefeuille", de="Geldbörse"),
+    existing_term(2, "staking", "Old description", fr="staking"),
+    existing_term(3, "top-up", "Recharge", fr="recharge", es="recarga"),
+    existing_term(4, "legacy", "Removed from the sheet"),
+]
+ROWS = [
+    row("wallet", "A wallet", fr="portefeuille"),
+    row("Staking", "New description", fr="staking"),
+    row("top-up", "Recharge", fr="recharge"),
+    row("card", "Payment card", es="tarjeta"),
+    row("WALLET", "Duplicate row, ignored"),
+]
+
+
+@pytest.fixture
+def lokalise(monkeypatch):
+    """Fake Lokalise glossary recording every write request."""
+    calls = []
+
+    async def get_all(project_id):
+        return EXISTING
+
+    async def create(project_id, request):
+        calls.append(("create", [term.term for term in request.terms]))
+        created = [
+            GlossaryTerm(id=10 + i, term=term.term, description="", project_id="p")
+            for i, term in enumerate(request.terms)
+        ]
+        return GlossaryTermsCreateResponse(
+            data=created,
+            meta=GlossaryTermsCreateMeta(count=len(created), created=len(created)),
+        )
+
+    async def update(project_id, request):
+        calls.append(("update", request.terms))
+        updated = [
+            GlossaryTerm(id=term.id, term=term.term, description="", project_id="p")
+            for term in request.terms
+        ]
+        return GlossaryTermsUpdateResponse(
+            data=updated,
+            meta=GlossaryTermsUpdateMeta(count=len(updated), updated=len(updated)),
+        )
+
+    async def delete(project_id, request):
+        calls.append(("delete", request.terms))
+        return GlossaryTermsDeleteResponse(
+            data=GlossaryTermsDeleteData(
+                deleted=GlossaryTermsDeletedInfo(
+                    count=len(request.terms), ids=request.terms
+                ),
+                failed=GlossaryTermsDeleteFailedInfo(count=0, ids=[], message=""),
+            )
+        )
+
+    monkeypatch.setattr(lokalise_glossary_service, "get_all_glossary_terms", get_all)
+    monkeypatch.setattr(lokalise_glossary_service, "create_glossary_terms", create)
+    monkeypatch.setattr(lokalise_glossary_service, "update_glossary_terms", update)
+    monkeypatch.setattr(lokalise_glossary_service, "delete_glossary_terms", delete)
+    use_project_languages(monkeypatch)
+    return calls
+
+
+@pytest.mark.unit
+class TestGlossaryDiff:
+    """Test suite for diffing a glossary file against a project glossary."""
+
+    def test_classifies_terms(self, tmp_path):
+        """Terms are matched by name and compared on the file's fields only."""
+        path = write_csv(tmp_path / "glossary.csv", [HEADER, *ROWS])
+        columns, blocks = iter_glossary_batches(path, 2, PROJECT_LANGUAGES)
+
+        diff = GlossaryDiff.for_glossary(EXISTING, columns.language_codes)
+        for block in blocks:
+            diff.add(block)
+
+        assert [term.term for term in diff.create] == ["card"]
+        assert [(term.term, fields) for term, _, fields in diff.update] == [
+            ("Staking", ["term", "description"]),
+            ("top-up", ["es"]),
+        ]
+        assert [term.term for term in diff.delete] == ["legacy"]
+        # German translations and tags are not in the file, so not compared
+        assert diff.unchanged == 1
+
+    def test_update_request(self, tmp_path):
+        """Updates send the changed translations with the project's language IDs."""
+        path = write_csv(tmp_path / "glossary.csv", [HEADER, *ROWS])
+        columns, blocks = iter_glossary_batches(path, 10, PROJECT_LANGUAGES)
+        diff = GlossaryDiff.for_glossary(EXISTING, columns.language_codes)
+        diff.add(next(blocks))
+
+        term, current, fields = diff.update[1]
+        update = term_update(term, current, fields)
+
+        assert update.id == 3
+        translations = [(t.lang_id, t.translation) for t in update.translations]
+        assert translations == [(640, "")]
+        assert update.tags is None
+
+
+@pytest.mark.unit
+class TestGlossarySync:
+    """Test suite for applying a glossary sync."""
+
+    def test_dry_run_changes_nothing(self, tmp_path, lokalise):
+        """A dry run reports the planned changes without writing."""
+        path = write_csv(tmp_path / "glossary.csv", [HEADER, *ROWS])
+
+        report = asyncio.run(
+            glossary_processor.sync_glossary_file(
+                path, "p", dry_run=True, delete_missing=True
+            )
+        )
+
+        assert lokalise == []
+        assert (report["created"], report["updated"], report["deleted"]) == (1, 2, 1)
+        assert report["unchanged"] == 1
+        assert {change["status"] for change in report["changes"]} == {"planned"}
+
+    def test_sync_sends_one_request_per_action(self, tmp_path, lokalise):
+        """Only the differences are sent, in one bulk request per action."""
+        path = write_csv(tmp_path / "glossary.csv", [HEADER, *ROWS])
+
+        report = asyncio.run(
+            glossary_processor.sync_glossary_file(path, "p", delete_missing=True)
+        )
+
+        assert [action for action, _ in lokalise] == ["create", "update", "delete"]
+        assert lokalise[0][1] == ["card"]
+        assert [term.id for term in lokalise[1][1]] == [2, 3]
+        assert lokalise[2][1] == [4]
+        assert report["failed"] == 0
+        assert {change["status"] for change in report["changes"]} == {"applied"}
+
+    def test_keeps_missing_terms(self, tmp_path, lokalise):
+        """Terms missing from the file are kept unless deletion is enabled."""
+        path = write_csv(tmp_path / "glossary.csv", [HEADER, *ROWS])
+
+        report = asyncio.run(glossary_processor.sync_glossary_file(path, "p"))
+
+        assert "delete" not in [action for action, _ in lokalise]
+        assert report["deleted"] == 0
@@ -0,0 +1,159 @@
+"""
+Pytest tests for concurrent, resumable glossary uploads.
+Run with: pytest tests/services/test_glossary_upload.py -v
+"""
+
+import asyncio
+import csv
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import glossary_processor as glossary_processor_module
+from app.services.glossary_processor import glossary_processor
+from app.services.glossary_upload import AdaptiveBatchSize, UploadCheckpoint
+from app.services.lokalise.glossary import lokalise_glossary_service
+from tests.services.test_glossary_reader import use_project_languages
+
+HEADER = ["term", "description", "casesensitive", "translatable", "forbidden"]
+
+
+@pytest.fixture
+def upload(tmp_path, monkeypatch):
+    """Upload a CSV glossary of the given terms against a fake Lokalise."""
+    path = tmp_path / "glossary.csv"
+    checkpoint = UploadCheckpoint(tmp_path / "uploads.sqlite3")
+    monkeypatch.setattr(glossary_processor_module, "upload_checkpoint", checkpoint)
+    settings = glossary_processor_module._settings
+    monkeypatch.setattr(settings, "GLOSSARY_UPLOAD_BATCH_SIZE", 4)
+    monkeypatch.setattr(settings, "GLOSSARY_UPLOAD_MIN_BATCH_SIZE", 1)
+    monkeypatch.setattr(settings, "GLOSSARY_UPLOAD_CONCURRENCY", 2)
+    lokalise = SimpleNamespace(terms=["existing"], requests=[], fail=set())
+    lokalise.in_flight = lokalise.max_in_flight = 0
+
+    async def fake_all_terms(project_id):
+        return [SimpleNamespace(term=term) for term in lokalise.terms]
+
+    async def fake_create(project_id, request):
+        names = [term.term for term in request.terms]
+        lokalise.requests.append(names)
+        lokalise.in_flight += 1
+        lokalise.max_in_flight = max(lokalise.max_in_flight, lokalise.in_flight)
+        try:
+            await asyncio.sleep(0)
+            for name in names:
+                if name in lokalise.fail:
+                    raise lokalise.fail_with
+            lokalise.terms.extend(names)
+            return SimpleNamespace(
+                data=[SimpleNamespace(term=name) for name in names],
+                meta=SimpleNamespace(errors={}),
+            )
+        finally:
+            lokalise.in_flight -= 1
+
+    monkeypatch.setattr(
+        lokalise_glossary_service, "get_all_glossary_terms", fake_all_terms
+    )
+    monkeypatch.setattr(lokalise_glossary_service, "create_glossary_terms", fake_create)
+    use_project_languages(monkeypatch)
+
+    def run(terms, **kwargs):
+        with path.open("w", newline="") as file:
+            csv.writer(file).writerows(
+                [HEADER, *([term, "", "no", "yes", "no"] for term in terms)]
+            )
+        return asyncio.run(glossary_processor.load_glossary_file(path, "p", **kwargs))
+
+    run.lokalise = lokalise
+    return run
+
+
+@pytest.mark.unit
+class TestGlossaryUpload:
+    """Test suite for the glossary upload pipeline."""
+
+    def test_concurrent_batches_and_report(self, upload):
+        """Batches run concurrently and every term gets an outcome."""
+        terms = ["existing", *(f"term{i}" for i in range(10)), "TERM1"]
+
+        report = upload(terms)
+
+        assert (report["created"], report["skipped"], report["failed"]) == (10, 1, 0)
+        assert {entry["term"] for entry in report["terms"]} == set(terms[:-1])
+        assert upload.lokalise.max_in_flight == 2
+        assert sorted(
+            name for names in upload.lokalise.requests for name in names
+        ) == sorted(terms[1:-1])
+
+    def test_rejected_batch_is_split(self, upload):
+        """Only the term Lokalise rejects fails; its batch mates are created."""
+        upload.lokalise.fail = {"term2"}
+        upload.lokalise.fail_with = HTTPException(status_code=400, detail="bad term")
+
+        report = upload([f"term{i}" for i in range(4)])
+
+        failed = [entry for entry in report["terms"] if entry["status"] == "failed"]
+        assert failed == [{"term": "term2", "status": "failed", "detail": "bad term"}]
+        assert report["created"] == 3
+
+    def test_rerun_resumes_upload(self, upload):
+        """A re-run only retries the terms that failed before."""
+        terms = [f"term{i}" for i in range(8)]
+        upload.lokalise.fail = {"term5"}
+        upload.lokalise.fail_with = HTTPException(status_code=500, detail="down")
+
+        first = upload(terms)
+        upload.lokalise.fail = set()
+        upload.lokalise.requests.clear()
+        second = upload(terms)
+
+        assert first["failed"] == 4
+        # The first batch (term0-3) was created by the first run
+        assert (
+            sorted(name for names in upload.lokalise.requests for name in names)
+            == terms[4:]
+        )
+        assert (second["created"], second["failed"]) == (8, 0)
+        assert second["upload_id"] == first["upload_id"]
+
+    def test_reports_progress(self, upload):
+        """Progress counts parsed rows, uploaded batches and term outcomes."""
+        updates = []
+
+        upload(
+            ["existing", *(f"term{i}" for i in range(6))],
+            on_progress=lambda done, total, counters: updates.append((done, counters)),
+        )
+
+        done, counters = updates[-1]
+        assert done == 7
+        assert counters == {
+            "rows_parsed": 7,
+            "batches_uploaded": 2,
+            "created": 6,
+            "skipped": 1,
+            "failed": 0,
+        }
+
+
+@pytest.mark.unit
+class TestAdaptiveBatchSize:
+    """Test suite for adapting batch sizes to Lokalise latency."""
+
+    def test_grows_and_shrinks(self):
+        """Fast batches grow the size, slow and failed batches shrink it."""
+        sizer = AdaptiveBatchSize(initial=50, minimum=5, maximum=100, target_seconds=2)
+
+        sizer.record_success(0.5)
+        assert sizer.size == 75
+        sizer.record_success(0.5)
+        assert sizer.size == 100
+        sizer.record_success(4.0)
+        assert sizer.size == 50
+        sizer.record_failure()
+        assert sizer.size == 25
+        for _ in range(5):
+            sizer.record_failure()
+        assert sizer.size == 5
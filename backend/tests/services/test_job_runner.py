@@ -0,0 +1,76 @@
+"""
+Pytest tests for the background job runner.
+Run with: pytest tests/services/test_job_runner.py -v
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.job_runner import JobRunner
+
+
+@pytest.mark.unit
+class TestJobRunner:
+    """Test suite for running and following background jobs."""
+
+    def test_watch_follows_job(self):
+        """Watchers get every state change and the stream ends with the job."""
+        runner = JobRunner()
+        step = asyncio.Event()
+
+        async def work(job):
+            job.report_progress(1, 2, {"rows_parsed": 10})
+            await step.wait()
+            job.report_progress(2, 2, {"rows_parsed": 20})
+            return {"done": True}
+
+        async def main():
+            status = runner.submit("test", work)
+            seen = []
+            async for update in runner.watch(status.job_id, heartbeat=5):
+                seen.append((update.status, update.progress.completed))
+                if update.progress.completed == 1:
+                    step.set()
+            return seen, update
+
+        seen, last = asyncio.run(main())
+
+        assert seen[0] == ("queued", 0)
+        assert ("running", 1) in seen
+        assert seen[-1] == ("completed", 2)
+        assert last.progress.counters == {"rows_parsed": 20}
+        assert last.result == {"done": True}
+
+    def test_watch_heartbeat(self):
+        """The status is repeated while a job makes no progress."""
+        runner = JobRunner()
+        release = asyncio.Event()
+
+        async def work(job):
+            await release.wait()
+            return {}
+
+        async def main():
+            status = runner.submit("test", work)
+            updates = 0
+            async for _ in runner.watch(status.job_id, heartbeat=0.01):
+                updates += 1
+                if updates == 5:
+                    release.set()
+            return updates
+
+        assert asyncio.run(main()) > 5
+
+    def test_watch_unknown_job(self):
+        """Following an unknown job fails with 404."""
+
+        async def main():
+            async for _ in JobRunner().watch("missing"):
+                pass
+
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(main())
+
+        assert error.value.status_code == 404
@@ -0,0 +1,182 @@
+"""
+Pytest tests for the local SQLite key mirror.
+Run with: pytest tests/services/test_key_mirror.py -v
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.key_mirror import KeyMirrorService, KeyMirrorStore, build_match_query
+
+
+@pytest.fixture
+def store(tmp_path, make_key):
+    store = KeyMirrorStore(tmp_path / "mirror.sqlite3")
+    store.replace_languages(
+        [
+            {"lang_id": 640, "lang_iso": "en", "lang_name": "English"},
+            {"lang_id": 673, "lang_iso": "fr", "lang_name": "French"},
+        ]
+    )
+    store.upsert_keys(
+        [
+            make_key(1, "welcome", {"en": "Welcome", "fr": "Bienvenue"}, tags=["home"]),
+            make_key(2, "goodbye", {"en": "Goodbye", "fr": ""}),
+            make_key(
+                3,
+                "legacy",
+                {"en": "Legacy", "fr": ""},
+                is_archived=True,
+                filenames={"ios": "", "android": "", "web": "old.json", "other": ""},
+            ),
+        ]
+    )
+    yield store
+    store.close()
+
+
+@pytest.mark.unit
+class TestKeyMirrorStore:
+    """Test suite for mirror storage and filtering."""
+
+    def test_filters_use_local_indexes(self, store):
+        """Tag, filename, archived and untranslated filters match Lokalise semantics."""
+        keys, total = store.query_keys(tags=["home"])
+        assert total == 1 and keys[0]["key_id"] == 1
+
+        keys, _ = store.query_keys(filenames=["old.json"])
+        assert [k["key_id"] for k in keys] == [3]
+
+        _, total = store.query_keys(archived="exclude")
+        assert total == 2
+
+        keys, _ = store.query_keys(untranslated=True, translation_lang_ids=[640])
+        assert keys == []
+        keys, _ = store.query_keys(untranslated=True, translation_lang_ids=[673])
+        assert [k["key_id"] for k in keys] == [2, 3]
+
+    def test_translations_included_per_language(self, store):
+        """Only requested languages are attached to key payloads."""
+        keys, _ = store.query_keys(
+            include_translations=True, translation_lang_ids=[673], key_ids=[1]
+        )
+        assert [t["language_iso"] for t in keys[0]["translations"]] == ["fr"]
+
+        keys, _ = store.query_keys(key_ids=[1])
+        assert keys[0]["translations"] == []
+
+    def test_cursor_pagination(self, store):
+        """Keyset pagination resumes after the last returned key."""
+        first, total = store.query_keys(limit=2)
+        assert total == 3 and len(first) == 2
+        rest, _ = store.query_keys(limit=2, after_key_id=first[-1]["key_id"])
+        assert [k["key_id"] for k in rest] == [3]
+
+    def test_upsert_and_delete_track_versions(self, store, make_key):
+        """Re-upserting a key replaces its translations and lookup rows."""
+        store.upsert_keys(
+            [
+                make_key(
+                    2,
+                    "goodbye",
+                    {"en": "Goodbye", "fr": "Au revoir"},
+                    translations_modified_at_timestamp=1704070000,
+                )
+            ]
+        )
+        assert store.get_key_versions()[2] == (1704067200, 1704070000)
+        translations, total = store.query_translations(lang_id=673, untranslated=True)
+        assert total == 1 and translations[0]["key_id"] == 3
+        assert translations[0]["segment_number"] == 1
+
+        store.delete_keys([3])
+        _, total = store.query_keys()
+        assert total == 2
+        _, total = store.query_translations(untranslated=True)
+        assert total == 0
+
+    def test_full_text_search(self, store, make_key):
+        """Search ranks name hits first and honours fields, languages and updates."""
+        results, total = store.search(build_match_query("welc"))
+        assert total == 1 and results[0]["key_id"] == 1
+        assert {m["field"] for m in results[0]["matches"]} == {"name", "translation"}
+
+        results, _ = store.search(build_match_query("bienvenue"), language_isos=["en"])
+        assert results == []
+        results, _ = store.search(
+            build_match_query("bienvenue", prefix=False), fields=["translation"]
+        )
+        assert results[0]["matches"][0]["snippet"] == "<mark>Bienvenue</mark>"
+
+        store.upsert_keys([make_key(2, "goodbye", {"en": "Farewell", "fr": ""})])
+        _, total = store.search(build_match_query("goodbye"), fields=["translation"])
+        assert total == 0
+        store.delete_keys([1])
+        _, total = store.search(build_match_query("welcome"))
+        assert total == 0
+
+        assert build_match_query('NOT "') is not None
+        assert build_match_query("!!") is None
+
+
+@pytest.mark.unit
+class TestKeyMirrorPassthrough:
+    """Test suite for requests passed through to the live API."""
+
+    def test_qa_issue_filter_passes_explicit_params(self, tmp_path):
+        """Only the list parameters are sent, with booleans as 0/1."""
+        service = KeyMirrorService(tmp_path)
+        calls = []
+
+        class FakeKeysService:
+            async def list_keys(self, project_id, params):
+                calls.append((project_id, params))
+                return "response", {"X-Pagination-Total-Count": "1", "Other": "x"}
+
+        service.keys_service = FakeKeysService()
+
+        response, headers = asyncio.run(
+            service.list_keys("p1", filter_qa_issues="spelling", cursor="abc")
+        )
+
+        assert response == "response"
+        assert headers == {"X-Pagination-Total-Count": "1"}
+        ((project_id, params),) = calls
+        assert project_id == "p1"
+        assert params["filter_qa_issues"] == "spelling"
+        assert params["include_translations"] == 0
+        assert "cursor" not in params
+        assert {"self", "project_id", "params"}.isdisjoint(params)
+
+
+@pytest.mark.unit
+class TestKeyMirrorFreshness:
+    """Test suite for syncing mirrors on demand."""
+
+    def test_concurrent_first_requests_sync_once(self, tmp_path, make_key):
+        """Requests waiting on the initial load do not sync again."""
+        service = KeyMirrorService(tmp_path)
+        walks = []
+
+        class FakeLanguagesService:
+            async def list_project_languages(self, project_id):
+                await asyncio.sleep(0)
+                return SimpleNamespace(languages=[])
+
+        class FakeKeysService:
+            async def iter_key_pages(self, project_id, **params):
+                walks.append(params)
+                yield [make_key(1, "welcome", {"en": "Welcome"})]
+
+        service.languages_service = FakeLanguagesService()
+        service.keys_service = FakeKeysService()
+
+        async def first_requests():
+            await asyncio.gather(*(service.ensure_fresh("p1") for _ in range(3)))
+
+        asyncio.run(first_requests())
+
+        assert walks == [{}]
+        assert service.get_store("p1").get_sync_state()["last_full_sync_at"]
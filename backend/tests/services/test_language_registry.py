@@ -0,0 +1,99 @@
+"""
+Pytest tests for the per-project language registry.
+Run with: pytest tests/services/test_language_registry.py -v
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.lokalise.languages import BaseLanguage
+from app.services.language_registry import LanguageRegistry
+
+
+class FakeLanguagesService:
+    """Languages endpoint counting its requests."""
+
+    def __init__(self, *isos):
+        self.isos = list(isos)
+        self.requests = 0
+
+    async def list_project_languages(self, project_id):
+        self.requests += 1
+        await asyncio.sleep(0)
+        return SimpleNamespace(
+            languages=[
+                BaseLanguage(lang_id=100 + i, lang_iso=iso)
+                for i, iso in enumerate(self.isos)
+            ]
+        )
+
+
+@pytest.mark.unit
+class TestLanguageRegistry:
+    """Test suite for caching and resolving project languages."""
+
+    def test_loads_once(self):
+        """Concurrent lookups share one request and later ones hit the cache."""
+        service = FakeLanguagesService("en", "fr")
+        registry = LanguageRegistry(ttl_seconds=60, languages_service=service)
+
+        async def scenario():
+            await asyncio.gather(*(registry.get("p") for _ in range(5)))
+            return await registry.get("p")
+
+        languages = asyncio.run(scenario())
+
+        assert service.requests == 1
+        assert sorted(languages) == ["en", "fr"]
+        assert languages.lang_ids(["fr", "de"]) == {"fr": 101}
+
+    def test_expires(self):
+        """Cached languages are reloaded once the TTL has passed."""
+        service = FakeLanguagesService("en")
+        registry = LanguageRegistry(ttl_seconds=0, languages_service=service)
+
+        asyncio.run(registry.get("p"))
+        asyncio.run(registry.get("p"))
+
+        assert service.requests == 2
+
+    def test_unknown_codes_reload(self):
+        """A code missing from the cache triggers one reload before failing."""
+        service = FakeLanguagesService("en")
+        registry = LanguageRegistry(
+            ttl_seconds=60, reload_interval=0, languages_service=service
+        )
+        asyncio.run(registry.get("p"))
+        service.isos.append("fr")
+
+        assert asyncio.run(registry.resolve("p", ["fr"])) == {"fr": 101}
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(registry.resolve("p", ["fr", "xx"]))
+
+        assert error.value.status_code == 400
+        assert "xx" in error.value.detail
+        assert service.requests == 3
+
+    def test_unknown_codes_reload_once_per_interval(self):
+        """Repeated unknown codes do not reload recently loaded languages."""
+        service = FakeLanguagesService("en")
+        registry = LanguageRegistry(
+            ttl_seconds=60, reload_interval=60, languages_service=service
+        )
+
+        for _ in range(3):
+            assert asyncio.run(registry.unknown("p", ["xx"])) == ["xx"]
+
+        assert service.requests == 1
+
+    def test_prime(self):
+        """Languages fetched elsewhere are served without a request."""
+        service = FakeLanguagesService()
+        registry = LanguageRegistry(ttl_seconds=60, languages_service=service)
+        registry.prime("p", [BaseLanguage(lang_id=7, lang_iso="it")])
+
+        assert asyncio.run(registry.resolve("p", ["it"])) == {"it": 7}
+        assert service.requests == 0
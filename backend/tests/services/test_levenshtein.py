@@ -0,0 +1,82 @@
+"""
+Pytest tests for the Levenshtein edit distance engine.
+Run with: pytest tests/services/test_levenshtein.py -v
+"""
+
+import random
+
+import pytest
+
+from app.services.levenshtein import (
+    _banded,
+    levenshtein,
+    levenshtein_batch,
+    levenshtein_many,
+)
+
+
+def reference_distance(a, b) -> int:
+    """Textbook full-matrix dynamic programming."""
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, start=1):
+        current = [i]
+        for j, y in enumerate(b, start=1):
+            current.append(
+                min(previous[j] + 1, current[-1] + 1, previous[j - 1] + (x != y))
+            )
+        previous = current
+    return previous[-1]
+
+
+@pytest.fixture
+def random_pairs():
+    rng = random.Random(3)
+    return [
+        (
+            "".join(rng.choices("abcd", k=rng.randint(0, 150))),
+            "".join(rng.choices("abcd", k=rng.randint(0, 150))),
+        )
+        for _ in range(300)
+    ]
+
+
+@pytest.mark.unit
+class TestLevenshtein:
+    """Test suite for exact, bounded and batched edit distances."""
+
+    def test_known_distances(self):
+        """Classic examples at character and word level."""
+        assert levenshtein("kitten", "sitting") == 3
+        assert levenshtein("", "abc") == 3
+        assert levenshtein("flaw", "lawn") == 2
+        assert levenshtein("save the file now".split(), "save a file".split()) == 2
+
+    def test_matches_full_dp(self, random_pairs):
+        """Bit-parallel distances equal the full DP, beyond one machine word."""
+        for a, b in random_pairs:
+            assert levenshtein(a, b) == reference_distance(a, b)
+
+    def test_bounded_distances(self, random_pairs):
+        """Bounded distances are exact up to the bound and capped above it."""
+        for a, b in random_pairs:
+            expected = reference_distance(a, b)
+            for bound in (0, 3, 40):
+                assert levenshtein(a, b, bound) == min(expected, bound + 1)
+                if a and b and abs(len(a) - len(b)) <= bound:
+                    assert _banded(a, b, bound) == min(expected, bound + 1)
+
+    def test_batch_matches_pairwise(self, random_pairs):
+        """Lane-parallel batches give the same distances as single pairs."""
+        query = random_pairs[0][0]
+        candidates = [b for _, b in random_pairs]
+        pairs = [(query, b) for b in candidates] + random_pairs[:20]
+
+        assert levenshtein_many(query, candidates) == [
+            reference_distance(query, b) for b in candidates
+        ]
+        assert levenshtein_batch(pairs, max_distance=10) == [
+            min(reference_distance(a, b), 11) for a, b in pairs
+        ]
+        assert levenshtein_batch(pairs, words=True) == [
+            reference_distance(a.split(), b.split()) for a, b in pairs
+        ]
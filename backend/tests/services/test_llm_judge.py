@@ -0,0 +1,112 @@
+"""
+Pytest tests for batched LLM-as-judge evaluation.
+Run with: pytest tests/services/test_llm_judge.py -v
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.translation_evaluation_service import TranslationEvaluationService
+
+
+def segment(index: int, length: int = 40) -> dict:
+    return {
+        "source_text": f"Source {index} " + "s" * length,
+        "translated_text": f"Translation {index} " + "t" * length,
+        "reference_text": f"Reference {index}",
+    }
+
+
+def feedback(item_id: str, summary: str | None = "Fine.") -> dict:
+    item = {"id": item_id, "strengths": ["Accurate"], "weaknesses": []}
+    if summary is not None:
+        item["summary"] = summary
+    return item
+
+
+@pytest.fixture
+def judge():
+    """Evaluation service whose LLM answers from a list of canned responses."""
+    service = TranslationEvaluationService()
+    prompts: list[str] = []
+    responses: list[str] = []
+
+    async def generate_content_async(prompt, generation_config=None):
+        prompts.append(prompt)
+        return SimpleNamespace(text=responses.pop(0))
+
+    service.llm_service = SimpleNamespace(
+        model=SimpleNamespace(generate_content_async=generate_content_async)
+    )
+    return service, prompts, responses
+
+
+@pytest.mark.unit
+class TestLLMJudge:
+    """Test suite for batched judge requests."""
+
+    def test_batches_follow_token_budget(self, judge):
+        """Segments are packed up to the input budget and output item limit."""
+        service, _, _ = judge
+        service.judge_input_token_budget = 1400
+        segments = [segment(i, length=800) for i in range(10)]
+
+        batches = service._plan_judge_batches(segments)
+
+        # (1400 - 400 overhead) tokens fit two segments of ~430 tokens
+        assert batches == [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]]
+        service.judge_input_token_budget = 10**6
+        assert len(service._plan_judge_batches(segments * 5)) == 3
+
+    def test_fallback_only_for_unparsable_items(self, judge):
+        """Valid items keep their feedback; broken or missing ones fall back."""
+        service, prompts, responses = judge
+        responses.append(
+            json.dumps(
+                {
+                    "evaluations": [
+                        feedback("2", "Third is good."),
+                        feedback("0", "First is good."),
+                        feedback("1", summary=None),
+                    ]
+                }
+            )
+        )
+        segments = [segment(i) for i in range(4)]
+
+        results = asyncio.run(service._get_llm_feedback_batch(segments, "en", "fr"))
+
+        assert len(prompts) == 1
+        assert results[0]["summary"] == "First is good."
+        assert results[2]["summary"] == "Third is good."
+        assert results[1]["strengths"] == ["Translation provided"]
+        assert results[3]["strengths"] == ["Translation provided"]
+
+    def test_batch_evaluation_attaches_feedback(self, judge):
+        """Batch evaluation with sources adds LLM feedback to every segment."""
+        service, prompts, responses = judge
+        responses.append(
+            json.dumps({"evaluations": [feedback("0", "A"), feedback("1", "B")]})
+        )
+        segments = [segment(i) for i in range(2)]
+
+        async def collect():
+            return [
+                line
+                async for line in service.evaluate_batch(
+                    [s["translated_text"] for s in segments],
+                    [s["reference_text"] for s in segments],
+                    sources=[s["source_text"] for s in segments],
+                    source_lang="en",
+                    target_lang="fr",
+                )
+            ]
+
+        lines = asyncio.run(collect())
+
+        assert [line["llm_feedback"]["summary"] for line in lines[:2]] == ["A", "B"]
+        assert lines[-1]["type"] == "corpus"
+        assert len(prompts) == 1
@@ -0,0 +1,121 @@
+"""
+Pytest tests for chunked bulk key writes.
+Run with: pytest tests/services/test_lokalise_keys.py -v
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services.lokalise.keys import lokalise_keys_service
+from app.services.lokalise.retry import AmbiguousWriteError
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    """Replace Lokalise HTTP calls with a recorder that can fail chosen chunks."""
+    calls: list[list[str]] = []
+    failures: dict[str, list[int]] = {}
+
+    async def fake_send_once(method, url, headers, params, json_data, content):
+        names = [key["key_name"] for key in json_data["keys"]]
+        calls.append(names)
+        statuses = failures.get(names[0])
+        if statuses:
+            return httpx.Response(statuses.pop(0), json={"error": {"message": "boom"}})
+        return httpx.Response(
+            200,
+            json={
+                "keys": [
+                    {"key_id": i, "key_name": name}
+                    for i, name in enumerate(names)
+                    if name != "dup"
+                ],
+                "errors": [
+                    {"message": "This key name is already taken", "code": 400}
+                    for name in names
+                    if name == "dup"
+                ],
+            },
+        )
+
+    async def no_sleep(_):
+        return None
+
+    monkeypatch.setattr(lokalise_keys_service, "_send_once", fake_send_once)
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    return calls, failures
+
+
+@pytest.mark.unit
+class TestBulkKeyWrites:
+    """Test suite for chunking, retries and error merging."""
+
+    def test_chunks_and_merges_errors(self, fake_api):
+        """Keys are split into chunks and per-key API errors are merged."""
+        calls, _ = fake_api
+        keys = [{"key_name": f"k{i}"} for i in range(5)] + [{"key_name": "dup"}]
+        progress = []
+
+        result = asyncio.run(
+            lokalise_keys_service.write_keys(
+                "p1", "POST", keys, on_progress=progress.append, chunk_size=2
+            )
+        )
+
+        assert [len(c) for c in calls] == [2, 2, 2]
+        assert len(result["keys"]) == 5
+        assert result["errors"][0]["code"] == 400
+        assert sorted(progress) == [2, 4, 6]
+
+    def test_retries_only_failed_chunks(self, fake_api):
+        """A throttled chunk is resent alone; a rejected chunk is reported."""
+        calls, failures = fake_api
+        failures["k2"] = [429]
+        failures["k4"] = [400]
+        keys = [{"key_name": f"k{i}"} for i in range(6)]
+
+        result = asyncio.run(
+            lokalise_keys_service.write_keys("p1", "PUT", keys, chunk_size=2)
+        )
+
+        assert [c[0] for c in calls].count("k2") == 2
+        assert [c[0] for c in calls].count("k0") == 1
+        assert [c[0] for c in calls].count("k4") == 1
+        assert len(result["keys"]) == 4
+        assert [e["key"] for e in result["errors"]] == [
+            {"key_name": "k4"},
+            {"key_name": "k5"},
+        ]
+
+    def test_ambiguous_create_counts_only_new_keys(self, monkeypatch):
+        """After an ambiguous create, only keys created since then count as written."""
+        posts: list[list[str]] = []
+
+        async def fake_make_request(method, endpoint, params=None, json_data=None):
+            if method == "GET":
+                return {
+                    "keys": [
+                        {"key_id": 1, "key_name": "new", "created_at_timestamp": now},
+                        {"key_id": 2, "key_name": "old", "created_at_timestamp": 1},
+                    ]
+                }
+            names = [key["key_name"] for key in json_data["keys"]]
+            posts.append(names)
+            if len(posts) == 1:
+                raise AmbiguousWriteError("connection lost")
+            return {"keys": [{"key_id": 3, "key_name": name} for name in names]}
+
+        now = int(time.time())
+        monkeypatch.setattr(lokalise_keys_service, "_make_request", fake_make_request)
+        keys = [{"key_name": name} for name in ("new", "old", "rest")]
+
+        result = asyncio.run(lokalise_keys_service.write_keys("p1", "POST", keys))
+
+        assert posts == [["new", "old", "rest"], ["rest"]]
+        assert [key["key_name"] for key in result["keys"]] == ["new", "rest"]
+        (error,) = result["errors"]
+        assert error["key"] == {"key_name": "old"}
+        assert error["message"] == "This key name is already taken"
@@ -0,0 +1,82 @@
+"""
+Pytest tests for single-pass decoding of Lokalise project responses.
+Run with: pytest tests/services/test_lokalise_projects.py -v
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.serialization import GC_PAUSE_THRESHOLD
+from app.main import app
+from app.services.lokalise.projects import lokalise_projects_service
+
+
+def make_project(index: int) -> dict:
+    return {
+        "project_id": f"{index}.abc",
+        "project_type": "localization_files",
+        "name": f"Project {index}",
+        "description": "Synthetic project " + "x" * 200,
+        "created_at": "2024-01-01 00:00:00 (Etc/UTC)",
+        "created_at_timestamp": 1704067200,
+        "created_by": 1,
+        "created_by_email": "user@example.com",
+        "team_id": 7,
+        "base_language_id": 640,
+        "base_language_iso": "en",
+        "statistics": {
+            "keys_total": index,
+            "languages": [
+                {
+                    "language_id": 673,
+                    "project_language_id": 1,
+                    "project_language_uuid": "fr-uuid",
+                    "language_iso": "fr",
+                }
+            ],
+        },
+    }
+
+
+@pytest.fixture
+def fake_projects(monkeypatch):
+    """Serve a large raw projects payload instead of calling Lokalise."""
+    payload = {"projects": [make_project(i) for i in range(3000)]}
+    raw = json.dumps(payload).encode()
+    assert len(raw) > GC_PAUSE_THRESHOLD
+
+    async def fake_send(method, endpoint, params=None, json_data=None):
+        return httpx.Response(200, content=raw)
+
+    monkeypatch.setattr(lokalise_projects_service, "_send", fake_send)
+    return payload
+
+
+@pytest.mark.unit
+class TestProjectsDecoding:
+    """Test suite for validating and serving project payloads."""
+
+    def test_validates_raw_response(self, fake_projects):
+        """Raw bytes are validated straight into typed models."""
+        response = asyncio.run(lokalise_projects_service.list_projects())
+
+        assert len(response.projects) == len(fake_projects["projects"])
+        assert response.projects[5].statistics.keys_total == 5
+        assert response.projects[5].statistics.languages[0].progress == 0.0
+
+    def test_endpoint_serves_validated_model(self, fake_projects):
+        """The endpoint returns the same JSON FastAPI validation would produce."""
+        client = TestClient(app)
+
+        response = client.get("/api/v1/lokalise/projects/")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        projects = response.json()["projects"]
+        assert len(projects) == len(fake_projects["projects"])
+        assert projects[0]["settings"] is None
+        assert projects[0]["statistics"]["qa_issues"] is None
@@ -0,0 +1,214 @@
+"""
+Pytest tests for the Lokalise retry policy and write deduplication.
+Run with: pytest tests/services/test_lokalise_retry.py -v
+"""
+
+import asyncio
+import base64
+import time
+
+import httpx
+import pytest
+
+from app.schemas.lokalise.glossary import GlossaryTermCreate
+from app.services.glossary_processor import glossary_processor
+from app.services.lokalise.files import iter_base64_file, lokalise_files_service
+from app.services.lokalise.glossary import lokalise_glossary_service
+from app.services.lokalise.keys import lokalise_keys_service
+from app.services.lokalise.retry import (
+    AmbiguousWriteError,
+    lokalise_retry_stats,
+    parse_retry_after,
+)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def scripted(service, monkeypatch, responses):
+    """Answer requests from a list of responses (or errors to raise)."""
+    calls = []
+
+    async def fake_send_once(method, url, headers, params, json_data, content):
+        calls.append((method, url.rsplit("/api2", 1)[-1], params, json_data))
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(service, "_send_once", fake_send_once)
+    return calls
+
+
+@pytest.mark.unit
+class TestRetryPolicy:
+    """Test suite for retries in LokaliseBaseService."""
+
+    def test_retries_idempotent_request(self, monkeypatch, sleeps):
+        """A GET is retried on 5xx and timeouts, honouring Retry-After."""
+        calls = scripted(
+            lokalise_keys_service,
+            monkeypatch,
+            [
+                httpx.Response(503, headers={"Retry-After": "7"}),
+                httpx.ReadTimeout("timed out"),
+                httpx.Response(200, json={"keys": []}),
+            ],
+        )
+        retries_before = lokalise_retry_stats.snapshot()["retries_total"]
+
+        data = asyncio.run(
+            lokalise_keys_service._make_request("GET", "/projects/p/keys")
+        )
+
+        assert data == {"keys": []}
+        assert len(calls) == 3
+        assert sleeps[0] >= 7
+        assert lokalise_retry_stats.snapshot()["retries_total"] == retries_before + 2
+
+    def test_does_not_resend_ambiguous_write(self, monkeypatch, sleeps):
+        """A POST failing with a 5xx is not resent but reported as ambiguous."""
+        calls = scripted(
+            lokalise_keys_service,
+            monkeypatch,
+            [httpx.Response(502, json={"error": {"message": "bad gateway"}})],
+        )
+
+        with pytest.raises(AmbiguousWriteError):
+            asyncio.run(
+                lokalise_keys_service._make_request(
+                    "POST", "/projects/p/keys", json_data={"keys": []}
+                )
+            )
+
+        assert len(calls) == 1
+        assert sleeps == []
+
+    def test_retries_throttled_write(self, monkeypatch, sleeps):
+        """A throttled POST was not processed and is retried."""
+        calls = scripted(
+            lokalise_keys_service,
+            monkeypatch,
+            [httpx.Response(429), httpx.Response(200, json={"keys": []})],
+        )
+
+        asyncio.run(
+            lokalise_keys_service._make_request(
+                "POST", "/projects/p/keys", json_data={"keys": []}
+            )
+        )
+
+        assert len(calls) == 2
+
+    def test_retries_throttled_streamed_upload(self, monkeypatch, sleeps, tmp_path):
+        """A throttled file upload is resent with the whole body."""
+        path = tmp_path / "en.json"
+        path.write_text('{"hello": "Hello"}')
+        bodies = []
+        responses = [
+            httpx.Response(429),
+            httpx.Response(200, json={"project_id": "p", "process": None}),
+        ]
+
+        async def fake_send_once(method, url, headers, params, json_data, content):
+            bodies.append(b"".join([chunk async for chunk in content]))
+            return responses.pop(0)
+
+        monkeypatch.setattr(lokalise_files_service, "_send_once", fake_send_once)
+
+        asyncio.run(
+            lokalise_files_service._make_request_with_headers(
+                "POST",
+                "/projects/p/files/upload",
+                content=lambda: iter_base64_file(path),
+            )
+        )
+
+        assert len(bodies) == 2
+        assert bodies[0] == bodies[1] == base64.b64encode(path.read_bytes())
+
+    def test_parse_retry_after(self):
+        """Retry-After accepts seconds and HTTP dates."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+@pytest.mark.unit
+class TestWriteDeduplication:
+    """Test suite for resending writes that may have been applied."""
+
+    def test_key_chunk_resends_only_missing_keys(self, monkeypatch, sleeps):
+        """Keys created by the failed request are not created twice."""
+        created = {
+            "key_id": 1,
+            "key_name": "a",
+            "created_at_timestamp": int(time.time()),
+        }
+        calls = scripted(
+            lokalise_keys_service,
+            monkeypatch,
+            [
+                httpx.ReadTimeout("timed out"),
+                httpx.Response(200, json={"keys": [created]}),
+                httpx.Response(200, json={"keys": [{"key_id": 2, "key_name": "b"}]}),
+            ],
+        )
+
+        result = asyncio.run(
+            lokalise_keys_service.create_keys(
+                "p", [{"key_name": "a"}, {"key_name": "b"}]
+            )
+        )
+
+        assert [call[0] for call in calls] == ["POST", "GET", "POST"]
+        assert calls[1][2]["filter_keys"] == "a,b"
+        assert calls[2][3]["keys"] == [{"key_name": "b"}]
+        assert [key["key_id"] for key in result["keys"]] == [1, 2]
+        assert result["errors"] == []
+
+    def test_glossary_batch_resends_only_missing_terms(self, monkeypatch, sleeps):
+        """Glossary terms created by the failed request are not created twice."""
+        calls = scripted(
+            lokalise_glossary_service,
+            monkeypatch,
+            [
+                httpx.Response(500, json={"error": {"message": "oops"}}),
+                httpx.Response(
+                    200,
+                    json={
+                        "data": [{"id": 1, "term": "Alpha", "description": ""}],
+                        "meta": {"hasMore": False},
+                    },
+                ),
+                httpx.Response(
+                    200, json={"data": [{"id": 2, "term": "beta", "description": ""}]}
+                ),
+            ],
+        )
+        batch = [
+            GlossaryTermCreate(
+                term=term,
+                description="",
+                case_sensitive=False,
+                translatable=True,
+                forbidden=False,
+            )
+            for term in ("alpha", "beta")
+        ]
+
+        created = asyncio.run(glossary_processor._upload_term_batch("p", batch))
+
+        assert created == {"alpha", "beta"}
+        assert [call[0] for call in calls] == ["POST", "GET", "POST"]
+        assert [term["term"] for term in calls[2][3]["terms"]] == ["beta"]
@@ -1,7 +1,7 @@
 import { useState, useRef } from 'react';
 import { Button } from '@/components/ui/button';
-import { uploadGlossary } from '@/services/api';
-import type { GlossaryUploadResponse } from '@/types/api';
+import { uploadGlossary, watchJob } from '@/services/api';
+import type { GlossaryUploadResponse, JobProgress } from '@/types/api';
 import { Upload, X, FileSpreadsheet, CheckCircle, AlertCircle } from 'lucide-react';
 
 interface GlossaryUploaderProps {
@@ -15,6 +15,7 @@ export function GlossaryUploader({ projectId, onClose, onSuccess }: GlossaryUplo
   const [sourceLanguage, setSourceLanguage] = useState('en');
   const [isUploading, setIsUploading] = useState(false);
   const [uploadResult, setUploadResult] = useState<GlossaryUploadResponse | null>(null);
+  const [progress, setProgress] = useState<JobProgress | null>(null);
   const [error, setError] = useState<string | null>(null);
   const fileInputRef = useRef<HTMLInputElement>(null);
 
@@ -68,20 +69,29 @@ export function GlossaryUploader({ projectId, onClose, onSuccess }: GlossaryUplo
     if (!selectedFile) return;
 
     setIsUploading(true);
+    setProgress(null);
     setError(null);
 
     try {
-      const response = await uploadGlossary(selectedFile, {
+      const submitted = await uploadGlossary(selectedFile, {
         project_id: projectId,
         source_language: sourceLanguage,
       });
+      // The import keeps running on the server if this dialog is closed
+      const job = await watchJob<GlossaryUploadResponse>(submitted.job_id, (update) =>
+        setProgress(update.progress)
+      );
+      if (job.status === 'failed' || !job.result) {
+        throw new Error(job.error || 'Failed to upload glossary');
+      }
 
-      setUploadResult(response);
-      onSuccess?.(response);
+      setUploadResult(job.result);
+      onSuccess?.(job.result);
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to upload glossary');
     } finally {
       setIsUploading(false);
+      setProgress(null);
     }
   };
 
@@ -185,6 +195,32 @@ export function GlossaryUploader({ projectId, onClose, onSuccess }: GlossaryUplo
             </div>
           </div>
 
+          {/* Import Progress */}
+          {isUploading && progress && (
+            <div className="bg-muted/50 grid grid-cols-2 gap-2 rounded-lg border p-3 text-sm">
+              <div>
+                <span className="font-medium">Rows parsed:</span>
+                <span className="ml-2">{progress.counters.rows_parsed ?? 0}</span>
+              </div>
+              <div>
+                <span className="font-medium">Batches uploaded:</span>
+                <span className="ml-2">{progress.counters.batches_uploaded ?? 0}</span>
+              </div>
+              <div>
+                <span className="font-medium">Created:</span>
+                <span className="ml-2">{progress.counters.created ?? 0}</span>
+              </div>
+              <div>
+                <span className="font-medium">Skipped:</span>
+                <span className="ml-2">{progress.counters.skipped ?? 0}</span>
+              </div>
+              <div>
+                <span className="font-medium">Errors:</span>
+                <span className="ml-2">{progress.counters.failed ?? 0}</span>
+              </div>
+            </div>
+          )}
+
           {/* Error Display */}
           {error && (
             <div className="border-destructive bg-destructive/10 flex items-center gap-2 rounded-lg border p-3">
@@ -265,7 +301,7 @@ export function GlossaryUploader({ projectId, onClose, onSuccess }: GlossaryUplo
               {isUploading ? (
                 <>
                   <div className="mr-2 h-4 w-4 animate-spin rounded-full border-b-2 border-white"></div>
-                  Uploading...
+                  {progress ? `Uploading ${progress.completed} terms...` : 'Uploading...'}
                 </>
               ) : (
                 <>
@@ -1,9 +1,13 @@
 import { useState } from 'react';
 import { Button } from '@/components/ui/button';
-import { createKeys } from '@/services/api';
-import type { KeyCreate, KeysCreateResponse } from '@/types/api';
+import { createKeys, createKeysInBackground, getJob } from '@/services/api';
+import type { JobProgress, KeyCreate, KeysCreateRequest, KeysCreateResponse } from '@/types/api';
 import { Plus, X, Save } from 'lucide-react';
 
+// Larger imports run as a background job so the request cannot time out
+const BACKGROUND_THRESHOLD = 500;
+const JOB_POLL_INTERVAL_MS = 1000;
+
 interface KeyCreatorProps {
   projectId: string;
   onKeysCreated: (response: KeysCreateResponse) => void;
@@ -31,6 +35,7 @@ export function KeyCreator({ projectId, onKeysCreated, onClose }: KeyCreatorProp
     },
   ]);
   const [isCreating, setIsCreating] = useState(false);
+  const [progress, setProgress] = useState<JobProgress | null>(null);
   const [error, setError] = useState<string | null>(null);
 
   const addKey = () => {
@@ -81,8 +86,22 @@ export function KeyCreator({ projectId, onKeysCreated, onClose }: KeyCreatorProp
     setKeys(updatedKeys);
   };
 
+  const createKeysAsJob = async (request: KeysCreateRequest): Promise<KeysCreateResponse> => {
+    let job = await createKeysInBackground(projectId, request);
+    while (job.status === 'queued' || job.status === 'running') {
+      setProgress(job.progress);
+      await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+      job = await getJob<KeysCreateResponse>(job.job_id);
+    }
+    if (job.status === 'failed' || !job.result) {
+      throw new Error(job.error || 'Key import failed');
+    }
+    return job.result;
+  };
+
   const handleSubmit = async () => {
     setIsCreating(true);
+    setProgress(null);
     setError(null);
 
     try {
@@ -101,10 +120,11 @@ export function KeyCreator({ projectId, onKeysCreated, onClose }: KeyCreatorProp
         throw new Error('Please provide at least one key with a name and translation');
       }
 
-      const response = await createKeys(projectId, {
-        keys: validKeys,
-        use_automations: false,
-      });
+      const request = { keys: validKeys, use_automations: false };
+      const response =
+        validKeys.length > BACKGROUND_THRESHOLD
+          ? await createKeysAsJob(request)
+          : await createKeys(projectId, request);
 
       onKeysCreated(response);
       onClose();
@@ -112,6 +132,7 @@ export function KeyCreator({ projectId, onKeysCreated, onClose }: KeyCreatorProp
       setError(err instanceof Error ? err.message : 'Failed to create keys');
     } finally {
       setIsCreating(false);
+      setProgress(null);
     }
   };
 
@@ -277,7 +298,9 @@ export function KeyCreator({ projectId, onKeysCreated, onClose }: KeyCreatorProp
             {isCreating ? (
               <>
                 <div className="mr-2 h-4 w-4 animate-spin rounded-full border-b-2 border-white"></div>
-                Creating...
+                {progress
+                  ? `Creating ${progress.completed}/${progress.total ?? '?'}...`
+                  : 'Creating...'}
               </>
             ) : (
               <>
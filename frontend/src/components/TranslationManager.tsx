@@ -58,7 +58,10 @@ export function TranslationManager() {
 
   const handleKeysCreated = async (response: KeysCreateResponse) => {
     // Show success message
-    console.log(`Successfully created ${response.meta.created} keys`);
+    console.log(`Successfully created ${response.keys.length} keys`);
+    if (response.errors.length > 0) {
+      console.warn(`${response.errors.length} keys could not be created`, response.errors);
+    }
 
     // Automatically reload translations to show the new keys
     await reloadTranslations();
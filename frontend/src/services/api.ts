@@ -11,6 +11,7 @@ import type {
   ProjectTranslationsParams,
   KeysCreateRequest,
   KeysCreateResponse,
+  JobStatus,
   ProjectsListParams,
   ProjectsListResponse,
   GlossaryUploadParams,
@@ -139,6 +140,68 @@ export async function createKeys(
   });
 }
 
+// Create keys as a background job (for large imports)
+export async function createKeysInBackground(
+  projectId: string,
+  request: KeysCreateRequest
+): Promise<JobStatus<KeysCreateResponse>> {
+  const url = `${API_BASE}/lokalise/projects/${projectId}/keys?background=true`;
+  return fetchApi<JobStatus<KeysCreateResponse>>(url, {
+    method: 'POST',
+    body: JSON.stringify(request),
+  });
+}
+
+// Get background job status
+export async function getJob<TResult = Record<string, unknown>>(
+  jobId: string
+): Promise<JobStatus<TResult>> {
+  const url = `${API_BASE}/jobs/${jobId}`;
+  return fetchApi<JobStatus<TResult>>(url);
+}
+
+// Follow a background job until it completes or fails. Updates arrive as
+// server-sent events; if the stream is unavailable the job is polled instead.
+export function watchJob<TResult = Record<string, unknown>>(
+  jobId: string,
+  onUpdate: (job: JobStatus<TResult>) => void,
+  pollIntervalMs = 1000
+): Promise<JobStatus<TResult>> {
+  const isFinished = (job: JobStatus<TResult>) =>
+    job.status === 'completed' || job.status === 'failed';
+
+  const poll = async (): Promise<JobStatus<TResult>> => {
+    let job = await getJob<TResult>(jobId);
+    onUpdate(job);
+    while (!isFinished(job)) {
+      await new Promise((resolve) => setTimeout(resolve, pollIntervalMs));
+      job = await getJob<TResult>(jobId);
+      onUpdate(job);
+    }
+    return job;
+  };
+
+  if (typeof EventSource === 'undefined') {
+    return poll();
+  }
+
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(`${API_BASE}/jobs/${jobId}/events`);
+    source.onmessage = (event) => {
+      const job = JSON.parse(event.data) as JobStatus<TResult>;
+      onUpdate(job);
+      if (isFinished(job)) {
+        source.close();
+        resolve(job);
+      }
+    };
+    source.onerror = () => {
+      source.close();
+      poll().then(resolve, reject);
+    };
+  });
+}
+
 // Get projects list
 export async function getProjects(params: ProjectsListParams = {}): Promise<ProjectsListResponse> {
   const searchParams = new URLSearchParams();
@@ -153,11 +216,11 @@ export async function getProjects(params: ProjectsListParams = {}): Promise<Proj
   return fetchApi<ProjectsListResponse>(url);
 }
 
-// Upload glossary file
+// Upload glossary file; the import runs as a background job (follow it with watchJob)
 export async function uploadGlossary(
   file: File,
   params: GlossaryUploadParams
-): Promise<GlossaryUploadResponse> {
+): Promise<JobStatus<GlossaryUploadResponse>> {
   const { project_id, source_language = 'en' } = params;
 
   const formData = new FormData();
@@ -166,6 +229,7 @@ export async function uploadGlossary(
   const searchParams = new URLSearchParams({
     project_id,
     source_language,
+    background: 'true',
   });
 
   const url = `${API_BASE}/glossary/load?${searchParams}`;
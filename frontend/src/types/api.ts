@@ -193,16 +193,35 @@ export interface KeysCreateRequest {
   use_automations?: boolean;
 }
 
-export interface KeyCreateMeta {
-  count: number;
-  created: number;
-  limit: number | null;
-  errors: Record<string, unknown>;
+export interface KeyBulkError {
+  message: string;
+  code: number;
+  key?: Record<string, unknown> | null;
 }
 
 export interface KeysCreateResponse {
-  data: TranslationKey[];
-  meta: KeyCreateMeta;
+  project_id: string;
+  keys: TranslationKey[];
+  errors: KeyBulkError[];
+}
+
+// Background Jobs API Types
+export interface JobProgress {
+  completed: number;
+  total: number | null;
+  counters: Record<string, number>;
+}
+
+export interface JobStatus<TResult = Record<string, unknown>> {
+  job_id: string;
+  kind: string;
+  status: 'queued' | 'running' | 'completed' | 'failed';
+  progress: JobProgress;
+  result: TResult | null;
+  error: string | null;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
 }
 
 // Projects API Types
@@ -297,10 +316,26 @@ export interface GlossaryUploadStats {
   language_count: number;
 }
 
+export interface GlossaryUploadTerm {
+  term: string;
+  status: 'created' | 'skipped' | 'failed';
+  detail: string | null;
+}
+
+export interface GlossaryUploadReport {
+  project_id: string;
+  upload_id: string;
+  created: number;
+  skipped: number;
+  failed: number;
+  terms: GlossaryUploadTerm[];
+}
+
 export interface GlossaryUploadResponse {
   success: boolean;
   message: string;
   stats: GlossaryUploadStats;
+  report: GlossaryUploadReport | null;
 }
 
 export interface GlossaryUploadParams {